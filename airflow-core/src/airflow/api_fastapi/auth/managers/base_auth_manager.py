@@ -22,12 +22,15 @@ import warnings
 from abc import ABCMeta, abstractmethod
 from collections import defaultdict
 from enum import Enum
-from functools import cache
+from functools import cache, cached_property
+from threading import RLock
 from typing import TYPE_CHECKING, Any, Generic, Literal, TypeVar
 
+from cachetools import TTLCache
 from jwt import InvalidTokenError
 from sqlalchemy import select
 
+from airflow._shared.observability.metrics import stats
 from airflow.api_fastapi.auth.managers.models.base_user import BaseUser
 from airflow.api_fastapi.auth.managers.models.resource_details import (
     ConnectionDetails,
@@ -113,6 +116,16 @@ T = TypeVar("T", bound=BaseUser)
 COOKIE_NAME_JWT_TOKEN = "_token"
 
 
+class _AuthorizedDagIdsCache:
+    """Dags authorized per user and method, and the Dags by team they were computed from."""
+
+    def __init__(self, *, maxsize: int, ttl: int) -> None:
+        self.entries: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.lock = RLock()
+        # Shared by all the entries which are still valid
+        self.dags_by_team: dict[str | None, set[str]] | None = None
+
+
 class BaseAuthManager(Generic[T], LoggingMixin, metaclass=ABCMeta):
     """
     Class to derive in order to implement concrete auth managers.
@@ -598,10 +611,36 @@ class BaseAuthManager(Generic[T], LoggingMixin, metaclass=ABCMeta):
         )
         # The below type annotation is acceptable on SQLA2.1, but not on 2.0
         rows: Sequence[Row[Unpack[tuple[str, str]]]] = session.execute(stmt).all()  # type: ignore[type-arg]
-        dags_by_team: dict[str, set[str]] = defaultdict(set)
+        dags_by_team: dict[str | None, set[str]] = defaultdict(set)
         for dag_id, team_name in rows:
             dags_by_team[team_name].add(dag_id)
 
+        if (cache := self._authorized_dag_ids_cache) is None:
+            return self._filter_authorized_dag_ids_by_team(dags_by_team, user=user, method=method)
+
+        # Cached authorized Dags are only used as long as the Dags and the teams of their bundles did
+        # not change since they were computed. All the entries share the same Dags by team mapping, so
+        # that checking it is an identity check and it is only stored once.
+        key = (user.get_id(), method)
+        with cache.lock:
+            if dags_by_team == cache.dags_by_team:
+                dags_by_team = cache.dags_by_team
+            else:
+                cache.dags_by_team = dags_by_team
+            cached = cache.entries.get(key)
+        if cached is not None and cached[0] is dags_by_team:
+            stats.incr("api_server.authorized_dags_cache.hit")
+            return set(cached[1])
+
+        stats.incr("api_server.authorized_dags_cache.miss")
+        dag_ids = self._filter_authorized_dag_ids_by_team(dags_by_team, user=user, method=method)
+        with cache.lock:
+            cache.entries[key] = (dags_by_team, frozenset(dag_ids))
+        return dag_ids
+
+    def _filter_authorized_dag_ids_by_team(
+        self, dags_by_team: dict[str | None, set[str]], *, user: T, method: ResourceMethod
+    ) -> set[str]:
         dag_ids: set[str] = set()
         for team_name, team_dag_ids in dags_by_team.items():
             dag_ids.update(
@@ -609,9 +648,24 @@ class BaseAuthManager(Generic[T], LoggingMixin, metaclass=ABCMeta):
                     dag_ids=team_dag_ids, user=user, method=method, team_name=team_name
                 )
             )
-
         return dag_ids
 
+    def clear_authorized_dag_ids_cache(self) -> None:
+        """Clear the Dags cached by ``get_authorized_dag_ids``, e.g. after the permissions of users changed."""
+        if (cache := self._authorized_dag_ids_cache) is not None:
+            with cache.lock:
+                cache.entries.clear()
+
+    @cached_property
+    def _authorized_dag_ids_cache(self) -> _AuthorizedDagIdsCache | None:
+        """Dags authorized per user and method, or None if ``[api] authorized_dags_cache_size`` is 0."""
+        cache_size = conf.getint("api", "authorized_dags_cache_size", fallback=0)
+        if cache_size <= 0:
+            return None
+        return _AuthorizedDagIdsCache(
+            maxsize=cache_size, ttl=conf.getint("api", "authorized_dags_cache_ttl", fallback=30)
+        )
+
     def filter_authorized_dag_ids(
         self,
         *,
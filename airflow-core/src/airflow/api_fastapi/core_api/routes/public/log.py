@@ -101,6 +101,7 @@ def get_log(
     full_content: bool = False,
     map_index: int = -1,
     token: str | None = None,
+    tail_lines: PositiveInt | None = None,
 ):
     """Get logs for a specific task instance."""
     if not token:
@@ -117,6 +118,10 @@ def get_log(
         full_content = True
 
     metadata["download_logs"] = full_content
+    if tail_lines:
+        # Read only the last lines of each source, and then each source from where the previous read stopped
+        metadata["tail_lines"] = tail_lines
+        metadata.setdefault("source_offsets", {})
 
     task_log_reader = TaskLogReader()
 
@@ -162,8 +167,15 @@ def get_log(
             ti.task = dag.get_task(ti.task_id)
 
     if accept == Mimetype.NDJSON:  # only specified application/x-ndjson will return streaming response
-        # LogMetadata(TypedDict) is used as type annotation for log_reader; added ignore to suppress mypy error
-        raw_stream = task_log_reader.read_log_stream(ti, try_number, metadata)  # type: ignore[arg-type]
+        raw_stream: Iterable[str]
+        if "source_offsets" in metadata:
+            # Range reads know up to where each source is read before streaming it, so the continuation
+            # token can be sent in the headers without reading the whole log first
+            structured_log_stream, metadata = task_log_reader.read_log_chunks(ti, try_number, metadata)  # type: ignore[arg-type,assignment]
+            raw_stream = (f"{log.model_dump_json()}\n" for log in structured_log_stream)
+        else:
+            # LogMetadata(TypedDict) is used as type annotation for log_reader; added ignore to suppress mypy error
+            raw_stream = task_log_reader.read_log_stream(ti, try_number, metadata)  # type: ignore[arg-type]
         log_stream = _buffered_ndjson_stream(raw_stream)
         headers = None
         if not metadata.get("end_of_log", False):
@@ -271,6 +271,39 @@ class TIHeartbeatInfo(StrictBaseModel):
     pid: int
 
 
+class TIBulkHeartbeatInfo(TIHeartbeatInfo):
+    """Heartbeat of one TaskInstance in a bulk heartbeat."""
+
+    id: uuid.UUID
+    token: str
+    """The API token of the TaskInstance, authorizing its heartbeat."""
+
+
+class TIBulkHeartbeatBody(StrictBaseModel):
+    """Payload for the heartbeats of several TaskInstances in one request."""
+
+    heartbeats: list[TIBulkHeartbeatInfo]
+
+
+class TIBulkHeartbeatResult(BaseModel):
+    """
+    Outcome of the heartbeat of one TaskInstance.
+
+    ``status_code`` and ``detail`` are those the single heartbeat endpoint would have responded with.
+    """
+
+    status_code: int
+    detail: dict[str, Any] | None = None
+    refreshed_token: str | None = None
+    """A new API token for the TaskInstance, when its token is close to expiry."""
+
+
+class TIBulkHeartbeatResponse(BaseModel):
+    """Outcome of the heartbeats of several TaskInstances, in the order of the payload."""
+
+    results: list[TIBulkHeartbeatResult]
+
+
 # This model is not used in the API, but it is included in generated OpenAPI schema
 # for use in the client SDKs.
 class TaskInstance(BaseModel):
@@ -17,9 +17,9 @@
 
 from __future__ import annotations
 
-from pydantic import JsonValue, RootModel
+from pydantic import Field, JsonValue, RootModel
 
-from airflow.api_fastapi.core_api.base import BaseModel
+from airflow.api_fastapi.core_api.base import BaseModel, StrictBaseModel
 
 
 class XComResponse(BaseModel):
@@ -40,3 +40,32 @@ class XComSequenceSliceResponse(RootModel):
     """XCom schema with minimal structure for slice-based access."""
 
     root: list[JsonValue]
+
+
+class XComBatchQuery(StrictBaseModel):
+    """A single XCom read in a batch."""
+
+    dag_id: str
+    run_id: str
+    task_id: str
+    key: str = Field(min_length=1)
+    map_index: int | None = -1
+    """The map index to read, or *None* to read the values of all map indexes."""
+    include_prior_dates: bool = False
+
+
+class XComBatchBody(StrictBaseModel):
+    """Payload for reading several XComs in one request."""
+
+    queries: list[XComBatchQuery]
+
+
+class XComBatchResponse(RootModel):
+    """
+    XCom values of a batch, in the order of the queries.
+
+    Each query gets a list of values: empty if the XCom was not found, the single value when a map index
+    was given, or the values of all map indexes ordered by map index.
+    """
+
+    root: list[list[JsonValue]]
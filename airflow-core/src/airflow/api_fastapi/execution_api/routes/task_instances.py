@@ -43,9 +43,9 @@ from structlog.contextvars import bind_contextvars
 from airflow._shared.observability.traces import override_ids
 from airflow._shared.state import TaskScope
 from airflow._shared.timezones import timezone
-from airflow.api_fastapi.auth.tokens import JWTGenerator
+from airflow.api_fastapi.auth.tokens import JWTGenerator, JWTValidator
 from airflow.api_fastapi.common.dagbag import DagBagDep, get_latest_version_of_dag
-from airflow.api_fastapi.common.db.common import SessionDep
+from airflow.api_fastapi.common.db.common import AsyncSessionDep, SessionDep
 from airflow.api_fastapi.common.types import UtcDateTime
 from airflow.api_fastapi.compat import HTTP_422_UNPROCESSABLE_CONTENT
 from airflow.api_fastapi.core_api.openapi.exceptions import create_openapi_http_exception_doc
@@ -56,6 +56,10 @@ from airflow.api_fastapi.execution_api.datamodels.taskinstance import (
     TaskBreadcrumbsResponse,
     TaskStatesResponse,
     TIAwaitingInputStatePayload,
+    TIBulkHeartbeatBody,
+    TIBulkHeartbeatInfo,
+    TIBulkHeartbeatResponse,
+    TIBulkHeartbeatResult,
     TIDeferredStatePayload,
     TIEnterRunningPayload,
     TIHeartbeatInfo,
@@ -74,6 +78,7 @@ from airflow.api_fastapi.execution_api.security import (
     ExecutionAPIRoute,
     get_team_name_for_ti,
     require_auth,
+    token_needs_refresh,
 )
 from airflow.configuration import conf
 from airflow.exceptions import InvalidPartitionKeyError, TaskNotFound
@@ -91,7 +96,7 @@ from airflow.models.xcom import XComModel
 from airflow.serialization.definitions.assets import SerializedAsset, SerializedAssetUniqueKey
 from airflow.state import get_state_backend
 from airflow.triggers.base import TriggerEvent
-from airflow.utils.sqlalchemy import get_dialect_name
+from airflow.utils.sqlalchemy import get_dialect_name, with_row_locks
 from airflow.utils.state import DagRunState, TaskInstanceState, TerminalTIState
 
 if TYPE_CHECKING:
@@ -509,6 +514,10 @@ def ti_update_state(
         )
 
     if updated_state == TaskInstanceState.SUCCESS:
+        if conf.getboolean("scheduler", "schedule_downstream_on_success"):
+            _schedule_downstream_tasks(
+                dag_id=dag_id, run_id=run_id, task_id=task_id, session=session, dag_bag=dag_bag
+            )
         if conf.getboolean("state_store", "clear_on_success"):
             scope = TaskScope(
                 dag_id=dag_id,
@@ -584,6 +593,48 @@ def _emit_task_span(ti, state):
         span.end()
 
 
+def _schedule_downstream_tasks(
+    *, dag_id: str, run_id: str, task_id: str, session: SessionDep, dag_bag: DagBagDep
+) -> None:
+    """
+    Schedule the direct downstream task instances of a successful task whose dependencies are met.
+
+    This only saves waiting for the scheduler to examine the Dag run, which schedules anything left here:
+    the Dag run is skipped if a scheduler holds its lock, and errors only roll back this step.
+    """
+    try:
+        with session.begin_nested():
+            dag_run = session.scalar(
+                with_row_locks(
+                    select(DR).where(DR.dag_id == dag_id, DR.run_id == run_id),
+                    of=DR,
+                    session=session,
+                    skip_locked=True,
+                )
+            )
+            if dag_run is None or dag_run.state != DagRunState.RUNNING:
+                log.debug("Dag run is locked or not running, leaving downstream tasks to the scheduler")
+                return
+            dag = dag_bag.get_dag_for_run(dag_run=dag_run, session=session)
+            if not dag or not (downstream_task_ids := dag.get_task(task_id).downstream_task_ids):
+                return
+            # Only the direct downstream tasks and their own upstream tasks are needed to evaluate
+            # the trigger rules, their task instances are the only ones loaded.
+            dag_run.dag = dag.partial_subset(
+                downstream_task_ids, include_upstream=False, include_direct_upstream=True
+            )
+            info = dag_run.task_instance_scheduling_decisions(session=session)
+            schedulable_tis = [ti for ti in info.schedulable_tis if ti.task_id in downstream_task_ids]
+            dag_run._emit_downstream_scheduling_delay_stats(
+                schedulable_tis, info.finished_tis, source="execution_api"
+            )
+            scheduled = dag_run.schedule_tis(schedulable_tis, session=session)
+    except (SQLAlchemyError, TaskNotFound):
+        log.warning("Failed to schedule downstream task instances", exc_info=True)
+    else:
+        log.info("Scheduled downstream task instances", count=scheduled)
+
+
 def _handle_fail_fast_for_dag(ti: TI, dag_id: str, session: SessionDep, dag_bag: DagBagDep) -> None:
     dr = ti.dag_run
 
@@ -870,10 +921,10 @@ def ti_skip_downstream(
         ]
     ),
 )
-def ti_heartbeat(
+async def ti_heartbeat(
     task_instance_id: UUID,
     ti_payload: TIHeartbeatInfo,
-    session: SessionDep,
+    session: AsyncSessionDep,
 ):
     """Update the heartbeat of a TaskInstance to mark it as alive & still running."""
     bind_contextvars(ti_id=str(task_instance_id))
@@ -883,7 +934,7 @@ def ti_heartbeat(
     # so we can update last_heartbeat_at directly without first taking a row lock.
     fast_path_result = cast(
         "CursorResult[Any]",
-        session.execute(
+        await session.execute(
             update(TI)
             .where(
                 TI.id == task_instance_id,
@@ -904,7 +955,7 @@ def ti_heartbeat(
     old = select(TI.state, TI.hostname, TI.pid).where(TI.id == task_instance_id).with_for_update()
 
     try:
-        (previous_state, hostname, pid) = session.execute(old).one()
+        (previous_state, hostname, pid) = (await session.execute(old)).one()
         log.debug(
             "Retrieved current task state", state=previous_state, current_hostname=hostname, current_pid=pid
         )
@@ -912,7 +963,7 @@ def ti_heartbeat(
         # Check if the TI exists in the Task Instance History table.
         # If it does, it was likely cleared while running, so return 410 Gone
         # instead of 404 Not Found to give the client a more specific signal.
-        tih_exists = session.scalar(
+        tih_exists = await session.scalar(
             select(func.count(TIH.task_instance_id)).where(TIH.task_instance_id == task_instance_id)
         )
         if tih_exists:
@@ -966,10 +1017,103 @@ def ti_heartbeat(
         )
 
     # Update the last heartbeat time!
-    session.execute(update(TI).where(TI.id == task_instance_id).values(last_heartbeat_at=timezone.utcnow()))
+    await session.execute(
+        update(TI).where(TI.id == task_instance_id).values(last_heartbeat_at=timezone.utcnow())
+    )
     log.debug("Heartbeat updated", state=previous_state)
 
 
+@router.put("/heartbeats", status_code=status.HTTP_200_OK)
+async def ti_bulk_heartbeat(
+    payload: TIBulkHeartbeatBody,
+    session: AsyncSessionDep,
+    services=DepContainer,
+) -> TIBulkHeartbeatResponse:
+    """
+    Update the heartbeats of several TaskInstances at once, e.g. of all the ones running on a host.
+
+    Each heartbeat is authorized by the token of its TaskInstance, and gets the status code and detail
+    the single heartbeat endpoint would have responded with. The heartbeats of all the TaskInstances
+    still running on the given host and pid are updated with a single query.
+    """
+    validator: JWTValidator = services.get(JWTValidator)
+    generator: JWTGenerator = services.get(JWTGenerator)
+
+    results: list[TIBulkHeartbeatResult] = []
+    authorized: dict[UUID, tuple[TIBulkHeartbeatInfo, TIBulkHeartbeatResult]] = {}
+    for heartbeat in payload.heartbeats:
+        try:
+            claims = await validator.avalidated_claims(heartbeat.token)
+        except Exception:
+            claims = {}
+        result = TIBulkHeartbeatResult(status_code=status.HTTP_204_NO_CONTENT)
+        if claims.get("sub") != str(heartbeat.id) or claims.get("scope", "execution") != "execution":
+            log.warning("Invalid token in bulk heartbeat", ti_id=str(heartbeat.id))
+            result.status_code = status.HTTP_403_FORBIDDEN
+            result.detail = {"reason": "invalid_token", "message": "Invalid auth token"}
+        else:
+            authorized[heartbeat.id] = heartbeat, result
+            if token_needs_refresh(claims):
+                result.refreshed_token = generator.generate(claims)
+        results.append(result)
+
+    current = {
+        row.id: row
+        for row in await session.execute(
+            select(TI.id, TI.state, TI.hostname, TI.pid).where(TI.id.in_(authorized))
+        )
+    }
+    archived: set[UUID] = set()
+    if missing := authorized.keys() - current.keys():
+        archived.update(
+            await session.scalars(
+                select(TIH.task_instance_id).where(TIH.task_instance_id.in_(missing)).distinct()
+            )
+        )
+
+    alive = []
+    for ti_id, (heartbeat, result) in authorized.items():
+        if (row := current.get(ti_id)) is None:
+            if ti_id in archived:
+                result.status_code = status.HTTP_410_GONE
+                result.detail = {
+                    "reason": "not_found",
+                    "message": "Task Instance not found, it may have been moved to the Task Instance History table",
+                }
+            else:
+                result.status_code = status.HTTP_404_NOT_FOUND
+                result.detail = {"reason": "not_found", "message": "Task Instance not found"}
+        elif row.hostname != heartbeat.hostname or row.pid != heartbeat.pid:
+            result.status_code = status.HTTP_409_CONFLICT
+            result.detail = {
+                "reason": "running_elsewhere",
+                "message": "TI is already running elsewhere",
+                "current_hostname": row.hostname,
+                "current_pid": row.pid,
+            }
+        elif row.state != TaskInstanceState.RUNNING:
+            result.status_code = status.HTTP_409_CONFLICT
+            result.detail = {
+                "reason": "not_running",
+                "message": "TI is no longer in the running state and task should terminate",
+                "current_state": row.state,
+            }
+        else:
+            alive.append(ti_id)
+        if result.detail:
+            result.refreshed_token = None
+
+    if alive:
+        await session.execute(
+            update(TI)
+            .where(TI.id.in_(alive), TI.state == TaskInstanceState.RUNNING)
+            .values(last_heartbeat_at=timezone.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+    log.debug("Bulk heartbeat processed", heartbeats=len(results), updated=len(alive))
+    return TIBulkHeartbeatResponse(results=results)
+
+
 @ti_id_router.put(
     "/{task_instance_id}/rtif",
     status_code=status.HTTP_201_CREATED,
@@ -988,22 +1132,25 @@ def ti_heartbeat(
         ]
     ),
 )
-def ti_put_rtif(
+async def ti_put_rtif(
     task_instance_id: UUID,
     put_rtif_payload: Annotated[dict[str, JsonValue], Body()],
-    session: SessionDep,
+    session: AsyncSessionDep,
 ):
     """Add an RTIF entry for a task instance, sent by the worker."""
     bind_contextvars(ti_id=str(task_instance_id))
     log.info("Updating RenderedTaskInstanceFields", field_count=len(put_rtif_payload))
 
-    task_instance = session.scalar(select(TI).where(TI.id == task_instance_id))
+    task_instance = await session.scalar(select(TI).where(TI.id == task_instance_id))
     if not task_instance:
         log.error("Task Instance not found")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
         )
-    task_instance.update_rtif(put_rtif_payload, session=session)
+    # Writing the RTIF goes through the ORM, which may lazy-load attributes of the task instance
+    await session.run_sync(
+        lambda sync_session: task_instance.update_rtif(put_rtif_payload, session=sync_session)
+    )
     log.debug("RenderedTaskInstanceFields updated successfully")
 
     return {"message": "Rendered task instance fields successfully set"}
@@ -18,6 +18,8 @@
 from __future__ import annotations
 
 import logging
+from collections import defaultdict
+from operator import itemgetter
 from typing import Annotated
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Path, Query, Request, Response, status
@@ -25,9 +27,11 @@ from pydantic import JsonValue
 from sqlalchemy import delete
 from sqlalchemy.sql.selectable import Select
 
-from airflow.api_fastapi.common.db.common import SessionDep
+from airflow.api_fastapi.common.db.common import AsyncSessionDep, SessionDep
 from airflow.api_fastapi.core_api.base import BaseModel
 from airflow.api_fastapi.execution_api.datamodels.xcom import (
+    XComBatchBody,
+    XComBatchResponse,
     XComResponse,
     XComSequenceIndexResponse,
     XComSequenceSliceResponse,
@@ -35,7 +39,7 @@ from airflow.api_fastapi.execution_api.datamodels.xcom import (
 from airflow.api_fastapi.execution_api.security import CurrentTIToken
 from airflow.models.taskmap import TaskMap
 from airflow.models.xcom import XComModel
-from airflow.utils.db import get_query_count
+from airflow.utils.db import get_query_count_async
 
 
 async def has_xcom_access(
@@ -65,6 +69,18 @@ async def has_xcom_access(
     return True
 
 
+async def has_xcom_batch_access(body: XComBatchBody, token=CurrentTIToken) -> bool:
+    """Check if the task has read access to all the XComs of a batch."""
+    log.debug(
+        "Checking read XCom access for xcoms from TaskInstance %s with keys %s",
+        token.id,
+        sorted({query.key for query in body.queries}),
+    )
+
+    # As in has_xcom_access, access is always granted until multi-tenancy is supported.
+    return True
+
+
 router = APIRouter(
     responses={
         status.HTTP_401_UNAUTHORIZED: {"description": "Unauthorized"},
@@ -74,6 +90,15 @@ router = APIRouter(
     dependencies=[Depends(has_xcom_access)],
 )
 
+# Batch reads don't have the XCom in their path, so they can't share the access check of ``router``.
+batch_router = APIRouter(
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"description": "Unauthorized"},
+        status.HTTP_403_FORBIDDEN: {"description": "Task does not have access to the XComs"},
+    },
+    dependencies=[Depends(has_xcom_batch_access)],
+)
+
 log = logging.getLogger(__name__)
 
 
@@ -98,13 +123,13 @@ async def xcom_query(
     "/{dag_id}/{run_id}/{task_id}/{key:path}/item/{offset}",
     description="Get a single XCom value from a mapped task by sequence index",
 )
-def get_mapped_xcom_by_index(
+async def get_mapped_xcom_by_index(
     dag_id: str,
     run_id: str,
     task_id: str,
     key: Annotated[str, Path(min_length=1)],
     offset: int,
-    session: SessionDep,
+    session: AsyncSessionDep,
 ) -> XComSequenceIndexResponse:
     xcom_query = XComModel.get_many(
         run_id=run_id,
@@ -119,7 +144,7 @@ def get_mapped_xcom_by_index(
         xcom_query = xcom_query.order_by(XComModel.map_index.desc()).offset(-1 - offset)
 
     result: tuple[XComModel] | None
-    if (result := session.scalars(xcom_query).first()) is None:
+    if (result := (await session.scalars(xcom_query)).first()) is None:
         message = (
             f"XCom with {key=} {offset=} not found for task {task_id!r} in DAG run {run_id!r} of {dag_id!r}"
         )
@@ -143,13 +168,13 @@ class GetXComSliceFilterParams(BaseModel):
     "/{dag_id}/{run_id}/{task_id}/{key:path}/slice",
     description="Get XCom values from a mapped task by sequence slice",
 )
-def get_mapped_xcom_by_slice(
+async def get_mapped_xcom_by_slice(
     dag_id: str,
     run_id: str,
     task_id: str,
     key: Annotated[str, Path(min_length=1)],
     params: Annotated[GetXComSliceFilterParams, Query()],
-    session: SessionDep,
+    session: AsyncSessionDep,
 ) -> XComSequenceSliceResponse:
     query = XComModel.get_many(
         run_id=run_id,
@@ -194,7 +219,7 @@ def get_mapped_xcom_by_slice(
                 query = query.limit(start + 1)
         else:
             if stop < 0:
-                stop += get_query_count(query, session=session)
+                stop += await get_query_count_async(query, session=session)
             if step >= 0:
                 query = query.slice(start, stop)
             else:
@@ -209,13 +234,13 @@ def get_mapped_xcom_by_slice(
                 query = query.limit(-start)
         else:
             if stop >= 0:
-                stop -= get_query_count(query, session=session)
+                stop -= await get_query_count_async(query, session=session)
             if step > 0:
                 query = query.slice(-1 - start, -1 - stop)
             else:
                 query = query.slice(-stop, -start)
 
-    values = [row.value for row in session.execute(query.with_only_columns(XComModel.value)).all()]
+    values = [row.value for row in (await session.execute(query.with_only_columns(XComModel.value))).all()]
     if step != 1:
         values = values[::step]
     return XComSequenceSliceResponse(values)
@@ -236,9 +261,9 @@ def get_mapped_xcom_by_slice(
     },
     description="Returns the count of mapped XCom values found in the `Content-Range` response header",
 )
-def head_xcom(
+async def head_xcom(
     response: Response,
-    session: SessionDep,
+    session: AsyncSessionDep,
     xcom_query: Annotated[Select, Depends(xcom_query)],
     map_index: Annotated[int | None, Query()] = None,
 ) -> None:
@@ -249,7 +274,7 @@ def head_xcom(
             detail={"reason": "invalid_request", "message": "Cannot specify map_index in a HEAD request"},
         )
 
-    count = get_query_count(xcom_query, session=session)
+    count = await get_query_count_async(xcom_query, session=session)
     # Tell the caller how many items in this query. We define a custom range unit (HTTP spec only defines
     # "bytes" but we can add our own)
     response.headers["Content-Range"] = f"map_indexes {count}"
@@ -267,12 +292,12 @@ class GetXcomFilterParams(BaseModel):
     "/{dag_id}/{run_id}/{task_id}/{key:path}",
     description="Get a single XCom Value",
 )
-def get_xcom(
+async def get_xcom(
     dag_id: str,
     run_id: str,
     task_id: str,
     key: Annotated[str, Path(min_length=1)],
-    session: SessionDep,
+    session: AsyncSessionDep,
     params: Annotated[GetXcomFilterParams, Query()],
 ) -> XComResponse:
     """Get an Airflow XCom from database - not other XCom Backends."""
@@ -298,7 +323,7 @@ def get_xcom(
     # (which automatically deserializes using the backend), we avoid potential
     # performance hits from retrieving large data files into the API server.
     result: tuple[XComModel] | None
-    if (result := session.scalars(xcom_query).first()) is None:
+    if (result := (await session.scalars(xcom_query)).first()) is None:
         if params.offset is None:
             message = (
                 f"XCom with {key=} map_index={params.map_index} not found for "
@@ -317,6 +342,52 @@ def get_xcom(
     return XComResponse(key=key, value=(result[0] if isinstance(result, tuple) else result).value)
 
 
+@batch_router.post(
+    "/batch",
+    description="Get several XCom values in one request",
+)
+async def get_xcoms_batch(body: XComBatchBody, session: AsyncSessionDep) -> XComBatchResponse:
+    """
+    Get several Airflow XComs from database - not other XCom Backends.
+
+    Each query returns what ``GET /{dag_id}/{run_id}/{task_id}/{key}`` (for a map index) or
+    ``GET /{dag_id}/{run_id}/{task_id}/{key}/slice`` (for all map indexes) would, and queries of the same
+    DAG run and key are answered with a single database query.
+    """
+    groups: dict[tuple[str, str, str, bool], list[int]] = defaultdict(list)
+    for i, query in enumerate(body.queries):
+        groups[query.dag_id, query.run_id, query.key, query.include_prior_dates].append(i)
+
+    values: list[list[JsonValue]] = [[] for _ in body.queries]
+    for (dag_id, run_id, key, include_prior_dates), indexes in groups.items():
+        queries = [body.queries[i] for i in indexes]
+        map_indexes = (
+            None if any(query.map_index is None for query in queries) else {q.map_index for q in queries}
+        )
+        xcom_query = XComModel.get_many(
+            run_id=run_id,
+            key=key,
+            task_ids={query.task_id for query in queries},
+            dag_ids=dag_id,
+            map_indexes=map_indexes,
+            include_prior_dates=include_prior_dates,
+        ).with_only_columns(XComModel.task_id, XComModel.map_index, XComModel.value)
+
+        # Rows come latest first, so the first row of a map index is the one a single GET returns
+        latest: dict[tuple[str, int], JsonValue] = {}
+        by_task: dict[str, list[tuple[int, JsonValue]]] = defaultdict(list)
+        for task_id, map_index, value in await session.execute(xcom_query):
+            latest.setdefault((task_id, map_index), value)
+            by_task[task_id].append((map_index, value))
+
+        for i, query in zip(indexes, queries):
+            if query.map_index is None:
+                values[i] = [value for _, value in sorted(by_task[query.task_id], key=itemgetter(0))]
+            elif (query.task_id, query.map_index) in latest:
+                values[i] = [latest[query.task_id, query.map_index]]
+    return XComBatchResponse(values)
+
+
 # TODO: once we have JWT tokens, then remove dag_id/run_id/task_id from the URL and just use the info in
 # the token
 @router.post(
@@ -67,6 +67,7 @@ Why ``ExecutionAPIRoute`` is needed:
 # Disable future annotations in this file to work around https://github.com/fastapi/fastapi/issues/13056
 # ruff: noqa: I002
 
+import time
 from typing import Any, get_args
 
 import structlog
@@ -203,6 +204,14 @@ async def require_auth(
 CurrentTIToken: TIToken = Depends(require_auth)
 
 
+def token_needs_refresh(claims: dict[str, Any]) -> bool:
+    """Whether a token with these claims is in the last 20% of its lifetime, or its last 30 seconds."""
+    token_lifetime = int(claims.get("exp", 0)) - int(claims.get("iat", 0))
+    refresh_when_less_than = max(int(token_lifetime * 0.20), 30)
+    valid_left = int(claims.get("exp", 0)) - int(time.time())
+    return valid_left <= refresh_when_less_than
+
+
 class ExecutionAPIRoute(APIRoute):
     """
     Custom route class that precomputes allowed token types from Security scopes.
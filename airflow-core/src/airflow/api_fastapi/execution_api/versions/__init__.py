@@ -43,12 +43,14 @@ from airflow.api_fastapi.execution_api.versions.v2026_04_06 import (
 from airflow.api_fastapi.execution_api.versions.v2026_06_30 import (
     AddAssetsByAliasEndpoint,
     AddAwaitingInputStatePayload,
+    AddBulkHeartbeatEndpoint,
     AddConnectionTestEndpoint,
     AddRetryPolicyFields,
     AddTaskAndAssetStateStoreEndpoints,
     AddTaskInstanceQueueField,
     AddTeamNameField,
     AddVariableKeysEndpoint,
+    AddXComBatchEndpoint,
 )
 
 bundle = VersionBundle(
@@ -63,6 +65,8 @@ bundle = VersionBundle(
         AddTeamNameField,
         AddTaskAndAssetStateStoreEndpoints,
         AddAssetsByAliasEndpoint,
+        AddXComBatchEndpoint,
+        AddBulkHeartbeatEndpoint,
     ),
     Version(
         "2026-04-06",
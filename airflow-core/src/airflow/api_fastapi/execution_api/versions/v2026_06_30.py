@@ -42,6 +42,24 @@ class AddVariableKeysEndpoint(VersionChange):
     instructions_to_migrate_to_previous_version = (endpoint("/variables/keys", ["GET"]).didnt_exist,)
 
 
+class AddXComBatchEndpoint(VersionChange):
+    """Add POST /xcoms/batch endpoint for reading several XComs in one request."""
+
+    description = __doc__
+
+    instructions_to_migrate_to_previous_version = (endpoint("/xcoms/batch", ["POST"]).didnt_exist,)
+
+
+class AddBulkHeartbeatEndpoint(VersionChange):
+    """Add PUT /task-instances/heartbeats endpoint for the heartbeats of several task instances."""
+
+    description = __doc__
+
+    instructions_to_migrate_to_previous_version = (
+        endpoint("/task-instances/heartbeats", ["PUT"]).didnt_exist,
+    )
+
+
 class AddConnectionTestEndpoint(VersionChange):
     """Add connection-tests endpoints for the async connection-test workflow."""
 
@@ -55,6 +55,7 @@ from airflow.models.dagwarning import DagWarningType
 from airflow.models.errors import ParseImportError
 from airflow.models.serialized_dag import SerializedDagModel
 from airflow.models.trigger import Trigger
+from airflow.serialization.dag_hash import DagHashTree, hash_dag_tree
 from airflow.serialization.definitions.assets import (
     SerializedAsset,
     SerializedAssetAlias,
@@ -63,7 +64,11 @@ from airflow.serialization.definitions.assets import (
 )
 from airflow.serialization.definitions.dag import SerializedDAG
 from airflow.serialization.enums import Encoding
-from airflow.serialization.serialized_objects import BaseSerialization, LazyDeserializedDAG
+from airflow.serialization.serialized_objects import (
+    BaseSerialization,
+    DagSerialization,
+    LazyDeserializedDAG,
+)
 from airflow.triggers.base import BaseEventTrigger
 from airflow.utils.retries import MAX_DB_RETRIES, run_with_db_retries
 from airflow.utils.sqlalchemy import get_dialect_name, with_row_locks
@@ -270,6 +275,7 @@ def _serialize_dag_capturing_errors(
     bundle_version: str | None,
     version_data: dict | None = None,
     _prefetched: DagWriteMetadata | None = None,
+    _hash_tree: DagHashTree | None = None,
 ):
     """
     Try to serialize the dag to the DB, but make a note of any errors.
@@ -293,6 +299,7 @@ def _serialize_dag_capturing_errors(
             min_update_interval=MIN_SERIALIZED_DAG_UPDATE_INTERVAL,
             session=session,
             _prefetched=_prefetched,
+            _hash_tree=_hash_tree,
         )
         if not dag_was_updated:
             # Check and update DagCode
@@ -314,6 +321,46 @@ def _serialize_dag_capturing_errors(
         ]
 
 
+def _validate_changed_dags(
+    dags: Collection[LazyDeserializedDAG],
+    bundle_name: str,
+    prefetched_metadata: dict[str, DagWriteMetadata],
+    hash_trees: dict[str, DagHashTree],
+) -> tuple[list[LazyDeserializedDAG], list[tuple[tuple[str, str], str]]]:
+    """
+    Validate the serialized Dags that changed since they were last written.
+
+    The Dag processor does not validate serialized Dags when
+    ``[dag_processor] validate_serialized_dags_on_change`` is enabled, so this has to happen before
+    anything is written for them. Invalid Dags are left out and reported as import errors.
+
+    :param hash_trees: Filled with the hash trees of the Dags, by Dag ID, so they are not hashed again
+    :returns: The valid Dags, and the import errors of the invalid ones
+    """
+    valid_dags = []
+    validation_errors = []
+    for dag in dags:
+        metadata = prefetched_metadata.get(dag.dag_id)
+        hash_trees[dag.dag_id] = hash_tree = hash_dag_tree(dag.data)
+        if metadata is not None and metadata.dag_hash == hash_tree.dag_hash:
+            valid_dags.append(dag)
+            continue
+        try:
+            DagSerialization.validate_schema(dag.data)
+        except Exception:
+            log.exception("Invalid serialized DAG dag_id=%s fileloc=%s", dag.dag_id, dag.fileloc)
+            dagbag_import_error_traceback_depth = conf.getint("core", "dagbag_import_error_traceback_depth")
+            validation_errors.append(
+                (
+                    (bundle_name, dag.relative_fileloc),
+                    traceback.format_exc(limit=-dagbag_import_error_traceback_depth),
+                )
+            )
+        else:
+            valid_dags.append(dag)
+    return valid_dags, validation_errors
+
+
 def _sync_dag_perms(dag: LazyDeserializedDAG, session: Session):
     """Sync DAG specific permissions."""
     dag_id = dag.dag_id
@@ -485,9 +532,6 @@ def update_dag_parsing_results_in_db(
             )
             log.debug("Calling the DAG.bulk_sync_to_db method")
             try:
-                SerializedDAG.bulk_write_to_db(
-                    bundle_name, bundle_version, dags, parse_duration, session=session
-                )
                 # Bulk prefetch metadata for all DAGs to avoid the standard per-DAG
                 # metadata lookups in write_dag. This replaces the update-interval,
                 # hash, and version queries with 2 bulk queries total; DAGs with
@@ -495,8 +539,18 @@ def update_dag_parsing_results_in_db(
                 prefetched_metadata = SerializedDagModel._prefetch_dag_write_metadata(
                     [dag.dag_id for dag in dags], session=session
                 )
+                dags_to_write: Collection[LazyDeserializedDAG] = dags
+                hash_trees: dict[str, DagHashTree] = {}
+                if conf.getboolean("dag_processor", "validate_serialized_dags_on_change"):
+                    dags_to_write, validation_errors = _validate_changed_dags(
+                        dags, bundle_name, prefetched_metadata, hash_trees
+                    )
+                    serialize_errors.extend(validation_errors)
+                SerializedDAG.bulk_write_to_db(
+                    bundle_name, bundle_version, dags_to_write, parse_duration, session=session
+                )
                 # Write Serialized DAGs to DB, capturing errors
-                for dag in dags:
+                for dag in dags_to_write:
                     serialize_errors.extend(
                         _serialize_dag_capturing_errors(
                             dag=dag,
@@ -505,6 +559,7 @@ def update_dag_parsing_results_in_db(
                             version_data=version_data,
                             session=session,
                             _prefetched=prefetched_metadata.get(dag.dag_id),
+                            _hash_tree=hash_trees.get(dag.dag_id),
                         )
                     )
             except OperationalError:
@@ -0,0 +1,130 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import logging
+import os
+import stat
+import zipfile
+from pathlib import Path
+from typing import NamedTuple
+
+from airflow.configuration import conf
+from airflow.utils.file import list_py_file_paths, might_contain_dag
+
+log = logging.getLogger(__name__)
+
+
+def find_zipped_dags(abs_path: str | os.PathLike[str]) -> list[str] | None:
+    """Return the absolute paths of the DAG-like files inside a ZIP archive, or None if not an archive."""
+    if not zipfile.is_zipfile(abs_path):
+        return None
+    try:
+        with zipfile.ZipFile(abs_path) as z:
+            return [
+                os.path.join(abs_path, info.filename)
+                for info in z.infolist()
+                if might_contain_dag(info.filename, True, z)
+            ]
+    except zipfile.BadZipFile:
+        log.exception("There was an error accessing ZIP file %s", abs_path)
+        return []
+
+
+def _is_dag_file(file_path: str, safe_mode: bool) -> bool:
+    try:
+        return (
+            os.path.splitext(file_path)[1] == ".py" or zipfile.is_zipfile(file_path)
+        ) and might_contain_dag(file_path, safe_mode)
+    except Exception:
+        log.exception("Error while examining %s", file_path)
+        return False
+
+
+class _IndexedFile(NamedTuple):
+    mtime_ns: int
+    size: int
+    is_dag_file: bool
+    zipped_dags: list[str] | None = None
+    """DAG-like files of a ZIP archive, once inspected."""
+
+
+class DagFileIndex:
+    """
+    Index of the files of a bundle, to only inspect the files changed since the previous scan.
+
+    Finding the DAG files of a bundle reads every file with ``[core] dag_discovery_safe_mode``, and every
+    ZIP archive to list the DAG files inside. The index keeps the outcome of these inspections along with
+    the modification time and size of each file, and only inspects again the files for which they changed.
+    The tree is still walked on each scan, following ``.airflowignore`` files.
+
+    :param bundle_path: Path of the bundle. Use a new index when it changes, e.g. for a new version.
+    """
+
+    def __init__(self, bundle_path: Path) -> None:
+        self.bundle_path = bundle_path
+        self._files: dict[str, _IndexedFile] = {}
+        self.last_changed = 0
+        """Number of files added or modified since the previous scan."""
+
+    def find_dag_files(
+        self,
+        safe_mode: bool = conf.getboolean("core", "DAG_DISCOVERY_SAFE_MODE", fallback=True),
+    ) -> list[str]:
+        """Return the paths of the DAG files of the bundle, like ``list_py_file_paths``."""
+        from airflow._shared.module_loading.file_discovery import find_path_from_directory
+
+        if not os.path.isdir(self.bundle_path):
+            self.last_changed = 0
+            return list_py_file_paths(self.bundle_path, safe_mode)
+
+        ignore_file_syntax = conf.get_mandatory_value("core", "DAG_IGNORE_FILE_SYNTAX", fallback="glob")
+        files: dict[str, _IndexedFile] = {}
+        changed = 0
+        for file_path in find_path_from_directory(self.bundle_path, ".airflowignore", ignore_file_syntax):
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                continue
+            if not stat.S_ISREG(st.st_mode):
+                continue
+            indexed = self._files.get(file_path)
+            if indexed is None or (indexed.mtime_ns, indexed.size) != (st.st_mtime_ns, st.st_size):
+                indexed = _IndexedFile(st.st_mtime_ns, st.st_size, _is_dag_file(file_path, safe_mode))
+                changed += 1
+            files[file_path] = indexed
+
+        self._files = files
+        self.last_changed = changed
+        return [file_path for file_path, indexed in files.items() if indexed.is_dag_file]
+
+    def find_zipped_dags(self, abs_path: str | os.PathLike[str]) -> list[str] | None:
+        """Like :func:`find_zipped_dags`, inspecting the archive again only if it changed."""
+        indexed = self._files.get(os.fspath(abs_path))
+        if indexed is None:
+            return find_zipped_dags(abs_path)
+        if indexed.zipped_dags is None:
+            try:
+                st = os.stat(abs_path)
+            except OSError:
+                return find_zipped_dags(abs_path)
+            zipped_dags = find_zipped_dags(abs_path)
+            if zipped_dags is None or (indexed.mtime_ns, indexed.size) != (st.st_mtime_ns, st.st_size):
+                return zipped_dags
+            indexed = self._files[os.fspath(abs_path)] = indexed._replace(zipped_dags=zipped_dags)
+        return indexed.zipped_dags
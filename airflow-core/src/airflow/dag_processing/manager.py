@@ -29,15 +29,15 @@ import selectors
 import signal
 import sys
 import time
-import zipfile
 from collections import OrderedDict, defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Literal, NamedTuple, cast
+from typing import TYPE_CHECKING, Any, BinaryIO, Literal, NamedTuple, cast
 
 import attrs
+import psutil
 import structlog
 from sqlalchemy import select, update
 from sqlalchemy.exc import OperationalError
@@ -55,6 +55,7 @@ from airflow.dag_processing.bundles.base import (
 )
 from airflow.dag_processing.bundles.manager import DagBundlesManager
 from airflow.dag_processing.collection import update_dag_parsing_results_in_db
+from airflow.dag_processing.file_index import DagFileIndex, find_zipped_dags
 from airflow.dag_processing.processor import DagFileParsingResult, DagFileProcessorProcess
 from airflow.exceptions import AirflowException
 from airflow.models.asset import remove_references_to_deleted_dags
@@ -68,7 +69,7 @@ from airflow.observability.metrics import stats_utils
 from airflow.sdk import SecretCache
 from airflow.sdk.log import init_log_file, logging_processors
 from airflow.typing_compat import assert_never
-from airflow.utils.file import list_py_file_paths, might_contain_dag
+from airflow.utils.file import list_py_file_paths
 from airflow.utils.helpers import prune_dict
 from airflow.utils.log.logging_mixin import LoggingMixin
 from airflow.utils.net import get_hostname
@@ -97,6 +98,37 @@ if TYPE_CHECKING:
     from airflow.sdk.api.client import Client
 
 
+class _SwitchableLogFile:
+    """
+    Log file handle of a parsing process that is reused for several DAG files.
+
+    The process' loggers are bound to this object once, when the process starts; it forwards
+    writes to the log file of the DAG file currently being parsed.
+    """
+
+    def __init__(self, file: BinaryIO):
+        self._file: BinaryIO | None = file
+
+    def switch_to(self, file: BinaryIO) -> None:
+        self.close()
+        self._file = file
+
+    def write(self, data: bytes) -> int:
+        # Output received between two files (e.g. while the process exits) has nowhere to go.
+        if self._file is None:
+            return 0
+        return self._file.write(data)
+
+    def flush(self) -> None:
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
 def _make_execution_api() -> InProcessExecutionAPI:
     # This is a seriously weighty import, pulling in svcs, cadwyn, fastapi, aiohttp, etc.
     #
@@ -269,6 +301,20 @@ class DagFileProcessorManager(LoggingMixin):
 
     _processors: dict[DagFileInfo, DagFileProcessorProcess] = attrs.field(factory=dict, init=False)
 
+    _process_max_files: int = attrs.field(
+        factory=_config_int_factory("dag_processor", "parsing_process_max_files")
+    )
+    """How many files a parsing process handles before it is replaced; 1 starts a process per file."""
+    _process_max_rss_mb: int = attrs.field(
+        factory=_config_int_factory("dag_processor", "parsing_process_max_rss_mb")
+    )
+    _idle_processors: list[tuple[tuple[str, Path | None], DagFileProcessorProcess]] = attrs.field(
+        factory=list, init=False
+    )
+    """Kept-alive processes waiting for another file of their bundle, least recently used first."""
+    _retiring_processors: list[DagFileProcessorProcess] = attrs.field(factory=list, init=False)
+    """Kept-alive processes that were asked to exit, kept until they have been reaped."""
+
     _parsing_start_time: float | None = attrs.field(default=None, init=False)
     _num_run: int = attrs.field(default=0, init=False)
 
@@ -297,15 +343,35 @@ class DagFileProcessorManager(LoggingMixin):
         factory=_config_get_factory("dag_processor", "file_parsing_sort_mode")
     )
 
+    _incremental_file_discovery: bool = attrs.field(
+        factory=_config_bool_factory("dag_processor", "incremental_file_discovery")
+    )
+    _file_indexes: dict[str, DagFileIndex] = attrs.field(factory=dict, init=False)
+    """Files of each bundle found by the previous refresh, see ``[dag_processor] incremental_file_discovery``"""
+
     _api_server: InProcessExecutionAPI = attrs.field(init=False, factory=_make_execution_api)
     """API server to interact with Metadata DB"""
 
+    _signals_pid: int | None = attrs.field(default=None, init=False)
+    """PID of the process the signal handlers were registered in, which the parsing processes inherit"""
+
     def register_exit_signals(self):
         """Register signals that stop child processes."""
+        self._signals_pid = os.getpid()
         signal.signal(signal.SIGINT, self._exit_gracefully)
         signal.signal(signal.SIGTERM, self._exit_gracefully)
         # So that we ignore the debug dump signal, making it easier to send
         signal.signal(signal.SIGUSR2, signal.SIG_IGN)
+        if conf.getboolean("core", "config_snapshot", fallback=False):
+            signal.signal(signal.SIGHUP, self._reload_config)
+
+    def _reload_config(self, signum, frame):
+        """Resolve the configuration values again, see ``[core] config_snapshot``."""
+        if os.getpid() != self._signals_pid:
+            # Only the manager reloads its configuration, not the parsing processes forked from it
+            return
+        self.log.info("Reloading the configuration upon receiving signal %s", signum)
+        conf.reload_snapshot()
 
     def _exit_gracefully(self, signum, frame):
         """Clean up DAG file processors to avoid leaving orphan processes."""
@@ -333,7 +399,8 @@ class DagFileProcessorManager(LoggingMixin):
         """
         self.before_run()
         try:
-            return self._run_parsing_loop()
+            with conf.snapshot(enabled=conf.getboolean("core", "config_snapshot", fallback=False)):
+                return self._run_parsing_loop()
         finally:
             self.after_run()
 
@@ -899,9 +966,21 @@ class DagFileProcessorManager(LoggingMixin):
         """Get relative paths for dag files from bundle dir."""
         # Build up a list of Python files that could contain DAGs
         self.log.info("Searching for files in %s at %s", bundle.name, bundle.path)
-        rel_paths = [Path(x).relative_to(bundle.path) for x in list_py_file_paths(bundle.path)]
-        self.log.info("Found %s files for bundle %s", len(rel_paths), bundle.name)
-
+        if not self._incremental_file_discovery:
+            rel_paths = [Path(x).relative_to(bundle.path) for x in list_py_file_paths(bundle.path)]
+            self.log.info("Found %s files for bundle %s", len(rel_paths), bundle.name)
+            return rel_paths
+
+        index = self._file_indexes.get(bundle.name)
+        if index is None or index.bundle_path != bundle.path:
+            index = self._file_indexes[bundle.name] = DagFileIndex(bundle.path)
+        rel_paths = [Path(x).relative_to(bundle.path) for x in index.find_dag_files()]
+        self.log.info(
+            "Found %s files for bundle %s, %s files changed since the previous search",
+            len(rel_paths),
+            bundle.name,
+            index.last_changed,
+        )
         return rel_paths
 
     def _get_observed_filelocs(self, present: set[DagFileInfo]) -> set[str]:
@@ -912,26 +991,20 @@ class DagFileProcessorManager(LoggingMixin):
         For ZIP archives this includes DAG-like inner paths such as
         ``archive.zip/dag.py``.
         """
-
-        def find_zipped_dags(abs_path: os.PathLike) -> Iterator[str]:
-            """Yield absolute paths for DAG-like files inside a ZIP archive."""
-            try:
-                with zipfile.ZipFile(abs_path) as z:
-                    for info in z.infolist():
-                        if might_contain_dag(info.filename, True, z):
-                            yield os.path.join(abs_path, info.filename)
-            except zipfile.BadZipFile:
-                self.log.exception("There was an error accessing ZIP file %s", abs_path)
-
         observed_filelocs: set[str] = set()
         for info in present:
             abs_path = str(info.absolute_path)
-            if abs_path.endswith(".py") or not zipfile.is_zipfile(abs_path):
+            if abs_path.endswith(".py"):
+                observed_filelocs.add(str(info.rel_path))
+                continue
+            index = self._file_indexes.get(info.bundle_name)
+            zipped_dags = index.find_zipped_dags(abs_path) if index else find_zipped_dags(abs_path)
+            if zipped_dags is None:
                 observed_filelocs.add(str(info.rel_path))
             else:
                 if TYPE_CHECKING:
                     assert info.bundle_path
-                for abs_sub_path in find_zipped_dags(abs_path=info.absolute_path):
+                for abs_sub_path in zipped_dags:
                     rel_sub_path = Path(abs_sub_path).relative_to(info.bundle_path)
                     observed_filelocs.add(str(rel_sub_path))
 
@@ -1314,6 +1387,74 @@ class DagFileProcessorManager(LoggingMixin):
         for file in finished:
             processor = self._processors.pop(file)
             processor.logger_filehandle.close()
+            if processor.keep_alive:
+                self._release_process(file, processor)
+
+        self._reap_retiring_processes()
+
+    def _release_process(self, file: DagFileInfo, processor: DagFileProcessorProcess) -> None:
+        """Keep a kept-alive process that finished a file for the next file of its bundle, or retire it."""
+        if not processor.is_idle:
+            # It exited (or crashed) instead of waiting for more work
+            return
+        if processor.num_requests >= self._process_max_files:
+            self._retire_process(processor)
+            return
+        if self._process_max_rss_mb > 0:
+            try:
+                rss_mb = psutil.Process(processor.pid).memory_info().rss / 1024 / 1024
+            except psutil.Error:
+                rss_mb = 0
+            if rss_mb > self._process_max_rss_mb:
+                self.log.info(
+                    "Replacing DAG parsing process %s using %.0f MB, above the limit of %d MB",
+                    processor.pid,
+                    rss_mb,
+                    self._process_max_rss_mb,
+                )
+                self._retire_process(processor)
+                return
+        self._idle_processors.append(((file.bundle_name, file.bundle_path), processor))
+
+    def _retire_process(self, processor: DagFileProcessorProcess) -> None:
+        processor.stop_accepting_requests()
+        self._retiring_processors.append(processor)
+
+    def _reap_retiring_processes(self) -> None:
+        """Forget retired processes once they have exited and all their output has been read."""
+        still_running = []
+        for processor in self._retiring_processors:
+            if processor.is_ready:
+                processor.logger_filehandle.close()
+            else:
+                still_running.append(processor)
+        self._retiring_processors = still_running
+
+    def _pop_idle_process(self, dag_file: DagFileInfo) -> DagFileProcessorProcess | None:
+        """Return the most recently used idle process that can parse files of this file's bundle."""
+        key = (dag_file.bundle_name, dag_file.bundle_path)
+        for i in reversed(range(len(self._idle_processors))):
+            process_key, processor = self._idle_processors[i]
+            if process_key != key:
+                continue
+            del self._idle_processors[i]
+            if processor.is_idle:
+                return processor
+            # It died while waiting; make sure its remaining output is read and it gets reaped.
+            self._retiring_processors.append(processor)
+        return None
+
+    def _has_room_for_new_process(self) -> bool:
+        # Retiring processes count too: they hold their slot until they have exited.
+        num_processes = len(self._processors) + len(self._idle_processors) + len(self._retiring_processors)
+        if self._parallelism > num_processes:
+            return True
+        if self._idle_processors and not self._retiring_processors:
+            # Retire the least recently used idle process, which was kept for files of another bundle.
+            # Its slot is free once it has been reaped.
+            _, processor = self._idle_processors.pop(0)
+            self._retire_process(processor)
+        return False
 
     def _get_log_dir(self) -> str:
         return os.path.join(self.base_log_dir, timezone.utcnow().strftime("%Y-%m-%d"))
@@ -1353,10 +1494,16 @@ class DagFileProcessorManager(LoggingMixin):
         relative_path = Path(dag_file.rel_path)
         return os.path.join(self._get_log_dir(), bundle.name, f"{relative_path}.log")
 
-    def _get_logger_for_dag_file(self, dag_file: DagFileInfo):
+    def _open_log_file(self, dag_file: DagFileInfo) -> BinaryIO:
         log_filename = self._render_log_filename(dag_file)
         log_file = init_log_file(log_filename)
-        logger_filehandle = log_file.open("ab")
+        return log_file.open("ab")
+
+    def _get_logger_for_dag_file(self, dag_file: DagFileInfo):
+        logger_filehandle: BinaryIO = self._open_log_file(dag_file)
+        if self._process_max_files > 1:
+            # The process may be reused for other files, which log to their own file.
+            logger_filehandle = cast("BinaryIO", _SwitchableLogFile(logger_filehandle))
         underlying_logger = structlog.BytesLogger(logger_filehandle)
         processors = logging_processors(json_output=True)
         return structlog.wrap_logger(
@@ -1390,7 +1537,21 @@ class DagFileProcessorManager(LoggingMixin):
             logger_filehandle=logger_filehandle,
             subprocess_logs_to_stdout=conf.get("logging", "dag_processor_log_target") == "stdout",
             client=self.client,
+            keep_alive=self._process_max_files > 1,
+        )
+
+    def _reuse_process(
+        self, processor: DagFileProcessorProcess, dag_file: DagFileInfo
+    ) -> DagFileProcessorProcess:
+        cast("_SwitchableLogFile", processor.logger_filehandle).switch_to(self._open_log_file(dag_file))
+        processor.parse_next(
+            path=dag_file.absolute_path,
+            bundle_path=cast("Path", dag_file.bundle_path),
+            bundle_name=dag_file.bundle_name,
+            dag_file_rel_path=str(dag_file.rel_path),
+            callbacks=self._callback_to_execute.pop(dag_file, []),
         )
+        return processor
 
     def _start_new_processes(self):
         """Start more processors if we have enough slots and files to process."""
@@ -1402,13 +1563,20 @@ class DagFileProcessorManager(LoggingMixin):
         else:
             bundle_to_team = {}
 
-        while self._parallelism > len(self._processors) and self._file_queue:
-            file, _ = self._file_queue.popitem(last=False)
+        while self._file_queue:
+            file = next(iter(self._file_queue))
+            idle_processor = None if file in self._processors else self._pop_idle_process(file)
+            if idle_processor is None and not self._has_room_for_new_process():
+                break
+            self._file_queue.popitem(last=False)
             # Stop creating duplicate processor i.e. processor with the same filepath
             if file in self._processors:
                 continue
 
-            processor = self._create_process(file)
+            if idle_processor is not None:
+                processor = self._reuse_process(idle_processor, file)
+            else:
+                processor = self._create_process(file)
             stats.incr(
                 "dag_processing.processes",
                 tags=prune_dict(
@@ -1696,9 +1864,18 @@ class DagFileProcessorManager(LoggingMixin):
             # SIGTERM, wait 5s, SIGKILL if still alive
             processor.kill(signal.SIGTERM, escalation_delay=5.0)
 
+        for processor in self._iter_pooled_processes():
+            processor.kill(signal.SIGTERM, escalation_delay=5.0)
+
+    def _iter_pooled_processes(self) -> Iterator[DagFileProcessorProcess]:
+        """Kept-alive processes that are not currently parsing a file."""
+        yield from (processor for _, processor in self._idle_processors)
+        yield from self._retiring_processors
+
     def end(self):
         """Kill all child processes on exit since we don't want to leave them as orphaned."""
         pids_to_kill = [p.pid for p in self._processors.values()]
+        pids_to_kill.extend(p.pid for p in self._iter_pooled_processes())
         if pids_to_kill:
             kill_child_processes_by_pids(pids_to_kill)
 
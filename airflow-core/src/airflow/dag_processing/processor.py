@@ -20,9 +20,12 @@ import contextlib
 import importlib
 import logging
 import os
+import sys
+import time
 import traceback
 from collections.abc import Callable, Sequence
 from pathlib import Path
+from socket import SHUT_WR
 from typing import TYPE_CHECKING, Annotated, BinaryIO, ClassVar, Literal
 
 import attrs
@@ -53,6 +56,7 @@ from airflow.sdk.execution_time.comms import (
     GetVariable,
     GetVariableKeys,
     GetXCom,
+    GetXComBatch,
     GetXComCount,
     GetXComSequenceItem,
     GetXComSequenceSlice,
@@ -65,6 +69,7 @@ from airflow.sdk.execution_time.comms import (
     TaskStatesResult,
     VariableKeysResult,
     VariableResult,
+    XComBatchResult,
     XComCountResponse,
     XComResult,
     XComSequenceIndexResult,
@@ -79,6 +84,7 @@ from airflow.sdk.execution_time.request_handlers import (
     handle_get_ti_count,
     handle_get_variable_keys,
     handle_get_xcom,
+    handle_get_xcom_batch,
     handle_get_xcom_count,
     handle_get_xcom_sequence_item,
     handle_get_xcom_sequence_slice,
@@ -125,6 +131,10 @@ class DagFileParseRequest(BaseModel):
     """Bundle name for team-specific executor validation."""
 
     callback_requests: list[CallbackRequest] = Field(default_factory=list)
+
+    keep_alive: bool = False
+    """Whether the parsing process should wait for another request once this one is done."""
+
     type: Literal["DagFileParseRequest"] = "DagFileParseRequest"
 
 
@@ -143,8 +153,20 @@ class DagFileParsingResult(BaseModel):
     type: Literal["DagFileParsingResult"] = "DagFileParsingResult"
 
 
+class DagFileCallbacksCompleted(BaseModel):
+    """
+    Sent by a kept-alive parsing process once it has executed the callbacks of a request.
+
+    Parsing requests are answered with a :class:`DagFileParsingResult`; callback-only requests
+    have no result, so this tells the manager the process is ready for its next request.
+    """
+
+    type: Literal["DagFileCallbacksCompleted"] = "DagFileCallbacksCompleted"
+
+
 ToManager = Annotated[
     DagFileParsingResult
+    | DagFileCallbacksCompleted
     | GetConnection
     | GetVariable
     | GetVariableKeys
@@ -156,6 +178,7 @@ ToManager = Annotated[
     | GetPreviousDagRun
     | GetPreviousTI
     | GetXCom
+    | GetXComBatch
     | GetXComCount
     | GetXComSequenceItem
     | GetXComSequenceSlice
@@ -174,6 +197,7 @@ ToDagProcessor = Annotated[
     | PrevSuccessfulDagRunResult
     | ErrorResponse
     | OKResponse
+    | XComBatchResult
     | XComCountResponse
     | XComResult
     | XComSequenceIndexResult
@@ -217,17 +241,45 @@ def _parse_file_entrypoint():
         body_decoder=TypeAdapter[ToDagProcessor](ToDagProcessor),
     )
 
-    msg = comms_decoder._get_response()
+    msg = comms_decoder.receive()
     if not isinstance(msg, DagFileParseRequest):
         raise RuntimeError(f"Required first message to be a DagFileParseRequest, it was {msg}")
 
     task_runner.SUPERVISOR_COMMS = comms_decoder
     log = structlog.get_logger(logger_name="task")
 
-    result = _parse_file(msg, log)
+    while True:
+        result = _parse_file(msg, log)
+
+        if result is not None:
+            comms_decoder.send(result)
 
-    if result is not None:
-        comms_decoder.send(result)
+        if not msg.keep_alive:
+            return
+        if result is None:
+            comms_decoder.send(DagFileCallbacksCompleted())
+
+        # Wait for the next file. The manager shuts down its end of the socket when it wants us to exit.
+        try:
+            msg = comms_decoder.receive()
+        except EOFError:
+            return
+        if not isinstance(msg, DagFileParseRequest):
+            raise RuntimeError(f"Expected a DagFileParseRequest, it was {msg}")
+        _unload_bundle_modules(msg.bundle_path)
+
+
+def _unload_bundle_modules(bundle_path: Path) -> None:
+    """
+    Forget modules previously imported from the bundle.
+
+    A kept-alive parsing process would otherwise keep using stale copies of helper modules
+    that DAG files import from their bundle, while a fresh process would pick up changes.
+    """
+    prefix = os.path.join(os.fspath(bundle_path), "")
+    for name, module in list(sys.modules.items()):
+        if (getattr(module, "__file__", None) or "").startswith(prefix):
+            del sys.modules[name]
 
 
 def _parse_file(msg: DagFileParseRequest, log: FilteringBoundLogger) -> DagFileParsingResult | None:
@@ -272,9 +324,11 @@ def _serialize_dags(
 ) -> tuple[list[LazyDeserializedDAG], dict[str, str]]:
     serialization_import_errors = {}
     serialized_dags = []
+    # When only validating changed Dags, SerializedDagModel.write_dag validates them
+    validate = not conf.getboolean("dag_processor", "validate_serialized_dags_on_change")
     for dag in bag.dags.values():
         try:
-            data = DagSerialization.to_dict(dag)
+            data = DagSerialization.to_dict(dag, validate=validate)
             serialized_dags.append(LazyDeserializedDAG(data=data, last_loaded=dag.last_loaded))
         except Exception:
             log.exception("Failed to serialize DAG: %s", dag.fileloc)
@@ -571,6 +625,19 @@ class DagFileProcessorProcess(WatchedSubprocess):
     bundle_name: str
     dag_file_rel_path: str
 
+    keep_alive: bool = False
+    """
+    Keep the process alive after it finishes a file, so it can be handed another one with :meth:`parse_next`.
+
+    Kept-alive processes skip the per-file process start-up cost, and keep third-party modules imported
+    by earlier DAG files warm.
+    """
+
+    num_requests: int = 1
+    """Number of files this process has been asked to parse (or run callbacks for)."""
+
+    _request_completed: bool = attrs.field(default=False, init=False)
+
     @classmethod
     def start(  # type: ignore[override]
         cls,
@@ -599,6 +666,33 @@ class DagFileProcessorProcess(WatchedSubprocess):
         proc._on_child_started(callbacks, path, bundle_path, bundle_name)
         return proc
 
+    def parse_next(
+        self,
+        *,
+        path: str | os.PathLike[str],
+        bundle_path: Path,
+        bundle_name: str,
+        dag_file_rel_path: str,
+        callbacks: list[CallbackRequest],
+    ) -> None:
+        """Hand another file to a kept-alive process that has completed its previous request."""
+        if not self.keep_alive or not self._request_completed:
+            raise RuntimeError("Can only hand a new file to an idle, kept-alive parsing process")
+        self.parsing_result = None
+        self._request_completed = False
+        self.had_callbacks = bool(callbacks)
+        self.bundle_name = bundle_name
+        self.dag_file_rel_path = dag_file_rel_path
+        self.start_time = time.monotonic()
+        self.num_requests += 1
+        self._on_child_started(callbacks, path, bundle_path, bundle_name)
+
+    def stop_accepting_requests(self) -> None:
+        """Ask an idle, kept-alive process to exit, by shutting down our end of the request socket."""
+        self._request_completed = False
+        with contextlib.suppress(OSError):
+            self.stdin.shutdown(SHUT_WR)
+
     def _on_child_started(
         self,
         callbacks: list[CallbackRequest],
@@ -611,6 +705,7 @@ class DagFileProcessorProcess(WatchedSubprocess):
             bundle_path=bundle_path,
             bundle_name=bundle_name,
             callback_requests=callbacks,
+            keep_alive=self.keep_alive,
         )
         self.send_msg(msg, request_id=0)
 
@@ -618,6 +713,9 @@ class DagFileProcessorProcess(WatchedSubprocess):
         base = super()._get_target_loggers()
         if not self.subprocess_logs_to_stdout:
             return base
+        if self.keep_alive:
+            # The loggers outlive the file being parsed, so only bind what stays the same.
+            return tuple(logger.bind(bundle_name=self.bundle_name) for logger in base)
         return tuple(
             logger.bind(dag_file=self.dag_file_rel_path, bundle_name=self.bundle_name) for logger in base
         )
@@ -647,6 +745,9 @@ class DagFileProcessorProcess(WatchedSubprocess):
         dump_opts: dict[str, bool] = {}
         if isinstance(msg, DagFileParsingResult):
             self.parsing_result = msg
+            self._request_completed = True
+        elif isinstance(msg, DagFileCallbacksCompleted):
+            self._request_completed = True
         elif isinstance(msg, GetConnection):
             conn = self.client.connections.get(msg.conn_id)
             if isinstance(conn, ConnectionResponse):
@@ -681,6 +782,8 @@ class DagFileProcessorProcess(WatchedSubprocess):
             resp, dump_opts = handle_get_prev_successful_dag_run(self.client, self.id)
         elif isinstance(msg, GetXCom):
             resp, dump_opts = handle_get_xcom(self.client, msg)
+        elif isinstance(msg, GetXComBatch):
+            resp, dump_opts = handle_get_xcom_batch(self.client, msg)
         elif isinstance(msg, GetXComCount):
             resp, dump_opts = handle_get_xcom_count(self.client, msg)
         elif isinstance(msg, GetXComSequenceItem):
@@ -708,8 +811,15 @@ class DagFileProcessorProcess(WatchedSubprocess):
 
         self.send_msg(resp, request_id=req_id, error=None, **dump_opts)
 
+    @property
+    def is_idle(self) -> bool:
+        """Whether this is a kept-alive process that completed its request and waits for the next one."""
+        return self.keep_alive and self._request_completed and self._check_subprocess_exit() is None
+
     @property
     def is_ready(self) -> bool:
+        if self.is_idle:
+            return True
         if self._check_subprocess_exit() is None:
             # Process still alive, def can't be finished yet
             return False
@@ -18,6 +18,8 @@
 
 from __future__ import annotations
 
+import heapq
+import itertools
 import logging
 import sys
 from collections import defaultdict, deque
@@ -124,6 +126,111 @@ class RunningRetryAttemptType:
         return True
 
 
+class QueuedTasks(dict):
+    """
+    The ``queued_tasks`` of an executor, indexed by the priority of the queued workloads.
+
+    This behaves as a regular ``dict`` of workloads, and additionally keeps a heap ordered by
+    ``priority_weight`` (ties broken by the order in which keys were first queued), so that
+    picking the next ``n`` workloads to run does not need to sort the whole queue.
+
+    Entries are indexed lazily the first time the queue is ordered, and removed entries are dropped
+    from the heap lazily while it is being read, so adding and removing workloads stays O(1).
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__()
+        self._seq = itertools.count()
+        # Position of a key in insertion order; re-assigning a key keeps its position, like a dict does.
+        self._order: dict[Any, int] = {}
+        # Keys that were (re-)assigned since the heap was last read.
+        self._pending: dict[Any, None] = {}
+        # The (priority, order) a key currently has in the heap; other heap items of a key are stale.
+        self._indexed: dict[Any, tuple[int, int]] = {}
+        self._heap: list[tuple[int, int, Any]] = []
+        self.update(*args, **kwargs)
+
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        if key not in self._order:
+            self._order[key] = next(self._seq)
+        self._pending[key] = None
+
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        self._forget(key)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def _forget(self, key) -> None:
+        self._order.pop(key, None)
+        self._pending.pop(key, None)
+        self._indexed.pop(key, None)
+
+    def pop(self, key, *args):
+        value = super().pop(key, *args)
+        self._forget(key)
+        return value
+
+    def popitem(self):
+        key, value = super().popitem()
+        self._forget(key)
+        return key, value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self) -> None:
+        super().clear()
+        self._order.clear()
+        self._pending.clear()
+        self._indexed.clear()
+        self._heap.clear()
+
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
+    def _index_pending(self) -> None:
+        for key in self._pending:
+            entry = (self[key].ti.priority_weight, self._order[key])
+            if self._indexed.get(key) != entry:
+                self._indexed[key] = entry
+                heapq.heappush(self._heap, (*entry, key))
+        self._pending.clear()
+        # Don't let stale items pile up when workloads are removed faster than the heap is read
+        if len(self._heap) > 2 * len(self._indexed) + 64:
+            self._heap = [(*entry, key) for key, entry in self._indexed.items()]
+            heapq.heapify(self._heap)
+
+    def by_priority(self, limit: int | None = None) -> list[tuple[Any, Any]]:
+        """
+        Return up to ``limit`` queued items, lowest ``priority_weight`` first, without removing them.
+
+        This is O(limit * log(n)), rather than the O(n * log(n)) of sorting the whole queue.
+        """
+        self._index_pending()
+        if limit is None or limit > len(self._indexed):
+            limit = len(self._indexed)
+        popped: dict[Any, tuple[int, int, Any]] = {}
+        while len(popped) < limit:
+            item = heapq.heappop(self._heap)
+            priority, order, key = item
+            # A key re-assigned back to an earlier priority can have two current items; keep one.
+            if self._indexed.get(key) == (priority, order) and key not in popped:
+                popped[key] = item
+        for item in popped.values():
+            heapq.heappush(self._heap, item)
+        return [(key, self[key]) for key in popped]
+
+
 class ExecutorConf:
     """
     This class is used to fetch configuration for an executor for a particular team_name.
@@ -222,7 +329,7 @@ class BaseExecutor(LoggingMixin):
 
         self.parallelism: int = parallelism
         self.team_name: str | None = team_name
-        self.queued_tasks: dict[TaskInstanceKey, workloads.ExecuteTask] = {}
+        self.queued_tasks: dict[TaskInstanceKey, workloads.ExecuteTask] = QueuedTasks()
         self.queued_callbacks: dict[CallbackKey, workloads.ExecuteCallback] = {}
         self.queued_connection_tests: dict[ConnectionTestKey, workloads.TestConnection] = {}
         self.running: set[WorkloadKey] = set()
@@ -305,10 +412,9 @@ class BaseExecutor(LoggingMixin):
                 workloads_to_schedule.append((key, workload))
 
         if open_slots > len(workloads_to_schedule) and self.queued_tasks:
-            for task_key, task_workload in self.order_queued_tasks_by_priority():
-                if len(workloads_to_schedule) >= open_slots:
-                    break
-                workloads_to_schedule.append((task_key, task_workload))
+            workloads_to_schedule.extend(
+                self.order_queued_tasks_by_priority(limit=open_slots - len(workloads_to_schedule))
+            )
 
         return workloads_to_schedule
 
@@ -425,21 +531,27 @@ class BaseExecutor(LoggingMixin):
             tags=prune_dict({"status": "running", "executor_class_name": name, "team_name": self.team_name}),
         )
 
-    def order_queued_tasks_by_priority(self) -> list[tuple[TaskInstanceKey, workloads.ExecuteTask]]:
+    def order_queued_tasks_by_priority(
+        self, limit: int | None = None
+    ) -> list[tuple[TaskInstanceKey, workloads.ExecuteTask]]:
         """
         Orders the queued tasks by priority.
 
+        :param limit: Only return the first ``limit`` tasks; all of them if not set.
         :return: List of workloads from the queued_tasks according to the priority.
         """
         if not self.queued_tasks:
             return []
 
-        # V3 + new executor that supports workloads
+        if isinstance(self.queued_tasks, QueuedTasks):
+            return self.queued_tasks.by_priority(limit)
+
+        # queued_tasks was replaced by a plain dict
         return sorted(
             self.queued_tasks.items(),
             key=lambda x: x[1].ti.priority_weight,
             reverse=False,
-        )
+        )[:limit]
 
     def trigger_tasks(self, open_slots: int) -> None:
         """
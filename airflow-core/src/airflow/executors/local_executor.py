@@ -30,6 +30,7 @@ import multiprocessing
 import multiprocessing.sharedctypes
 import os
 import sys
+from contextlib import nullcontext
 from multiprocessing import Queue, SimpleQueue
 from typing import TYPE_CHECKING
 
@@ -48,6 +49,7 @@ else:
 if TYPE_CHECKING:
     from airflow.executors.workloads import ExecutorWorkload
     from airflow.executors.workloads.types import WorkloadResultType
+    from airflow.sdk.execution_time.heartbeat_aggregator import HeartbeatAggregator, HeartbeatSlots
 
 
 def _get_executor_process_title_prefix(team_name: str | None) -> str:
@@ -66,6 +68,7 @@ def _run_worker(
     output: Queue[WorkloadResultType],
     unread_messages: multiprocessing.sharedctypes.Synchronized[int],
     team_conf,
+    heartbeat_slots: HeartbeatSlots | None = None,
 ):
     import signal
 
@@ -75,6 +78,14 @@ def _run_worker(
     log = structlog.get_logger(logger_name)
     log.info("Worker starting up pid=%d", os.getpid())
 
+    if heartbeat_slots is not None:
+        try:
+            # The supervisors of this worker register their task instance in the slot, and the executor
+            # sends its heartbeat along with the ones of all the others
+            heartbeat_slots.claim()
+        except RuntimeError:
+            log.warning("No heartbeat slot available, tasks of this worker will heartbeat themselves")
+
     while True:
         setproctitle(f"{_get_executor_process_title_prefix(team_conf.team_name)} <idle>", log)
         try:
@@ -132,6 +143,8 @@ class LocalExecutor(BaseExecutor):
     result_queue: SimpleQueue[WorkloadResultType]
     workers: dict[int, multiprocessing.Process]
     _unread_messages: multiprocessing.sharedctypes.Synchronized[int]
+    _heartbeat_slots: HeartbeatSlots | None = None
+    _heartbeat_aggregator: HeartbeatAggregator | None = None
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -160,11 +173,37 @@ class LocalExecutor(BaseExecutor):
 
         self._unread_messages = multiprocessing.Value(ctypes.c_uint)
 
+        aggregate_heartbeats = self.conf.getboolean("workers", "aggregate_heartbeats", fallback=False)
+        if aggregate_heartbeats:
+            from airflow.sdk.execution_time.heartbeat_aggregator import HeartbeatSlots
+
+            # The slots must exist before the worker processes, which claim them
+            self._heartbeat_slots = HeartbeatSlots(self.parallelism)
+
         if self.is_mp_using_fork:
             # This creates the maximum number of worker processes (parallelism) at once
             # to minimize gc freeze/unfreeze cycles when using fork in multiprocessing
             self._spawn_workers_with_gc_freeze(self.parallelism)
 
+        if aggregate_heartbeats:
+            # Only once the worker processes are forked: they must not inherit the state of its thread
+            self._start_heartbeat_aggregator()
+
+    def _start_heartbeat_aggregator(self) -> None:
+        """Send the heartbeats of the tasks of all workers together, in one request per interval."""
+        from airflow.sdk.api.client import Client
+        from airflow.sdk.execution_time.heartbeat_aggregator import HeartbeatAggregator
+
+        if TYPE_CHECKING:
+            assert self._heartbeat_slots
+        self._heartbeat_aggregator = HeartbeatAggregator(
+            self._heartbeat_slots,
+            # Authenticated with the tokens of the tasks being heartbeat
+            Client(base_url=get_execution_api_server_url(self.conf), token=""),
+            interval=self.conf.getint("workers", "min_heartbeat_interval", fallback=5),
+        )
+        self._heartbeat_aggregator.start()
+
     def _check_workers(self):
         # Reap any dead workers
         to_remove = set()
@@ -172,6 +211,8 @@ class LocalExecutor(BaseExecutor):
             if not proc.is_alive():
                 to_remove.add(pid)
                 proc.close()
+                if self._heartbeat_slots is not None:
+                    self._heartbeat_slots.release(pid)
 
         if to_remove:
             self.workers = {pid: proc for pid, proc in self.workers.items() if pid not in to_remove}
@@ -206,6 +247,7 @@ class LocalExecutor(BaseExecutor):
                 "output": self.result_queue,
                 "unread_messages": self._unread_messages,
                 "team_conf": self.conf,
+                "heartbeat_slots": self._heartbeat_slots,
             },
         )
         p.start()
@@ -228,8 +270,11 @@ class LocalExecutor(BaseExecutor):
 
         gc.freeze()
         try:
-            for _ in range(spawn_number):
-                self._spawn_worker()
+            # The forked workers must not inherit the state of a request sent by the heartbeat aggregator
+            aggregator = self._heartbeat_aggregator
+            with aggregator.paused() if aggregator is not None else nullcontext():
+                for _ in range(spawn_number):
+                    self._spawn_worker()
         finally:
             gc.unfreeze()
 
@@ -267,6 +312,11 @@ class LocalExecutor(BaseExecutor):
         # Process any extra results before closing
         self._read_results()
 
+        if self._heartbeat_aggregator is not None:
+            self._heartbeat_aggregator.stop()
+            self._heartbeat_aggregator.client.close()
+            self._heartbeat_aggregator = self._heartbeat_slots = None
+
         self.activity_queue.close()
         self.result_queue.close()
 
@@ -119,6 +119,7 @@ from airflow.triggers.base import TriggerEvent
 from airflow.utils.event_scheduler import EventScheduler
 from airflow.utils.helpers import prune_dict
 from airflow.utils.log.logging_mixin import LoggingMixin
+from airflow.utils.loop_profiler import LoopPhaseProfiler
 from airflow.utils.retries import MAX_DB_RETRIES, retry_db_transaction, run_with_db_retries
 from airflow.utils.session import NEW_SESSION, create_session, provide_session
 from airflow.utils.sqlalchemy import (
@@ -144,6 +145,7 @@ if TYPE_CHECKING:
     from airflow.executors.base_executor import BaseExecutor
     from airflow.executors.executor_utils import ExecutorName
     from airflow.executors.workloads.types import SchedulerWorkload
+    from airflow.models.dag import AdrqWatermark
     from airflow.serialization.definitions.dag import SerializedDAG
     from airflow.utils.sqlalchemy import CommitProhibitorGuard
 
@@ -256,6 +258,122 @@ class ConcurrencyMap:
             if state not in (TaskInstanceState.DEFERRED, TaskInstanceState.AWAITING_INPUT):
                 self.dag_run_active_tasks_map[dag_id, run_id] += count
 
+    def add_task_instance(self, ti: TaskInstance) -> None:
+        """Account for a task instance that is being moved to QUEUED."""
+        self.dag_run_active_tasks_map[ti.dag_id, ti.run_id] += 1
+        self.task_concurrency_map[(ti.dag_id, ti.task_id)] += 1
+        self.task_dagrun_concurrency_map[(ti.dag_id, ti.run_id, ti.task_id)] += 1
+
+
+class IncrementalConcurrencyMap(ConcurrencyMap):
+    """
+    Concurrency map that is kept up to date in memory instead of being reloaded on every call.
+
+    The set of active task instances is tracked by key. Task instances queued by this scheduler
+    are added as they are queued, and task instances reported as finished by this scheduler's
+    executors are removed. Transitions this scheduler does not observe (tasks queued by another
+    scheduler, tasks deferring or being cleared, rows deleted) are picked up when the map is
+    reconciled against the database, which happens every ``reconcile_interval`` seconds.
+
+    :param reconcile_interval: How often, in seconds, to rebuild the map from the database.
+    """
+
+    def __init__(self, reconcile_interval: float):
+        super().__init__()
+        self.reconcile_interval = reconcile_interval
+        # TaskInstanceKey -> whether the task instance holds a worker slot
+        self._active: dict[TaskInstanceKey, bool] = {}
+        self._last_reconciled_at: float | None = None
+        self._loaded = False
+
+    def load(self, session: Session) -> None:
+        if (
+            self._last_reconciled_at is None
+            or time.monotonic() - self._last_reconciled_at >= self.reconcile_interval
+        ):
+            self.reconcile(session=session)
+
+    def invalidate(self) -> None:
+        """Force the next :meth:`load` to reconcile with the database."""
+        self._last_reconciled_at = None
+
+    def reconcile(self, session: Session) -> None:
+        """Rebuild the tracked task instances from the database and report the drift."""
+        with stats.timer("scheduler.concurrency_map.reconcile_duration"):
+            rows = session.execute(
+                select(TI.dag_id, TI.task_id, TI.run_id, TI.try_number, TI.map_index, TI.state).where(
+                    TI.state.in_(ACTIVE_STATES)
+                )
+            )
+            active = {
+                TaskInstanceKey(dag_id, task_id, run_id, try_number, map_index): state
+                not in (TaskInstanceState.DEFERRED, TaskInstanceState.AWAITING_INPUT)
+                for dag_id, task_id, run_id, try_number, map_index, state in rows
+            }
+        if self._loaded:
+            self.emit_drift_metrics(
+                missing=len(active.keys() - self._active.keys()),
+                stale=len(self._active.keys() - active.keys()),
+            )
+        self._active = {}
+        self.dag_run_active_tasks_map.clear()
+        self.task_concurrency_map.clear()
+        self.task_dagrun_concurrency_map.clear()
+        for key, holds_slot in active.items():
+            self._add(key, holds_slot)
+        self._loaded = True
+        self._last_reconciled_at = time.monotonic()
+
+    @staticmethod
+    def emit_drift_metrics(*, missing: int, stale: int) -> None:
+        """
+        Emit metrics describing how far the in-memory map was from the database.
+
+        :param missing: Active task instances in the database that were not tracked in memory.
+        :param stale: Task instances tracked in memory that are no longer active in the database.
+        """
+        stats.gauge("scheduler.concurrency_map.drift_missing", missing)
+        stats.gauge("scheduler.concurrency_map.drift_stale", stale)
+        if missing or stale:
+            stats.incr("scheduler.concurrency_map.drift_detected")
+
+    def add_task_instance(self, ti: TaskInstance) -> None:
+        self._add(ti.key, True)
+
+    def remove_task_instances(self, keys: Iterable[TaskInstanceKey]) -> None:
+        """Stop accounting for task instances that have finished."""
+        for key in keys:
+            self._remove(key)
+
+    def _add(self, key: TaskInstanceKey, holds_slot: bool) -> None:
+        if key in self._active:
+            if holds_slot and not self._active[key]:
+                self._active[key] = True
+                self.dag_run_active_tasks_map[key.dag_id, key.run_id] += 1
+            return
+        self._active[key] = holds_slot
+        self.task_concurrency_map[(key.dag_id, key.task_id)] += 1
+        self.task_dagrun_concurrency_map[(key.dag_id, key.run_id, key.task_id)] += 1
+        if holds_slot:
+            self.dag_run_active_tasks_map[key.dag_id, key.run_id] += 1
+
+    def _remove(self, key: TaskInstanceKey) -> None:
+        holds_slot = self._active.pop(key, None)
+        if holds_slot is None:
+            return
+        _decrement(self.task_concurrency_map, (key.dag_id, key.task_id))
+        _decrement(self.task_dagrun_concurrency_map, (key.dag_id, key.run_id, key.task_id))
+        if holds_slot:
+            _decrement(self.dag_run_active_tasks_map, (key.dag_id, key.run_id))
+
+
+def _decrement(counter: Counter, key: Any) -> None:
+    """Decrement a counter entry, dropping it once it reaches zero so the counter does not grow forever."""
+    if counter[key] <= 1:
+        counter.pop(key, None)
+    else:
+        counter[key] -= 1
+
 
 def _is_parent_process() -> bool:
     """
@@ -324,6 +442,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         )
         self._task_queued_timeout = conf.getfloat("scheduler", "task_queued_timeout")
         self._enable_tracemalloc = conf.getboolean("scheduler", "enable_tracemalloc")
+        self._config_snapshot = conf.getboolean("core", "config_snapshot", fallback=False)
 
         # this param is intentionally undocumented
         self._num_stuck_queued_retries = conf.getint(
@@ -336,6 +455,24 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         self._multi_team = conf.getboolean("core", "multi_team")
         self._max_partition_dag_runs_per_loop = MAX_PARTITION_DAG_RUNS_PER_LOOP
         self._dag_id_to_team_name: dict[str, str | None] = {}
+        self._concurrency_map: IncrementalConcurrencyMap | None = None
+        if conf.getboolean("scheduler", "incremental_concurrency_map", fallback=False):
+            self._concurrency_map = IncrementalConcurrencyMap(
+                reconcile_interval=conf.getfloat(
+                    "scheduler", "concurrency_map_reconcile_interval", fallback=60.0
+                )
+            )
+
+        # Watermarks of the queued asset events of the asset-triggered Dags found not ready, so they
+        # are only evaluated again once their queue changes. See DagModel.dags_needing_dagruns.
+        self._adrq_watermarks: dict[str, AdrqWatermark] | None = None
+        if conf.getboolean("scheduler", "asset_queue_watermarks", fallback=True):
+            self._adrq_watermarks = {}
+
+        self._phase_profiler = LoopPhaseProfiler(
+            "scheduler.loop_phase",
+            enabled=conf.getboolean("scheduler", "loop_phase_profiling", fallback=False),
+        )
 
         self.executors: list[BaseExecutor] = executors if executors else ExecutorLoader.init_executors()
         self.executor: BaseExecutor = self.executors[0]
@@ -348,7 +485,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         if log:
             self._log = log
 
-        self.scheduler_dag_bag = DBDagBag(load_op_links=False)
+        self.scheduler_dag_bag = DBDagBag(load_op_links=False, lazy_load=True)
 
         # Set of (dag_id, asset_name, asset_uri) tuples for trigger policies that
         # are permanently unreachable for the rollup window's cardinality — the
@@ -367,6 +504,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             if not serdag:
                 return None
             serdag.load_op_links = False
+            serdag.lazy_load = True
             return serdag.dag
         except Exception:
             self.log.exception("Failed to deserialize DAG '%s'", dag_id)
@@ -387,6 +525,10 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             prev = signal.signal(signal.SIGUSR1, self._log_memory_usage)
             resetter.callback(signal.signal, signal.SIGUSR1, prev)
 
+        if self._config_snapshot:
+            prev_hup = signal.signal(signal.SIGHUP, self._reload_config)
+            resetter.callback(signal.signal, signal.SIGHUP, prev_hup)
+
         return resetter
 
     def _get_team_names_for_dag_ids(
@@ -495,6 +637,12 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             "\n\t".join(map(str, top_stats[:n])),
         )
 
+    def _reload_config(self, signum: int, frame: FrameType | None) -> None:
+        if not _is_parent_process():
+            return
+        self.log.info("Reloading the configuration upon receiving signal %s", signum)
+        conf.reload_snapshot()
+
     def _debug_dump(self, signum: int, frame: FrameType | None) -> None:
         import threading
         from traceback import extract_stack
@@ -515,6 +663,9 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             executor.debug_dump()
             self.log.info("-" * 80)
 
+        self._phase_profiler.dump()
+        self.log.info("-" * 80)
+
         id2name = {th.ident: th.name for th in threading.enumerate()}
         for threadId, stack in sys._current_frames().items():
             self.log.info("Stack Trace for Scheduler Job Runner on thread: %s", id2name[threadId])
@@ -580,7 +731,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             pool_to_team_name = Pool.get_name_to_team_name_mapping(list(pools.keys()), session=session)
 
         # dag_id to # of running tasks and (dag_id, task_id) to # of running tasks.
-        concurrency_map = ConcurrencyMap()
+        concurrency_map = self._concurrency_map or ConcurrencyMap()
         concurrency_map.load(session=session)
 
         # Number of tasks that cannot be scheduled because of no open slot in pool
@@ -931,11 +1082,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
 
                 executable_tis.append(task_instance)
                 open_slots -= task_instance.pool_slots
-                concurrency_map.dag_run_active_tasks_map[dag_run_key] += 1
-                concurrency_map.task_concurrency_map[(task_instance.dag_id, task_instance.task_id)] += 1
-                concurrency_map.task_dagrun_concurrency_map[
-                    (task_instance.dag_id, task_instance.run_id, task_instance.task_id)
-                ] += 1
+                concurrency_map.add_task_instance(task_instance)
 
                 pool_stats["open"] = open_slots
 
@@ -1247,17 +1394,28 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
     def _is_tracing_enabled():
         return conf.getboolean("traces", "otel_on")
 
+    def _invalidate_concurrency_map(self) -> None:
+        if self._concurrency_map is not None:
+            # Anything accounted for in the rolled back transaction must be reloaded from the database.
+            self._concurrency_map.invalidate()
+
     def _process_executor_events(self, executor: BaseExecutor, session: Session) -> int:
         return SchedulerJobRunner.process_executor_events(
             executor=executor,
             job_id=self.job.id,
             scheduler_dag_bag=self.scheduler_dag_bag,
             session=session,
+            concurrency_map=self._concurrency_map,
         )
 
     @classmethod
     def process_executor_events(
-        cls, executor: BaseExecutor, job_id: int | None, scheduler_dag_bag: DBDagBag, session: Session
+        cls,
+        executor: BaseExecutor,
+        job_id: int | None,
+        scheduler_dag_bag: DBDagBag,
+        session: Session,
+        concurrency_map: IncrementalConcurrencyMap | None = None,
     ) -> int:
         """
         Process task completion events from the executor and update task instance states.
@@ -1280,6 +1438,8 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         :param job_id: The scheduler job ID, used to detect task requeuing by other schedulers
         :param scheduler_dag_bag: Serialized DAG bag for retrieving task definitions
         :param session: Database session for task instance updates
+        :param concurrency_map: In-memory concurrency map of the scheduler, from which the task
+            instances that are no longer active in the database are removed
 
         :return: Number of events processed from the executor event buffer
 
@@ -1372,7 +1532,9 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         # multi-schedulers
         locked_query = with_row_locks(query, of=TI, session=session, skip_locked=True)
         tis: Iterator[TI] = session.scalars(locked_query)
+        processed_tis: list[TI] = []
         for ti in tis:
+            processed_tis.append(ti)
             try_number = ti_primary_key_to_try_number_map[ti.key.primary]
             buffer_key = ti.key.with_try_number(try_number)
             if ti.try_number != try_number:
@@ -1578,6 +1740,13 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 # Update task state - emails are handled by DAG processor now
                 ti.handle_failure(error=msg, session=session)
 
+        if concurrency_map is not None:
+            # The executor reports success when the task process exits after deferring or waiting for
+            # input too, so only the state of the task instance tells whether it still counts.
+            concurrency_map.remove_task_instances(
+                ti.key for ti in processed_tis if ti.state not in ACTIVE_STATES
+            )
+
         return len(event_buffer)
 
     def _execute(self) -> int | None:
@@ -1609,7 +1778,11 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 export_legacy_names=conf.getboolean("metrics", "legacy_names_on"),
             )
 
-            self._run_scheduler_loop()
+            with (
+                self._phase_profiler.track_queries(settings.engine),
+                conf.snapshot(enabled=self._config_snapshot),
+            ):
+                self._run_scheduler_loop()
 
             if settings.Session is not None:
                 settings.Session.remove()
@@ -1679,64 +1852,69 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         is_unit_test: bool = conf.getboolean("core", "unit_test_mode")
 
         timers = EventScheduler()
+        profiler = self._phase_profiler
+
+        def call_regular_interval(delay: float, action: Callable) -> None:
+            # Each timed event is profiled as a phase of its own, named after its action
+            timers.call_regular_interval(delay, profiler.wrap(action))
 
         # Check on start up, then every configured interval
-        self.adopt_or_reset_orphaned_tasks()
+        profiler.wrap(self.adopt_or_reset_orphaned_tasks)()
 
-        timers.call_regular_interval(
+        call_regular_interval(
             conf.getfloat("scheduler", "orphaned_tasks_check_interval", fallback=300.0),
             self.adopt_or_reset_orphaned_tasks,
         )
 
-        timers.call_regular_interval(
+        call_regular_interval(
             conf.getfloat("scheduler", "trigger_timeout_check_interval", fallback=15.0),
             self.check_trigger_timeouts,
         )
 
-        timers.call_regular_interval(
+        call_regular_interval(
             conf.getfloat("scheduler", "trigger_timeout_check_interval", fallback=15.0),
             self.check_awaiting_input_timeouts,
         )
 
-        timers.call_regular_interval(
+        call_regular_interval(
             30,
             self._mark_backfills_complete,
         )
 
         if self._is_metrics_enabled() or self._is_tracing_enabled():
-            timers.call_regular_interval(
+            call_regular_interval(
                 conf.getfloat("scheduler", "pool_metrics_interval", fallback=5.0),
                 self._emit_pool_metrics,
             )
 
         if self._is_metrics_enabled():
-            timers.call_regular_interval(
+            call_regular_interval(
                 conf.getfloat("scheduler", "ti_metrics_interval", fallback=30.0),
                 self._emit_ti_metrics,
             )
 
-            timers.call_regular_interval(
+            call_regular_interval(
                 conf.getfloat("scheduler", "dagrun_metrics_interval", fallback=30.0),
                 self._emit_running_dags_metric,
             )
 
-        timers.call_regular_interval(
+        call_regular_interval(
             conf.getfloat("scheduler", "task_instance_heartbeat_timeout_detection_interval", fallback=10.0),
             self._find_and_purge_task_instances_without_heartbeats,
         )
 
-        timers.call_regular_interval(60.0, self._update_dag_run_state_for_paused_dags)
+        call_regular_interval(60.0, self._update_dag_run_state_for_paused_dags)
 
-        timers.call_regular_interval(
+        call_regular_interval(
             conf.getfloat("scheduler", "task_queued_timeout_check_interval"),
             self._handle_tasks_stuck_in_queued,
         )
 
-        timers.call_regular_interval(
+        call_regular_interval(
             conf.getfloat("scheduler", "parsing_cleanup_interval"),
             self._update_asset_orphanage,
         )
-        timers.call_regular_interval(
+        call_regular_interval(
             conf.getfloat("scheduler", "parsing_cleanup_interval"),
             self._remove_unreferenced_triggers,
         )
@@ -1748,12 +1926,12 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 key="stale_bundle_cleanup_interval",
             )
             if check_interval > 0:
-                timers.call_regular_interval(
+                call_regular_interval(
                     delay=check_interval,
                     action=bundle_cleanup_mgr.remove_stale_bundle_versions,
                 )
 
-        timers.call_regular_interval(
+        call_regular_interval(
             delay=conf.getfloat("connection_test", "reaper_interval", fallback=30.0),
             action=self._reap_stale_connection_tests,
         )
@@ -1765,7 +1943,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             # are picked up each iteration without requiring a scheduler restart.
             self._dag_id_to_team_name = {}
             with stats.timer("scheduler.scheduler_loop_duration") as timer:
-                with create_session() as session:
+                with profiler.phase("do_scheduling"), create_session() as session:
                     # This will schedule for as many executors as possible.
                     num_queued_tis = self._do_scheduling(session)
                     # Don't keep any objects alive -- we've possibly just looked at 500+ ORM objects!
@@ -1774,28 +1952,30 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 # Heartbeat all executors, even if they're not receiving new tasks this loop. It will be
                 # either a no-op, or they will check-in on currently running tasks and send out new
                 # events to be processed below.
-                for executor in self.executors:
-                    with stats.timer(
-                        "scheduler.executor_heartbeat_duration",
-                        tags={"executor": type(executor).__name__},
-                    ):
-                        executor.heartbeat()
+                with profiler.phase("executor_heartbeat"):
+                    for executor in self.executors:
+                        with stats.timer(
+                            "scheduler.executor_heartbeat_duration",
+                            tags={"executor": type(executor).__name__},
+                        ):
+                            executor.heartbeat()
 
-                with create_session() as session:
+                with profiler.phase("process_executor_events"), create_session() as session:
                     num_finished_events = 0
                     for executor in self.executors:
                         num_finished_events += self._process_executor_events(
                             executor=executor, session=session
                         )
 
-                for executor in self.executors:
-                    try:
-                        with create_session() as session:
-                            self._process_task_event_logs(executor._task_event_logs, session)
-                    except Exception:
-                        self.log.exception("Something went wrong when trying to save task event logs.")
+                with profiler.phase("process_task_event_logs"):
+                    for executor in self.executors:
+                        try:
+                            with create_session() as session:
+                                self._process_task_event_logs(executor._task_event_logs, session)
+                        except Exception:
+                            self.log.exception("Something went wrong when trying to save task event logs.")
 
-                with create_session() as session:
+                with profiler.phase("handle_deadlines"), create_session() as session:
                     # Lock expired, unhandled deadlines with FOR UPDATE SKIP LOCKED so
                     # concurrent HA scheduler replicas don't both process the same row
                     # and create duplicate callbacks.
@@ -1817,14 +1997,17 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                         deadline.handle_miss(session)
 
                     # Route ExecutorCallback workloads to executors (similar to task routing)
-                    self._enqueue_executor_callbacks(session)
+                    with profiler.phase("enqueue_executor_callbacks"):
+                        self._enqueue_executor_callbacks(session)
 
-                    self._enqueue_connection_tests(session=session)
+                    with profiler.phase("enqueue_connection_tests"):
+                        self._enqueue_connection_tests(session=session)
 
                 # Heartbeat the scheduler periodically
-                perform_heartbeat(
-                    job=self.job, heartbeat_callback=self.heartbeat_callback, only_if_necessary=True
-                )
+                with profiler.phase("heartbeat"):
+                    perform_heartbeat(
+                        job=self.job, heartbeat_callback=self.heartbeat_callback, only_if_necessary=True
+                    )
 
                 # Run any pending timed events
                 next_event = timers.run(blocking=False)
@@ -1884,12 +2067,15 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
 
         :return: Number of TIs enqueued in this iteration
         """
+        profiler = self._phase_profiler
         # Put a check in place to make sure we don't commit unexpectedly
         with prohibit_commit(session) as guard:
             if self._scheduler_use_job_schedule:
-                self._create_dagruns_for_dags(guard, session)
+                with profiler.phase("create_dagruns"):
+                    self._create_dagruns_for_dags(guard, session)
 
-            self._start_queued_dagruns(session)
+            with profiler.phase("start_queued_dagruns"):
+                self._start_queued_dagruns(session)
             guard.commit()
 
             # Bulk fetch the currently active dag runs for the dags we are
@@ -1905,7 +2091,8 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                     if team := dr_team_mapping.get(dr.dag_id):
                         dr._team_name = team
 
-            callback_tuples = self._schedule_all_dag_runs(guard, dag_runs, session)
+            with profiler.phase("schedule_dag_runs"):
+                callback_tuples = self._schedule_all_dag_runs(guard, dag_runs, session)
 
         # Send the callbacks after we commit to ensure the context is up to date when it gets run
         # cache saves time during scheduling of many dag_runs for same dag
@@ -1937,7 +2124,8 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                     timer.start()
 
                     # Find any TIs in state SCHEDULED, try to QUEUE them (send it to the executors)
-                    num_queued_tis = self._critical_section_enqueue_task_instances(session=session)
+                    with profiler.phase("critical_section"):
+                        num_queued_tis = self._critical_section_enqueue_task_instances(session=session)
 
                     # Make sure we only sent this metric if we obtained the lock, otherwise we'll skew the
                     # metric, way down
@@ -1945,14 +2133,22 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 except OperationalError as e:
                     timer.stop(send=False)
 
+                    self._invalidate_concurrency_map()
                     if is_lock_not_available_error(error=e):
                         self.log.debug("Critical section lock held by another Scheduler")
                         stats.incr("scheduler.critical_section_busy")
                         session.rollback()
                         return 0
                     raise
+                except Exception:
+                    self._invalidate_concurrency_map()
+                    raise
 
-            guard.commit()
+            try:
+                guard.commit()
+            except Exception:
+                self._invalidate_concurrency_map()
+                raise
 
         return num_queued_tis
 
@@ -2222,6 +2418,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         for serdag in serdags_by_dag_id.values():
             try:
                 serdag.load_op_links = False
+                serdag.lazy_load = True
                 serialized_dags[serdag.dag_id] = serdag.dag
             except Exception:
                 self.log.exception("Failed to deserialize Dag '%s'", serdag.dag_id)
@@ -2322,7 +2519,9 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         """Find Dag Models needing DagRuns and Create Dag Runs with retries in case of OperationalError."""
         partition_dag_ids: set[str] = self._create_dagruns_for_partitioned_asset_dags(session)
 
-        query, triggered_date_by_dag = DagModel.dags_needing_dagruns(session)
+        query, triggered_date_by_dag = DagModel.dags_needing_dagruns(
+            session, adrq_watermarks=self._adrq_watermarks
+        )
         all_dags_needing_dag_runs = set(query.all())
         asset_triggered_dags = [d for d in all_dags_needing_dag_runs if d.dag_id in triggered_date_by_dag]
         non_asset_dags = {
@@ -76,6 +76,7 @@ from airflow.sdk.execution_time.comms import (
     GetVariable,
     GetVariableKeys,
     GetXCom,
+    GetXComBatch,
     MaskSecret,
     OKResponse,
     PutVariable,
@@ -85,6 +86,7 @@ from airflow.sdk.execution_time.comms import (
     UpdateHITLDetail,
     VariableKeysResult,
     VariableResult,
+    XComBatchResult,
     XComResult,
     _new_encoder,
     _RequestFrame,
@@ -101,6 +103,7 @@ from airflow.sdk.execution_time.request_handlers import (
     handle_get_variable,
     handle_get_variable_keys,
     handle_get_xcom,
+    handle_get_xcom_batch,
     handle_mask_secret,
     handle_put_variable,
     handle_set_xcom,
@@ -346,6 +349,7 @@ ToTriggerRunner = Annotated[
     | ConnectionResult
     | VariableResult
     | VariableKeysResult
+    | XComBatchResult
     | XComResult
     | DagRunStateResult
     | DRCount
@@ -371,6 +375,7 @@ ToTriggerSupervisor = Annotated[
     | PutVariable
     | DeleteXCom
     | GetXCom
+    | GetXComBatch
     | SetXCom
     | GetTICount
     | GetTaskStates
@@ -461,6 +466,7 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
 
     health_check_threshold = conf.getint("triggerer", "triggerer_health_check_threshold")
     runner_health_check_threshold = conf.getfloat("triggerer", "runner_health_check_threshold")
+    event_batch_size = conf.getint("triggerer", "event_batch_size", fallback=1)
 
     runner: TriggerRunner | None = None
     stop: bool = False
@@ -594,6 +600,8 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
             resp, dump_opts = handle_delete_xcom(self.client, msg)
         elif isinstance(msg, GetXCom):
             resp, dump_opts = handle_get_xcom(self.client, msg)
+        elif isinstance(msg, GetXComBatch):
+            resp, dump_opts = handle_get_xcom_batch(self.client, msg)
         elif isinstance(msg, SetXCom):
             resp, dump_opts = handle_set_xcom(self.client, msg)
         elif isinstance(msg, GetDRCount):
@@ -701,21 +709,50 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
     def handle_events(self):
         """Dispatch outbound events to the Trigger model which pushes them to the relevant task instances."""
         while self.events:
-            entry = self.events.popleft()
-            # Tell the model to wake up its tasks
-            self.on_trigger_event(trigger_id=entry.trigger_id, event=entry.event)
-            # Only reached when on_trigger_event returned, i.e. the event was
-            # persisted; a raise above leaves the seq unconfirmed so the
-            # bound shared-stream advance fails out and the broker redelivers.
-            if entry.persist_seq is not None:
-                self.persisted_event_seqs.append(entry.persist_seq)
-            # Emit stat event
-            stats.incr("triggers.succeeded", tags=prune_dict({"team_name": self.team_name}))
+            if self.event_batch_size > 1 and len(self.events) > 1:
+                batch = [self.events.popleft() for _ in range(min(self.event_batch_size, len(self.events)))]
+                try:
+                    self.on_trigger_events(batch)
+                except Exception:
+                    # Nothing in the batch was persisted. Put it back and fall back to persisting the
+                    # events one by one, so a single bad event cannot hold back the others.
+                    log.exception("Failed to persist a batch of trigger events, retrying them one by one")
+                    self.events.extendleft(reversed(batch))
+                    for _ in batch:
+                        self._handle_event(self.events.popleft())
+                else:
+                    for entry in batch:
+                        self._event_persisted(entry)
+            else:
+                self._handle_event(self.events.popleft())
+
+    def _handle_event(self, entry: TriggerEventEntry) -> None:
+        # Tell the model to wake up its tasks
+        self.on_trigger_event(trigger_id=entry.trigger_id, event=entry.event)
+        self._event_persisted(entry)
+
+    def _event_persisted(self, entry: TriggerEventEntry) -> None:
+        # Only reached once the event was persisted; a raise before leaves the
+        # seq unconfirmed so the bound shared-stream advance fails out and the
+        # broker redelivers.
+        if entry.persist_seq is not None:
+            self.persisted_event_seqs.append(entry.persist_seq)
+        # Emit stat event
+        stats.incr("triggers.succeeded", tags=prune_dict({"team_name": self.team_name}))
 
     def on_trigger_event(self, trigger_id: int, event: TriggerEvent) -> None:
         """Record that a trigger fired an event."""
         Trigger.submit_event(trigger_id=trigger_id, event=event)
 
+    def on_trigger_events(self, entries: list[TriggerEventEntry]) -> None:
+        """
+        Record that triggers fired a batch of events, all in one transaction.
+
+        Subclasses that override :meth:`on_trigger_event` should override this too, or leave
+        ``[triggerer] event_batch_size`` at 1.
+        """
+        Trigger.submit_events([(entry.trigger_id, entry.event) for entry in entries])
+
     def clean_unused(self) -> None:
         """Remove triggers that are no longer needed."""
         Trigger.clean_unused()
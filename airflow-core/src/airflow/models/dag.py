@@ -56,6 +56,7 @@ from sqlalchemy.orm import (
 from sqlalchemy.sql import expression
 
 from airflow import settings
+from airflow._shared.observability.metrics import stats
 from airflow._shared.timezones import timezone
 from airflow.assets.evaluation import AssetEvaluator
 from airflow.configuration import conf as airflow_conf
@@ -71,6 +72,7 @@ from airflow.serialization.enums import Encoding
 from airflow.timetables.base import DataInterval, PartitionMapperInfo, Timetable
 from airflow.timetables.interval import CronDataIntervalTimetable, DeltaDataIntervalTimetable
 from airflow.timetables.simple import AssetTriggeredTimetable, NullTimetable, OnceTimetable
+from airflow.utils.helpers import chunks
 from airflow.utils.session import NEW_SESSION, provide_session
 from airflow.utils.sqlalchemy import UtcDateTime, with_row_locks
 from airflow.utils.state import DagRunState
@@ -91,6 +93,8 @@ if TYPE_CHECKING:
     from airflow.serialization.serialized_objects import LazyDeserializedDAG
 
     UKey: TypeAlias = SerializedAssetUniqueKey
+    # Number of queued asset events, time the last one was queued, and latest version of a Dag
+    AdrqWatermark: TypeAlias = tuple[int, datetime, int | None]
     DagStateChangeCallback = Callable[[Context], None]
     ScheduleInterval = None | str | timedelta | relativedelta
 
@@ -479,6 +483,7 @@ class DagModel(Base):
     NUM_DAGS_PER_DAGRUN_QUERY = airflow_conf.getint(
         "scheduler", "max_dagruns_to_create_per_loop", fallback=10
     )
+    NUM_ADRQ_DAGS_PER_QUERY = airflow_conf.getint("scheduler", "asset_queue_dags_per_query", fallback=100)
     dag_versions = relationship(
         "DagVersion", back_populates="dag_model", cascade="all, delete, delete-orphan"
     )
@@ -680,7 +685,12 @@ class DagModel(Base):
         return any_deactivated
 
     @classmethod
-    def dags_needing_dagruns(cls, session: Session) -> tuple[Any, dict[str, datetime]]:
+    def dags_needing_dagruns(
+        cls,
+        session: Session,
+        *,
+        adrq_watermarks: dict[str, AdrqWatermark] | None = None,
+    ) -> tuple[Any, dict[str, datetime]]:
         """
         Return (and lock) a list of Dag objects that are due to create a new DagRun.
 
@@ -692,13 +702,19 @@ class DagModel(Base):
         ``SerializedDagModel`` row are omitted from ``triggered_date_by_dag`` until serialization exists;
         ADRQs are **not** deleted here so the scheduler can re-evaluate on a later run.
 
+        The ``AssetDagRunQueue`` rows are loaded and evaluated ``NUM_ADRQ_DAGS_PER_QUERY`` Dags at a time.
+        When ``adrq_watermarks`` is given, it maps the Dags found not ready by previous calls to the
+        watermark of their queued asset events at the time, and Dags whose watermark has not changed since
+        are not evaluated again. It is updated in place, and should be kept by the caller between calls.
+
         :meta private:
         """
+        from airflow.models.dag_version import DagVersion
         from airflow.models.serialized_dag import SerializedDagModel
 
         evaluator = AssetEvaluator(session)
 
-        def dag_ready(dag_id: str, cond: SerializedAssetBase, statuses: dict[UKey, bool]) -> bool:
+        def dag_ready(dag_id: str, cond: SerializedAssetBase, statuses: dict[UKey, bool]) -> bool | None:
             try:
                 return evaluator.run(cond, statuses)
             except AttributeError:
@@ -709,60 +725,92 @@ class DagModel(Base):
                 return False
             except Exception:
                 log.exception("Dag '%s' failed to be evaluated; assuming not ready", dag_id)
-                return False
-
-        # this loads all the ADRQ records.... may need to limit num dags
-        adrq_by_dag: dict[str, list[AssetDagRunQueue]] = defaultdict(list)
-        for adrq in session.scalars(
-            select(AssetDagRunQueue).options(
-                joinedload(AssetDagRunQueue.dag_model),
-                joinedload(AssetDagRunQueue.asset),
-            )
-        ):
-            if adrq.dag_model.asset_expression is None:
-                # The dag referenced does not actually depend on an asset! This
-                # could happen if the dag DID depend on an asset at some point,
-                # but no longer does. Delete the stale adrq.
-                session.delete(adrq)
-            else:
-                adrq_by_dag[adrq.target_dag_id].append(adrq)
-
-        if adrq_by_dag:
-            log.info(
-                "Asset-triggered Dags with queued events: %s",
-                {dag_id: len(adrqs) for dag_id, adrqs in adrq_by_dag.items()},
+                return None
+
+        # The watermark of a Dag changes whenever one of its ADRQ rows is added or deleted, or a new
+        # version of it is serialized (which may change its asset condition), so a Dag that was not
+        # ready at a given watermark cannot be ready until it changes. It is computed from the
+        # target_dag_id index, without loading the ADRQ rows themselves.
+        latest_version_number = (
+            select(func.max(DagVersion.version_number))
+            .where(DagVersion.dag_id == AssetDagRunQueue.target_dag_id)
+            .scalar_subquery()
+        )
+        watermarks: dict[str, AdrqWatermark] = {
+            dag_id: (num_queued, last_queued_at, version_number)
+            for dag_id, num_queued, last_queued_at, version_number in session.execute(
+                select(
+                    AssetDagRunQueue.target_dag_id,
+                    func.count(),
+                    func.max(AssetDagRunQueue.created_at),
+                    latest_version_number,
+                ).group_by(AssetDagRunQueue.target_dag_id)
             )
-
-        dag_statuses: dict[str, dict[UKey, bool]] = {
-            dag_id: {SerializedAssetUniqueKey.from_asset(adrq.asset): True for adrq in adrqs}
-            for dag_id, adrqs in adrq_by_dag.items()
         }
-        ser_dags = SerializedDagModel.get_latest_serialized_dags(dag_ids=list(dag_statuses), session=session)
-        ser_dag_ids = {ser_dag.dag_id for ser_dag in ser_dags}
-        if missing_from_serialized := set(adrq_by_dag.keys()) - ser_dag_ids:
-            log.info(
-                "Dags have queued asset events (ADRQ), but are not found in the serialized_dag table."
-                " — skipping Dag run creation: %s",
-                sorted(missing_from_serialized),
+        if adrq_watermarks is None:
+            dag_ids_to_evaluate = list(watermarks)
+        else:
+            for dag_id in adrq_watermarks.keys() - watermarks.keys():
+                del adrq_watermarks[dag_id]
+            dag_ids_to_evaluate = [
+                dag_id for dag_id, watermark in watermarks.items() if adrq_watermarks.get(dag_id) != watermark
+            ]
+            for dag_id in dag_ids_to_evaluate:
+                adrq_watermarks.pop(dag_id, None)
+
+        triggered_date_by_dag: dict[str, datetime] = {}
+        num_rows_scanned = 0
+        for dag_ids in chunks(dag_ids_to_evaluate, cls.NUM_ADRQ_DAGS_PER_QUERY):
+            adrq_by_dag: dict[str, list[AssetDagRunQueue]] = defaultdict(list)
+            for adrq in session.scalars(
+                select(AssetDagRunQueue)
+                .where(AssetDagRunQueue.target_dag_id.in_(dag_ids))
+                .options(
+                    joinedload(AssetDagRunQueue.dag_model),
+                    joinedload(AssetDagRunQueue.asset),
+                )
+            ):
+                num_rows_scanned += 1
+                if adrq.dag_model.asset_expression is None:
+                    # The dag referenced does not actually depend on an asset! This
+                    # could happen if the dag DID depend on an asset at some point,
+                    # but no longer does. Delete the stale adrq.
+                    session.delete(adrq)
+                else:
+                    adrq_by_dag[adrq.target_dag_id].append(adrq)
+
+            if adrq_by_dag:
+                log.info(
+                    "Asset-triggered Dags with queued events: %s",
+                    {dag_id: len(adrqs) for dag_id, adrqs in adrq_by_dag.items()},
+                )
+
+            ser_dags = SerializedDagModel.get_latest_serialized_dags(
+                dag_ids=list(adrq_by_dag), session=session
             )
-            for dag_id in missing_from_serialized:
-                del adrq_by_dag[dag_id]
-                del dag_statuses[dag_id]
-        for ser_dag in ser_dags:
-            dag_id = ser_dag.dag_id
-            statuses = dag_statuses[dag_id]
-            ready = dag_ready(dag_id, cond=ser_dag.dag.timetable.asset_condition, statuses=statuses)
-            if not ready:
+            ser_dag_ids = {ser_dag.dag_id for ser_dag in ser_dags}
+            if missing_from_serialized := set(adrq_by_dag.keys()) - ser_dag_ids:
+                log.info(
+                    "Dags have queued asset events (ADRQ), but are not found in the serialized_dag table."
+                    " — skipping Dag run creation: %s",
+                    sorted(missing_from_serialized),
+                )
+            for ser_dag in ser_dags:
+                dag_id = ser_dag.dag_id
+                adrqs = adrq_by_dag[dag_id]
+                statuses = {SerializedAssetUniqueKey.from_asset(adrq.asset): True for adrq in adrqs}
+                ready = dag_ready(dag_id, cond=ser_dag.dag.timetable.asset_condition, statuses=statuses)
+                if ready:
+                    # triggered dates for asset triggered dags
+                    triggered_date_by_dag[dag_id] = max(adrq.created_at for adrq in adrqs)
+                    continue
                 log.debug("Asset condition not met for dag '%s'", dag_id)
-                del adrq_by_dag[dag_id]
-                del dag_statuses[dag_id]
-        del dag_statuses
+                if ready is False and adrq_watermarks is not None:
+                    adrq_watermarks[dag_id] = watermarks[dag_id]
 
-        # triggered dates for asset triggered dags
-        triggered_date_by_dag: dict[str, datetime] = {
-            dag_id: max(adrq.created_at for adrq in adrqs) for dag_id, adrqs in adrq_by_dag.items()
-        }
-        del adrq_by_dag
+        stats.gauge("scheduler.asset_dag_run_queue.rows_scanned", num_rows_scanned)
+        stats.gauge("scheduler.asset_dag_run_queue.dags_evaluated", len(dag_ids_to_evaluate))
+        stats.gauge("scheduler.asset_dag_run_queue.dags_skipped", len(watermarks) - len(dag_ids_to_evaluate))
 
         asset_triggered_dag_ids = set(triggered_date_by_dag.keys())
         if asset_triggered_dag_ids:
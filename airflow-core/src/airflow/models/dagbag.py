@@ -74,6 +74,7 @@ class DBDagBag:
         load_op_links: bool = True,
         cache_size: int | None = None,
         cache_ttl: int | None = None,
+        lazy_load: bool = False,
     ) -> None:
         """
         Initialize DBDagBag.
@@ -81,8 +82,11 @@ class DBDagBag:
         :param load_op_links: Should the extra operator link be loaded when de-serializing the DAG?
         :param cache_size: Size of LRU cache. If None or 0, uses unbounded dict (no eviction).
         :param cache_ttl: Time-to-live for cache entries in seconds. If None or 0, no TTL (LRU only).
+        :param lazy_load: Should the operator fields not needed for scheduling (params, docs, executor
+            config...) only be de-serialized when first accessed?
         """
         self.load_op_links = load_op_links
+        self.lazy_load = lazy_load
         self._dags: MutableMapping[UUID | str, _CacheEntry] = {}
         self._use_cache = False
 
@@ -104,6 +108,7 @@ class DBDagBag:
     def _read_dag(self, serdag: SerializedDagModel) -> SerializedDAG | None:
         """Read and cache a SerializedDAG (with its ``dag_hash`` for staleness detection)."""
         serdag.load_op_links = self.load_op_links
+        serdag.lazy_load = self.lazy_load
         dag = serdag.dag
         if not dag:
             return None
@@ -190,6 +195,7 @@ class DBDagBag:
         if not dag_version or not (serdag := dag_version.serialized_dag):
             return None
         serdag.load_op_links = self.load_op_links
+        serdag.lazy_load = self.lazy_load
         return serdag
 
     def clear_cache(self) -> int:
@@ -231,6 +237,7 @@ class DBDagBag:
 
         for sdm in session.scalars(select(SerializedDagModel)):
             sdm.load_op_links = self.load_op_links
+            sdm.lazy_load = self.lazy_load
             if dag := sdm.dag:
                 yield dag
 
@@ -1309,6 +1309,7 @@ class DagRun(Base, LoggingMixin):
                 self.log.warning("Failed to emit dag run span", exc_info=True)
 
         self._emit_true_scheduling_delay_stats_for_finished_state(finished_tis)
+        self._emit_downstream_scheduling_delay_stats(schedulable_tis, finished_tis)
         self._emit_duration_stats_for_finished_state()
 
         session.merge(self)
@@ -1567,6 +1568,8 @@ class DagRun(Base, LoggingMixin):
                 if new_tis is not None:
                     additional_tis.extend(new_tis)
                     expansion_happened = True
+                    # The task instance counts cached for the trigger rule checks are now stale
+                    dep_context.reset_upstream_state_index()
             if new_tis is None and schedulable.state in SCHEDULEABLE_STATES:
                 # It's enough to revise map index once per task id,
                 # checking the map index for each mapped task significantly slows down scheduling
@@ -1577,6 +1580,7 @@ class DagRun(Base, LoggingMixin):
                         )
                     )
                     revised_map_index_task_ids.add(schedulable.task.task_id)
+                    dep_context.reset_upstream_state_index()
 
                 # _revise_map_indexes_if_mapped might mark the current task as REMOVED
                 # after calculating mapped task length, so we need to re-check
@@ -1665,6 +1669,41 @@ class DagRun(Base, LoggingMixin):
         except Exception:
             self.log.warning("Failed to record first_task_scheduling_delay metric:", exc_info=True)
 
+    def _emit_downstream_scheduling_delay_stats(
+        self, schedulable_tis: list[TI], finished_tis: list[TI], *, source: str = "scheduler"
+    ) -> None:
+        """
+        Emit the delay between the end of the last upstream task of each task instance and its scheduling.
+
+        This is the latency between the tasks of the Dag run. Only task instances scheduled for their first
+        try are measured, retries are delayed on purpose.
+
+        :param schedulable_tis: the task instances about to be scheduled, with their ``task`` set
+        :param finished_tis: the finished task instances of the Dag run
+        :param source: what schedules the task instances, to tell the scheduler apart from the fast path
+            of the Execution API
+        """
+        if not schedulable_tis or not finished_tis:
+            return
+        try:
+            end_dates: dict[str, datetime] = {}
+            for ti in finished_tis:
+                if ti.end_date and (ti.task_id not in end_dates or end_dates[ti.task_id] < ti.end_date):
+                    end_dates[ti.task_id] = ti.end_date
+            now = timezone.utcnow()
+            for ti in schedulable_tis:
+                if ti.state is not None or ti.task is None:
+                    continue
+                upstream_end_dates = [end_dates[t] for t in ti.task.upstream_task_ids if t in end_dates]
+                if upstream_end_dates:
+                    stats.timing(
+                        "ti.downstream_scheduling_delay",
+                        now - max(upstream_end_dates),
+                        tags={**self.stats_tags, "task_id": ti.task_id, "source": source},
+                    )
+        except Exception:
+            self.log.warning("Failed to record downstream_scheduling_delay metric:", exc_info=True)
+
     def _emit_duration_stats_for_finished_state(self):
         if self.state == DagRunState.RUNNING:
             return
@@ -1969,7 +2008,6 @@ class DagRun(Base, LoggingMixin):
         """
         from airflow.models.expandinput import NotFullyPopulated
         from airflow.serialization.definitions.mappedoperator import get_mapped_ti_count
-        from airflow.settings import task_instance_mutation_hook
 
         try:
             total_length = get_mapped_ti_count(task, self.run_id, session=session)
@@ -2001,16 +2039,18 @@ class DagRun(Base, LoggingMixin):
             )
             session.flush()
 
-        for index in range(total_length):
-            if index in existing_indexes:
-                continue
-            ti = TI(task, run_id=self.run_id, map_index=index, state=None, dag_version_id=dag_version_id)
-            self.log.debug("Expanding TIs upserted %s", ti)
-            task_instance_mutation_hook(ti, dag_run=self)
-            ti = session.merge(ti)
-            ti.refresh_from_task(task, dag_run=self)
-            session.flush()
-            yield ti
+        missing_indexes = [index for index in range(total_length) if index not in existing_indexes]
+        if missing_indexes:
+            self.log.debug("Expanding %s with %d missing task instances", task, len(missing_indexes))
+            yield from TI.create_mapped(
+                task,
+                self.run_id,
+                missing_indexes,
+                state=None,
+                dag_version_id=dag_version_id,
+                dag_run=self,
+                session=session,
+            )
 
     @classmethod
     @provide_session
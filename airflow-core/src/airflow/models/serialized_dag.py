@@ -19,8 +19,8 @@
 
 from __future__ import annotations
 
+import functools
 import logging
-import zlib
 from collections.abc import Callable, Iterable, Iterator, Sequence
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any, Literal, NamedTuple
@@ -33,7 +33,6 @@ from sqlalchemy.orm import Mapped, backref, foreign, mapped_column, relationship
 from sqlalchemy.sql.expression import func, literal
 
 from airflow._shared.timezones import timezone
-from airflow.configuration import conf
 from airflow.models.asset import (
     AssetAliasModel,
     AssetModel,
@@ -45,19 +44,20 @@ from airflow.models.dagcode import DagCode
 from airflow.models.dagrun import DagRun
 from airflow.models.deadline_alert import DeadlineAlert as DeadlineAlertModel
 from airflow.models.taskinstance import TaskInstance
+from airflow.serialization import dag_codec
+from airflow.serialization.dag_codec import DagCodec
 from airflow.serialization.dag_dependency import DagDependency
+from airflow.serialization.dag_hash import DagHashTree, hash_dag_tree, sort_serialized_dag_dict
 from airflow.serialization.definitions.assets import SerializedAssetUniqueKey as UKey
 from airflow.serialization.definitions.deadline import DeadlineAlertFields
 from airflow.serialization.enums import Encoding
 from airflow.serialization.serialized_objects import DagSerialization
 from airflow.settings import json
-from airflow.utils.hashlib_wrapper import md5
 from airflow.utils.session import NEW_SESSION, provide_session
 from airflow.utils.sqlalchemy import UtcDateTime, get_dialect_name
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
-    from sqlalchemy.orm.attributes import InstrumentedAttribute
     from sqlalchemy.sql import Select
     from sqlalchemy.sql.elements import ColumnElement
 
@@ -67,8 +67,27 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
-# If set to True, serialized DAGs is compressed before writing to DB,
-_COMPRESS_SERIALIZED_DAGS = conf.getboolean("core", "compress_serialized_dags", fallback=False)
+# The hash trees of the DAGs last written by this process, to tell which tasks changed when a DAG is
+# written again without loading its previous version from the DB.
+_LAST_HASH_TREES_MAX_SIZE = 1024
+_last_hash_trees: dict[str, DagHashTree] = {}
+
+
+def _swap_last_hash_tree(dag_id: str, hash_tree: DagHashTree) -> DagHashTree | None:
+    """Record the hash tree last written for a DAG, returning the previous one if known."""
+    previous = _last_hash_trees.pop(dag_id, None)
+    _last_hash_trees[dag_id] = hash_tree
+    if len(_last_hash_trees) > _LAST_HASH_TREES_MAX_SIZE:
+        # Dicts keep insertion order, so this evicts the DAG written least recently
+        del _last_hash_trees[next(iter(_last_hash_trees))]
+    return previous
+
+
+@functools.cache
+def _get_dag_codec() -> DagCodec:
+    """Return how serialized DAGs are encoded and compressed before writing to DB."""
+    # Resolved on first use rather than on import, so an invalid configuration only fails DAG writes
+    return DagCodec.from_config()
 
 
 class DagWriteMetadata(NamedTuple):
@@ -294,6 +313,8 @@ class SerializedDagModel(Base):
       to use a smaller interval such as 60
     * ``[core] compress_serialized_dags``:
       whether compressing the dag data to the Database.
+    * ``[core] serialized_dag_encoding`` and ``[core] serialized_dag_compression``:
+      the binary format and compression of the dag data (see :mod:`airflow.serialization.dag_codec`).
 
     It is used by webserver to load dags
     because reading from database is lightweight compared to importing from files,
@@ -343,24 +364,24 @@ class SerializedDagModel(Base):
     )
 
     load_op_links = True
+    lazy_load = False
 
-    def __init__(self, dag: LazyDeserializedDAG) -> None:
+    def __init__(self, dag: LazyDeserializedDAG, hash_tree: DagHashTree | None = None) -> None:
         self.dag_id = dag.dag_id
         dag_data = dag.data
-        self.dag_hash = SerializedDagModel.hash(dag_data)
-
-        # partially ordered json data
-        dag_data_json = json.dumps(dag_data, sort_keys=True).encode("utf-8")
+        self.__hash_tree: DagHashTree | None = hash_tree or hash_dag_tree(dag_data)
+        self.dag_hash = self.__hash_tree.dag_hash
 
-        if _COMPRESS_SERIALIZED_DAGS:
-            self._data = None
-            self._data_compressed = zlib.compress(dag_data_json)
-        else:
+        dag_codec = _get_dag_codec()
+        if dag_codec.uses_json_column:
             self._data = dag_data
             self._data_compressed = None
+        else:
+            self._data = None
+            self._data_compressed = dag_codec.encode(dag_data)
 
         # serve as cache so no need to decompress and load, when accessing data field
-        # when COMPRESS_SERIALIZED_DAGS is True
+        # when the dag data is stored in the data_compressed column
         self.__data_cache: dict[Any, Any] | None = dag_data
 
     def __repr__(self) -> str:
@@ -368,36 +389,26 @@ class SerializedDagModel(Base):
 
     @classmethod
     def hash(cls, dag_data):
-        """Hash the data to get the dag_hash."""
-        dag_data = cls._sort_serialized_dag_dict(dag_data)
-        data_ = dag_data.copy()
-        # Remove fileloc from the hash so changes to fileloc
-        # does not affect the hash. In 3.0+, a combination of
-        # bundle_path and relative fileloc more correctly determines the
-        # dag file location.
-        data_["dag"].pop("fileloc", None)
-        data_json = json.dumps(data_, sort_keys=True).encode("utf-8")
-        return md5(data_json).hexdigest()
+        """
+        Hash the data to get the dag_hash.
+
+        The hash is the root of the tree built by :func:`~airflow.serialization.dag_hash.hash_dag_tree`.
+        ``fileloc`` is not part of it, so changes to fileloc do not affect the hash. In 3.0+, a combination
+        of bundle_path and relative fileloc more correctly determines the dag file location.
+        """
+        return hash_dag_tree(dag_data).dag_hash
 
     @classmethod
     def _sort_serialized_dag_dict(cls, serialized_dag: Any):
         """Recursively sort json_dict and its nested dictionaries and lists."""
-        if isinstance(serialized_dag, dict):
-            return {k: cls._sort_serialized_dag_dict(v) for k, v in sorted(serialized_dag.items())}
-        if isinstance(serialized_dag, (list, tuple)):
-            if all(isinstance(i, dict) for i in serialized_dag):
-                if all(
-                    isinstance(i.get("__var", {}), Iterable) and "task_id" in i.get("__var", {})
-                    for i in serialized_dag
-                ):
-                    return sorted(
-                        [cls._sort_serialized_dag_dict(i) for i in serialized_dag],
-                        key=lambda x: x["__var"]["task_id"],
-                    )
-            elif all(isinstance(item, str) for item in serialized_dag):
-                return sorted(serialized_dag)
-            return [cls._sort_serialized_dag_dict(i) for i in serialized_dag]
-        return serialized_dag
+        return sort_serialized_dag_dict(serialized_dag)
+
+    @property
+    def hash_tree(self) -> DagHashTree:
+        """The hashes of the tasks and task groups of the serialized DAG, whose root is ``dag_hash``."""
+        if getattr(self, "_SerializedDagModel__hash_tree", None) is None:
+            self.__hash_tree = hash_dag_tree(self.data)
+        return self.__hash_tree
 
     @classmethod
     def _generate_deadline_uuids(cls, dag_data: dict[str, Any]) -> dict[str, dict]:
@@ -605,6 +616,7 @@ class SerializedDagModel(Base):
         *,
         session: Session = NEW_SESSION,
         _prefetched: DagWriteMetadata | None = None,
+        _hash_tree: DagHashTree | None = None,
     ) -> bool:
         """
         Serialize a DAG and writes it into database.
@@ -619,6 +631,7 @@ class SerializedDagModel(Base):
         :param min_update_interval: minimal interval in seconds to update serialized DAG
         :param session: ORM Session
         :param _prefetched: Pre-fetched metadata to skip per-DAG queries; used by bulk callers
+        :param _hash_tree: Hash tree of the DAG already computed by the caller, to not hash it again
 
         :returns: Boolean indicating if the DAG was written to the DB
         """
@@ -643,6 +656,8 @@ class SerializedDagModel(Base):
 
         name_updated = False
         if dag.data.get("dag", {}).get("deadline"):
+            # The deadline UUIDs set below change the hash
+            _hash_tree = None
             # Try to reuse existing deadline UUIDs if the deadline definitions haven't changed.
             # This preserves the hash and avoids unnecessary SerializedDagModel recreations.
             existing_serialized_dag = session.scalar(
@@ -683,7 +698,8 @@ class SerializedDagModel(Base):
         else:
             deadline_uuid_mapping = {}
 
-        new_serialized_dag = cls(dag)
+        new_serialized_dag = cls(dag, hash_tree=_hash_tree)
+        previous_hash_tree = _swap_last_hash_tree(dag.dag_id, new_serialized_dag.hash_tree)
 
         if (
             serialized_dag_hash == new_serialized_dag.dag_hash
@@ -709,6 +725,18 @@ class SerializedDagModel(Base):
             log.debug("Serialized DAG (%s) is unchanged. Skipping writing to DB", dag.dag_id)
             return False
 
+        if previous_hash_tree is not None and previous_hash_tree.dag_hash == serialized_dag_hash:
+            changed_tasks = new_serialized_dag.hash_tree.changed_tasks(previous_hash_tree)
+            log.info(
+                "Serialized DAG (%s) changed: %d task(s) added, removed or modified %s, DAG attributes %s",
+                dag.dag_id,
+                len(changed_tasks),
+                sorted(changed_tasks),
+                "modified"
+                if new_serialized_dag.hash_tree.attributes_hash != previous_hash_tree.attributes_hash
+                else "unchanged",
+            )
+
         has_task_instances: bool = False
         if dag_version:
             has_task_instances = bool(
@@ -880,7 +908,7 @@ class SerializedDagModel(Base):
         # use __data_cache to avoid decompress and loads
         if not hasattr(self, "_SerializedDagModel__data_cache") or self.__data_cache is None:
             if self._data_compressed:
-                self.__data_cache = json.loads(zlib.decompress(self._data_compressed))
+                self.__data_cache = dag_codec.decode(self._data_compressed)
             else:
                 self.__data_cache = self._data
 
@@ -890,6 +918,7 @@ class SerializedDagModel(Base):
     def dag(self) -> SerializedDAG:
         """The DAG deserialized from the ``data`` column."""
         DagSerialization._load_operator_extra_links = self.load_op_links
+        DagSerialization._lazy_load_operator_fields = self.lazy_load
         if isinstance(self.data, dict):
             data = self.data
         elif isinstance(self.data, str):
@@ -937,33 +966,33 @@ class SerializedDagModel(Base):
         :param session: ORM Session
         """
         load_json: Callable
-        data_col_to_select: ColumnElement[Any] | InstrumentedAttribute[bytes | None]
-        if _COMPRESS_SERIALIZED_DAGS is False:
-            dialect = get_dialect_name(session)
-            if dialect in ["sqlite", "mysql"]:
-                data_col_to_select = func.json_extract(cls._data, "$.dag.dag_dependencies")
-
-                def load_json(deps_data):
-                    return json.loads(deps_data) if deps_data else []
-            elif dialect == "postgresql":
-                # Use #> operator which works for both JSON and JSONB types
-                # Returns the JSON sub-object at the specified path
-                data_col_to_select = cls._data.op("#>")(literal('{"dag","dag_dependencies"}'))
-                load_json = lambda x: x
-            else:
-                data_col_to_select = func.json_extract_path(cls._data, "dag", "dag_dependencies")
-                load_json = lambda x: x
-        else:
-            data_col_to_select = cls._data_compressed
+        data_col_to_select: ColumnElement[Any]
+        dialect = get_dialect_name(session)
+        if dialect in ["sqlite", "mysql"]:
+            data_col_to_select = func.json_extract(cls._data, "$.dag.dag_dependencies")
 
             def load_json(deps_data):
-                return json.loads(zlib.decompress(deps_data))["dag"]["dag_dependencies"] if deps_data else []
+                return json.loads(deps_data) if deps_data else []
+        elif dialect == "postgresql":
+            # Use #> operator which works for both JSON and JSONB types
+            # Returns the JSON sub-object at the specified path
+            data_col_to_select = cls._data.op("#>")(literal('{"dag","dag_dependencies"}'))
+            load_json = lambda x: x
+        else:
+            data_col_to_select = func.json_extract_path(cls._data, "dag", "dag_dependencies")
+            load_json = lambda x: x
+
+        def load_dependencies(deps_data, data_compressed):
+            # Rows written with different codecs can coexist, so the column used depends on the row
+            if data_compressed:
+                return dag_codec.decode(data_compressed)["dag"]["dag_dependencies"]
+            return load_json(deps_data)
 
         latest_sdag_subquery = (
             select(cls.dag_id, func.max(cls.created_at).label("max_created")).group_by(cls.dag_id).subquery()
         )
         query = session.execute(
-            select(cls.dag_id, data_col_to_select)
+            select(cls.dag_id, data_col_to_select, cls._data_compressed)
             .join(
                 latest_sdag_subquery,
                 (cls.dag_id == latest_sdag_subquery.c.dag_id)
@@ -972,7 +1001,10 @@ class SerializedDagModel(Base):
             .join(cls.dag_model)
             .where(~DagModel.is_stale)
         )
-        dag_depdendencies = [(str(dag_id), load_json(deps_data)) for dag_id, deps_data in query]
+        dag_depdendencies = [
+            (str(dag_id), load_dependencies(deps_data, data_compressed))
+            for dag_id, deps_data, data_compressed in query
+        ]
         resolver = _DagDependenciesResolver(dag_id_dependencies=dag_depdendencies, session=session)
         dag_depdendencies_by_dag = resolver.resolve()
         return dag_depdendencies_by_dag
@@ -96,11 +96,14 @@ from airflow.models.taskreschedule import TaskReschedule
 from airflow.models.xcom import XCOM_RETURN_KEY, LazyXComSelectSequence, XComModel
 from airflow.serialization.enums import stringify_encoding_keys
 from airflow.settings import task_instance_mutation_hook
-from airflow.task.priority_strategy import validate_and_load_priority_weight_strategy
+from airflow.task.priority_strategy import (
+    get_airflow_priority_weight_strategies,
+    validate_and_load_priority_weight_strategy,
+)
 from airflow.ti_deps.dep_context import DepContext
 from airflow.ti_deps.dependencies_deps import REQUEUEABLE_DEPS, RUNNING_DEPS
 from airflow.ti_deps.deps.ready_to_reschedule import ReadyToRescheduleDep
-from airflow.utils.helpers import prune_dict
+from airflow.utils.helpers import chunks, prune_dict
 from airflow.utils.log.logging_mixin import LoggingMixin
 from airflow.utils.net import get_hostname
 from airflow.utils.platform import getuser
@@ -776,6 +779,79 @@ class TaskInstance(Base, LoggingMixin, BaseWorkload):
             "context_carrier": context_carrier,
         }
 
+    @classmethod
+    def create_mapped(
+        cls,
+        task: Operator,
+        run_id: str,
+        map_indexes: Iterable[int],
+        *,
+        state: str | None,
+        dag_version_id: UUID | None,
+        dag_run: DagRun,
+        session: Session,
+    ) -> list[TaskInstance]:
+        """
+        Create the task instances of a mapped task for the given map indexes, which must not exist yet.
+
+        Without a ``task_instance_mutation_hook`` cluster policy, the rows are inserted with multi-row
+        INSERT statements of ``[scheduler] max_tis_per_insert`` task instances, and read back with one
+        query per batch. Otherwise the task instances go through the hook, and are flushed in batches.
+
+        :return: The created task instances, in the order of ``map_indexes``.
+
+        :meta private:
+        """
+        batch_size = conf.getint("scheduler", "max_tis_per_insert", fallback=1000)
+        hook = settings.task_instance_mutation_hook
+        # Policies loaded from the "airflow.policy" entry points don't unset is_noop
+        hook_is_noop = getattr(hook, "is_noop", False) is True and not (
+            settings.get_policy_plugin_manager().hook.task_instance_mutation_hook.get_hookimpls()
+        )
+        weight_rule = task.weight_rule
+        if not hasattr(weight_rule, "get_weight"):
+            weight_rule = validate_and_load_priority_weight_strategy(weight_rule)
+        # The priority weight of the built-in strategies doesn't depend on the map index
+        same_weight = type(weight_rule) in get_airflow_priority_weight_strategies().values()
+        template: dict[str, Any] | None = None
+
+        def insert_mapping(index: int) -> dict[str, Any]:
+            nonlocal template
+            if template is None or not same_weight:
+                template = cls.insert_mapping(
+                    run_id, task, index, dag_version_id=dag_version_id, dag_run=dag_run
+                )
+                return {**template, "state": state}
+            carrier = new_task_run_carrier(dag_run.context_carrier)
+            return {**template, "map_index": index, "context_carrier": carrier, "state": state}
+
+        created: list[TaskInstance] = []
+        for batch in chunks(list(map_indexes), batch_size):
+            if hook_is_noop:
+                session.bulk_insert_mappings(cls.__mapper__, [insert_mapping(index) for index in batch])
+                tis = session.scalars(
+                    select(cls).where(
+                        cls.dag_id == task.dag_id,
+                        cls.task_id == task.task_id,
+                        cls.run_id == run_id,
+                        cls.map_index.in_(batch),
+                    )
+                )
+                by_index = {ti.map_index: ti for ti in tis}
+                for index in batch:
+                    by_index[index].task = task
+                    created.append(by_index[index])
+            else:
+                for index in batch:
+                    ti = cls(task, run_id=run_id, map_index=index, state=state, dag_version_id=dag_version_id)
+                    ti.context_carrier = new_task_run_carrier(dag_run.context_carrier)
+                    # Attached first, for hooks querying through the session of the task instance
+                    session.add(ti)
+                    hook(ti, dag_run=dag_run)
+                    created.append(ti)
+                session.flush()
+        return created
+
     @reconstructor
     def init_on_load(self) -> None:
         """Initialize the attributes that aren't stored in the DB."""
@@ -28,7 +28,6 @@ from opentelemetry import trace
 from sqlalchemy import CheckConstraint, ForeignKeyConstraint, Integer, String, func, or_, select
 from sqlalchemy.orm import Mapped, mapped_column
 
-from airflow._shared.observability.traces import new_task_run_carrier
 from airflow.models.base import COLLATION_ARGS, ID_LEN, TaskInstanceDependencies
 from airflow.models.dag_version import DagVersion
 from airflow.utils.db import exists_query
@@ -256,21 +255,18 @@ class TaskMap(TaskInstanceDependencies):
                 )
             )
 
-        for index in indexes_to_map:
-            # TODO: Make more efficient with bulk_insert_mappings/bulk_save_mappings.
-            ti = TaskInstance(
+        if indexes_to_map:
+            expanded_tis = TaskInstance.create_mapped(
                 task,
-                run_id=run_id,
-                map_index=index,
+                run_id,
+                indexes_to_map,
                 state=state,
                 dag_version_id=dag_version_id,
+                dag_run=dr,
+                session=session,
             )
-            task.log.debug("Expanding TIs upserted %s", ti)
-            task_instance_mutation_hook(ti, dag_run=dr)
-            ti = session.merge(ti)
-            ti.context_carrier = new_task_run_carrier(dr.context_carrier)
-            ti.refresh_from_task(task, dag_run=dr)  # session.merge() loses task information.
-            all_expanded_tis.append(ti)
+            task.log.debug("Expanded %s into %d task instances", task, len(expanded_tis))
+            all_expanded_tis.extend(expanded_tis)
 
         # Coerce the None case to 0 -- these two are almost treated identically,
         # except the unmapped ti (if exists) is marked to different states.
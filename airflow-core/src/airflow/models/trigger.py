@@ -18,7 +18,8 @@ from __future__ import annotations
 
 import datetime
 import logging
-from collections.abc import Iterable
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
 from enum import Enum
 from functools import singledispatch
 from traceback import format_exception
@@ -299,6 +300,63 @@ class Trigger(Base):
         if trigger.callback:
             trigger.callback.handle_event(event, session)
 
+    @classmethod
+    @provide_session
+    def submit_events(
+        cls, events: Sequence[tuple[int, TriggerEvent]], *, session: Session = NEW_SESSION
+    ) -> None:
+        """
+        Fire many events in one transaction.
+
+        This has the same effect as calling :meth:`submit_event` for each ``(trigger_id, event)`` pair
+        in order, but the deferred task instances and triggers of the whole batch are loaded with a
+        few queries and the task instance updates are flushed together.
+        """
+        trigger_ids = {trigger_id for trigger_id, _ in events}
+        if not trigger_ids:
+            return
+
+        # Resume deferred tasks. Only the first event of a trigger resumes its task instances, as
+        # they are no longer deferred by the time a later event of the same trigger is submitted.
+        deferred_tis: dict[int, list[TaskInstance]] = defaultdict(list)
+        for task_instance in session.scalars(
+            select(TaskInstance).where(
+                TaskInstance.trigger_id.in_(trigger_ids), TaskInstance.state == TaskInstanceState.DEFERRED
+            )
+        ):
+            if TYPE_CHECKING:
+                assert task_instance.trigger_id is not None
+            deferred_tis[task_instance.trigger_id].append(task_instance)
+
+        triggers = {
+            trigger.id: trigger
+            for trigger in session.scalars(
+                select(cls)
+                .where(cls.id.in_(trigger_ids))
+                .options(selectinload(cls.asset_watchers).joinedload(AssetWatcherModel.asset))
+                .options(selectinload(cls.callback))
+            )
+        }
+
+        for trigger_id, event in events:
+            for task_instance in deferred_tis.pop(trigger_id, ()):
+                handle_event_submit(event, task_instance=task_instance, session=session, flush=False)
+
+            # Send an event to assets
+            trigger = triggers.get(trigger_id)
+            if trigger is None:
+                # Already deleted for some reason
+                continue
+            for asset in trigger.assets:
+                AssetManager.register_asset_change(
+                    asset=asset.to_serialized(),
+                    extra={"from_trigger": True, "payload": event.payload},
+                    session=session,
+                )
+            if trigger.callback:
+                trigger.callback.handle_event(event, session)
+        session.flush()
+
     @classmethod
     @provide_session
     def submit_failure(cls, trigger_id, exc=None, *, session: Session = NEW_SESSION) -> None:
@@ -498,7 +556,9 @@ class Trigger(Base):
 
 
 @singledispatch
-def handle_event_submit(event: TriggerEvent, *, task_instance: TaskInstance, session: Session) -> None:
+def handle_event_submit(
+    event: TriggerEvent, *, task_instance: TaskInstance, session: Session, flush: bool = True
+) -> None:
     """
     Handle the submit event for a given task instance.
 
@@ -508,6 +568,7 @@ def handle_event_submit(event: TriggerEvent, *, task_instance: TaskInstance, ses
 
     :param task_instance: The task instance to handle the submit event for.
     :param session: The session to be used for the database callback sink.
+    :param flush: Whether to flush the session; callers submitting many events flush once at the end.
     """
     from airflow.sdk.serde import deserialize, serialize
     from airflow.utils.state import TaskInstanceState
@@ -540,11 +601,12 @@ def handle_event_submit(event: TriggerEvent, *, task_instance: TaskInstance, ses
     # Set the state of the task instance to scheduled
     task_instance.state = TaskInstanceState.SCHEDULED
     task_instance.scheduled_dttm = timezone.utcnow()
-    session.flush()
+    if flush:
+        session.flush()
 
 
 @handle_event_submit.register
-def _(event: BaseTaskEndEvent, *, task_instance: TaskInstance, session: Session) -> None:
+def _(event: BaseTaskEndEvent, *, task_instance: TaskInstance, session: Session, flush: bool = True) -> None:
     """
     Submit event for the given task instance.
 
@@ -552,6 +614,7 @@ def _(event: BaseTaskEndEvent, *, task_instance: TaskInstance, session: Session)
 
     :param task_instance: The task instance to be submitted.
     :param session: The session to be used for the database callback sink.
+    :param flush: Whether to flush the session once the event has been handled.
     """
     from airflow.callbacks.callback_requests import TaskCallbackRequest
     from airflow.callbacks.database_callback_sink import DatabaseCallbackSink
@@ -587,4 +650,5 @@ def _(event: BaseTaskEndEvent, *, task_instance: TaskInstance, session: Session)
 
     _submit_callback_if_necessary()
     _push_xcoms_if_necessary()
-    session.flush()
+    if flush:
+        session.flush()
@@ -0,0 +1,162 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Encoding and compression of the serialized DAGs stored in the ``serialized_dag`` table.
+
+Serialized DAGs are stored either as JSON in the ``data`` column, or as bytes in the
+``data_compressed`` column. Those bytes are either a bare zlib-compressed JSON document (the format
+written when ``[core] compress_serialized_dags`` is set), or a frame starting with a header naming
+the encoding and compression of the rest of the frame. Readers detect the format of each row, so
+the codec used for writing can be changed at any time: existing rows are still read, and are
+rewritten with the new codec as their DAGs change.
+"""
+
+from __future__ import annotations
+
+import struct
+import zlib
+from typing import Any, NamedTuple
+
+import msgspec
+
+from airflow.configuration import conf
+from airflow.exceptions import AirflowConfigException
+from airflow.settings import json
+
+ENCODINGS = ("json", "msgpack")
+COMPRESSIONS = ("none", "zlib", "zstd", "lz4")
+
+# A zlib stream never starts with a null byte, so the header cannot be mistaken for one.
+_MAGIC = b"\x00SDG"
+_HEADER = struct.Struct(f"!{len(_MAGIC)}sBB")
+
+
+def _zstd():
+    try:
+        from compression import zstd  # type: ignore[import-not-found]  # Python 3.14+
+    except ImportError:
+        try:
+            import zstandard as zstd
+        except ImportError:
+            raise ImportError(
+                "The zstd compression of serialized DAGs requires the `zstandard` package"
+            ) from None
+    return zstd
+
+
+def _lz4():
+    try:
+        import lz4.frame
+    except ImportError:
+        raise ImportError("The lz4 compression of serialized DAGs requires the `lz4` package") from None
+    return lz4.frame
+
+
+def _compress(compression: str, data: bytes) -> bytes:
+    if compression == "zlib":
+        return zlib.compress(data)
+    if compression == "zstd":
+        return _zstd().compress(data)
+    if compression == "lz4":
+        return _lz4().compress(data)
+    return data
+
+
+def _decompress(compression: str, data: bytes) -> bytes:
+    if compression == "zlib":
+        return zlib.decompress(data)
+    if compression == "zstd":
+        return _zstd().decompress(data)
+    if compression == "lz4":
+        return _lz4().decompress(data)
+    return data
+
+
+class DagCodec(NamedTuple):
+    """
+    How serialized DAGs are written to the ``serialized_dag`` table.
+
+    :param encoding: ``json`` or ``msgpack``.
+    :param compression: ``none``, ``zlib``, ``zstd`` or ``lz4``.
+    """
+
+    encoding: str = "json"
+    compression: str = "none"
+
+    @classmethod
+    def from_config(cls) -> DagCodec:
+        """
+        Get the codec configured with ``[core] serialized_dag_encoding`` and ``serialized_dag_compression``.
+
+        Without ``serialized_dag_compression``, DAGs are compressed with zlib if ``[core]
+        compress_serialized_dags`` is set.
+        """
+        encoding = conf.get("core", "serialized_dag_encoding", fallback="json").lower()
+        compression = conf.get("core", "serialized_dag_compression", fallback="").lower()
+        if not compression:
+            compress = conf.getboolean("core", "compress_serialized_dags", fallback=False)
+            compression = "zlib" if compress else "none"
+        if encoding not in ENCODINGS:
+            raise AirflowConfigException(
+                f"Invalid [core] serialized_dag_encoding {encoding!r}, must be one of {ENCODINGS}"
+            )
+        if compression not in COMPRESSIONS:
+            raise AirflowConfigException(
+                f"Invalid [core] serialized_dag_compression {compression!r}, must be one of {COMPRESSIONS}"
+            )
+        codec = cls(encoding, compression)
+        try:
+            codec.encode({})
+        except ImportError as e:
+            raise AirflowConfigException(str(e)) from e
+        return codec
+
+    @property
+    def uses_json_column(self) -> bool:
+        """Whether serialized DAGs are stored as JSON in the ``data`` column rather than as bytes."""
+        return self.encoding == "json" and self.compression == "none"
+
+    def encode(self, data: dict[str, Any]) -> bytes:
+        """Encode a serialized DAG to be stored in the ``data_compressed`` column."""
+        if self.encoding == "json":
+            encoded = json.dumps(data, sort_keys=True).encode("utf-8")
+            if self.compression == "zlib":
+                # Written without a header, to stay readable by Airflow versions that do not know it
+                return zlib.compress(encoded)
+        else:
+            encoded = msgspec.msgpack.encode(data)
+        return _HEADER.pack(
+            _MAGIC, ENCODINGS.index(self.encoding), COMPRESSIONS.index(self.compression)
+        ) + _compress(self.compression, encoded)
+
+
+def decode(data: bytes) -> dict[str, Any]:
+    """Decode a serialized DAG stored in the ``data_compressed`` column, whatever its codec."""
+    if not data.startswith(_MAGIC):
+        return json.loads(zlib.decompress(data))
+    _, encoding_id, compression_id = _HEADER.unpack_from(data)
+    try:
+        encoding, compression = ENCODINGS[encoding_id], COMPRESSIONS[compression_id]
+    except IndexError:
+        raise ValueError(
+            f"Unknown serialized DAG codec ({encoding_id}, {compression_id}), written by a newer Airflow?"
+        ) from None
+    payload = _decompress(compression, data[_HEADER.size :])
+    if encoding == "json":
+        return json.loads(payload)
+    return msgspec.msgpack.decode(payload)
@@ -0,0 +1,148 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Hierarchical content hashes of serialized DAGs, stored as ``dag_hash`` in the ``serialized_dag`` table.
+
+The hash of a DAG is combined from the hashes of its parts: one per task, one per task group -- combined
+from the hashes of its children -- and one of the DAG-level attributes. Each task is hashed on its own,
+so comparing the trees of two versions of a DAG tells which of its tasks changed. All the parts are
+hashed again on every parse: the serialized tasks are new objects each time, so telling that one is
+unchanged would take as long as hashing it.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any, NamedTuple
+
+from airflow.serialization.enums import DagAttributeTypes as DAT, Encoding
+from airflow.settings import json
+from airflow.utils.hashlib_wrapper import md5
+
+# DAG-level keys which are not DAG attributes, or don't affect how the DAG runs
+_NON_ATTRIBUTE_KEYS = frozenset(("tasks", "task_group", "fileloc"))
+
+
+class DagHashTree(NamedTuple):
+    """Content hashes of a serialized DAG and of its parts."""
+
+    dag_hash: str
+    attributes_hash: str
+    task_hashes: dict[str, str]
+    task_group_hashes: dict[str, str]
+
+    def changed_tasks(self, previous: DagHashTree) -> set[str]:
+        """Return the IDs of the tasks added, removed or modified since ``previous``."""
+        return {
+            task_id
+            for task_id in self.task_hashes.keys() | previous.task_hashes.keys()
+            if self.task_hashes.get(task_id) != previous.task_hashes.get(task_id)
+        }
+
+
+def sort_serialized_dag_dict(serialized_dag: Any) -> Any:
+    """Recursively sort json_dict and its nested dictionaries and lists."""
+    if isinstance(serialized_dag, dict):
+        return {k: sort_serialized_dag_dict(v) for k, v in sorted(serialized_dag.items())}
+    if isinstance(serialized_dag, (list, tuple)):
+        if all(isinstance(i, dict) for i in serialized_dag):
+            if all(
+                isinstance(i.get("__var", {}), Iterable) and "task_id" in i.get("__var", {})
+                for i in serialized_dag
+            ):
+                return sorted(
+                    [sort_serialized_dag_dict(i) for i in serialized_dag],
+                    key=lambda x: x["__var"]["task_id"],
+                )
+        elif all(isinstance(item, str) for item in serialized_dag):
+            return sorted(serialized_dag)
+        return [sort_serialized_dag_dict(i) for i in serialized_dag]
+    return serialized_dag
+
+
+def hash_dag_tree(dag_data: dict[str, Any]) -> DagHashTree:
+    """Hash a serialized DAG and its parts."""
+    task_hashes = {task_id: _hash_task(task) for task_id, task in _iter_tasks(dag_data["dag"].get("tasks"))}
+    task_group_hashes: dict[str, str] = {}
+    root_group = dag_data["dag"].get("task_group")
+    root_group_hash = _hash_task_group("", root_group, task_hashes, task_group_hashes) if root_group else None
+    attributes_hash = _hash_attributes(dag_data)
+    return DagHashTree(
+        dag_hash=_combine_root(attributes_hash, root_group_hash, task_hashes),
+        attributes_hash=attributes_hash,
+        task_hashes=task_hashes,
+        task_group_hashes=task_group_hashes,
+    )
+
+
+def _iter_tasks(tasks: Any) -> Iterable[tuple[str, Any]]:
+    if isinstance(tasks, dict):
+        yield from tasks.items()
+        return
+    for index, task in enumerate(tasks or ()):
+        task_var = task.get(Encoding.VAR, task) if isinstance(task, dict) else None
+        if isinstance(task_var, dict) and "task_id" in task_var:
+            yield task_var["task_id"], task
+        else:
+            yield f"__{index}", task
+
+
+def _hash_task(task: Any) -> str:
+    # The keys of the dicts are sorted by the C implementation of json, which is the bulk of the
+    # speedup over sorting the whole serialized DAG in Python first. The sets of the task are sorted
+    # when serialized.
+    return md5(json.dumps(task, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _hash_attributes(dag_data: dict[str, Any]) -> str:
+    attributes = {key: value for key, value in dag_data.items() if key != "dag"}
+    attributes["dag"] = {
+        key: value for key, value in dag_data["dag"].items() if key not in _NON_ATTRIBUTE_KEYS
+    }
+    return md5(json.dumps(sort_serialized_dag_dict(attributes), sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _hash_task_group(
+    group_id: str, task_group: dict[str, Any], task_hashes: dict[str, str], task_group_hashes: dict[str, str]
+) -> str:
+    """
+    Hash a task group from its attributes and the hashes of its children, recording those of its groups.
+
+    The groups are recorded under their full IDs -- the labels of the children of their parent groups --
+    and the root task group under an empty string.
+    """
+    attributes = {key: value for key, value in task_group.items() if key != "children"}
+    parts = [
+        md5(json.dumps(sort_serialized_dag_dict(attributes), sort_keys=True).encode("utf-8")).hexdigest()
+    ]
+    for label, (child_type, child) in sorted(task_group.get("children", {}).items()):
+        if child_type == DAT.TASK_GROUP:
+            child_hash = _hash_task_group(label, child, task_hashes, task_group_hashes)
+        else:
+            child_hash = task_hashes.get(child, "")
+        parts.append(f"{label}:{child_type}:{child_hash}")
+    group_hash = md5("\n".join(parts).encode("utf-8")).hexdigest()
+    task_group_hashes[group_id] = group_hash
+    return group_hash
+
+
+def _combine_root(attributes_hash: str, root_group_hash: str | None, task_hashes: dict[str, str]) -> str:
+    # All the tasks are combined, in case some are not in the task groups
+    parts = [attributes_hash, root_group_hash or ""]
+    parts.extend(f"{task_id}:{task_hash}" for task_id, task_hash in sorted(task_hashes.items()))
+    return md5("\n".join(parts).encode("utf-8")).hexdigest()
@@ -35,7 +35,7 @@ from airflow.ti_deps.deps.prev_dagrun_dep import PrevDagrunDep
 from airflow.ti_deps.deps.trigger_rule_dep import TriggerRuleDep
 
 if TYPE_CHECKING:
-    from collections.abc import Collection, Iterable, Iterator, Sequence
+    from collections.abc import Callable, Collection, Iterable, Iterator, Sequence
 
     from airflow.models.taskinstance import TaskInstance
     from airflow.sdk import Context
@@ -58,6 +58,38 @@ DEFAULT_OPERATOR_DEPS: frozenset[BaseTIDep] = frozenset(
 )
 
 
+class _LazyField:
+    """
+    Operator field decoded from its serialized value when first accessed.
+
+    When a DAG is deserialized lazily, ``OperatorSerialization.populate_operator`` stores a decoder
+    of the serialized value of each of the :attr:`SerializedBaseOperator.LAZY_FIELDS` of an operator
+    in its ``_lazy_fields``, instead of decoding the value.
+    """
+
+    def __init__(self, name: str, default: Any) -> None:
+        self.name = name
+        self.default = default
+
+    def __get__(self, instance: SerializedBaseOperator | None, owner: type | None = None) -> Any:
+        if instance is None:
+            return self.default
+        try:
+            return instance.__dict__[self.name]
+        except KeyError:
+            pass
+        lazy_fields = instance.__dict__.get("_lazy_fields")
+        if not lazy_fields or (decode := lazy_fields.pop(self.name, None)) is None:
+            return self.default
+        value = instance.__dict__[self.name] = decode()
+        return value
+
+    def __set__(self, instance: SerializedBaseOperator, value: Any) -> None:
+        instance.__dict__[self.name] = value
+        if lazy_fields := instance.__dict__.get("_lazy_fields"):
+            lazy_fields.pop(self.name, None)
+
+
 class SerializedBaseOperator(DAGNode):
     """
     Serialized representation of a BaseOperator instance.
@@ -152,12 +184,30 @@ class SerializedBaseOperator(DAGNode):
 
     is_mapped = False
 
+    LAZY_FIELDS = frozenset(
+        (
+            "doc",
+            "doc_json",
+            "doc_md",
+            "doc_rst",
+            "doc_yaml",
+            "email",
+            "executor_config",
+            "inlets",
+            "outlets",
+            "params",
+            "resources",
+        )
+    )
+    """Fields not needed for scheduling, which are decoded on first access when deserialized lazily."""
+
     def __init__(self, *, task_id: str, _airflow_from_mapped: bool = False) -> None:
         super().__init__()
         self._BaseOperator__from_mapped = _airflow_from_mapped
         self.task_id = task_id
         self.deps = DEFAULT_OPERATOR_DEPS
         self._operator_name: str | None = None
+        self._lazy_fields: dict[str, Callable[[], Any]] = {}
 
     # Disable hashing.
     __hash__ = None  # type: ignore[assignment]
@@ -448,3 +498,8 @@ class SerializedBaseOperator(DAGNode):
         if group is None:
             raise NotMapped()
         return group.get_parse_time_mapped_ti_count()
+
+
+for _field in SerializedBaseOperator.LAZY_FIELDS:
+    setattr(SerializedBaseOperator, _field, _LazyField(_field, getattr(SerializedBaseOperator, _field)))
+del _field
@@ -21,6 +21,7 @@ from __future__ import annotations
 
 import pkgutil
 from collections.abc import Iterable
+from functools import cache
 from typing import TYPE_CHECKING, Protocol
 
 from airflow.exceptions import AirflowException
@@ -66,8 +67,13 @@ def load_dag_schema_dict() -> dict:
     return schema
 
 
+@cache
 def load_dag_schema() -> Validator:
-    """Load & Validate Json Schema for DAG."""
+    """
+    Load & Validate Json Schema for DAG.
+
+    The validator is created once per process, and shared by the serializers validating against it.
+    """
     import jsonschema
 
     schema = load_dag_schema_dict()
@@ -30,7 +30,7 @@ import math
 import sys
 import weakref
 from collections.abc import Collection, Iterable, Mapping
-from functools import cache, cached_property, lru_cache
+from functools import cache, cached_property, lru_cache, partial
 from inspect import signature
 from textwrap import dedent
 from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple, TypeVar, cast, overload
@@ -348,6 +348,7 @@ class BaseSerialization:
     # de-serializing the DAG? This flag is set to False in Scheduler so that Extra Operator links
     # are not loaded to not run User code in Scheduler.
     _load_operator_extra_links = True
+    _lazy_load_operator_fields = False
 
     _CONSTRUCTOR_PARAMS: dict[str, Parameter] = {}
 
@@ -1106,11 +1107,20 @@ class OperatorSerialization(DAGNode, BaseSerialization):
                 )
 
         deserialized_partial_kwarg_defaults = {}
+        lazy_fields = (
+            SerializedBaseOperator.LAZY_FIELDS.difference(encoded_op.get("template_fields", ()))
+            if cls._lazy_load_operator_fields and not op.is_mapped
+            else frozenset()
+        )
 
         for k_in, v_in in encoded_op.items():
             k = k_in  # surpass PLW2901
             v = v_in  # surpass PLW2901
             # Use centralized field deserialization logic
+            if k in lazy_fields:
+                # Decoded when first accessed, see SerializedBaseOperator.LAZY_FIELDS
+                op._lazy_fields[k] = partial(cls._deserialize_lazy_field, k, v)
+                continue
             if k in encoded_op.get("template_fields", []):
                 pass  # Template fields are handled separately
             elif k == "_operator_extra_links":
@@ -1558,6 +1568,15 @@ class OperatorSerialization(DAGNode, BaseSerialization):
 
         return client_defaults
 
+    @classmethod
+    def _deserialize_lazy_field(cls, field_name: str, value: Any) -> Any:
+        """Deserialize the value of one of the ``SerializedBaseOperator.LAZY_FIELDS`` as populate_operator does."""
+        if field_name == "params":
+            return cls._deserialize_params_dict(value)
+        if field_name in cls._decorated_fields or field_name in ("outlets", "inlets"):
+            return cls.deserialize(value)
+        return cls._deserialize_field_value(field_name, value)
+
     @classmethod
     def _deserialize_field_value(cls, field_name: str, value: Any) -> Any:
         """
@@ -1783,6 +1802,7 @@ class DagSerialization(BaseSerialization):
                 v = set(v)
             elif k == "tasks":
                 OperatorSerialization._load_operator_extra_links = cls._load_operator_extra_links
+                OperatorSerialization._lazy_load_operator_fields = cls._lazy_load_operator_fields
                 tasks = {}
                 for obj in v:
                     if obj.get(Encoding.TYPE) == DAT.OP:
@@ -1902,8 +1922,14 @@ class DagSerialization(BaseSerialization):
         return optional_fields
 
     @classmethod
-    def to_dict(cls, var: Any) -> dict:
-        """Stringifies DAGs and operators contained by var and returns a dict of var."""
+    def to_dict(cls, var: Any, *, validate: bool = True) -> dict:
+        """
+        Stringifies DAGs and operators contained by var and returns a dict of var.
+
+        :param var: the DAG to serialize
+        :param validate: whether to validate the serialized DAG against the JSON schema. Callers that
+            skip it are expected to validate the DAGs they store themselves.
+        """
         # Clear any cached client_defaults to ensure fresh generation for this DAG
         # Clear lru_cache for client defaults
         OperatorSerialization.generate_client_defaults.cache_clear()
@@ -1916,8 +1942,9 @@ class DagSerialization(BaseSerialization):
         if client_defaults:
             json_dict["client_defaults"] = {"tasks": client_defaults}
 
-        # Validate Serialized DAG with Json Schema. Raises Error if it mismatches
-        cls.validate_schema(json_dict)
+        if validate:
+            # Validate Serialized DAG with Json Schema. Raises Error if it mismatches
+            cls.validate_schema(json_dict)
         return json_dict
 
     @staticmethod
@@ -681,12 +681,20 @@ def _configure_secrets_masker():
     """Configure the secrets masker with values from config."""
     from airflow._shared.secrets_masker import (
         DEFAULT_SENSITIVE_FIELDS,
+        MASK_ENGINES,
         _secrets_masker as secrets_masker_core,
     )
     from airflow.configuration import conf
 
     min_length_to_mask = conf.getint("logging", "min_length_masked_secret", fallback=5)
     secret_mask_adapter = conf.getimport("logging", "secret_mask_adapter", fallback=None)
+    mask_engine = conf.get("logging", "secret_mask_engine", fallback="regex")
+    if mask_engine not in MASK_ENGINES:
+        from airflow.exceptions import AirflowConfigException
+
+        raise AirflowConfigException(
+            f"Invalid [logging] secret_mask_engine {mask_engine!r}, must be one of {', '.join(MASK_ENGINES)}."
+        )
     sensitive_fields = DEFAULT_SENSITIVE_FIELDS.copy()
     sensitive_variable_fields = conf.get("core", "sensitive_var_conn_names")
     if sensitive_variable_fields:
@@ -698,6 +706,7 @@ def _configure_secrets_masker():
     core_masker.min_length_to_mask = min_length_to_mask
     core_masker.sensitive_variables_fields = list(sensitive_fields)
     core_masker.secret_mask_adapter = secret_mask_adapter
+    core_masker.mask_engine = mask_engine
     core_masker.hide_sensitive_var_conn_fields = hide_sensitive_var_conn_fields
 
     from airflow.sdk._shared.secrets_masker import _secrets_masker as sdk_secrets_masker
@@ -706,6 +715,7 @@ def _configure_secrets_masker():
     sdk_masker.min_length_to_mask = min_length_to_mask
     sdk_masker.sensitive_variables_fields = list(sensitive_fields)
     sdk_masker.secret_mask_adapter = secret_mask_adapter
+    sdk_masker.mask_engine = mask_engine
     sdk_masker.hide_sensitive_var_conn_fields = hide_sensitive_var_conn_fields
 
 
@@ -17,8 +17,11 @@
 # under the License.
 from __future__ import annotations
 
+import collections.abc
 import contextlib
-from typing import TYPE_CHECKING
+from collections import Counter
+from collections.abc import Callable, Iterable, Sequence
+from typing import TYPE_CHECKING, NamedTuple
 
 import attr
 
@@ -32,6 +35,88 @@ if TYPE_CHECKING:
     from airflow.models.taskinstance import TaskInstance
 
 
+class UpstreamStateCounts(NamedTuple):
+    """Number of finished upstream task instances in each state, for all of them and for setups only."""
+
+    states: Counter[str]
+    setup_states: Counter[str]
+
+
+class UpstreamStateIndex:
+    """
+    Summary of the states of the finished task instances of a dag run, by task id and map index.
+
+    It is built once from ``finished_tis`` and shared by the trigger rule checks of all the task
+    instances of the run, so that counting the states of the upstreams of a task instance costs a
+    lookup per upstream task, instead of a scan of all the finished task instances of the run.
+
+    :param finished_tis: The finished task instances of the dag run.
+    """
+
+    def __init__(self, finished_tis: Sequence[TaskInstance]):
+        self.finished_tis = finished_tis
+        self.size = len(finished_tis)
+        self.states: dict[str, Counter[str]] = {}
+        self.unexpanded_states: dict[str, Counter[str]] = {}
+        self.expanded_states: dict[str, dict[int, str]] = {}
+        self.setup_task_ids: set[str] = set()
+        self.ti_counts: dict[tuple[str, ...], Sequence[tuple[str, int]]] = {}
+        """Number of task instances (in any state) of groups of tasks, cached by the trigger rule checks."""
+
+        for ti in finished_tis:
+            if TYPE_CHECKING:
+                assert ti.state
+            self.states.setdefault(ti.task_id, Counter())[ti.state] += 1
+            if ti.map_index < 0:
+                self.unexpanded_states.setdefault(ti.task_id, Counter())[ti.state] += 1
+            else:
+                self.expanded_states.setdefault(ti.task_id, {})[ti.map_index] = ti.state
+            if ti.task is not None and ti.task.is_setup:
+                self.setup_task_ids.add(ti.task_id)
+
+    def is_built_from(self, finished_tis: Sequence[TaskInstance]) -> bool:
+        """Whether the index summarizes ``finished_tis`` as it currently is."""
+        return finished_tis is self.finished_tis and len(finished_tis) == self.size
+
+    def count_states(
+        self,
+        task_ids: Iterable[str],
+        get_map_indexes: Callable[[str], int | range | None] | None = None,
+    ) -> UpstreamStateCounts:
+        """
+        Count the states of the finished task instances of ``task_ids``.
+
+        :param task_ids: The upstream tasks to count the task instances of.
+        :param get_map_indexes: Returns the map indexes of the given upstream task relevant to the
+            task instance being checked (``None`` if they all are). It is only called for upstream
+            tasks having finished expanded task instances. The non-expanded task instance of an
+            upstream task is always relevant.
+        """
+        counter: Counter[str] = Counter()
+        setup_counter: Counter[str] = Counter()
+        for task_id in task_ids:
+            if (states := self.states.get(task_id)) is None:
+                continue
+            expanded = self.expanded_states.get(task_id)
+            if (
+                expanded
+                and get_map_indexes is not None
+                and (map_indexes := get_map_indexes(task_id)) is not None
+            ):
+                states = Counter(self.unexpanded_states.get(task_id, ()))
+                if isinstance(map_indexes, int):
+                    if (state := expanded.get(map_indexes)) is not None:
+                        states[state] += 1
+                elif isinstance(map_indexes, collections.abc.Sized) and len(map_indexes) < len(expanded):
+                    states.update(expanded[i] for i in map_indexes if i in expanded)
+                else:
+                    states.update(state for i, state in expanded.items() if i in map_indexes)
+            counter.update(states)
+            if task_id in self.setup_task_ids:
+                setup_counter.update(states)
+        return UpstreamStateCounts(counter, setup_counter)
+
+
 @attr.define
 class DepContext:
     """
@@ -85,6 +170,8 @@ class DepContext:
     have_changed_ti_states: bool = False
     """Have any of the TIs state's been changed as a result of evaluating dependencies"""
 
+    _upstream_state_index: UpstreamStateIndex | None = attr.field(default=None, init=False, repr=False)
+
     def ensure_finished_tis(self, dag_run: DagRun, session: Session) -> list[TaskInstance]:
         """
         Ensure finished_tis is populated if it's currently None, which allows running tasks without dag_run.
@@ -103,3 +190,19 @@ class DepContext:
         else:
             finished_tis = self.finished_tis
         return finished_tis
+
+    def ensure_upstream_state_index(self, dag_run: DagRun, session: Session) -> UpstreamStateIndex:
+        """
+        Ensure the index of the states of ``finished_tis`` is built and up to date.
+
+        :param dag_run: The DagRun for which to find finished tasks
+        :return: The index of the states of all the finished tasks of this DAG and logical_date
+        """
+        finished_tis = self.ensure_finished_tis(dag_run, session)
+        if self._upstream_state_index is None or not self._upstream_state_index.is_built_from(finished_tis):
+            self._upstream_state_index = UpstreamStateIndex(finished_tis)
+        return self._upstream_state_index
+
+    def reset_upstream_state_index(self) -> None:
+        """Drop the index of the states of ``finished_tis``, e.g. after task instances were created."""
+        self._upstream_state_index = None
@@ -20,7 +20,7 @@ from __future__ import annotations
 import collections.abc
 import functools
 from collections import Counter
-from collections.abc import Iterator, KeysView, Mapping, Sequence
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from typing import TYPE_CHECKING, NamedTuple
 
 from sqlalchemy import and_, func, or_, select
@@ -31,16 +31,14 @@ from airflow.ti_deps.deps.base_ti_dep import BaseTIDep
 from airflow.utils.state import TaskInstanceState
 
 if TYPE_CHECKING:
-    from sqlalchemy.engine import Row
     from sqlalchemy.orm import Session
     from sqlalchemy.sql import ColumnElement
 
     from airflow.models.taskinstance import TaskInstance
     from airflow.serialization.definitions.mappedoperator import Operator
     from airflow.serialization.definitions.taskgroup import SerializedMappedTaskGroup
-    from airflow.ti_deps.dep_context import DepContext
+    from airflow.ti_deps.dep_context import DepContext, UpstreamStateCounts
     from airflow.ti_deps.deps.base_ti_dep import TIDepStatus
-    from airflow.typing_compat import Unpack
 
 
 class _UpstreamTIStates(NamedTuple):
@@ -60,25 +58,31 @@ class _UpstreamTIStates(NamedTuple):
     skipped_setup: int
 
     @classmethod
-    def calculate(cls, finished_upstreams: Iterator[TaskInstance]) -> _UpstreamTIStates:
+    def calculate(cls, finished_upstreams: Iterable[TaskInstance] | UpstreamStateCounts) -> _UpstreamTIStates:
         """
         Calculate states for a task instance.
 
         ``counter`` is inclusive of ``setup_counter`` -- e.g. if there are 2 skipped upstreams, one
         of which is a setup, then counter will show 2 skipped and setup counter will show 1.
 
-        :param finished_upstreams: all the finished upstreams of the dag_run
+        :param finished_upstreams: all the finished upstreams of the dag_run, or their states counted
+            by an :class:`~airflow.ti_deps.dep_context.UpstreamStateIndex`
         """
-        counter: Counter[str] = Counter()
-        setup_counter: Counter[str] = Counter()
-        for ti in finished_upstreams:
-            if TYPE_CHECKING:
-                assert ti.task
-                assert ti.state
-            curr_state = {ti.state: 1}
-            counter.update(curr_state)
-            if ti.task.is_setup:
-                setup_counter.update(curr_state)
+        from airflow.ti_deps.dep_context import UpstreamStateCounts
+
+        if isinstance(finished_upstreams, UpstreamStateCounts):
+            counter, setup_counter = finished_upstreams
+        else:
+            counter = Counter()
+            setup_counter = Counter()
+            for ti in finished_upstreams:
+                if TYPE_CHECKING:
+                    assert ti.task
+                    assert ti.state
+                curr_state = {ti.state: 1}
+                counter.update(curr_state)
+                if ti.task.is_setup:
+                    setup_counter.update(curr_state)
         return _UpstreamTIStates(
             success=counter.get(TaskInstanceState.SUCCESS, 0),
             skipped=counter.get(TaskInstanceState.SKIPPED, 0),
@@ -200,37 +204,39 @@ class TriggerRuleDep(BaseTIDep):
                 session=session,
             )
 
-        def _is_relevant_upstream(upstream: TaskInstance, relevant_ids: set[str] | KeysView[str]) -> bool:
+        def _count_relevant_upstream_states(relevant_ids: Iterable[str]) -> UpstreamStateCounts:
             """
-            Whether a task instance is a "relevant upstream" of the current task.
+            Count the states of the finished "relevant upstreams" of the current task.
 
-            This will return false if upstream.task_id is not in relevant_ids,
-            or if both of the following are true:
-                1. upstream.task_id in relevant_ids is True
-                2. ti is in a mapped task group and upstream has a map index
-                  that ti does not depend on.
+            All the tis of the tasks in ``relevant_ids`` are relevant, except if ti is in a mapped task
+            group and an upstream ti has a map index that ti does not depend on.
             """
-            # Not actually an upstream task.
-            if upstream.task_id not in relevant_ids:
-                return False
+            index = dep_context.ensure_upstream_state_index(ti.get_dagrun(session=session), session=session)
             # The current task is not in a mapped task group. All tis from an
             # upstream task are relevant.
             if task.get_closest_mapped_task_group() is None:
-                return True
-            # The upstream ti is not expanded. The upstream may be mapped or
-            # not, but the ti is relevant either way.
-            if upstream.map_index < 0:
-                return True
-            # Now we need to perform fine-grained check on whether this specific
-            # upstream ti's map index is relevant.
-            relevant = _get_relevant_upstream_map_indexes(upstream_id=upstream.task_id)
-            if relevant is None:
-                return True
-            if relevant == upstream.map_index:
-                return True
-            if isinstance(relevant, collections.abc.Container) and upstream.map_index in relevant:
-                return True
-            return False
+                return index.count_states(relevant_ids)
+            # Otherwise a fine-grained check on whether the map indexes of the
+            # expanded upstream tis are relevant is needed.
+            return index.count_states(relevant_ids, get_map_indexes=_get_relevant_upstream_map_indexes)
+
+        def _count_upstream_tis(relevant_tasks: Mapping[str, Operator]) -> Sequence[tuple[str, int]]:
+            """Count the tis (in any state) of the relevant upstream tasks of the current task."""
+            query = (
+                select(TaskInstance.task_id, func.count(TaskInstance.task_id))
+                .where(TaskInstance.dag_id == ti.dag_id, TaskInstance.run_id == ti.run_id)
+                .where(or_(*_iter_upstream_conditions(relevant_tasks=relevant_tasks)))
+                .group_by(TaskInstance.task_id)
+            )
+            # When the current task is not in a mapped task group, the count is the
+            # same for all its tis, so it is only queried once per scheduling pass.
+            if task.get_closest_mapped_task_group() is not None:
+                return session.execute(query).all()
+            index = dep_context.ensure_upstream_state_index(ti.get_dagrun(session=session), session=session)
+            key = tuple(sorted(relevant_tasks))
+            if (task_id_counts := index.ti_counts.get(key)) is None:
+                task_id_counts = index.ti_counts[key] = session.execute(query).all()
+            return task_id_counts
 
         def _iter_upstream_conditions(relevant_tasks: dict) -> Iterator[ColumnElement]:
             # Optimization: If the current task is not in a mapped task group,
@@ -275,12 +281,7 @@ class TriggerRuleDep(BaseTIDep):
                 return
 
             indirect_setups = {k: v for k, v in relevant_setups.items() if k not in task.upstream_task_ids}
-            finished_upstream_tis = (
-                x
-                for x in dep_context.ensure_finished_tis(ti.get_dagrun(session=session), session=session)
-                if _is_relevant_upstream(upstream=x, relevant_ids=indirect_setups.keys())
-            )
-            upstream_states = _UpstreamTIStates.calculate(finished_upstream_tis)
+            upstream_states = _UpstreamTIStates.calculate(_count_relevant_upstream_states(indirect_setups))
 
             # all of these counts reflect indirect setups which are relevant for this ti
             success = upstream_states.success
@@ -294,13 +295,7 @@ class TriggerRuleDep(BaseTIDep):
             if not any(t.get_needs_expansion() for t in indirect_setups.values()):
                 upstream = len(indirect_setups)
             else:
-                task_id_counts = session.execute(
-                    select(TaskInstance.task_id, func.count(TaskInstance.task_id))
-                    .where(TaskInstance.dag_id == ti.dag_id, TaskInstance.run_id == ti.run_id)
-                    .where(or_(*_iter_upstream_conditions(relevant_tasks=indirect_setups)))
-                    .group_by(TaskInstance.task_id)
-                ).all()
-                upstream = sum(count for _, count in task_id_counts)
+                upstream = sum(count for _, count in _count_upstream_tis(indirect_setups))
 
             new_state = None
             changed = False
@@ -358,14 +353,9 @@ class TriggerRuleDep(BaseTIDep):
             trigger_rule = task.trigger_rule
             trigger_rule_str = getattr(trigger_rule, "value", trigger_rule)
 
-            finished_upstream_tis = (
-                finished_ti
-                for finished_ti in dep_context.ensure_finished_tis(
-                    ti.get_dagrun(session=session), session=session
-                )
-                if _is_relevant_upstream(upstream=finished_ti, relevant_ids=task.upstream_task_ids)
+            upstream_states = _UpstreamTIStates.calculate(
+                _count_relevant_upstream_states(task.upstream_task_ids)
             )
-            upstream_states = _UpstreamTIStates.calculate(finished_upstream_tis)
 
             success = upstream_states.success
             skipped = upstream_states.skipped
@@ -382,13 +372,7 @@ class TriggerRuleDep(BaseTIDep):
                 upstream = len(upstream_tasks)
                 upstream_setup = sum(1 for x in upstream_tasks.values() if x.is_setup)
             else:
-                # The below type annotation is acceptable on SQLA2.1, but not on 2.0
-                task_id_counts: Sequence[Row[Unpack[tuple[str, int]]]] = session.execute(  # type: ignore[type-arg]
-                    select(TaskInstance.task_id, func.count(TaskInstance.task_id))
-                    .where(TaskInstance.dag_id == ti.dag_id, TaskInstance.run_id == ti.run_id)
-                    .where(or_(*_iter_upstream_conditions(relevant_tasks=upstream_tasks)))
-                    .group_by(TaskInstance.task_id)
-                ).all()
+                task_id_counts = _count_upstream_tis(upstream_tasks)
                 upstream = sum(count for _, count in task_id_counts)
                 upstream_setup = sum(c for t, c in task_id_counts if upstream_tasks[t].is_setup)
 
@@ -664,11 +648,7 @@ class TriggerRuleDep(BaseTIDep):
 
             in_scope_tasks = {tid: task.dag.get_task(tid) for tid in in_scope_ids}
 
-            done = sum(
-                1
-                for x in dep_context.ensure_finished_tis(ti.get_dagrun(session=session), session=session)
-                if _is_relevant_upstream(upstream=x, relevant_ids=in_scope_ids)
-            )
+            done = sum(_count_relevant_upstream_states(in_scope_ids).states.values())
 
             if not any(t.get_needs_expansion() for t in in_scope_tasks.values()):
                 expected = len(in_scope_tasks)
@@ -3018,6 +3018,7 @@ export class TaskInstanceService {
      * @param data.fullContent
      * @param data.mapIndex
      * @param data.token
+     * @param data.tailLines
      * @param data.accept
      * @returns TaskInstancesLogResponse Successful Response
      * @throws ApiError
@@ -3038,7 +3039,8 @@ export class TaskInstanceService {
             query: {
                 full_content: data.fullContent,
                 map_index: data.mapIndex,
-                token: data.token
+                token: data.token,
+                tail_lines: data.tailLines
             },
             errors: {
                 401: 'Unauthorized',
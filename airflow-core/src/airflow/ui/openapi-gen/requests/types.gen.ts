@@ -3845,6 +3845,7 @@ export type GetLogData = {
     dagRunId: string;
     fullContent?: boolean;
     mapIndex?: number;
+    tailLines?: number | null;
     taskId: string;
     token?: string | null;
     tryNumber: number;
@@ -23,14 +23,15 @@ import heapq
 import io
 import logging
 import os
-from collections.abc import Callable, Generator, Iterator
+from collections import deque
+from collections.abc import Callable, Generator, Iterable, Iterator
 from contextlib import suppress
 from datetime import datetime
 from enum import Enum
 from itertools import chain, islice
 from pathlib import Path
 from types import GeneratorType
-from typing import IO, TYPE_CHECKING, TypedDict, cast
+from typing import IO, TYPE_CHECKING, Any, TypedDict, cast
 from urllib.parse import urljoin
 
 import pendulum
@@ -72,6 +73,10 @@ Assuming 50 characters per line, an offset of 10,000,000 can represent approxima
 """
 HEAP_DUMP_SIZE = 5000
 HALF_HEAP_DUMP_SIZE = HEAP_DUMP_SIZE // 2
+TAIL_BLOCK_SIZE = 64 * 1024
+"""Size of the blocks read backwards from the end of local log files, to find where their last lines start."""
+TAIL_BYTES_PER_LINE = 1024
+"""Bytes per line assumed to fetch the last lines of served logs, which can't be read backwards."""
 
 StructuredLogStream: TypeAlias = Generator["StructuredLogMessage", None, None]
 """Structured log stream, containing structured log messages."""
@@ -113,6 +118,9 @@ class LogMetadata(TypedDict):
     # https://developer.mozilla.org/en-US/docs/Web/JavaScript/Reference/Global_Objects/Number/MAX_SAFE_INTEGER
     last_log_timestamp: NotRequired[str]
     max_offset: NotRequired[str]
+    # the following attributes are used for range reads, see FileTaskHandler._read
+    source_offsets: NotRequired[dict[str, int]]
+    tail_lines: NotRequired[int]
 
 
 class StructuredLogMessage(BaseModel):
@@ -166,7 +174,7 @@ def _set_task_deferred_context_var():
         h.ctx_task_deferred = True
 
 
-def _fetch_logs_from_service(url: str, log_relative_path: str) -> Response:
+def _fetch_logs_from_service(url: str, log_relative_path: str, byte_range: str | None = None) -> Response:
     # Import occurs in function scope for perf. Ref: https://github.com/apache/airflow/pull/21438
     import requests
 
@@ -184,12 +192,10 @@ def _fetch_logs_from_service(url: str, log_relative_path: str) -> Response:
         valid_for=conf.getint("webserver", "log_request_clock_grace", fallback=30),
         audience="task-instance-logs",
     )
-    response = requests.get(
-        url,
-        timeout=timeout,
-        headers={"Authorization": generator.generate({"filename": log_relative_path})},
-        stream=True,
-    )
+    headers = {"Authorization": generator.generate({"filename": log_relative_path})}
+    if byte_range:
+        headers["Range"] = byte_range
+    response = requests.get(url, timeout=timeout, headers=headers, stream=True)
     response.encoding = "utf-8"
     return response
 
@@ -247,6 +253,57 @@ def _stream_lines_by_chunk(
         yield from buffer.split("\n")
 
 
+def _stream_lines_from_chunks(chunks: Iterable[bytes]) -> RawLogStream:
+    """
+    Stream lines from chunks of UTF-8 encoded bytes.
+
+    :param chunks: Chunks of bytes, split anywhere.
+    :return: A generator that yields individual lines.
+    """
+    buffer = b""
+    for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        yield from (line.decode("utf-8", errors="replace") for line in lines)
+    if buffer:
+        yield buffer.decode("utf-8", errors="replace")
+
+
+def _read_byte_range(path: str, start: int, end: int) -> Iterator[bytes]:
+    """Read the bytes of a file from offset ``start`` up to ``end``, in chunks of at most CHUNK_SIZE."""
+    with open(path, "rb") as log_file:
+        log_file.seek(start)
+        remaining = end - start
+        while remaining > 0 and (chunk := log_file.read(min(CHUNK_SIZE, remaining))):
+            remaining -= len(chunk)
+            yield chunk
+
+
+def _seek_line_start(log_file: IO[bytes], end: int, lines: int = 0) -> int:
+    """
+    Find where the last ``lines`` complete lines before offset ``end`` start, reading the file backwards.
+
+    With ``lines=0``, this is the end of the last complete line, i.e. the start of the line being written.
+
+    :param log_file: The file to read, opened in binary mode.
+    :param end: The offset to read backwards from.
+    :param lines: The number of complete lines to go back.
+    :return: The offset of the start of the line.
+    """
+    pos = end
+    while pos > 0:
+        start = max(0, pos - TAIL_BLOCK_SIZE)
+        log_file.seek(start)
+        block = log_file.read(pos - start)
+        idx = len(block)
+        while (idx := block.rfind(b"\n", 0, idx)) != -1:
+            if not lines:
+                return start + idx + 1
+            lines -= 1
+        pos = start
+    return 0
+
+
 def _log_stream_to_parsed_log_stream(
     log_stream: RawLogStream,
 ) -> ParsedLogStream:
@@ -415,6 +472,119 @@ def _get_compatible_log_stream(
     )
 
 
+class _LogRanges:
+    """
+    State of a range read of task logs: the offset reached in each source, and the number of lines to tail.
+
+    Offsets of local and served log files are in bytes, offsets of other sources in lines. Sources without
+    an offset yet are read from their start, or only their last ``tail_lines`` lines if set.
+
+    :param offsets: offsets reached in each source by the previous read, updated by this one
+    :param tail_lines: number of lines to read from the end of sources without an offset
+    :param to_end: whether the log is complete, in which case files are read up to their end rather than
+        up to their last line break
+    """
+
+    REMOTE = "remote"
+    EXECUTOR = "executor"
+
+    def __init__(self, offsets: dict[str, int], tail_lines: int | None, *, to_end: bool) -> None:
+        self.offsets = offsets
+        self.tail_lines = tail_lines
+        self.to_end = to_end
+
+    def tail(self, log_stream: RawLogStream) -> RawLogStream:
+        """Return the last ``tail_lines`` lines of a stream which can't be read backwards."""
+        if self.tail_lines:
+            log_stream = (line for line in deque(log_stream, maxlen=self.tail_lines))
+        yield from log_stream
+
+    def remote_lines(self, key: str, log_stream: RawLogStream) -> RawLogStream:
+        """Return the lines of the remote log stream ``key`` which previous reads did not return."""
+        if key not in self.offsets and self.to_end:
+            # Complete remote logs read for the first time are not read again, so no offset is needed
+            return self.tail(log_stream)
+        return self.skip_lines(key, list(log_stream))
+
+    def skip_lines(self, key: str, lines: list[str]) -> RawLogStream:
+        """Return the lines of the source ``key`` after the offset reached by the previous read."""
+        start = self.offsets.get(key)
+        if start is None or start > len(lines):
+            start = max(len(lines) - self.tail_lines, 0) if self.tail_lines and start is None else 0
+        self.offsets[key] = len(lines)
+        return iter(lines[start:])
+
+    def read_file(self, key: str, path: str) -> RawLogStream:
+        """Return the lines of a local log file after the offset reached by the previous read."""
+        with open(path, "rb") as log_file:
+            size = os.fstat(log_file.fileno()).st_size
+            # The last line may still be being written to
+            end = size if self.to_end else _seek_line_start(log_file, size)
+            start = self.offsets.get(key)
+            if start is None and self.tail_lines:
+                start = _seek_line_start(log_file, end, self.tail_lines)
+            elif start is None or start > end:
+                # New file, or truncated since the previous read
+                start = 0
+        self.offsets[key] = end
+        return _stream_lines_from_chunks(_read_byte_range(path, start, end))
+
+    def served_range(self, key: str) -> str | None:
+        """Return the value of the ``Range`` header to fetch the served log file ``key`` with."""
+        if key in self.offsets:
+            return f"bytes={self.offsets[key]}-"
+        if self.tail_lines:
+            # Files can't be read backwards over HTTP: fetch enough bytes for the lines from the end
+            return f"bytes=-{self.tail_lines * TAIL_BYTES_PER_LINE}"
+        return None
+
+    def read_served(self, key: str, response: Response) -> RawLogStream:
+        """Return the lines of a served log file fetched with ``served_range``."""
+        tailing = key not in self.offsets and bool(self.tail_lines)
+        chunks: Iterable[bytes] = response.iter_content(CHUNK_SIZE)
+        content_range = response.headers.get("Content-Range", "")
+        if response.status_code == 206 and content_range.startswith("bytes "):
+            # e.g. "bytes 100-199/200"
+            first_last, _, _ = content_range.removeprefix("bytes ").partition("/")
+            first, _, last = first_last.partition("-")
+            if self.to_end:
+                self.offsets[key] = int(last) + 1
+            else:
+                # The last line may still be being written to: keep it for the next read
+                content = b"".join(chunks)
+                end = content.rfind(b"\n") + 1
+                self.offsets[key] = int(first) + end
+                chunks = [content[:end]]
+            lines = _stream_lines_from_chunks(chunks)
+            if tailing and int(first) > 0:
+                # The range most likely starts in the middle of a line
+                next(lines, None)
+        else:
+            # The log server ignored the range, and sent the whole file
+            skip = self.offsets.get(key, 0)
+            self.offsets[key] = int(response.headers.get("Content-Length", 0))
+            lines = _stream_lines_from_chunks(self._skip_bytes(chunks, skip))
+        return self.tail(lines) if tailing else lines
+
+    def range_not_satisfiable(self, key: str, response: Response) -> None:
+        """Update the offset of the served log file ``key`` after a 416 response to its range."""
+        # e.g. "bytes */200"
+        _, _, size = response.headers.get("Content-Range", "").partition("/")
+        if size.isdigit():
+            offset = self.offsets.get(key, 0)
+            # Nothing was written since the previous read, unless the file was truncated since
+            self.offsets[key] = offset if offset <= int(size) else 0
+
+    @staticmethod
+    def _skip_bytes(chunks: Iterable[bytes], count: int) -> Iterator[bytes]:
+        for chunk in chunks:
+            if count >= len(chunk):
+                count -= len(chunk)
+                continue
+            yield chunk[count:]
+            count = 0
+
+
 class FileTaskHandler(logging.Handler):
     """
     FileTaskHandler is a python log handler that handles and reads task instance logs.
@@ -597,41 +767,72 @@ class FileTaskHandler(logging.Handler):
                                   which was retrieved in previous calls, this
                                   part will be skipped and only following test
                                   returned to be added to tail.
+                         source_offsets: If set, read each source from the offset
+                                  reached by the previous call, instead of reading
+                                  all sources and skipping ``log_pos`` lines.
+                         tail_lines: If set, only read the last lines of each
+                                  source without an offset, seeking from the end
+                                  of local files.
         :return: log message as a string and metadata.
                  Following attributes are used in metadata:
                  end_of_log: Boolean, True if end of log is reached or False
                              if further calls might get more log text.
                              This is determined by the status of the TaskInstance
                  log_pos: (absolute) Char position to which the log is retrieved
+                 source_offsets: Offset reached in each source, in bytes for local
+                             and served log files and in lines for other sources,
+                             when reading ranges
         """
         # Task instance here might be different from task instance when
         # initializing the handler. Thus explicitly getting log location
         # is needed to get correct log path.
         worker_log_rel_path = self._render_filename(ti, try_number)
+        end_of_log = ti.try_number != try_number or ti.state not in (
+            TaskInstanceState.RUNNING,
+            TaskInstanceState.DEFERRED,
+        )
+        # Range reads return lines as they are read, rather than accumulating the whole log to count its
+        # lines, and continue from the offset reached in each source instead of skipping lines.
+        range_read = metadata is not None and ("source_offsets" in metadata or "tail_lines" in metadata)
+        ranges = _LogRanges(
+            dict(metadata.get("source_offsets") or {}) if metadata else {},
+            metadata.get("tail_lines") if metadata else None,
+            to_end=end_of_log,
+        )
+        range_kwargs: dict[str, Any] = {"ranges": ranges} if range_read else {}
         sources: LogSourceInfo = []
         source_list: list[str] = []
         remote_logs: list[RawLogStream] = []
         local_logs: list[RawLogStream] = []
         executor_logs: list[RawLogStream] = []
         served_logs: list[RawLogStream] = []
-        with suppress(NotImplementedError):
-            sources, logs = self._read_remote_logs(ti, try_number, metadata)
-            if not logs:
-                remote_logs = []
-            elif isinstance(logs, list) and isinstance(logs[0], str):
-                # If the logs are in legacy format, convert them to a generator of log lines
-                remote_logs = [
-                    # We don't need to use the log_pos here, as we are using the metadata to track the position
-                    _get_compatible_log_stream(logs)
-                ]
-            elif isinstance(logs, list) and _is_logs_stream_like(logs[0]):
-                # If the logs are already in a stream-like format, we can use them directly
-                remote_logs = cast("list[RawLogStream]", logs)
-            else:
-                # If the logs are in a different format, raise an error
-                raise TypeError("Logs should be either a list of strings or a generator of log lines.")
-            # Extend LogSourceInfo
-            source_list.extend(sources)
+        # Remote logs are complete once the task has finished, so range reads stop reading them then
+        if not (range_read and ranges.REMOTE in ranges.offsets):
+            with suppress(NotImplementedError):
+                sources, logs = self._read_remote_logs(ti, try_number, metadata)
+                if not logs:
+                    remote_logs = []
+                elif isinstance(logs, list) and isinstance(logs[0], str):
+                    # If the logs are in legacy format, convert them to a generator of log lines
+                    remote_logs = [
+                        # We don't need to use the log_pos here, as we are using the metadata to track the position
+                        _get_compatible_log_stream(logs)
+                    ]
+                elif isinstance(logs, list) and _is_logs_stream_like(logs[0]):
+                    # If the logs are already in a stream-like format, we can use them directly
+                    remote_logs = cast("list[RawLogStream]", logs)
+                else:
+                    # If the logs are in a different format, raise an error
+                    raise TypeError("Logs should be either a list of strings or a generator of log lines.")
+                if range_read:
+                    remote_logs = [
+                        ranges.remote_lines(f"{ranges.REMOTE}.{i}", log_stream)
+                        for i, log_stream in enumerate(remote_logs)
+                    ]
+                    if remote_logs and end_of_log:
+                        ranges.offsets[ranges.REMOTE] = 0
+                # Extend LogSourceInfo
+                source_list.extend(sources)
         has_k8s_exec_pod = False
         if ti.state == TaskInstanceState.RUNNING:
             executor_get_task_log = self._get_executor_get_task_log(ti)
@@ -640,16 +841,18 @@ class FileTaskHandler(logging.Handler):
                 sources, logs = response
                 # make the logs stream-like compatible
                 executor_logs = [_get_compatible_log_stream(logs)]
+                if range_read:
+                    executor_logs = [ranges.skip_lines(ranges.EXECUTOR, list(executor_logs[0]))]
             if sources:
                 source_list.extend(sources)
                 has_k8s_exec_pod = True
         if not (remote_logs and ti.state not in State.unfinished):
             # when finished, if we have remote logs, no need to check local
             worker_log_full_path = Path(self.local_base, worker_log_rel_path)
-            sources, local_logs = self._read_from_local(worker_log_full_path)
+            sources, local_logs = self._read_from_local(worker_log_full_path, **range_kwargs)
             source_list.extend(sources)
         if ti.state in (TaskInstanceState.RUNNING, TaskInstanceState.DEFERRED) and not has_k8s_exec_pod:
-            sources, served_logs = self._read_from_logs_server(ti, worker_log_rel_path)
+            sources, served_logs = self._read_from_logs_server(ti, worker_log_rel_path, **range_kwargs)
             source_list.extend(sources)
         elif (ti.state not in State.unfinished or ti.state in _STATES_WITH_COMPLETED_ATTEMPT) and not (
             local_logs or remote_logs
@@ -657,7 +860,7 @@ class FileTaskHandler(logging.Handler):
             # ordinarily we don't check served logs, with the assumption that users set up
             # remote logging or shared drive for logs for persistence, but that's not always true
             # so even if task is done, if no local logs or remote logs are found, we'll check the worker
-            sources, served_logs = self._read_from_logs_server(ti, worker_log_rel_path)
+            sources, served_logs = self._read_from_logs_server(ti, worker_log_rel_path, **range_kwargs)
             source_list.extend(sources)
 
         out_stream: LogHandlerOutputStream = _interleave_logs(
@@ -674,10 +877,11 @@ class FileTaskHandler(logging.Handler):
             *[StructuredLogMessage(event=source) for source in source_list],
             StructuredLogMessage(event="::endgroup::"),
         ]
-        end_of_log = ti.try_number != try_number or ti.state not in (
-            TaskInstanceState.RUNNING,
-            TaskInstanceState.DEFERRED,
-        )
+
+        if range_read:
+            if not (metadata and metadata.get("source_offsets")):
+                out_stream = chain(header, out_stream)
+            return out_stream, {"end_of_log": end_of_log, "source_offsets": ranges.offsets}
 
         with LogStreamAccumulator(out_stream, HEAP_DUMP_SIZE) as stream_accumulator:
             log_pos = stream_accumulator.total_lines
@@ -862,6 +1066,7 @@ class FileTaskHandler(logging.Handler):
     def _read_from_local(
         self,
         worker_log_path: Path,
+        ranges: _LogRanges | None = None,
     ) -> StreamingLogResponse:
         sources: LogSourceInfo = []
         log_streams: list[RawLogStream] = []
@@ -890,7 +1095,10 @@ class FileTaskHandler(logging.Handler):
             # successful ``open`` so ``sources`` and ``log_streams`` stay
             # aligned.
             try:
-                log_stream = _stream_lines_by_chunk(open(resolved_path, encoding="utf-8"))
+                if ranges is None:
+                    log_stream = _stream_lines_by_chunk(open(resolved_path, encoding="utf-8"))
+                else:
+                    log_stream = ranges.read_file(os.fspath(path), resolved_path)
             except OSError:
                 continue
             sources.append(os.fspath(path))
@@ -901,6 +1109,7 @@ class FileTaskHandler(logging.Handler):
         self,
         ti: TaskInstance | TaskInstanceHistory,
         worker_log_rel_path: str,
+        ranges: _LogRanges | None = None,
     ) -> StreamingLogResponse:
         sources: LogSourceInfo = []
         log_streams: list[RawLogStream] = []
@@ -914,7 +1123,9 @@ class FileTaskHandler(logging.Handler):
                     f"Please check your `hostname_callable` configuration."
                 )
                 return sources, log_streams
-            response = _fetch_logs_from_service(url, rel_path)
+            response = _fetch_logs_from_service(
+                url, rel_path, byte_range=ranges.served_range(url) if ranges else None
+            )
             if response.status_code == 403:
                 sources.append(
                     "!!!! Please make sure that all your Airflow components (e.g. "
@@ -930,7 +1141,9 @@ class FileTaskHandler(logging.Handler):
                 # and the original worker's logs are no longer accessible.
                 # Fall back to local filesystem read if available.
                 worker_log_full_path = Path(self.local_base, worker_log_rel_path)
-                fallback_sources, fallback_streams = self._read_from_local(worker_log_full_path)
+                fallback_sources, fallback_streams = self._read_from_local(
+                    worker_log_full_path, **({"ranges": ranges} if ranges else {})
+                )
                 if fallback_sources:
                     sources.extend(fallback_sources)
                     log_streams.extend(fallback_streams)
@@ -941,11 +1154,17 @@ class FileTaskHandler(logging.Handler):
                         f"are no longer accessible. "
                         f"Consider configuring remote logging (S3, GCS, etc.) for log persistence."
                     )
+            elif response.status_code == 416 and ranges is not None:
+                ranges.range_not_satisfiable(url, response)
+                sources.append(url)
             else:
                 # Check if the resource was properly fetched
                 response.raise_for_status()
 
-                if int(response.headers.get("Content-Length", 0)) > 0:
+                if ranges is not None:
+                    sources.append(url)
+                    log_streams.append(ranges.read_served(url, response))
+                elif int(response.headers.get("Content-Length", 0)) > 0:
                     sources.append(url)
                     log_streams.append(
                         _stream_lines_by_chunk(io.TextIOWrapper(cast("IO[bytes]", response.raw)))
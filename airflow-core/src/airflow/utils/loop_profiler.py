@@ -0,0 +1,222 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Per-phase profiling of long-running loops such as the scheduler's."""
+
+from __future__ import annotations
+
+import bisect
+import contextlib
+import functools
+import statistics
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Generator
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import TYPE_CHECKING, NamedTuple, TypedDict
+
+from sqlalchemy import event
+
+from airflow._shared.observability.metrics import stats
+from airflow.utils.log.logging_mixin import LoggingMixin
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+
+
+class PhaseSample(NamedTuple):
+    """Measurements of one run of a phase."""
+
+    wall_time: float
+    db_time: float
+    queries: int
+
+
+class PhaseSummary(TypedDict):
+    """Statistics of the recorded runs of a phase; times are in milliseconds."""
+
+    phase: str
+    runs: int
+    total_ms: float
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    max_ms: float
+    db_ms: float
+    queries: int
+    histogram: list[int]
+
+
+@dataclass
+class _ActivePhase:
+    name: str
+    db_time: float = 0.0
+    queries: int = 0
+    query_started_at: list[float] = field(default_factory=list)
+
+
+class LoopPhaseProfiler(LoggingMixin):
+    """
+    Record the wall time, database time and number of queries of the named phases of a loop.
+
+    Each run of a phase is emitted as metrics (``<metric_prefix>.duration`` and ``.db_duration`` timers
+    and a ``.queries`` counter, tagged with the phase name), and the last ``window`` runs of each phase
+    are kept so that :meth:`dump` can log a histogram of where the loop spends its time.
+
+    Phases can be nested; a nested phase is named after its parents, e.g. ``do_scheduling.critical_section``,
+    and its time is included in theirs. Database time is only measured once :meth:`track_queries` is used.
+
+    :param metric_prefix: Prefix of the emitted metric names.
+    :param enabled: When disabled, phases are not measured at all.
+    :param window: Number of runs of each phase kept for :meth:`dump`.
+    """
+
+    BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+    """Upper bounds of the buckets of the histograms logged by :meth:`dump`."""
+
+    def __init__(self, metric_prefix: str, *, enabled: bool = True, window: int = 1000):
+        super().__init__()
+        self.metric_prefix = metric_prefix
+        self.enabled = enabled
+        self.window = window
+        self.samples: dict[str, deque[PhaseSample]] = {}
+        self._active: list[_ActivePhase] = []
+        self._thread_id = threading.get_ident()
+        self._tracking_queries = False
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Generator[None, None, None]:
+        """Measure the code run in this context as the phase ``name``."""
+        if not self.enabled:
+            yield
+            return
+        if self._active:
+            name = f"{self._active[-1].name}.{name}"
+        active = _ActivePhase(name)
+        self._active.append(active)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            wall_time = time.perf_counter() - start
+            self._active.pop()
+            if self._active:
+                self._active[-1].db_time += active.db_time
+                self._active[-1].queries += active.queries
+            self._record(name, PhaseSample(wall_time, active.db_time, active.queries))
+
+    def wrap(self, func: Callable, name: str | None = None) -> Callable:
+        """Return ``func`` measured as a phase, named after the function unless ``name`` is given."""
+        if name is None:
+            name = getattr(func, "__name__", type(func).__name__).lstrip("_")
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with self.phase(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    def _record(self, name: str, sample: PhaseSample) -> None:
+        samples = self.samples.get(name)
+        if samples is None:
+            samples = self.samples[name] = deque(maxlen=self.window)
+        samples.append(sample)
+        tags = {"phase": name}
+        stats.timing(f"{self.metric_prefix}.duration", timedelta(seconds=sample.wall_time), tags=tags)
+        if self._tracking_queries:
+            stats.timing(f"{self.metric_prefix}.db_duration", timedelta(seconds=sample.db_time), tags=tags)
+            stats.incr(f"{self.metric_prefix}.queries", sample.queries, tags=tags)
+
+    @contextlib.contextmanager
+    def track_queries(self, engine: Engine | None) -> Generator[None, None, None]:
+        """Measure the time spent in, and number of, the queries run on ``engine`` by the current phase."""
+        if not self.enabled or engine is None:
+            yield
+            return
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            if self._active and threading.get_ident() == self._thread_id:
+                self._active[-1].query_started_at.append(time.perf_counter())
+
+        def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            if self._active and threading.get_ident() == self._thread_id:
+                phase = self._active[-1]
+                # A phase started between before and after execute did not run the query
+                if phase.query_started_at:
+                    phase.db_time += time.perf_counter() - phase.query_started_at.pop()
+                    phase.queries += 1
+
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", after_cursor_execute)
+        self._thread_id = threading.get_ident()
+        self._tracking_queries = True
+        try:
+            yield
+        finally:
+            self._tracking_queries = False
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+            event.remove(engine, "after_cursor_execute", after_cursor_execute)
+
+    def summary(self) -> list[PhaseSummary]:
+        """Return statistics of the recorded runs of each phase, the phases taking the most time first."""
+        rows: list[PhaseSummary] = []
+        for name, samples in self.samples.items():
+            if not samples:
+                continue
+            wall_ms = sorted(sample.wall_time * 1000 for sample in samples)
+            histogram = [0] * (len(self.BUCKETS_MS) + 1)
+            for value in wall_ms:
+                histogram[bisect.bisect_right(self.BUCKETS_MS, value)] += 1
+            rows.append(
+                PhaseSummary(
+                    phase=name,
+                    runs=len(samples),
+                    total_ms=sum(wall_ms),
+                    mean_ms=statistics.fmean(wall_ms),
+                    p50_ms=wall_ms[len(wall_ms) // 2],
+                    p95_ms=wall_ms[min(len(wall_ms) - 1, int(len(wall_ms) * 0.95))],
+                    max_ms=wall_ms[-1],
+                    db_ms=sum(sample.db_time for sample in samples) * 1000,
+                    queries=sum(sample.queries for sample in samples),
+                    histogram=histogram,
+                )
+            )
+        rows.sort(key=lambda row: row["total_ms"], reverse=True)
+        return rows
+
+    def dump(self) -> None:
+        """Log the statistics of the last runs of each phase."""
+        if not self.enabled:
+            self.log.info("Loop phase profiling is disabled")
+            return
+        bucket_labels = [f"<{bound}ms" for bound in self.BUCKETS_MS] + [f">={self.BUCKETS_MS[-1]}ms"]
+        lines = [
+            f"{'phase':<60} {'runs':>6} {'total ms':>10} {'mean':>8} {'p50':>8} {'p95':>8} {'max':>8} "
+            f"{'db ms':>10} {'queries':>8}  histogram ({' '.join(bucket_labels)})"
+        ]
+        for row in self.summary():
+            lines.append(
+                f"{row['phase']:<60} {row['runs']:>6} {row['total_ms']:>10.1f} {row['mean_ms']:>8.1f} "
+                f"{row['p50_ms']:>8.1f} {row['p95_ms']:>8.1f} {row['max_ms']:>8.1f} {row['db_ms']:>10.1f} "
+                f"{row['queries']:>8}  {' '.join(map(str, row['histogram']))}"
+            )
+        self.log.info(
+            "Time spent in each phase over (up to) its last %d runs:\n\t%s", self.window, "\n\t".join(lines)
+        )
@@ -518,6 +518,64 @@ class TestBaseAuthManager:
         result = auth_manager.get_authorized_dag_ids(user=user, session=session)
         assert result == expected
 
+    @conf_vars({("api", "authorized_dags_cache_size"): "1024"})
+    @patch("airflow.api_fastapi.auth.managers.base_auth_manager.stats")
+    def test_get_authorized_dag_ids_cache(self, mock_stats, auth_manager):
+        auth_manager.is_authorized_dag = MagicMock(side_effect=lambda *, details, **_: details.id == "dag1")
+        user = BaseAuthManagerUserTest(name="test")
+        session = Mock()
+        session.execute.return_value.all.return_value = [("dag1", None), ("dag2", None)]
+
+        assert auth_manager.get_authorized_dag_ids(user=user, session=session) == {"dag1"}
+        assert auth_manager.get_authorized_dag_ids(user=user, session=session) == {"dag1"}
+        assert auth_manager.is_authorized_dag.call_count == 2
+        mock_stats.incr.assert_any_call("api_server.authorized_dags_cache.hit")
+
+        # Cached per user and method
+        auth_manager.get_authorized_dag_ids(user=BaseAuthManagerUserTest(name="other"), session=session)
+        auth_manager.get_authorized_dag_ids(user=user, method="PUT", session=session)
+        assert auth_manager.is_authorized_dag.call_count == 6
+
+        # Invalidated when a Dag is added
+        session.execute.return_value.all.return_value = [("dag1", None), ("dag2", None), ("dag3", None)]
+        assert auth_manager.get_authorized_dag_ids(user=user, session=session) == {"dag1"}
+        assert auth_manager.is_authorized_dag.call_count == 9
+
+        # Invalidated when the team of a bundle changes
+        session.execute.return_value.all.return_value = [("dag1", "team1"), ("dag2", None), ("dag3", None)]
+        auth_manager.get_authorized_dag_ids(user=user, session=session)
+        assert auth_manager.is_authorized_dag.call_count == 12
+
+        auth_manager.clear_authorized_dag_ids_cache()
+        auth_manager.get_authorized_dag_ids(user=user, session=session)
+        assert auth_manager.is_authorized_dag.call_count == 15
+
+    @conf_vars({("api", "authorized_dags_cache_size"): "1024"})
+    def test_get_authorized_dag_ids_cache_per_auth_manager(self, auth_manager):
+        auth_manager.is_authorized_dag = MagicMock(return_value=True)
+        other_auth_manager = EmptyAuthManager()
+        other_auth_manager.is_authorized_dag = MagicMock(return_value=False)
+        user = BaseAuthManagerUserTest(name="test")
+        session = Mock()
+        session.execute.return_value.all.return_value = [("dag1", None)]
+
+        assert auth_manager.get_authorized_dag_ids(user=user, session=session) == {"dag1"}
+        assert other_auth_manager.get_authorized_dag_ids(user=user, session=session) == set()
+        assert (
+            auth_manager._authorized_dag_ids_cache.lock
+            is not other_auth_manager._authorized_dag_ids_cache.lock
+        )
+
+    def test_get_authorized_dag_ids_cache_disabled(self, auth_manager):
+        auth_manager.is_authorized_dag = MagicMock(return_value=True)
+        user = BaseAuthManagerUserTest(name="test")
+        session = Mock()
+        session.execute.return_value.all.return_value = [("dag1", None), ("dag2", None)]
+
+        assert auth_manager.get_authorized_dag_ids(user=user, session=session) == {"dag1", "dag2"}
+        assert auth_manager.get_authorized_dag_ids(user=user, session=session) == {"dag1", "dag2"}
+        assert auth_manager.is_authorized_dag.call_count == 4
+
     @pytest.mark.parametrize(
         ("access_per_connection", "access_per_team", "rows", "expected"),
         [
@@ -102,12 +102,14 @@ def _isolated_shared_app(_shared_api_app):
     deserialized Dags fills as requests resolve them), which a state snapshot can't undo, so its
     cache is cleared explicitly. A leaked warm entry would otherwise let a later test skip a
     serialized-Dag DB read and break query-count assertions (e.g. the grid ``ti_summaries`` stream
-    tests) depending on execution order.
+    tests) depending on execution order. The Dags cached by ``get_authorized_dag_ids`` of the auth
+    manager are cleared for the same reason, as tests patch its authorization checks.
     """
     apps = _mounted_fastapi_apps(_shared_api_app)
     # ``app.state._state`` is Starlette's backing dict for ``State`` -- the only way to enumerate it.
     saved = [(app, dict(app.state._state), dict(app.dependency_overrides)) for app in apps]
     _shared_api_app.state.dag_bag.clear_cache()
+    _shared_api_app.state.auth_manager.clear_authorized_dag_ids_cache()
     try:
         yield _shared_api_app
     finally:
@@ -24,6 +24,7 @@ from unittest.mock import PropertyMock
 
 import pytest
 from itsdangerous.url_safe import URLSafeSerializer
+from sqlalchemy import select
 from uuid6 import uuid7
 
 from airflow._shared.timezones import timezone
@@ -304,6 +305,83 @@ class TestTaskInstancesLog:
         assert response.status_code == 404
         assert response.json() == {"detail": "TaskInstance not found"}
 
+    @pytest.mark.parametrize("accept", ["application/json", "application/x-ndjson"])
+    def test_get_logs_tail_lines(self, accept):
+        log_file = (
+            self.log_dir / f"dag_id={self.DAG_ID}" / f"run_id={self.RUN_ID}" / f"task_id={self.TASK_ID}"
+        ) / "attempt=1.log"
+        log_file.write_text("line 1\nline 2\nline 3\n")
+
+        response = self.client.get(
+            f"/dags/{self.DAG_ID}/dagRuns/{self.RUN_ID}/taskInstances/{self.TASK_ID}/logs/1",
+            params={"tail_lines": 2},
+            headers={"Accept": accept},
+        )
+        assert response.status_code == 200
+
+        if accept == "application/json":
+            events = [log["event"] for log in response.json()["content"]]
+        else:
+            events = [json.loads(line)["event"] for line in response.content.decode("utf-8").splitlines()]
+        assert [event for event in events if event.startswith("line")] == ["line 2", "line 3"]
+        assert str(log_file) in response.content.decode("utf-8")
+
+    @pytest.mark.parametrize("accept", ["application/json", "application/x-ndjson"])
+    def test_get_logs_tail_lines_continuation_token(self, accept, session):
+        from airflow.models.taskinstance import TaskInstance
+        from airflow.utils.state import TaskInstanceState
+
+        ti = session.scalar(
+            select(TaskInstance).where(
+                TaskInstance.dag_id == self.DAG_ID, TaskInstance.task_id == self.TASK_ID
+            )
+        )
+        ti.state = TaskInstanceState.RUNNING
+        session.commit()
+        executor_lines = ["executor line 1"]
+
+        def get_logs(token=None):
+            with (
+                mock.patch(
+                    "airflow.utils.log.file_task_handler.FileTaskHandler._get_executor_get_task_log",
+                    return_value=lambda ti, try_number: (["executor"], list(executor_lines)),
+                ),
+                mock.patch(
+                    "airflow.utils.log.file_task_handler.FileTaskHandler._read_from_logs_server",
+                    return_value=([], []),
+                ),
+            ):
+                response = self.client.get(
+                    f"/dags/{self.DAG_ID}/dagRuns/{self.RUN_ID}/taskInstances/{self.TASK_ID}/logs/2",
+                    params={"tail_lines": 10, **({"token": token} if token else {})},
+                    headers={"Accept": accept},
+                )
+            assert response.status_code == 200
+            if accept == "application/json":
+                logs = response.json()["content"]
+                token = response.json()["continuation_token"]
+            else:
+                logs = [json.loads(line) for line in response.content.decode("utf-8").splitlines()]
+                token = response.headers["Airflow-Continuation-Token"]
+            return [log["event"] for log in logs if log["event"].startswith("executor line")], token
+
+        events, token = get_logs()
+        assert events == ["executor line 1"]
+
+        # Only the lines written since the previous poll are returned
+        executor_lines.append("executor line 2")
+        events, token = get_logs(token)
+        assert events == ["executor line 2"]
+        events, _ = get_logs(token)
+        assert events == []
+
+    def test_get_logs_tail_lines_rejects_non_positive(self):
+        response = self.client.get(
+            f"/dags/{self.DAG_ID}/dagRuns/{self.RUN_ID}/taskInstances/{self.TASK_ID}/logs/1",
+            params={"tail_lines": 0},
+        )
+        assert response.status_code == 422
+
     @pytest.mark.parametrize("try_number", [1, 2])
     def test_get_logs_with_metadata_as_download_large_file(self, try_number):
         from airflow.utils.log.file_task_handler import StructuredLogMessage
@@ -25,6 +25,7 @@ from airflow.api_fastapi.app import cached_app
 from airflow.api_fastapi.execution_api.app import lifespan
 from airflow.api_fastapi.execution_api.datamodels.token import TIClaims, TIToken
 from airflow.api_fastapi.execution_api.security import require_auth
+from airflow.settings import _configure_async_session
 
 
 @pytest.fixture(autouse=True)
@@ -34,6 +35,13 @@ def _restore_lifespan_registry():
     lifespan.registry._services = snapshot
 
 
+@pytest.fixture(autouse=True)
+def _reconfigure_async_db_engine():
+    # The connections of the async engine are bound to the event loop they were created in, and each
+    # test client runs the app in a new event loop.
+    _configure_async_session()
+
+
 def _get_execution_api_app(root_app: FastAPI) -> FastAPI:
     """Find the mounted execution API sub-app."""
     for route in root_app.routes:
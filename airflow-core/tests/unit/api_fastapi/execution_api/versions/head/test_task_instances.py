@@ -33,6 +33,7 @@ from opentelemetry.trace import StatusCode
 from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
 from sqlalchemy import select, update
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from airflow._shared.observability.traces import OverrideableRandomIdGenerator
@@ -2276,6 +2277,76 @@ class TestTIUpdateState:
         ).all()
 
 
+class TestTIUpdateStateScheduleDownstream:
+    @pytest.fixture
+    def dag_run(self, dag_maker, session):
+        with dag_maker(dag_id="test_schedule_downstream", serialized=True):
+
+            @task
+            def noop(): ...
+
+            upstream = noop.override(task_id="upstream")()
+            other = noop.override(task_id="other")()
+            ready = noop.override(task_id="ready")()
+            waiting = noop.override(task_id="waiting")()
+            indirect = noop.override(task_id="indirect")()
+            upstream >> [ready, waiting]
+            other >> waiting
+            ready >> indirect
+
+        dag_run = dag_maker.create_dagrun()
+        ti = dag_run.get_task_instance(task_id="upstream", session=session)
+        ti.state = State.RUNNING
+        ti.start_date = DEFAULT_START_DATE
+        session.commit()
+        return dag_run
+
+    def _succeed_upstream(self, client, dag_run, session):
+        ti = dag_run.get_task_instance(task_id="upstream", session=session)
+        response = client.patch(
+            f"/execution/task-instances/{ti.id}/state",
+            json={"state": "success", "end_date": DEFAULT_END_DATE.isoformat()},
+        )
+        assert response.status_code == 204
+
+        session.expire_all()
+        return {ti.task_id: ti.state for ti in dag_run.get_task_instances(session=session)}
+
+    @conf_vars({("scheduler", "schedule_downstream_on_success"): "True"})
+    def test_schedules_ready_direct_downstream(self, client, session, dag_run):
+        with mock.patch("airflow._shared.observability.metrics.stats.timing") as stats_mock:
+            states = self._succeed_upstream(client, dag_run, session)
+
+        assert states == {
+            "upstream": State.SUCCESS,
+            "other": None,
+            "ready": State.SCHEDULED,
+            "waiting": None,
+            "indirect": None,
+        }
+        stats_mock.assert_any_call(
+            "ti.downstream_scheduling_delay",
+            mock.ANY,
+            tags={**dag_run.stats_tags, "task_id": "ready", "source": "execution_api"},
+        )
+
+    def test_disabled_by_default(self, client, session, dag_run):
+        states = self._succeed_upstream(client, dag_run, session)
+
+        assert states["upstream"] == State.SUCCESS
+        assert states["ready"] is None
+
+    @conf_vars({("scheduler", "schedule_downstream_on_success"): "True"})
+    def test_errors_only_skip_scheduling(self, client, session, dag_run):
+        with mock.patch(
+            "airflow.models.dagrun.DagRun.schedule_tis", side_effect=SQLAlchemyError("boom"), autospec=True
+        ):
+            states = self._succeed_upstream(client, dag_run, session)
+
+        assert states["upstream"] == State.SUCCESS
+        assert states["ready"] is None
+
+
 class TestTISkipDownstream:
     def setup_method(self):
         clear_db_runs()
@@ -2658,10 +2729,10 @@ class TestTIHealthEndpoint:
         new_time = time_now.add(minutes=10)
         time_machine.move_to(new_time, tick=False)
 
-        original_execute = Session.execute
+        original_execute = AsyncSession.execute
         fast_path_intercepted = False
 
-        def execute_with_fast_path_miss(session_obj, statement, *args, **kwargs):
+        async def execute_with_fast_path_miss(session_obj, statement, *args, **kwargs):
             nonlocal fast_path_intercepted
             if (
                 not fast_path_intercepted
@@ -2670,9 +2741,9 @@ class TestTIHealthEndpoint:
             ):
                 fast_path_intercepted = True
                 return mock.MagicMock(rowcount=0)
-            return original_execute(session_obj, statement, *args, **kwargs)
+            return await original_execute(session_obj, statement, *args, **kwargs)
 
-        monkeypatch.setattr(Session, "execute", execute_with_fast_path_miss)
+        monkeypatch.setattr(AsyncSession, "execute", execute_with_fast_path_miss)
 
         response = client.put(
             f"/execution/task-instances/{ti.id}/heartbeat",
@@ -2704,10 +2775,10 @@ class TestTIHealthEndpoint:
         new_time = time_now.add(minutes=10)
         time_machine.move_to(new_time, tick=False)
 
-        original_execute = Session.execute
+        original_execute = AsyncSession.execute
         fast_path_intercepted = False
 
-        def execute_with_unknown_fast_path_rowcount(session_obj, statement, *args, **kwargs):
+        async def execute_with_unknown_fast_path_rowcount(session_obj, statement, *args, **kwargs):
             nonlocal fast_path_intercepted
             if (
                 not fast_path_intercepted
@@ -2716,9 +2787,9 @@ class TestTIHealthEndpoint:
             ):
                 fast_path_intercepted = True
                 return mock.MagicMock(rowcount=-1)
-            return original_execute(session_obj, statement, *args, **kwargs)
+            return await original_execute(session_obj, statement, *args, **kwargs)
 
-        monkeypatch.setattr(Session, "execute", execute_with_unknown_fast_path_rowcount)
+        monkeypatch.setattr(AsyncSession, "execute", execute_with_unknown_fast_path_rowcount)
 
         response = client.put(
             f"/execution/task-instances/{ti.id}/heartbeat",
@@ -2731,6 +2802,152 @@ class TestTIHealthEndpoint:
         assert ti.last_heartbeat_at == new_time
 
 
+class TestTIBulkHeartbeat:
+    def setup_method(self):
+        clear_db_runs()
+
+    def teardown_method(self):
+        clear_db_runs()
+
+    @pytest.fixture(autouse=True)
+    def validator(self, client):
+        """Validate tokens of the form ``token-<ti id>``, expiring in 10 minutes unless ``-expiring``."""
+
+        def avalidated_claims(token, required_claims=None):
+            if not token.startswith("token-"):
+                raise ValueError("Invalid token")
+            ti_id = token.removeprefix("token-").removesuffix("-expiring")
+            now = int(timezone.utcnow().timestamp())
+            valid_for = 10 if token.endswith("-expiring") else 600
+            return {"sub": ti_id, "scope": "execution", "iat": now, "exp": now + valid_for}
+
+        validator = mock.AsyncMock(spec=JWTValidator)
+        validator.avalidated_claims.side_effect = avalidated_claims
+        lifespan.registry.register_value(JWTValidator, validator)
+        return validator
+
+    def test_ti_bulk_heartbeat(self, client, session, create_task_instance, time_machine):
+        time_now = timezone.parse("2024-10-31T12:00:00Z")
+        time_machine.move_to(time_now, tick=False)
+
+        tis = [
+            create_task_instance(
+                task_id=f"task_{i}",
+                dag_id="test_ti_bulk_heartbeat",
+                run_id=f"run_{i}",
+                logical_date=time_now.subtract(days=i),
+                state=state,
+                hostname="random-hostname",
+                pid=1000 + i,
+                last_heartbeat_at=time_now,
+                session=session,
+            )
+            for i, state in enumerate([State.RUNNING, State.RUNNING, State.RUNNING, State.SUCCESS])
+        ]
+        session.commit()
+        missing_id = UUID("0182e924-0f1e-77e6-ab50-e977118bc139")
+
+        mock_gen = mock.MagicMock(spec=JWTGenerator)
+        mock_gen.generate.return_value = "refreshed-token"
+        lifespan.registry.register_value(JWTGenerator, mock_gen)
+        time_machine.move_to(time_now.add(minutes=1), tick=False)
+
+        heartbeats = [
+            {"id": str(tis[0].id), "hostname": "random-hostname", "pid": 1000, "token": f"token-{tis[0].id}"},
+            {
+                "id": str(tis[1].id),
+                "hostname": "random-hostname",
+                "pid": 1001,
+                "token": f"token-{tis[1].id}-expiring",
+            },
+            {"id": str(tis[2].id), "hostname": "random-hostname", "pid": 1054, "token": f"token-{tis[2].id}"},
+            {"id": str(tis[3].id), "hostname": "random-hostname", "pid": 1003, "token": f"token-{tis[3].id}"},
+            {
+                "id": str(missing_id),
+                "hostname": "random-hostname",
+                "pid": 1004,
+                "token": f"token-{missing_id}",
+            },
+            {"id": str(tis[0].id), "hostname": "random-hostname", "pid": 1000, "token": f"token-{tis[1].id}"},
+        ]
+        response = client.put("/execution/task-instances/heartbeats", json={"heartbeats": heartbeats})
+
+        assert response.status_code == 200
+        assert response.json()["results"] == [
+            {"status_code": 204, "detail": None, "refreshed_token": None},
+            {"status_code": 204, "detail": None, "refreshed_token": "refreshed-token"},
+            {
+                "status_code": 409,
+                "detail": {
+                    "reason": "running_elsewhere",
+                    "message": "TI is already running elsewhere",
+                    "current_hostname": "random-hostname",
+                    "current_pid": 1002,
+                },
+                "refreshed_token": None,
+            },
+            {
+                "status_code": 409,
+                "detail": {
+                    "reason": "not_running",
+                    "message": "TI is no longer in the running state and task should terminate",
+                    "current_state": "success",
+                },
+                "refreshed_token": None,
+            },
+            {
+                "status_code": 404,
+                "detail": {"reason": "not_found", "message": "Task Instance not found"},
+                "refreshed_token": None,
+            },
+            {
+                "status_code": 403,
+                "detail": {"reason": "invalid_token", "message": "Invalid auth token"},
+                "refreshed_token": None,
+            },
+        ]
+
+        last_heartbeats = dict(
+            session.execute(select(TaskInstance.task_id, TaskInstance.last_heartbeat_at)).all()
+        )
+        assert last_heartbeats == {
+            "task_0": time_now.add(minutes=1),
+            "task_1": time_now.add(minutes=1),
+            "task_2": time_now,
+            "task_3": time_now,
+        }
+
+    def test_ti_bulk_heartbeat_cleared_task_returns_410(self, client, session, create_task_instance):
+        ti = create_task_instance(
+            task_id="test_ti_bulk_heartbeat_cleared",
+            state=State.RUNNING,
+            hostname="random-hostname",
+            pid=1547,
+            session=session,
+        )
+        session.commit()
+        old_ti_id = ti.id
+        ti.prepare_db_for_next_try(session)
+        session.commit()
+
+        response = client.put(
+            "/execution/task-instances/heartbeats",
+            json={
+                "heartbeats": [
+                    {
+                        "id": str(old_ti_id),
+                        "hostname": "random-hostname",
+                        "pid": 1547,
+                        "token": f"token-{old_ti_id}",
+                    }
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.json()["results"][0]["status_code"] == 410
+
+
 class TestTIPutRTIF:
     def setup_method(self):
         clear_db_runs()
@@ -322,6 +322,99 @@ class TestXComsGetEndpoint:
         assert set(response.json()) == set(expected_xcoms)
 
 
+class TestXComsBatchEndpoint:
+    def test_xcom_batch(self, client, dag_maker, session):
+        with dag_maker(dag_id="dag"):
+            EmptyOperator(task_id="task")
+            EmptyOperator.partial(task_id="mapped").expand(doc=["a", "b", "c"])
+        dag_run = dag_maker.create_dagrun(run_id="runid")
+
+        for ti in dag_run.task_instances:
+            if ti.map_index == 1:  # Leave a hole in the mapped values
+                continue
+            session.add(
+                XComModel(
+                    key="xcom_1",
+                    value=f"{ti.task_id}-{ti.map_index}",
+                    dag_run_id=dag_run.id,
+                    run_id=ti.run_id,
+                    task_id=ti.task_id,
+                    dag_id=ti.dag_id,
+                    map_index=ti.map_index,
+                )
+            )
+        session.commit()
+
+        def query(task_id, map_index=-1, key="xcom_1"):
+            return {
+                "dag_id": "dag",
+                "run_id": "runid",
+                "task_id": task_id,
+                "key": key,
+                "map_index": map_index,
+            }
+
+        response = client.post(
+            "/execution/xcoms/batch",
+            json={
+                "queries": [
+                    query("task"),
+                    query("mapped", 2),
+                    query("mapped", 1),
+                    query("mapped", None),
+                    query("task", key="other"),
+                    query("missing"),
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.json() == [["task--1"], ["mapped-2"], [], ["mapped-0", "mapped-2"], [], []]
+
+    @pytest.mark.parametrize(
+        ("include_prior_dates", "expected"),
+        [
+            pytest.param(True, [["later_value"], ["earlier_value", "later_value"]], id="prior_dates"),
+            pytest.param(False, [["later_value"], ["later_value"]], id="current_run"),
+        ],
+    )
+    def test_xcom_batch_include_prior_dates(self, client, dag_maker, session, include_prior_dates, expected):
+        with dag_maker(dag_id="dag"):
+            EmptyOperator(task_id="task")
+        earlier_run = dag_maker.create_dagrun(
+            run_id="earlier_run", logical_date=timezone.parse("2024-01-01T00:00:00Z")
+        )
+        later_run = dag_maker.create_dagrun(
+            run_id="later_run", logical_date=timezone.parse("2024-01-02T00:00:00Z")
+        )
+        for dag_run, value in [(earlier_run, "earlier_value"), (later_run, "later_value")]:
+            session.add(
+                XComModel(
+                    key="test_key",
+                    value=value,
+                    dag_run_id=dag_run.id,
+                    run_id=dag_run.run_id,
+                    task_id="task",
+                    dag_id="dag",
+                )
+            )
+        session.commit()
+
+        query = {
+            "dag_id": "dag",
+            "run_id": "later_run",
+            "task_id": "task",
+            "key": "test_key",
+            "include_prior_dates": include_prior_dates,
+        }
+        response = client.post(
+            "/execution/xcoms/batch", json={"queries": [query, {**query, "map_index": None}]}
+        )
+
+        assert response.status_code == 200
+        assert [sorted(values) for values in response.json()] == expected
+
+
 class TestXComsSetEndpoint:
     @pytest.mark.parametrize(
         ("value", "expected_value"),
@@ -63,7 +63,7 @@ from airflow.sdk import DAG, Asset, AssetAlias, AssetAll, AssetWatcher
 from airflow.sdk.definitions.timetables.assets import PartitionedAssetTimetable
 from airflow.serialization.definitions.assets import SerializedAsset
 from airflow.serialization.encoders import encode_trigger, ensure_serialized_asset
-from airflow.serialization.serialized_objects import LazyDeserializedDAG
+from airflow.serialization.serialized_objects import DagSerialization, LazyDeserializedDAG
 from airflow.timetables.simple import PartitionAtRuntime
 from airflow.triggers.base import BaseEventTrigger
 from airflow.utils.types import DagRunType
@@ -745,6 +745,7 @@ class TestUpdateDagParsingResults:
                     min_update_interval=mock.ANY,
                     session=mock_session,
                     _prefetched=mock.ANY,
+                    _hash_tree=None,
                 ),
             ]
         )
@@ -823,6 +824,43 @@ class TestUpdateDagParsingResults:
         assert len(dag_import_error_listener.existing) == 0
         assert dag_import_error_listener.new["abc.py"] == import_error.stacktrace
 
+    @patch.object(ParseImportError, "full_file_path")
+    @conf_vars({("dag_processor", "validate_serialized_dags_on_change"): "true"})
+    @pytest.mark.usefixtures("clean_db")
+    def test_changed_dags_validated_before_writing(self, mock_full_path, session, testing_dag_bundle):
+        """Test that an invalid changed Dag is not written at all, but recorded as an import error"""
+        with DAG(dag_id="test_valid", schedule=None) as valid_dag:
+            EmptyOperator(task_id="task1")
+        valid_dag.relative_fileloc = "valid.py"
+        with DAG(dag_id="test_invalid", schedule=None) as invalid_dag:
+            EmptyOperator(task_id="task1")
+        invalid_dag.relative_fileloc = "invalid.py"
+        mock_full_path.return_value = "invalid.py"
+        valid = LazyDeserializedDAG(data=DagSerialization.to_dict(valid_dag, validate=False))
+        invalid = LazyDeserializedDAG(data=DagSerialization.to_dict(invalid_dag, validate=False))
+        invalid.data["dag"]["max_active_tasks"] = "not a number"
+
+        import_errors = {}
+        with (
+            patch.object(DagSerialization, "validate_schema", wraps=DagSerialization.validate_schema) as spy,
+            patch("airflow.models.serialized_dag.hash_dag_tree") as write_dag_hash_dag_tree,
+        ):
+            update_dag_parsing_results_in_db(
+                "testing", None, [valid, invalid], import_errors, None, set(), session
+            )
+            assert spy.call_count == 2
+            # The Dags hashed to find out whether they changed are not hashed again to be written
+            write_dag_hash_dag_tree.assert_not_called()
+
+            # Unchanged Dags are not validated again
+            spy.reset_mock()
+            update_dag_parsing_results_in_db("testing", None, [valid], {}, None, set(), session)
+            spy.assert_not_called()
+
+        assert "ValidationError" in import_errors[("testing", "invalid.py")]
+        assert session.scalars(select(DagModel.dag_id)).all() == ["test_valid"]
+        assert session.scalars(select(SerializedDagModel.dag_id)).all() == ["test_valid"]
+
     @patch.object(ParseImportError, "full_file_path")
     @mark_fab_auth_manager_test
     @conf_vars({("core", "min_serialized_dag_update_interval"): "5"})
@@ -0,0 +1,85 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import os
+import zipfile
+from unittest import mock
+
+import pytest
+
+from airflow.dag_processing import file_index
+from airflow.dag_processing.file_index import DagFileIndex
+from airflow.utils.file import list_py_file_paths
+
+from unit.models import TEST_DAGS_FOLDER
+
+DAG_CONTENT = "from airflow.sdk import DAG\n"
+
+
+@pytest.fixture
+def bundle_path(tmp_path):
+    (tmp_path / "dag.py").write_text(DAG_CONTENT)
+    (tmp_path / "not_a_dag.py").write_text("print('hello')\n")
+    (tmp_path / "subdir").mkdir()
+    (tmp_path / "subdir" / "other_dag.py").write_text(DAG_CONTENT)
+    (tmp_path / "README.md").write_text("airflow dag\n")
+    return tmp_path
+
+
+def test_finds_same_files_as_list_py_file_paths():
+    index = DagFileIndex(TEST_DAGS_FOLDER)
+
+    assert sorted(index.find_dag_files()) == sorted(list_py_file_paths(TEST_DAGS_FOLDER))
+
+
+def test_only_inspects_changed_files(bundle_path):
+    index = DagFileIndex(bundle_path)
+    expected = {str(bundle_path / "dag.py"), str(bundle_path / "subdir" / "other_dag.py")}
+
+    assert set(index.find_dag_files()) == expected
+    assert index.last_changed == 4
+
+    with mock.patch.object(file_index, "might_contain_dag", wraps=file_index.might_contain_dag) as inspect:
+        assert set(index.find_dag_files()) == expected
+        assert index.last_changed == 0
+        inspect.assert_not_called()
+
+        (bundle_path / "not_a_dag.py").write_text(DAG_CONTENT + "# now it is\n")
+        (bundle_path / "subdir" / "other_dag.py").unlink()
+        assert set(index.find_dag_files()) == {str(bundle_path / "dag.py"), str(bundle_path / "not_a_dag.py")}
+        assert index.last_changed == 1
+        inspect.assert_called_once_with(str(bundle_path / "not_a_dag.py"), mock.ANY)
+
+
+def test_find_zipped_dags(bundle_path):
+    zip_path = bundle_path / "dags.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("zipped_dag.py", DAG_CONTENT)
+        zf.writestr("helper.py", "print('hello')\n")
+    index = DagFileIndex(bundle_path)
+
+    assert str(zip_path) in index.find_dag_files()
+    expected = [os.path.join(zip_path, "zipped_dag.py")]
+    assert index.find_zipped_dags(zip_path) == expected
+
+    with mock.patch.object(file_index, "find_zipped_dags") as find_zipped_dags:
+        assert index.find_zipped_dags(zip_path) == expected
+    find_zipped_dags.assert_not_called()
+
+    assert index.find_zipped_dags(bundle_path / "dag.py") is None
@@ -275,6 +275,29 @@ class TestDagFileProcessorManager:
         assert len(import_errors) == 1
         assert import_errors[0].filename == "test_zip.zip/broken_dag.py"
 
+    @conf_vars({("core", "config_snapshot"): "True"})
+    def test_reload_config_only_in_manager_process(self):
+        manager = DagFileProcessorManager(max_runs=1)
+        previous_handlers = {
+            signum: signal.getsignal(signum)
+            for signum in (signal.SIGINT, signal.SIGTERM, signal.SIGUSR2, signal.SIGHUP)
+        }
+        try:
+            manager.register_exit_signals()
+        finally:
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+
+        with mock.patch("airflow.dag_processing.manager.conf.reload_snapshot") as mock_reload:
+            manager._reload_config(signal.SIGHUP, None)
+            mock_reload.assert_called_once_with()
+
+            # Parsing processes forked from the manager inherit its signal handlers
+            mock_reload.reset_mock()
+            with mock.patch("airflow.dag_processing.manager.os.getpid", return_value=os.getpid() + 1):
+                manager._reload_config(signal.SIGHUP, None)
+            mock_reload.assert_not_called()
+
     def test_get_observed_filelocs_expands_zip_inner_paths(self, tmp_path):
         zip_path = tmp_path / "test_zip.zip"
         _create_zip_bundle_with_valid_and_broken_dags(zip_path)
@@ -401,6 +424,96 @@ class TestDagFileProcessorManager:
         assert file_2 in manager._processors.keys()
         assert OrderedDict.fromkeys([file_3]) == manager._file_queue
 
+    @conf_vars({("dag_processor", "parsing_process_max_files"): "10"})
+    def test_start_new_processes_reuses_idle_process_of_same_bundle(self):
+        manager = DagFileProcessorManager(max_runs=1)
+        manager._parallelism = 1
+        file_1 = DagFileInfo(bundle_name="testing", rel_path=Path("file_1.py"), bundle_path=TEST_DAGS_FOLDER)
+        file_2 = DagFileInfo(bundle_name="other", rel_path=Path("file_2.py"), bundle_path=Path("/tmp"))
+        manager._file_queue = OrderedDict.fromkeys([file_1, file_2])
+        idle_processor = MagicMock(is_idle=True)
+        manager._idle_processors.append((("testing", TEST_DAGS_FOLDER), idle_processor))
+
+        with (
+            mock.patch.object(DagFileProcessorManager, "_create_process") as mock_create,
+            mock.patch.object(DagFileProcessorManager, "_open_log_file"),
+        ):
+            manager._start_new_processes()
+
+        mock_create.assert_not_called()
+        idle_processor.parse_next.assert_called_once_with(
+            path=file_1.absolute_path,
+            bundle_path=TEST_DAGS_FOLDER,
+            bundle_name="testing",
+            dag_file_rel_path="file_1.py",
+            callbacks=[],
+        )
+        assert manager._processors == {file_1: idle_processor}
+        assert manager._idle_processors == []
+        # The only slot is taken, so file_2 has to wait
+        assert OrderedDict.fromkeys([file_2]) == manager._file_queue
+
+    @conf_vars({("dag_processor", "parsing_process_max_files"): "10"})
+    def test_start_new_processes_retires_idle_process_of_other_bundle(self):
+        manager = DagFileProcessorManager(max_runs=1)
+        manager._parallelism = 1
+        file_1 = DagFileInfo(bundle_name="testing", rel_path=Path("file_1.py"), bundle_path=TEST_DAGS_FOLDER)
+        manager._file_queue = OrderedDict.fromkeys([file_1])
+        idle_processor = MagicMock(is_idle=True)
+        manager._idle_processors.append((("other", Path("/tmp")), idle_processor))
+
+        with mock.patch.object(DagFileProcessorManager, "_create_process") as mock_create:
+            manager._start_new_processes()
+
+            # The retired process keeps its slot until it has exited
+            mock_create.assert_not_called()
+            idle_processor.stop_accepting_requests.assert_called_once()
+            assert manager._idle_processors == []
+            assert manager._retiring_processors == [idle_processor]
+
+            idle_processor.is_ready = False
+            manager._reap_retiring_processes()
+            manager._start_new_processes()
+            mock_create.assert_not_called()
+
+            idle_processor.is_ready = True
+            manager._reap_retiring_processes()
+            manager._start_new_processes()
+
+        mock_create.assert_called_once_with(file_1)
+        assert manager._retiring_processors == []
+
+    @pytest.mark.parametrize(
+        ("num_requests", "rss_mb", "expect_reused"),
+        [
+            pytest.param(1, 100, True, id="reused"),
+            pytest.param(3, 100, False, id="max-files"),
+            pytest.param(1, 600, False, id="max-rss"),
+        ],
+    )
+    @conf_vars(
+        {
+            ("dag_processor", "parsing_process_max_files"): "3",
+            ("dag_processor", "parsing_process_max_rss_mb"): "512",
+        }
+    )
+    def test_release_process(self, num_requests, rss_mb, expect_reused):
+        manager = DagFileProcessorManager(max_runs=1)
+        dag_file = DagFileInfo(bundle_name="testing", rel_path=Path("abc.py"), bundle_path=TEST_DAGS_FOLDER)
+        processor = MagicMock(is_idle=True, num_requests=num_requests)
+
+        with mock.patch("airflow.dag_processing.manager.psutil.Process") as mock_process:
+            mock_process.return_value.memory_info.return_value.rss = rss_mb * 1024 * 1024
+            manager._release_process(dag_file, processor)
+
+        if expect_reused:
+            assert manager._idle_processors == [(("testing", TEST_DAGS_FOLDER), processor)]
+            processor.stop_accepting_requests.assert_not_called()
+        else:
+            assert manager._idle_processors == []
+            assert manager._retiring_processors == [processor]
+            processor.stop_accepting_requests.assert_called_once()
+
     def test_handle_removed_files_when_processor_file_path_not_in_new_file_paths(self):
         """Ensure processors and file stats are removed when the file path is not in the new file paths"""
         manager = DagFileProcessorManager(max_runs=1)
@@ -1350,6 +1463,7 @@ class TestDagFileProcessorManager:
                     "bundle_path": "/opt/airflow/dags",
                     "bundle_name": "testing",
                     "callback_requests": [],
+                    "keep_alive": False,
                     "type": "DagFileParseRequest",
                 },
             ),
@@ -1383,6 +1497,7 @@ class TestDagFileProcessorManager:
                             "type": "DagCallbackRequest",
                         }
                     ],
+                    "keep_alive": False,
                     "type": "DagFileParseRequest",
                 },
             ),
@@ -1427,6 +1542,50 @@ class TestDagFileProcessorManager:
         with create_session() as session:
             assert session.get(DagModel, dag_id) is not None
 
+    @conf_vars(
+        {
+            ("core", "load_examples"): "False",
+            ("dag_processor", "parsing_processes"): "1",
+            ("dag_processor", "parsing_process_max_files"): "10",
+        }
+    )
+    @pytest.mark.execution_timeout(30)
+    def test_parse_files_with_reused_process(self, tmp_path, configure_testing_dag_bundle):
+        for i in range(3):
+            (tmp_path / f"dag_{i}.py").write_text(
+                textwrap.dedent(
+                    f"""
+                    from airflow.sdk import DAG
+
+                    with DAG("reused_process_dag_{i}", schedule=None):
+                        pass
+                    """
+                )
+            )
+
+        with configure_testing_dag_bundle(tmp_path):
+            manager = DagFileProcessorManager(max_runs=1)
+            with mock.patch.object(
+                DagFileProcessorManager,
+                "_create_process",
+                autospec=True,
+                side_effect=DagFileProcessorManager._create_process,
+            ) as mock_create:
+                manager.run()
+
+        assert mock_create.call_count == 1
+        assert sum(stat.run_count for stat in manager._file_stats.values()) == 3
+        assert all(stat.import_errors == 0 for stat in manager._file_stats.values())
+        with create_session() as session:
+            assert (
+                session.scalar(
+                    select(func.count())
+                    .select_from(DagModel)
+                    .where(DagModel.dag_id.like("reused_process_dag_%"))
+                )
+                == 3
+            )
+
     @conf_vars({("core", "load_examples"): "False"})
     @mock.patch("airflow.dag_processing.manager.stats.timing")
     def test_send_file_processing_statsd_timing(
@@ -1927,6 +2086,7 @@ class TestDagFileProcessorManager:
                     logger_filehandle=mock_filehandle,
                     subprocess_logs_to_stdout=False,
                     client=mock.ANY,
+                    keep_alive=False,
                 ),
                 mock.call(
                     id=mock.ANY,
@@ -1940,6 +2100,7 @@ class TestDagFileProcessorManager:
                     logger_filehandle=mock_filehandle,
                     subprocess_logs_to_stdout=False,
                     client=mock.ANY,
+                    keep_alive=False,
                 ),
             ]
             # And removed from the queue
@@ -17,6 +17,7 @@
 # under the License.
 from __future__ import annotations
 
+import importlib
 import inspect
 import logging
 import pathlib
@@ -63,11 +64,17 @@ from airflow.dag_processing.processor import (
     _execute_task_callbacks,
     _parse_file,
     _pre_import_airflow_modules,
+    _unload_bundle_modules,
 )
 from airflow.models import DagRun
 from airflow.sdk import DAG, BaseOperator
 from airflow.sdk.api.client import Client
-from airflow.sdk.api.datamodels._generated import ConnectionResponse, DagRunState, VariableResponse
+from airflow.sdk.api.datamodels._generated import (
+    ConnectionResponse,
+    DagRunState,
+    VariableResponse,
+    XComBatchQuery,
+)
 from airflow.sdk.execution_time import comms
 from airflow.sdk.execution_time.comms import (
     GetConnection,
@@ -75,11 +82,13 @@ from airflow.sdk.execution_time.comms import (
     GetTICount,
     GetVariable,
     GetXCom,
+    GetXComBatch,
     GetXComSequenceSlice,
     TaskStatesResult,
     TICount,
     ToSupervisor,
     ToTask,
+    XComBatchResult,
     XComResult,
     XComSequenceSliceResult,
 )
@@ -541,6 +550,24 @@ def test_parse_file_entrypoint_parses_dag_callbacks(mocker):
     ]
 
 
+def test_unload_bundle_modules(tmp_path, monkeypatch):
+    bundle_path = tmp_path / "bundle"
+    bundle_path.mkdir()
+    (bundle_path / "bundle_helper.py").write_text("VALUE = 1\n")
+    (tmp_path / "outside_helper.py").write_text("VALUE = 1\n")
+    monkeypatch.syspath_prepend(str(bundle_path))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "bundle_helper", raising=False)
+    monkeypatch.delitem(sys.modules, "outside_helper", raising=False)
+    importlib.import_module("bundle_helper")
+    importlib.import_module("outside_helper")
+
+    _unload_bundle_modules(bundle_path)
+
+    assert "bundle_helper" not in sys.modules
+    assert "outside_helper" in sys.modules
+
+
 def test_parse_file_with_dag_callbacks(spy_agency):
     from airflow import DAG
 
@@ -637,6 +664,25 @@ def test_parse_file_static_check_with_error():
     assert "Don't use the variables as arguments" in next(iter(result.import_errors.values()))
 
 
+@pytest.mark.parametrize(("validate_on_change", "expected_validations"), [("false", 1), ("true", 0)])
+def test_parse_file_validates_serialized_dags(validate_on_change, expected_validations):
+    with (
+        conf_vars({("dag_processor", "validate_serialized_dags_on_change"): validate_on_change}),
+        patch("airflow.dag_processing.processor.DagSerialization.validate_schema") as validate_schema,
+    ):
+        result = _parse_file(
+            DagFileParseRequest(
+                file=f"{TEST_DAG_FOLDER}/test_dag_with_no_tags.py",
+                bundle_path=TEST_DAG_FOLDER,
+                bundle_name="testing",
+            ),
+            log=structlog.get_logger(),
+        )
+
+    assert len(result.serialized_dags) == 1
+    assert validate_schema.call_count == expected_validations
+
+
 def test_parse_file_static_check_with_default_warning():
     result = _parse_file(
         DagFileParseRequest(
@@ -1097,6 +1143,24 @@ class TestExecuteDagCallbacks:
                     value="test",
                 ),
             ),
+            (
+                lambda ti, task_ids: ti.xcom_pull(key="batch_value", task_ids=["test_task", "other_task"]),
+                "GetXComBatch",
+                GetXComBatch(
+                    queries=[
+                        XComBatchQuery(
+                            dag_id="test_dag",
+                            run_id="test_run",
+                            task_id=task_id,
+                            key="batch_value",
+                            map_index=None,
+                            include_prior_dates=False,
+                        )
+                        for task_id in ("test_task", "other_task")
+                    ]
+                ),
+                XComBatchResult(root=[["a"], ["b"]]),
+            ),
         ],
     )
     def test_notifier_xcom_operations_send_correct_messages(
@@ -17,6 +17,7 @@
 # under the License.
 from __future__ import annotations
 
+import copy
 import logging
 from datetime import timedelta
 from pathlib import Path
@@ -35,7 +36,7 @@ from airflow.callbacks.callback_requests import CallbackRequest
 from airflow.cli.cli_config import DefaultHelpParser, GroupCommand
 from airflow.cli.cli_parser import AirflowHelpFormatter
 from airflow.executors import workloads
-from airflow.executors.base_executor import BaseExecutor, RunningRetryAttemptType
+from airflow.executors.base_executor import BaseExecutor, QueuedTasks, RunningRetryAttemptType
 from airflow.executors.local_executor import LocalExecutor
 from airflow.executors.workloads.base import BundleInfo
 from airflow.executors.workloads.callback import CallbackDTO
@@ -352,6 +353,76 @@ def test_trigger_running_tasks(dag_maker):
     executor._process_workloads.assert_called_once()
 
 
+def _fake_workload(priority_weight):
+    return mock.Mock(ti=mock.Mock(priority_weight=priority_weight))
+
+
+def test_queued_tasks_by_priority():
+    queued = QueuedTasks()
+    priorities = [5, 1, 3, 1, 4, 2, 5, 0]
+    for i, priority_weight in enumerate(priorities):
+        queued[f"key_{i}"] = _fake_workload(priority_weight)
+
+    def expected(limit=None):
+        return sorted(queued.items(), key=lambda x: x[1].ti.priority_weight)[:limit]
+
+    assert queued.by_priority() == expected()
+    assert queued.by_priority(3) == expected(3)
+    # Reading does not consume the queue
+    assert queued.by_priority(3) == expected(3)
+
+    del queued["key_7"]
+    queued.pop("key_1")
+    # Re-assigning a key keeps its position among keys of the same priority, like sorted() over a dict
+    queued["key_2"] = _fake_workload(1)
+    queued["key_6"] = _fake_workload(3)
+    queued["key_6"] = _fake_workload(5)
+    queued.update({"key_8": _fake_workload(2)})
+    assert queued.by_priority(4) == expected(4)
+    assert queued.by_priority() == expected()
+
+    queued.clear()
+    assert queued.by_priority(5) == []
+
+
+def test_queued_tasks_stale_entries_are_compacted():
+    queued = QueuedTasks()
+    for i in range(500):
+        queued[i] = _fake_workload(i)
+        queued.by_priority(1)
+        if i % 2:
+            del queued[i - 1]
+            del queued[i]
+    queued.by_priority(1)
+    assert len(queued._heap) <= 64
+
+
+def test_queued_tasks_copy():
+    queued = QueuedTasks({"a": _fake_workload(2), "b": _fake_workload(1)})
+    assert isinstance(copy.deepcopy(queued), QueuedTasks)
+    copied = copy.copy(queued)
+    copied["c"] = _fake_workload(0)
+    assert [key for key, _ in copied.by_priority()] == ["c", "b", "a"]
+    assert [key for key, _ in queued.by_priority()] == ["b", "a"]
+
+
+def test_order_queued_tasks_by_priority_with_plain_dict():
+    executor = BaseExecutor()
+    executor.queued_tasks = {"a": _fake_workload(2), "b": _fake_workload(1), "c": _fake_workload(3)}
+    assert [key for key, _ in executor.order_queued_tasks_by_priority(limit=2)] == ["b", "a"]
+
+
+@pytest.mark.db_test
+def test_trigger_tasks_respects_open_slots(dag_maker):
+    executor, dagrun = setup_trigger_tasks(dag_maker)
+    lowest = min(dagrun.task_instances, key=lambda ti: ti.priority_weight)
+
+    executor.trigger_tasks(open_slots=1)
+
+    (workload_items,) = executor._process_workloads.call_args[0]
+    assert [workload.ti.id for workload in workload_items] == [lowest.id]
+
+
 def test_debug_dump(caplog):
     executor = BaseExecutor()
     with caplog.at_level(logging.INFO):
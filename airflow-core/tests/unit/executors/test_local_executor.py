@@ -20,6 +20,7 @@ from __future__ import annotations
 import gc
 import multiprocessing
 import os
+import time
 from pathlib import Path
 from unittest import mock
 
@@ -111,6 +112,50 @@ class TestLocalExecutor:
 
         executor.end()
 
+    @skip_non_fork_mp_start
+    @conf_vars({("workers", "aggregate_heartbeats"): "True"})
+    def test_executor_aggregates_heartbeats(self):
+        executor = LocalExecutor(parallelism=2)
+        start_heartbeat_aggregator = executor._start_heartbeat_aggregator
+        workers_when_started = []
+
+        def record_workers():
+            workers_when_started.append(len(executor.workers))
+            start_heartbeat_aggregator()
+
+        with mock.patch.object(executor, "_start_heartbeat_aggregator", side_effect=record_workers):
+            executor.start()
+        # The thread of the aggregator is only started once the workers are forked
+        assert workers_when_started == [2]
+
+        try:
+            assert executor._heartbeat_aggregator._thread.is_alive()
+            # Each worker claims a slot for the tasks it runs
+            deadline = time.monotonic() + 10
+            while {slot.owner for slot in executor._heartbeat_slots._slots} != executor.workers.keys():
+                assert time.monotonic() < deadline, "Workers didn't claim their heartbeat slot"
+                time.sleep(0.1)
+        finally:
+            executor.end()
+
+        assert executor._heartbeat_aggregator is None
+
+    @skip_non_fork_mp_start
+    def test_workers_forked_with_the_heartbeat_aggregator_paused(self):
+        executor = LocalExecutor(parallelism=1)
+        executor._heartbeat_aggregator = aggregator = mock.MagicMock()
+        with mock.patch.object(executor, "_spawn_worker") as mock_spawn_worker:
+            aggregator.attach_mock(mock_spawn_worker, "spawn_worker")
+            executor._spawn_workers_with_gc_freeze(1)
+
+        # Respawned workers are forked while the aggregator is not sending heartbeats
+        assert aggregator.mock_calls == [
+            mock.call.paused(),
+            mock.call.paused().__enter__(),
+            mock.call.spawn_worker(),
+            mock.call.paused().__exit__(None, None, None),
+        ]
+
     @skip_fork_mp_start
     @mock.patch.object(gc, "unfreeze")
     @mock.patch.object(gc, "freeze")
@@ -22,6 +22,7 @@ import datetime
 import logging
 import os
 import re
+import signal
 from collections import Counter, deque
 from collections.abc import Callable, Generator, Iterator
 from contextlib import ExitStack, contextmanager
@@ -57,7 +58,7 @@ from airflow.executors.executor_loader import ExecutorLoader
 from airflow.executors.executor_utils import ExecutorName
 from airflow.executors.local_executor import LocalExecutor
 from airflow.jobs.job import Job, run_job
-from airflow.jobs.scheduler_job_runner import SchedulerJobRunner
+from airflow.jobs.scheduler_job_runner import IncrementalConcurrencyMap, SchedulerJobRunner
 from airflow.models.asset import (
     AssetActive,
     AssetAliasModel,
@@ -1324,6 +1325,38 @@ class TestSchedulerJob:
 
         patch_traceback_extract_stack.assert_called()
 
+    @conf_vars({("core", "config_snapshot"): "True"})
+    @mock.patch("airflow.jobs.scheduler_job_runner.conf.reload_snapshot")
+    def test_reload_config(self, mock_reload_snapshot, mock_executors):
+        scheduler_job = Job()
+        self.job_runner = SchedulerJobRunner(job=scheduler_job, num_runs=1)
+        self.job_runner._reload_config(signal.SIGHUP, None)
+
+        mock_reload_snapshot.assert_called_once()
+
+    @conf_vars({("scheduler", "loop_phase_profiling"): "True"})
+    def test_loop_phase_profiling(self, mock_executors, configure_testing_dag_bundle, caplog):
+        with configure_testing_dag_bundle(os.devnull):
+            scheduler_job = Job()
+            self.job_runner = SchedulerJobRunner(job=scheduler_job, num_runs=1)
+            self.job_runner._execute()
+
+        samples = self.job_runner._phase_profiler.samples
+        assert {
+            "adopt_or_reset_orphaned_tasks",
+            "do_scheduling",
+            "do_scheduling.start_queued_dagruns",
+            "do_scheduling.schedule_dag_runs",
+            "executor_heartbeat",
+            "process_executor_events",
+            "heartbeat",
+        } <= set(samples)
+        assert samples["do_scheduling"][0].queries > 0
+
+        with caplog.at_level(logging.INFO):
+            self.job_runner._debug_dump(signal.SIGUSR2, None)
+        assert "do_scheduling.schedule_dag_runs" in caplog.text
+
     def test_find_executable_task_instances_backfill(self, dag_maker):
         dag_id = "SchedulerJobTest.test_find_executable_task_instances_backfill"
         task_id_1 = "dummy"
@@ -2281,6 +2314,142 @@ class TestSchedulerJob:
 
         session.rollback()
 
+    @conf_vars({("scheduler", "incremental_concurrency_map"): "True"})
+    def test_find_executable_task_instances_incremental_concurrency_map(self, dag_maker, session):
+        """Queued TIs are accounted for in memory, without waiting for the next reconciliation."""
+        with dag_maker(dag_id="incremental_concurrency_map", max_active_tasks=2, session=session):
+            EmptyOperator(task_id="task_1")
+            EmptyOperator(task_id="task_2")
+            EmptyOperator(task_id="task_3")
+
+        scheduler_job = Job()
+        self.job_runner = SchedulerJobRunner(job=scheduler_job)
+        concurrency_map = self.job_runner._concurrency_map
+        assert isinstance(concurrency_map, IncrementalConcurrencyMap)
+
+        dr = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED, session=session)
+        for ti in dr.get_task_instances(session=session):
+            ti.state = State.SCHEDULED
+            session.merge(ti)
+        session.flush()
+
+        queued_tis = self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session)
+        assert len(queued_tis) == 2
+        assert concurrency_map.dag_run_active_tasks_map[(dr.dag_id, dr.run_id)] == 2
+
+        # Reconciling against the database must not change anything, as nothing happened behind our back.
+        with mock.patch.object(IncrementalConcurrencyMap, "emit_drift_metrics") as mock_emit:
+            concurrency_map.reconcile(session=session)
+        mock_emit.assert_called_once_with(missing=0, stale=0)
+        assert concurrency_map.dag_run_active_tasks_map[(dr.dag_id, dr.run_id)] == 2
+
+        # Within the reconcile interval, no further DB lookups happen and the limit is still enforced.
+        with mock.patch.object(IncrementalConcurrencyMap, "reconcile") as mock_reconcile:
+            assert self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session) == []
+        mock_reconcile.assert_not_called()
+
+        session.rollback()
+
+    def test_incremental_concurrency_map_tracks_deltas(self, dag_maker, session):
+        with dag_maker(dag_id="incremental_concurrency_map_deltas", session=session):
+            EmptyOperator(task_id="task_1")
+            EmptyOperator(task_id="task_2")
+
+        dr = dag_maker.create_dagrun(session=session)
+        ti1, ti2 = dr.get_task_instances(session=session)
+        ti1.state = TaskInstanceState.RUNNING
+        ti2.state = TaskInstanceState.DEFERRED
+        session.merge(ti1)
+        session.merge(ti2)
+        session.flush()
+
+        concurrency_map = IncrementalConcurrencyMap(reconcile_interval=60)
+        concurrency_map.load(session=session)
+        assert concurrency_map.dag_run_active_tasks_map[(dr.dag_id, dr.run_id)] == 1
+        assert concurrency_map.task_concurrency_map[(dr.dag_id, "task_2")] == 1
+
+        # Adding an already-tracked TI is a no-op, except a deferred TI picking up a worker slot again.
+        concurrency_map.add_task_instance(ti1)
+        concurrency_map.add_task_instance(ti2)
+        assert concurrency_map.dag_run_active_tasks_map[(dr.dag_id, dr.run_id)] == 2
+        assert concurrency_map.task_concurrency_map[(dr.dag_id, "task_2")] == 1
+
+        concurrency_map.remove_task_instances([ti1.key, ti2.key, ti2.key])
+        assert not concurrency_map.dag_run_active_tasks_map
+        assert not concurrency_map.task_concurrency_map
+        assert not concurrency_map.task_dagrun_concurrency_map
+
+        # Both TIs are still active in the DB, so the next reconciliation reports them as missing.
+        concurrency_map.invalidate()
+        with mock.patch("airflow.jobs.scheduler_job_runner.stats") as mock_stats:
+            concurrency_map.load(session=session)
+        mock_stats.gauge.assert_any_call("scheduler.concurrency_map.drift_missing", 2)
+        mock_stats.gauge.assert_any_call("scheduler.concurrency_map.drift_stale", 0)
+        mock_stats.incr.assert_called_once_with("scheduler.concurrency_map.drift_detected")
+        assert concurrency_map.dag_run_active_tasks_map[(dr.dag_id, dr.run_id)] == 1
+
+    @conf_vars({("scheduler", "incremental_concurrency_map"): "True"})
+    def test_process_executor_events_updates_incremental_concurrency_map(self, dag_maker, session):
+        with dag_maker(dag_id="incremental_concurrency_map_events", session=session):
+            EmptyOperator(task_id="task_1")
+
+        executor = MockExecutor(do_update=False)
+        self.job_runner = SchedulerJobRunner(job=Job(), executors=[executor])
+        concurrency_map = self.job_runner._concurrency_map
+
+        dr = dag_maker.create_dagrun(session=session)
+        ti = dr.get_task_instance("task_1", session=session)
+        ti.state = TaskInstanceState.QUEUED
+        session.merge(ti)
+        session.flush()
+
+        concurrency_map.load(session=session)
+        assert concurrency_map.task_concurrency_map[(dr.dag_id, "task_1")] == 1
+
+        executor.event_buffer[ti.key] = State.SUCCESS, None
+        self.job_runner._process_executor_events(executor=executor, session=session)
+        assert not concurrency_map.task_concurrency_map
+
+    @conf_vars({("scheduler", "incremental_concurrency_map"): "True"})
+    def test_process_executor_events_keeps_deferred_ti_in_incremental_concurrency_map(
+        self, dag_maker, session
+    ):
+        """The task process exits with success after deferring, but the TI still counts towards limits."""
+        with dag_maker(dag_id="incremental_concurrency_map_deferred", session=session):
+            EmptyOperator(task_id="task_1")
+
+        executor = MockExecutor(do_update=False)
+        self.job_runner = SchedulerJobRunner(job=Job(), executors=[executor])
+        concurrency_map = self.job_runner._concurrency_map
+
+        dr = dag_maker.create_dagrun(session=session)
+        ti = dr.get_task_instance("task_1", session=session)
+        ti.state = TaskInstanceState.DEFERRED
+        session.merge(ti)
+        session.flush()
+
+        concurrency_map.load(session=session)
+        executor.event_buffer[ti.key] = State.SUCCESS, None
+        self.job_runner._process_executor_events(executor=executor, session=session)
+        assert concurrency_map.task_concurrency_map[(dr.dag_id, "task_1")] == 1
+        assert concurrency_map.task_dagrun_concurrency_map[(dr.dag_id, dr.run_id, "task_1")] == 1
+
+    @conf_vars({("scheduler", "incremental_concurrency_map"): "True"})
+    def test_critical_section_error_invalidates_incremental_concurrency_map(self, session):
+        self.job_runner = SchedulerJobRunner(job=Job(), executors=[MockExecutor(do_update=False)])
+        concurrency_map = self.job_runner._concurrency_map
+        concurrency_map.load(session=session)
+
+        with (
+            mock.patch.object(
+                self.job_runner, "_critical_section_enqueue_task_instances", side_effect=ValueError("boom")
+            ),
+            mock.patch.object(concurrency_map, "invalidate") as mock_invalidate,
+            pytest.raises(ValueError, match="boom"),
+        ):
+            self.job_runner._do_scheduling(session)
+        mock_invalidate.assert_called_once_with()
+
     # TODO: This is a hack, I think I need to just remove the setting and have it on always
     def test_find_executable_task_instances_max_active_tis_per_dag(self, dag_maker):
         dag_id = "SchedulerJobTest.test_find_executable_task_instances_max_active_tis_per_dag"
@@ -2460,6 +2460,55 @@ def test_handle_events_does_not_confirm_seq_when_persist_fails(jobless_superviso
     assert list(jobless_supervisor.persisted_event_seqs) == []
 
 
+def test_handle_events_in_batches(jobless_supervisor):
+    """With batching enabled, events are persisted together and every seq is confirmed."""
+    entries = [TriggerEventEntry(i, TriggerEvent(i), i * 10 if i % 2 else None) for i in range(1, 6)]
+    jobless_supervisor.events.extend(entries)
+
+    with (
+        mock.patch.object(TriggerRunnerSupervisor, "event_batch_size", 3),
+        mock.patch.object(TriggerRunnerSupervisor, "on_trigger_events", autospec=True) as mock_events,
+        mock.patch.object(TriggerRunnerSupervisor, "on_trigger_event", autospec=True) as mock_event,
+    ):
+        jobless_supervisor.handle_events()
+
+    assert mock_events.mock_calls == [
+        mock.call(jobless_supervisor, entries[:3]),
+        mock.call(jobless_supervisor, entries[3:]),
+    ]
+    mock_event.assert_not_called()
+    assert list(jobless_supervisor.persisted_event_seqs) == [10, 30, 50]
+    assert len(jobless_supervisor.events) == 0
+
+
+def test_handle_events_batch_failure_falls_back_to_single_events(jobless_supervisor):
+    """A failed batch is retried event by event; events after a failing one stay queued."""
+    entries = [TriggerEventEntry(i, TriggerEvent(i), i) for i in range(1, 4)]
+    jobless_supervisor.events.extend(entries)
+
+    def fail_second(self, trigger_id, event):
+        if trigger_id == 2:
+            raise RuntimeError("db down")
+
+    with (
+        mock.patch.object(TriggerRunnerSupervisor, "event_batch_size", 10),
+        mock.patch.object(
+            TriggerRunnerSupervisor,
+            "on_trigger_events",
+            autospec=True,
+            side_effect=RuntimeError("db down"),
+        ),
+        mock.patch.object(
+            TriggerRunnerSupervisor, "on_trigger_event", autospec=True, side_effect=fail_second
+        ),
+    ):
+        with pytest.raises(RuntimeError, match="db down"):
+            jobless_supervisor.handle_events()
+
+    assert list(jobless_supervisor.persisted_event_seqs) == [1]
+    assert list(jobless_supervisor.events) == [entries[2]]
+
+
 @pytest.mark.parametrize(
     ("team_name", "expected_tags"),
     [
@@ -2655,6 +2655,83 @@ class TestDagModel:
         dag_models = query.all()
         assert dag_models == [dag_model]
 
+    def test_dags_needing_dagruns_adrq_watermarks(self, dag_maker, session):
+        assets = [Asset(uri=f"test://asset{i}", group="test-group") for i in range(2)]
+        with dag_maker(
+            session=session,
+            dag_id="my_dag",
+            max_active_runs=1,
+            schedule=AssetAll(*assets),
+            start_date=pendulum.now().add(days=-2),
+        ):
+            EmptyOperator(task_id="dummy")
+        dag_model = dag_maker.dag_model
+        asset_ids = [asset_model.id for asset_model in dag_model.schedule_assets]
+
+        # Only one of the two assets has an event, the Dag is evaluated and remembered as not ready.
+        session.add(AssetDagRunQueue(asset_id=asset_ids[0], target_dag_id=dag_model.dag_id))
+        session.flush()
+        adrq_watermarks: dict = {}
+        with mock.patch("airflow.models.dag.stats.gauge") as gauge:
+            query, _ = DagModel.dags_needing_dagruns(session, adrq_watermarks=adrq_watermarks)
+            assert query.all() == []
+            gauge.assert_any_call("scheduler.asset_dag_run_queue.dags_evaluated", 1)
+            assert list(adrq_watermarks) == [dag_model.dag_id]
+
+            # Nothing was queued since, so the Dag is not evaluated again.
+            gauge.reset_mock()
+            query, _ = DagModel.dags_needing_dagruns(session, adrq_watermarks=adrq_watermarks)
+            assert query.all() == []
+            gauge.assert_any_call("scheduler.asset_dag_run_queue.dags_evaluated", 0)
+            gauge.assert_any_call("scheduler.asset_dag_run_queue.dags_skipped", 1)
+            gauge.assert_any_call("scheduler.asset_dag_run_queue.rows_scanned", 0)
+
+            # The second event changes the watermark of the Dag, which is evaluated again and now ready.
+            gauge.reset_mock()
+            session.add(AssetDagRunQueue(asset_id=asset_ids[1], target_dag_id=dag_model.dag_id))
+            session.flush()
+            query, _ = DagModel.dags_needing_dagruns(session, adrq_watermarks=adrq_watermarks)
+            assert query.all() == [dag_model]
+            gauge.assert_any_call("scheduler.asset_dag_run_queue.dags_evaluated", 1)
+            gauge.assert_any_call("scheduler.asset_dag_run_queue.rows_scanned", 2)
+            assert adrq_watermarks == {}
+
+        # Watermarks of Dags without queued events anymore are dropped.
+        adrq_watermarks["removed_dag"] = (1, timezone.utcnow(), 1)
+        DagModel.dags_needing_dagruns(session, adrq_watermarks=adrq_watermarks)
+        assert adrq_watermarks == {}
+
+    def test_dags_needing_dagruns_adrq_batches(self, dag_maker, session):
+        asset = Asset(uri="test://asset", group="test-group")
+        dag_ids = [f"dag_{i}" for i in range(5)]
+        for dag_id in dag_ids:
+            with dag_maker(session=session, dag_id=dag_id, schedule=[asset], start_date=DEFAULT_DATE):
+                EmptyOperator(task_id="dummy")
+            session.add(
+                AssetDagRunQueue(
+                    asset_id=dag_maker.dag_model.schedule_assets[0].id,
+                    target_dag_id=dag_maker.dag_model.dag_id,
+                )
+            )
+        session.flush()
+
+        with (
+            mock.patch.object(DagModel, "NUM_ADRQ_DAGS_PER_QUERY", 2),
+            mock.patch.object(
+                SerializedDagModel,
+                "get_latest_serialized_dags",
+                side_effect=SerializedDagModel.get_latest_serialized_dags,
+            ) as get_latest_serialized_dags,
+            mock.patch("airflow.models.dag.stats.gauge") as gauge,
+        ):
+            _, triggered_date_by_dag = DagModel.dags_needing_dagruns(session)
+
+        assert sorted(triggered_date_by_dag) == dag_ids
+        assert get_latest_serialized_dags.call_count == 3
+        gauge.assert_any_call("scheduler.asset_dag_run_queue.rows_scanned", 5)
+        gauge.assert_any_call("scheduler.asset_dag_run_queue.dags_evaluated", 5)
+        gauge.assert_any_call("scheduler.asset_dag_run_queue.dags_skipped", 0)
+
     @pytest.mark.parametrize("ref", [Asset.ref(name="1"), Asset.ref(uri="s3://bucket/assets/1")])
     @pytest.mark.want_activate_assets
     @pytest.mark.need_serialized_dag
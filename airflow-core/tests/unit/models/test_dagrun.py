@@ -1191,6 +1191,37 @@ class TestDagRun:
             session.rollback()
             session.close()
 
+    def test_emit_downstream_scheduling_delay(self, dag_maker, session, time_machine):
+        """The delay since the end of their last upstream task is emitted for the task instances scheduled."""
+        with dag_maker(dag_id="test_emit_downstream_scheduling_delay", session=session):
+            first = EmptyOperator(task_id="first")
+            second = EmptyOperator(task_id="second")
+            downstream = EmptyOperator(task_id="downstream")
+            EmptyOperator(task_id="root")
+            [first, second] >> downstream
+
+        dag_run = dag_maker.create_dagrun(session=session)
+        now = timezone.utcnow()
+        for task_id, end_date in (("first", now - datetime.timedelta(seconds=30)), ("second", now)):
+            ti = dag_run.get_task_instance(task_id, session=session)
+            ti.state = TaskInstanceState.SUCCESS
+            ti.end_date = end_date
+        session.flush()
+
+        time_machine.move_to(now + datetime.timedelta(seconds=5), tick=False)
+        with mock.patch("airflow._shared.observability.metrics.stats.timing") as stats_mock:
+            schedulable_tis, _ = dag_run.update_state(session=session)
+
+        assert {ti.task_id for ti in schedulable_tis} == {"downstream", "root"}
+        delay_calls = [c for c in stats_mock.mock_calls if c.args[0] == "ti.downstream_scheduling_delay"]
+        assert delay_calls == [
+            call(
+                "ti.downstream_scheduling_delay",
+                datetime.timedelta(seconds=5),
+                tags={**dag_run.stats_tags, "task_id": "downstream", "source": "scheduler"},
+            )
+        ]
+
     @pytest.mark.parametrize(
         ("queued_at_offset", "expected"),
         [
@@ -37,6 +37,7 @@ from airflow.serialization.definitions.baseoperator import SerializedBaseOperato
 from airflow.task.trigger_rule import TriggerRule
 from airflow.utils.state import TaskInstanceState
 
+from tests_common.test_utils.config import conf_vars
 from tests_common.test_utils.dag import sync_dag_to_db
 from tests_common.test_utils.mapping import expand_mapped_task
 from tests_common.test_utils.mock_operators import MockOperator
@@ -501,6 +502,35 @@ def test_expand_mapped_task_task_instance_mutation_hook(dag_maker, session, crea
             assert call.args[0].map_index == expected_map_index[index]
 
 
+@conf_vars({("scheduler", "max_tis_per_insert"): "2"})
+def test_expand_mapped_task_inserts_in_batches(dag_maker, session):
+    with dag_maker(session=session, serialized=True) as dag:
+        task1 = BaseOperator(task_id="op1")
+        mapped = MockOperator.partial(task_id="task_2").expand(arg2=task1.output)
+
+    dr = dag_maker.create_dagrun()
+    serialized = dag.task_dict[mapped.task_id]
+    session.add(
+        TaskMap(dag_id=dr.dag_id, task_id=task1.task_id, run_id=dr.run_id, map_index=-1, length=5, keys=None)
+    )
+    session.flush()
+
+    with mock.patch.object(session, "bulk_insert_mappings", wraps=session.bulk_insert_mappings) as insert:
+        expanded_tis, max_map_index = TaskMap.expand_mapped_task(serialized, dr.run_id, session=session)
+
+    # The unmapped task instance becomes map index 0, the 4 others are inserted 2 at a time
+    assert insert.call_count == 2
+    assert max_map_index == 4
+    assert [ti.map_index for ti in expanded_tis] == [0, 1, 2, 3, 4]
+    assert all(ti.task is serialized for ti in expanded_tis[1:])
+    assert all(ti.context_carrier for ti in expanded_tis[1:])
+    assert session.scalars(
+        select(TaskInstance.map_index)
+        .where(TaskInstance.dag_id == dr.dag_id, TaskInstance.task_id == mapped.task_id)
+        .order_by(TaskInstance.map_index)
+    ).all() == [0, 1, 2, 3, 4]
+
+
 class TestMappedSetupTeardown:
     @staticmethod
     def get_states(dr):
@@ -29,17 +29,19 @@ from sqlalchemy import delete, func, select, update
 
 import airflow.example_dags as example_dags_module
 from airflow.dag_processing.dagbag import DagBag
+from airflow.exceptions import AirflowConfigException
 from airflow.models.asset import AssetActive, AssetAliasModel, AssetModel
 from airflow.models.dag import DagModel
 from airflow.models.dag_version import DagVersion
 from airflow.models.deadline_alert import DeadlineAlert as DAM
-from airflow.models.serialized_dag import SerializedDagModel as SDM
+from airflow.models.serialized_dag import SerializedDagModel as SDM, _get_dag_codec
 from airflow.providers.standard.operators.bash import BashOperator
 from airflow.providers.standard.operators.empty import EmptyOperator
 from airflow.providers.standard.operators.python import PythonOperator
 from airflow.sdk import DAG, Asset, AssetAlias, task as task_decorator
 from airflow.sdk.definitions.callback import AsyncCallback
 from airflow.sdk.definitions.deadline import DeadlineAlert, DeadlineReference
+from airflow.serialization.dag_codec import DagCodec
 from airflow.serialization.dag_dependency import DagDependency
 from airflow.serialization.definitions.dag import SerializedDAG
 from airflow.serialization.serialized_objects import DagSerialization, LazyDeserializedDAG
@@ -93,16 +95,17 @@ class TestSerializedDagModel:
     @pytest.fixture(
         autouse=True,
         params=[
-            pytest.param(False, id="raw-serialized_dags"),
-            pytest.param(True, id="compress-serialized_dags"),
+            pytest.param(DagCodec(), id="raw-serialized_dags"),
+            pytest.param(DagCodec("json", "zlib"), id="compress-serialized_dags"),
+            pytest.param(DagCodec("msgpack", "zlib"), id="msgpack-serialized_dags"),
         ],
     )
     def setup_test_cases(self, request, monkeypatch):
         db.clear_db_dags()
         db.clear_db_runs()
         db.clear_db_serialized_dags()
-        with conf_vars({("core", "compress_serialized_dags"): str(request.param)}):
-            yield
+        monkeypatch.setattr("airflow.models.serialized_dag._get_dag_codec", lambda: request.param)
+        yield
         db.clear_db_serialized_dags()
 
     def _write_example_dags(self):
@@ -772,6 +775,23 @@ class TestSerializedDagModel:
         # Hashes should be identical
         assert hash_1 == hash_2, "Hashes should be identical when dicts are sorted consistently"
 
+    def test_write_dag_logs_changed_tasks(self, session, caplog):
+        with DAG("test_changed_tasks", schedule=None) as dag:
+            EmptyOperator(task_id="task1")
+            EmptyOperator(task_id="task2")
+        sync_dag_to_db(dag, session=session)
+
+        with DAG("test_changed_tasks", schedule=None) as dag:
+            EmptyOperator(task_id="task1")
+            EmptyOperator(task_id="task2", retries=3)
+            EmptyOperator(task_id="task3")
+        with caplog.at_level(logging.INFO, logger="airflow.models.serialized_dag"):
+            sync_dag_to_db(dag, session=session)
+
+        assert (
+            "2 task(s) added, removed or modified ['task2', 'task3'], DAG attributes unchanged" in caplog.text
+        )
+
     def test_dynamic_dag_update_preserves_null_check(self, dag_maker, session):
         """
         Test that dynamic DAG update gracefully handles case where SerializedDagModel doesn't exist.
@@ -1018,3 +1038,18 @@ class TestSerializedDagModel:
 
         # The name must have been updated in the DB.
         assert updated_alert.name == "updated name"
+
+
+def test_dag_codec_resolved_when_writing():
+    """An invalid codec configuration only fails when a serialized DAG is created, not on import."""
+    with DAG("test_dag_codec_resolved_when_writing", schedule=None) as dag:
+        EmptyOperator(task_id="task1")
+    _get_dag_codec.cache_clear()
+    try:
+        with (
+            conf_vars({("core", "serialized_dag_encoding"): "pickle"}),
+            pytest.raises(AirflowConfigException, match="Invalid"),
+        ):
+            SDM(LazyDeserializedDAG.from_dag(dag))
+    finally:
+        _get_dag_codec.cache_clear()
@@ -20,7 +20,7 @@ import datetime
 import json
 from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING, Any
-from unittest.mock import patch
+from unittest.mock import call, patch
 
 import pendulum
 import pytest
@@ -234,6 +234,49 @@ def test_submit_event(mock_callback_handle_event, session, create_task_instance)
     mock_callback_handle_event.assert_called_once_with(event, session)
 
 
+@patch.object(TriggererCallback, "handle_event")
+def test_submit_events(mock_callback_handle_event, session, dag_maker):
+    """Submitting a batch behaves like submitting each event in turn."""
+    with dag_maker(session=session):
+        EmptyOperator(task_id="task_1")
+        EmptyOperator(task_id="task_2")
+    dr = dag_maker.create_dagrun()
+
+    trigger1 = Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={})
+    trigger2 = Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={})
+    session.add_all([trigger1, trigger2])
+    session.flush()
+    for ti, trigger in zip(dr.get_task_instances(session=session), (trigger1, trigger2)):
+        ti.state = State.DEFERRED
+        ti.trigger_id = trigger.id
+    asset = AssetModel("test_submit_events")
+    asset.add_trigger(trigger2, "test_asset_watcher")
+    session.add(asset)
+    callback = TriggererCallback(callback_def=AsyncCallback("classpath.callback"))
+    callback.trigger = trigger1
+    session.add(callback)
+    session.commit()
+
+    event1, event2, event3 = TriggerEvent("first"), TriggerEvent("second"), TriggerEvent("third")
+    Trigger.submit_events(
+        [(trigger1.id, event1), (trigger2.id, event2), (trigger1.id, event3)], session=session
+    )
+    session.flush()
+
+    ti1, ti2 = dr.get_task_instances(session=session)
+    for ti in (ti1, ti2):
+        session.refresh(ti)
+        assert ti.state == State.SCHEDULED
+        assert ti.trigger_id is None
+    # The second event of trigger1 does not touch its task instance again.
+    assert ti1.next_kwargs == {"event": "first"}
+    assert ti2.next_kwargs == {"event": "second"}
+
+    asset_events = session.scalars(select(AssetEvent).where(AssetEvent.asset_id == asset.id)).all()
+    assert [e.extra for e in asset_events] == [{"from_trigger": True, "payload": "second"}]
+    assert mock_callback_handle_event.mock_calls == [call(event1, session), call(event3, session)]
+
+
 def test_submit_failure(session, create_task_instance):
     """
     Tests that failures submitted to a trigger fail their dependent
@@ -0,0 +1,129 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import importlib.util
+import json
+import zlib
+from unittest import mock
+
+import pytest
+
+from airflow.exceptions import AirflowConfigException
+from airflow.serialization.dag_codec import COMPRESSIONS, ENCODINGS, DagCodec, decode
+
+from tests_common.test_utils.config import conf_vars
+
+DAG_DATA = {
+    "__version": 3,
+    "dag": {
+        "dag_id": "example",
+        "fileloc": "/dags/example.py",
+        "tasks": [
+            {"__var": {"task_id": f"task_{i}", "retries": i % 3}, "__type": "operator"} for i in range(50)
+        ],
+        "dag_dependencies": [],
+        "params": [],
+        "catchup": False,
+        "timezone": "UTC",
+    },
+}
+
+
+def _available(compression: str) -> bool:
+    if compression == "zstd":
+        return importlib.util.find_spec("zstandard") is not None
+    if compression == "lz4":
+        return importlib.util.find_spec("lz4") is not None
+    return True
+
+
+@pytest.mark.parametrize("encoding", ENCODINGS)
+@pytest.mark.parametrize("compression", COMPRESSIONS)
+def test_round_trip(encoding, compression):
+    if not _available(compression):
+        pytest.skip(f"{compression} is not installed")
+    codec = DagCodec(encoding, compression)
+
+    assert decode(codec.encode(DAG_DATA)) == DAG_DATA
+
+
+def test_json_zlib_is_written_like_compress_serialized_dags():
+    """Rows written with json and zlib stay readable by Airflow versions without codecs."""
+    encoded = DagCodec("json", "zlib").encode(DAG_DATA)
+
+    assert json.loads(zlib.decompress(encoded)) == DAG_DATA
+
+
+def test_decode_legacy_row():
+    assert decode(zlib.compress(json.dumps(DAG_DATA, sort_keys=True).encode("utf-8"))) == DAG_DATA
+
+
+def test_msgpack_is_smaller_than_json():
+    assert len(DagCodec("msgpack").encode(DAG_DATA)) < len(json.dumps(DAG_DATA).encode("utf-8"))
+
+
+def test_decode_unknown_codec():
+    encoded = bytearray(DagCodec("msgpack").encode(DAG_DATA))
+    encoded[4] = 42
+
+    with pytest.raises(ValueError, match="Unknown serialized DAG codec"):
+        decode(bytes(encoded))
+
+
+@pytest.mark.parametrize(
+    ("config", "expected"),
+    [
+        pytest.param({}, DagCodec("json", "none"), id="default"),
+        pytest.param({("core", "compress_serialized_dags"): "True"}, DagCodec("json", "zlib"), id="compress"),
+        pytest.param(
+            {("core", "serialized_dag_encoding"): "msgpack", ("core", "compress_serialized_dags"): "True"},
+            DagCodec("msgpack", "zlib"),
+            id="msgpack-compress",
+        ),
+        pytest.param(
+            {("core", "serialized_dag_compression"): "none", ("core", "compress_serialized_dags"): "True"},
+            DagCodec("json", "none"),
+            id="compression-overrides-compress",
+        ),
+    ],
+)
+def test_from_config(config, expected):
+    with conf_vars(config):
+        assert DagCodec.from_config() == expected
+    assert expected.uses_json_column == (expected == DagCodec())
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {("core", "serialized_dag_encoding"): "pickle"},
+        {("core", "serialized_dag_compression"): "bz2"},
+    ],
+)
+def test_from_config_invalid(config):
+    with conf_vars(config), pytest.raises(AirflowConfigException, match="Invalid"):
+        DagCodec.from_config()
+
+
+def test_from_config_missing_package():
+    with (
+        conf_vars({("core", "serialized_dag_compression"): "lz4"}),
+        mock.patch.dict("sys.modules", {"lz4": None, "lz4.frame": None}),
+        pytest.raises(AirflowConfigException, match="requires the `lz4` package"),
+    ):
+        DagCodec.from_config()
@@ -0,0 +1,101 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import copy
+
+import pytest
+
+from airflow.providers.standard.operators.empty import EmptyOperator
+from airflow.sdk import DAG, TaskGroup
+from airflow.serialization.dag_hash import hash_dag_tree
+from airflow.serialization.serialized_objects import DagSerialization
+
+
+@pytest.fixture
+def dag_data():
+    with DAG("example", schedule=None, tags=["b", "a"]) as dag:
+        start = EmptyOperator(task_id="start")
+        with TaskGroup("group"):
+            middle = EmptyOperator(task_id="middle", retries=1)
+            with TaskGroup("nested"):
+                inner = EmptyOperator(task_id="inner")
+        start >> middle >> inner
+    return DagSerialization.to_dict(dag)
+
+
+def _task(dag_data, task_id):
+    return next(task for task in dag_data["dag"]["tasks"] if task["__var"]["task_id"] == task_id)
+
+
+def test_hash_dag_tree(dag_data):
+    tree = hash_dag_tree(dag_data)
+
+    assert set(tree.task_hashes) == {"start", "group.middle", "group.nested.inner"}
+    assert set(tree.task_group_hashes) == {"", "group", "group.nested"}
+    assert hash_dag_tree(copy.deepcopy(dag_data)) == tree
+
+
+def test_hash_dag_tree_ignores_ordering_and_fileloc(dag_data):
+    tree = hash_dag_tree(dag_data)
+
+    dag_data["dag"]["tasks"].reverse()
+    dag_data["dag"]["fileloc"] = "/somewhere/else.py"
+    dag_data["dag"]["tags"].reverse()
+
+    assert hash_dag_tree(dag_data).dag_hash == tree.dag_hash
+
+
+def test_changed_task(dag_data):
+    tree = hash_dag_tree(dag_data)
+
+    _task(dag_data, "group.nested.inner")["__var"]["retries"] = 5
+    changed = hash_dag_tree(dag_data)
+
+    assert changed.dag_hash != tree.dag_hash
+    assert changed.attributes_hash == tree.attributes_hash
+    assert changed.changed_tasks(tree) == {"group.nested.inner"}
+    # Only the groups containing the task are hashed differently
+    assert changed.task_group_hashes["group.nested"] != tree.task_group_hashes["group.nested"]
+    assert changed.task_group_hashes["group"] != tree.task_group_hashes["group"]
+
+
+def test_added_and_removed_tasks(dag_data):
+    tree = hash_dag_tree(dag_data)
+
+    dag_data["dag"]["tasks"] = [
+        task for task in dag_data["dag"]["tasks"] if task["__var"]["task_id"] != "start"
+    ]
+    dag_data["dag"]["task_group"]["children"].pop("start")
+    new_task = copy.deepcopy(_task(dag_data, "group.middle"))
+    new_task["__var"]["task_id"] = "end"
+    dag_data["dag"]["tasks"].append(new_task)
+    dag_data["dag"]["task_group"]["children"]["end"] = ["operator", "end"]
+
+    assert hash_dag_tree(dag_data).changed_tasks(tree) == {"start", "end"}
+
+
+def test_changed_attributes(dag_data):
+    tree = hash_dag_tree(dag_data)
+
+    dag_data["dag"]["max_active_tasks"] = 3
+    changed = hash_dag_tree(dag_data)
+
+    assert changed.dag_hash != tree.dag_hash
+    assert changed.attributes_hash != tree.attributes_hash
+    assert changed.task_hashes == tree.task_hashes
+    assert changed.changed_tasks(tree) == set()
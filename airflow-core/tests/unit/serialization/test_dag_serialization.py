@@ -3037,6 +3037,44 @@ def test_task_resources_serde():
     }
 
 
+def test_lazy_load_operator_fields(monkeypatch):
+    """Fields not needed for scheduling are only decoded when first accessed, to the same values."""
+    from airflow.providers.standard.operators.empty import EmptyOperator
+
+    with DAG("test_lazy_load_operator_fields", schedule=None, start_date=datetime(2020, 1, 1)) as dag:
+        EmptyOperator(
+            task_id="task1",
+            params={"param": Param(5, type="integer")},
+            doc_md="# Task",
+            executor_config={"pod_override": k8s.V1Pod(metadata=k8s.V1ObjectMeta(name="pod"))},
+            outlets=[Asset("s3://bucket/key")],
+            resources={"cpus": 0.1},
+            retries=3,
+            trigger_rule="all_done",
+        )
+    serialized = DagSerialization.to_dict(dag)
+    eager_task = DagSerialization.from_dict(serialized).get_task("task1")
+
+    monkeypatch.setattr(DagSerialization, "_lazy_load_operator_fields", True)
+    task = DagSerialization.from_dict(serialized).get_task("task1")
+
+    assert set(task._lazy_fields) == {"params", "doc_md", "executor_config", "outlets", "resources"}
+    assert (task.retries, task.trigger_rule) == (3, "all_done")
+    assert task.doc_md == "# Task"
+    assert task.params.dump() == eager_task.params.dump()
+    assert task.executor_config == eager_task.executor_config
+    assert task.outlets == eager_task.outlets
+    assert task.resources == eager_task.resources
+    assert task._lazy_fields == {}
+
+    # Fields that are set are not decoded, and fields missing from the serialized task keep their defaults
+    task = DagSerialization.from_dict(serialized).get_task("task1")
+    task.doc_md = "# Changed"
+    assert task.doc_md == "# Changed"
+    assert "doc_md" not in task._lazy_fields
+    assert task.email is SerializedBaseOperator.email is None
+
+
 @pytest.mark.parametrize("execution_timeout", [None, timedelta(hours=1)])
 def test_task_execution_timeout_serde(execution_timeout):
     """
@@ -219,6 +219,23 @@ def test_serde_validate_schema_valid_json():
     assert t.obj == {"foo": "bar"}
 
 
+def test_to_dict_validate(monkeypatch):
+    validated = []
+    monkeypatch.setattr(DagSerialization, "validate_schema", validated.append)
+
+    DagSerialization.to_dict(DAG_WITH_TASKS, validate=False)
+    assert validated == []
+
+    data = DagSerialization.to_dict(DAG_WITH_TASKS)
+    assert validated == [data]
+
+
+def test_dag_schema_validator_is_shared():
+    from airflow.serialization.json_schema import load_dag_schema
+
+    assert load_dag_schema() is load_dag_schema()
+
+
 TASK_CALLBACK_TI = ti_datamodel.TaskInstance(
     id=uuid7(),
     task_id="test-task",
@@ -31,7 +31,7 @@ from airflow.providers.standard.operators.empty import EmptyOperator
 from airflow.sdk import task, task_group
 from airflow.sdk.bases.operator import BaseOperator
 from airflow.task.trigger_rule import TriggerRule
-from airflow.ti_deps.dep_context import DepContext
+from airflow.ti_deps.dep_context import DepContext, UpstreamStateIndex
 from airflow.ti_deps.deps.trigger_rule_dep import TriggerRuleDep, _UpstreamTIStates
 from airflow.utils.state import DagRunState, TaskInstanceState
 
@@ -1411,6 +1411,37 @@ class TestTriggerRuleDep:
         dr.update_state(session=session)
         assert dr.state == DagRunState.SUCCESS
 
+    @pytest.mark.parametrize(
+        ("map_indexes", "expected"),
+        [
+            pytest.param(None, (2, 1, 2, 0, 0, 5, 1, 0), id="all"),
+            pytest.param(1, (1, 0, 2, 0, 0, 3, 1, 0), id="single"),
+            pytest.param(range(2, 4), (1, 1, 1, 0, 0, 3, 1, 0), id="range"),
+            pytest.param(range(1, 1000), (1, 1, 2, 0, 0, 4, 1, 0), id="wide-range"),
+        ],
+    )
+    def test_upstream_state_index(self, map_indexes, expected):
+        """The index counts the same states as calculating them from the relevant finished tis."""
+        finished_tis = [
+            Mock(task_id="setup", map_index=-1, state=SUCCESS, task=Mock(is_setup=True)),
+            Mock(task_id="mapped", map_index=-1, state=FAILED, task=Mock(is_setup=False)),
+            Mock(task_id="mapped", map_index=0, state=SUCCESS, task=Mock(is_setup=False)),
+            Mock(task_id="mapped", map_index=1, state=FAILED, task=Mock(is_setup=False)),
+            Mock(task_id="mapped", map_index=2, state=SKIPPED, task=Mock(is_setup=False)),
+            Mock(task_id="other", map_index=-1, state=SUCCESS, task=Mock(is_setup=False)),
+        ]
+        index = UpstreamStateIndex(finished_tis)
+
+        get_map_indexes = None if map_indexes is None else lambda _: map_indexes
+        upstream_states = _UpstreamTIStates.calculate(
+            index.count_states(["setup", "mapped", "unknown"], get_map_indexes=get_map_indexes)
+        )
+
+        assert upstream_states == expected
+        assert index.is_built_from(finished_tis)
+        finished_tis.append(Mock(task_id="late", map_index=-1, state=SUCCESS, task=None))
+        assert not index.is_built_from(finished_tis)
+
     @pytest.mark.parametrize(("flag_upstream_failed", "expected_ti_state"), [(True, REMOVED), (False, None)])
     def test_mapped_task_upstream_removed_with_all_success_trigger_rules(
         self,
@@ -61,7 +61,11 @@ from airflow.utils.log.file_task_handler import (
     _is_logs_stream_like,
     _is_sort_key_with_default_timestamp,
     _log_stream_to_parsed_log_stream,
+    _LogRanges,
+    _read_byte_range,
+    _seek_line_start,
     _stream_lines_by_chunk,
+    _stream_lines_from_chunks,
 )
 from airflow.utils.log.logging_mixin import set_context
 from airflow.utils.net import get_hostname
@@ -517,6 +521,88 @@ class TestFileTaskLogHandler:
         assert list(log_streams[0]) == ["file1 content", "file1 content2"]
         assert list(log_streams[1]) == ["file2 content", "file2 content2"]
 
+    def test__read_from_local_ranges(self, tmp_path):
+        path = tmp_path / "hello1.log"
+        path.write_text("line 1\nline 2\nline 3\nline 4\npartial")
+        fth = FileTaskHandler(str(tmp_path))
+
+        # The last line of a running task may still be being written to
+        ranges = _LogRanges({}, tail_lines=2, to_end=False)
+        _, log_streams = fth._read_from_local(path, ranges=ranges)
+        assert list(log_streams[0]) == ["line 3", "line 4"]
+        assert ranges.offsets == {str(path): len("line 1\nline 2\nline 3\nline 4\n")}
+
+        with path.open("a") as f:
+            f.write(" line 5\nline 6\n")
+        ranges = _LogRanges(ranges.offsets, tail_lines=None, to_end=True)
+        _, log_streams = fth._read_from_local(path, ranges=ranges)
+        assert list(log_streams[0]) == ["partial line 5", "line 6"]
+        assert ranges.offsets == {str(path): path.stat().st_size}
+
+        # Truncated since the previous read
+        path.write_text("line 1\n")
+        _, log_streams = fth._read_from_local(path, ranges=ranges)
+        assert list(log_streams[0]) == ["line 1"]
+
+    def test__read_range_read(self, tmp_path, create_task_instance):
+        ti = create_task_instance(
+            dag_id="dag_for_testing_range_read",
+            task_id="task_for_testing_range_read",
+            run_type=DagRunType.SCHEDULED,
+            logical_date=DEFAULT_DATE,
+            state=TaskInstanceState.SUCCESS,
+        )
+        fth = FileTaskHandler(str(tmp_path))
+        path = tmp_path / fth._render_filename(ti, 1)
+        path.parent.mkdir(parents=True)
+        path.write_text("line 1\nline 2\nline 3\n")
+
+        log_stream, metadata = fth._read(ti=ti, try_number=1, metadata={"tail_lines": 2})
+        assert extract_events(log_stream) == ["line 2", "line 3"]
+        assert metadata == {"end_of_log": True, "source_offsets": {str(path): path.stat().st_size}}
+
+        with path.open("a") as f:
+            f.write("line 4\n")
+        log_stream, metadata = fth._read(ti=ti, try_number=1, metadata=metadata)
+        assert extract_events(log_stream, False) == ["line 4"]
+        assert metadata["source_offsets"] == {str(path): path.stat().st_size}
+
+    def test__read_range_read_remote_logs(self, tmp_path, create_task_instance):
+        ti = create_task_instance(
+            dag_id="dag_for_testing_range_read_remote",
+            task_id="task_for_testing_range_read_remote",
+            run_type=DagRunType.SCHEDULED,
+            logical_date=DEFAULT_DATE,
+            state=TaskInstanceState.RUNNING,
+        )
+        ti.try_number = 1
+        fth = FileTaskHandler(str(tmp_path))
+        fth._read_remote_logs = mock.Mock(return_value=([], []))
+        fth._read_from_logs_server = mock.Mock(return_value=([], []))
+        fth._get_executor_get_task_log = mock.Mock(return_value=mock.Mock(return_value=([], [])))
+
+        # Nothing was uploaded while the task runs
+        _, metadata = fth._read(ti=ti, try_number=1, metadata={"source_offsets": {}})
+        assert "remote" not in metadata["source_offsets"]
+
+        fth._read_remote_logs.return_value = ["remote"], ["line 1\nline 2"]
+        log_stream, metadata = fth._read(ti=ti, try_number=1, metadata=metadata)
+        assert extract_events(log_stream) == ["line 1", "line 2"]
+        assert metadata["source_offsets"]["remote.0"] == 2
+        assert "remote" not in metadata["source_offsets"]
+
+        ti.state = TaskInstanceState.SUCCESS
+        fth._read_remote_logs.return_value = ["remote"], ["line 1\nline 2\nline 3"]
+        log_stream, metadata = fth._read(ti=ti, try_number=1, metadata=metadata)
+        assert extract_events(log_stream) == ["line 3"]
+        assert metadata["source_offsets"]["remote"] == 0
+
+        # The complete remote logs were returned
+        fth._read_remote_logs.reset_mock()
+        log_stream, _ = fth._read(ti=ti, try_number=1, metadata=metadata)
+        assert extract_events(log_stream) == []
+        fth._read_remote_logs.assert_not_called()
+
     @pytest.mark.parametrize(
         ("remote_logs", "local_logs", "served_logs_checked"),
         [
@@ -1453,3 +1539,114 @@ def test_fetch_logs_from_service_with_cidr_no_proxy(mock_send, monkeypatch):
     proxies = kwargs["proxies"]
     assert "http" not in proxies.keys()
     assert "no" not in proxies.keys()
+
+
+@pytest.mark.parametrize(
+    ("chunks", "expected"),
+    [
+        ([b"line 1\nline 2\n"], ["line 1", "line 2"]),
+        ([b"li", b"ne 1\nli", b"ne 2"], ["line 1", "line 2"]),
+        ([b"caf\xc3", b"\xa9\n"], ["caf\u00e9"]),
+        ([], []),
+    ],
+)
+def test__stream_lines_from_chunks(chunks, expected):
+    assert list(_stream_lines_from_chunks(chunks)) == expected
+
+
+@pytest.mark.parametrize(
+    ("content", "end", "lines", "expected"),
+    [
+        (b"line 1\nline 2\npartial", 21, 0, 14),
+        (b"line 1\nline 2\n", 14, 0, 14),
+        (b"partial", 7, 0, 0),
+        (b"line 1\nline 2\nline 3\n", 21, 2, 7),
+        (b"line 1\nline 2\nline 3\n", 21, 5, 0),
+        (b"line 1\nline 2\nline 3\n", 14, 1, 7),
+    ],
+)
+def test__seek_line_start(tmp_path, monkeypatch, content, end, lines, expected):
+    # Small blocks, so that lines span several of them
+    monkeypatch.setattr("airflow.utils.log.file_task_handler.TAIL_BLOCK_SIZE", 4)
+    path = tmp_path / "test.log"
+    path.write_bytes(content)
+    with path.open("rb") as log_file:
+        assert _seek_line_start(log_file, end, lines) == expected
+
+
+def test__read_byte_range(tmp_path, monkeypatch):
+    monkeypatch.setattr("airflow.utils.log.file_task_handler.CHUNK_SIZE", 3)
+    path = tmp_path / "test.log"
+    path.write_bytes(b"0123456789")
+    assert list(_read_byte_range(str(path), 2, 9)) == [b"234", b"567", b"8"]
+    assert list(_read_byte_range(str(path), 5, 5)) == []
+
+
+def _served_response(status_code, body, headers):
+    response = mock.MagicMock(status_code=status_code, headers=headers)
+    response.iter_content.return_value = iter([body])
+    return response
+
+
+class TestLogRanges:
+    def test_served_range(self):
+        assert _LogRanges({}, tail_lines=None, to_end=False).served_range("url") is None
+        assert _LogRanges({}, tail_lines=2, to_end=False).served_range("url") == "bytes=-2048"
+        assert _LogRanges({"url": 10}, tail_lines=2, to_end=False).served_range("url") == "bytes=10-"
+
+    def test_read_served_partial_content(self):
+        ranges = _LogRanges({"url": 10}, tail_lines=None, to_end=False)
+        response = _served_response(206, b"line 2\nline 3\n", {"Content-Range": "bytes 10-23/24"})
+        assert list(ranges.read_served("url", response)) == ["line 2", "line 3"]
+        assert ranges.offsets == {"url": 24}
+
+    @pytest.mark.parametrize(
+        ("to_end", "expected_lines", "expected_offset"),
+        [
+            pytest.param(False, ["line 2"], 17, id="running"),
+            pytest.param(True, ["line 2", "line"], 21, id="finished"),
+        ],
+    )
+    def test_read_served_partial_last_line(self, to_end, expected_lines, expected_offset):
+        ranges = _LogRanges({"url": 10}, tail_lines=None, to_end=to_end)
+        response = _served_response(206, b"line 2\nline", {"Content-Range": "bytes 10-20/21"})
+        assert list(ranges.read_served("url", response)) == expected_lines
+        assert ranges.offsets == {"url": expected_offset}
+
+    def test_read_served_tail(self):
+        ranges = _LogRanges({}, tail_lines=2, to_end=False)
+        response = _served_response(
+            206, b"ne 1\nline 2\nline 3\nline 4\n", {"Content-Range": "bytes 4-29/30"}
+        )
+        # The first line, which most likely is incomplete, is dropped
+        assert list(ranges.read_served("url", response)) == ["line 3", "line 4"]
+        assert ranges.offsets == {"url": 30}
+
+    def test_read_served_range_ignored(self):
+        ranges = _LogRanges({"url": 7}, tail_lines=None, to_end=False)
+        response = _served_response(200, b"line 1\nline 2\n", {"Content-Length": "14"})
+        assert list(ranges.read_served("url", response)) == ["line 2"]
+        assert ranges.offsets == {"url": 14}
+
+    @pytest.mark.parametrize(
+        ("offsets", "expected"),
+        [
+            ({"url": 24}, {"url": 24}),
+            # Truncated since the previous read
+            ({"url": 40}, {"url": 0}),
+            ({}, {"url": 0}),
+        ],
+    )
+    def test_range_not_satisfiable(self, offsets, expected):
+        ranges = _LogRanges(offsets, tail_lines=2, to_end=False)
+        ranges.range_not_satisfiable("url", _served_response(416, b"", {"Content-Range": "bytes */24"}))
+        assert ranges.offsets == expected
+
+    def test_skip_lines(self):
+        ranges = _LogRanges({}, tail_lines=2, to_end=False)
+        lines = ranges.skip_lines("executor", ["line 1", "line 2", "line 3"])
+        # The offset is known before the lines are consumed, to be returned in the continuation token
+        assert ranges.offsets == {"executor": 3}
+        assert list(lines) == ["line 2", "line 3"]
+        assert list(ranges.skip_lines("executor", ["line 1", "line 2", "line 3", "line 4"])) == ["line 4"]
+        assert ranges.offsets == {"executor": 4}
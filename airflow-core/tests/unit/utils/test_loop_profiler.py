@@ -0,0 +1,125 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import logging
+from unittest import mock
+
+import pytest
+from sqlalchemy import text
+
+from airflow import settings
+from airflow.utils.loop_profiler import LoopPhaseProfiler
+
+
+class TestLoopPhaseProfiler:
+    @mock.patch("airflow.utils.loop_profiler.stats")
+    def test_phase(self, mock_stats):
+        profiler = LoopPhaseProfiler("loop")
+
+        with profiler.phase("outer"):
+            with profiler.phase("inner"):
+                pass
+            with profiler.phase("inner"):
+                pass
+
+        assert set(profiler.samples) == {"outer", "outer.inner"}
+        assert len(profiler.samples["outer.inner"]) == 2
+        assert profiler.samples["outer"][0].wall_time >= sum(
+            sample.wall_time for sample in profiler.samples["outer.inner"]
+        )
+        assert mock_stats.timing.call_args_list[-1] == mock.call(
+            "loop.duration", mock.ANY, tags={"phase": "outer"}
+        )
+        # Database metrics are only emitted when queries are tracked
+        mock_stats.incr.assert_not_called()
+
+    def test_phase_is_recorded_when_it_fails(self):
+        profiler = LoopPhaseProfiler("loop")
+
+        with pytest.raises(RuntimeError), profiler.phase("failing"):
+            raise RuntimeError
+
+        assert len(profiler.samples["failing"]) == 1
+        assert profiler._active == []
+
+    def test_disabled(self):
+        profiler = LoopPhaseProfiler("loop", enabled=False)
+
+        with profiler.phase("phase"):
+            pass
+
+        assert profiler.samples == {}
+
+    def test_wrap(self):
+        profiler = LoopPhaseProfiler("loop")
+
+        def _housekeeping(value):
+            return value * 2
+
+        wrapped = profiler.wrap(_housekeeping)
+
+        assert wrapped(21) == 42
+        assert wrapped.__name__ == "_housekeeping"
+        assert list(profiler.samples) == ["housekeeping"]
+
+    def test_window(self):
+        profiler = LoopPhaseProfiler("loop", window=3)
+
+        for _ in range(5):
+            with profiler.phase("phase"):
+                pass
+
+        assert len(profiler.samples["phase"]) == 3
+
+    @pytest.mark.db_test
+    @mock.patch("airflow.utils.loop_profiler.stats")
+    def test_track_queries(self, mock_stats):
+        profiler = LoopPhaseProfiler("loop")
+
+        with profiler.track_queries(settings.engine):
+            with profiler.phase("outer"):
+                with settings.engine.connect() as conn:
+                    conn.execute(text("SELECT 1"))
+                    with profiler.phase("inner"):
+                        conn.execute(text("SELECT 1"))
+                        conn.execute(text("SELECT 1"))
+        with profiler.phase("untracked"), settings.engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        assert profiler.samples["outer.inner"][0].queries == 2
+        assert profiler.samples["outer"][0].queries == 3
+        assert profiler.samples["outer"][0].db_time >= profiler.samples["outer.inner"][0].db_time > 0
+        assert profiler.samples["untracked"][0].queries == 0
+        mock_stats.incr.assert_any_call("loop.queries", 3, tags={"phase": "outer"})
+
+    def test_dump(self, caplog):
+        profiler = LoopPhaseProfiler("loop")
+        with profiler.phase("fast"):
+            pass
+        profiler._record("slow", profiler.samples["fast"][0]._replace(wall_time=2.0))
+
+        summary = profiler.summary()
+        assert [row["phase"] for row in summary] == ["slow", "fast"]
+        # The 2s run falls in the 1000-5000ms bucket
+        assert summary[0]["histogram"] == [0, 0, 0, 0, 0, 0, 0, 1, 0]
+
+        with caplog.at_level(logging.INFO):
+            profiler.dump()
+        assert "slow" in caplog.text
+        assert "fast" in caplog.text
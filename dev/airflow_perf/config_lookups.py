@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import statistics
+import timeit
+
+import rich_click as click
+
+# Lookups made in the scheduler and Dag processor loops
+LOOKUPS = [
+    ("getboolean", "core", "unit_test_mode", {}),
+    ("getfloat", "scheduler", "orphaned_tasks_check_interval", {"fallback": 300.0}),
+    ("getboolean", "core", "multi_team", {}),
+    ("getboolean", "dag_processor", "parsing_pre_import_modules", {"fallback": True}),
+    ("getint", "scheduler", "max_dagruns_to_create_per_loop", {}),
+    ("get", "core", "executor", {}),
+]
+
+
+def time_lookups(conf, number: int, repeat: int) -> dict[str, float]:
+    """Return the median time of each lookup, in microseconds."""
+    timings = {}
+    for getter, section, key, kwargs in LOOKUPS:
+        lookup = getattr(conf, getter)
+        runs = timeit.repeat(lambda: lookup(section, key, **kwargs), number=number, repeat=repeat)
+        timings[f"{getter}({section}, {key})"] = statistics.median(runs) / number * 1e6
+    return timings
+
+
+@click.command()
+@click.option("--number", default=10_000, help="number of lookups per run")
+@click.option("--repeat", default=5, help="number of runs, to reduce variance")
+def main(number, repeat):
+    """
+    Compare the cost of configuration lookups with and without ``[core] config_snapshot``.
+
+    Each lookup is one made in the scheduler or Dag processor loops, timed against the configuration
+    of the current environment (set ``AIRFLOW__*`` environment variables to try other ones).
+    """
+    from airflow.configuration import conf
+
+    conf.disable_snapshot()
+    before = time_lookups(conf, number, repeat)
+    with conf.snapshot():
+        after = time_lookups(conf, number, repeat)
+
+    width = max(map(len, before))
+    click.echo(f"\n| {'lookup':<{width}} | {'resolved (us)':>13} | {'snapshot (us)':>13} | {'speedup':>7} |")
+    click.echo(f"|{'-' * (width + 2)}|{'-' * 15}|{'-' * 15}|{'-' * 9}|")
+    for name, resolved in before.items():
+        snapshot = after[name]
+        click.echo(
+            f"| {name:<{width}} | {resolved:>13.2f} | {snapshot:>13.2f} | {resolved / snapshot:>6.0f}x |"
+        )
+
+
+if __name__ == "__main__":
+    main()
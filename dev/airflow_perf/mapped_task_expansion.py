@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import statistics
+import time
+from unittest import mock
+
+import rich_click as click
+from sqlalchemy import delete
+
+DAG_ID = "perf_mapped_task_expansion"
+BUNDLE_NAME = "perf"
+
+
+def create_dag():
+    """Create the benchmark Dag in the database, and return its serialized version."""
+    from airflow.models.dagbundle import DagBundleModel
+    from airflow.models.serialized_dag import SerializedDagModel
+    from airflow.sdk import DAG, BaseOperator
+    from airflow.serialization.definitions.dag import SerializedDAG
+    from airflow.serialization.serialized_objects import DagSerialization, LazyDeserializedDAG
+    from airflow.utils.session import create_session
+
+    class ExpandedOperator(BaseOperator):
+        def __init__(self, value=None, **kwargs):
+            super().__init__(**kwargs)
+            self.value = value
+
+    with DAG(DAG_ID, schedule=None) as dag:
+        upstream = BaseOperator(task_id="upstream")
+        ExpandedOperator.partial(task_id="mapped").expand(value=upstream.output)
+
+    with create_session() as session:
+        session.merge(DagBundleModel(name=BUNDLE_NAME))
+        session.flush()
+        SerializedDAG.bulk_write_to_db(BUNDLE_NAME, None, [dag], session=session)
+        data = DagSerialization.to_dict(dag)
+        SerializedDagModel.write_dag(LazyDeserializedDAG(data=data), BUNDLE_NAME, session=session)
+    return DagSerialization.from_dict(data)
+
+
+def reset_dag(session):
+    from airflow.models import DagRun, TaskInstance
+    from airflow.models.taskmap import TaskMap
+
+    session.execute(delete(TaskInstance).where(TaskInstance.dag_id == DAG_ID))
+    session.execute(delete(TaskMap).where(TaskMap.dag_id == DAG_ID))
+    session.execute(delete(DagRun).where(DagRun.dag_id == DAG_ID))
+
+
+def time_expansion(dag, size: int, with_hook: bool) -> float:
+    """Return the time taken to expand a mapped task into ``size`` task instances, in seconds."""
+    from airflow import settings
+    from airflow._shared.timezones import timezone
+    from airflow.models.taskmap import TaskMap
+    from airflow.utils.session import create_session
+    from airflow.utils.state import DagRunState
+    from airflow.utils.types import DagRunTriggeredByType, DagRunType
+
+    with create_session() as session:
+        reset_dag(session)
+        dag_run = dag.create_dagrun(
+            run_id=f"perf_{size}",
+            logical_date=None,
+            data_interval=None,
+            run_after=timezone.utcnow(),
+            run_type=DagRunType.MANUAL,
+            triggered_by=DagRunTriggeredByType.TEST,
+            state=DagRunState.RUNNING,
+            session=session,
+        )
+        session.add(
+            TaskMap(
+                dag_id=DAG_ID,
+                task_id="upstream",
+                run_id=dag_run.run_id,
+                map_index=-1,
+                length=size,
+                keys=None,
+            )
+        )
+        session.flush()
+
+        # Without a mutation hook, task instances are created with multi-row INSERT statements
+        with mock.patch.object(settings.task_instance_mutation_hook, "is_noop", not with_hook):
+            start = time.perf_counter()
+            TaskMap.expand_mapped_task(dag.get_task("mapped"), dag_run.run_id, session=session)
+            session.flush()
+            elapsed = time.perf_counter() - start
+        reset_dag(session)
+    return elapsed
+
+
+@click.command()
+@click.option("--sizes", default="1000,10000,100000", help="comma-separated numbers of mapped task instances")
+@click.option("--repeat", default=3, help="number of runs, to reduce variance")
+def main(sizes, repeat):
+    """
+    Time the expansion of a mapped task into task instances, as the scheduler does.
+
+    Compares the multi-row INSERT path used without ``task_instance_mutation_hook`` with the ORM path
+    used otherwise, against the database of the current environment, whose benchmark Dag and runs are
+    deleted afterwards. Set ``AIRFLOW__SCHEDULER__MAX_TIS_PER_INSERT`` to try other batch sizes.
+    """
+    dag = create_dag()
+
+    click.echo(f"\n| {'task instances':>14} | {'bulk (s)':>9} | {'with hook (s)':>13} | {'speedup':>7} |")
+    click.echo(f"|{'-' * 16}|{'-' * 11}|{'-' * 15}|{'-' * 9}|")
+    for size in map(int, sizes.split(",")):
+        bulk = statistics.median(time_expansion(dag, size, with_hook=False) for _ in range(repeat))
+        orm = statistics.median(time_expansion(dag, size, with_hook=True) for _ in range(repeat))
+        click.echo(f"| {size:>14} | {bulk:>9.3f} | {orm:>13.3f} | {orm / bulk:>6.1f}x |")
+
+
+if __name__ == "__main__":
+    main()
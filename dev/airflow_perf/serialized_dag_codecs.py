@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import statistics
+import time
+
+import rich_click as click
+from sqlalchemy import delete
+
+BUNDLE_NAME = "serialized_dag_codecs_benchmark"
+
+
+def parse_codec(spec: str):
+    from airflow.serialization.dag_codec import DagCodec
+
+    encoding, _, compression = spec.partition("+")
+    return DagCodec(encoding, compression or "none")
+
+
+def row_size(codec, data: dict) -> int:
+    from airflow.settings import json
+
+    if codec.uses_json_column:
+        return len(json.dumps(data).encode("utf-8"))
+    return len(codec.encode(data))
+
+
+def clear_dags(dag_ids, session):
+    from airflow.models.dag_version import DagVersion
+
+    # Serialized DAGs and DAG code are deleted with their versions
+    session.execute(delete(DagVersion).where(DagVersion.dag_id.in_(dag_ids)))
+    session.commit()
+
+
+@click.command()
+@click.option("--dag-folder", required=True, help="Folder of the DAGs to benchmark with")
+@click.option(
+    "--codecs",
+    default="json,json+zlib,msgpack,msgpack+zlib,msgpack+zstd,msgpack+lz4",
+    help="Comma separated <encoding>[+<compression>] codecs to compare",
+)
+@click.option("--repeat", default=3, help="number of times to run each codec, to reduce variance")
+def main(dag_folder, codecs, repeat):
+    """
+    Compare the serialized DAG codecs (``[core] serialized_dag_encoding`` and ``serialized_dag_compression``).
+
+    For each codec, the DAGs of ``--dag-folder`` are written to the ``serialized_dag`` table with
+    ``SerializedDagModel.write_dag`` and read back with ``SerializedDagModel.read_all_dags``, and the
+    time both take is reported along with the size of the rows and the time decoding them takes.
+
+    Run it against a dedicated database: ``read_all_dags`` reads all the DAGs of the database, and the
+    DAGs of ``--dag-folder`` are deleted from it between runs.
+    """
+    from airflow.dag_processing.dagbag import DagBag
+    from airflow.models import serialized_dag
+    from airflow.models.dag import DagModel
+    from airflow.models.dagbundle import DagBundleModel
+    from airflow.models.serialized_dag import SerializedDagModel
+    from airflow.serialization import dag_codec
+    from airflow.serialization.definitions.dag import SerializedDAG
+    from airflow.serialization.serialized_objects import DagSerialization, LazyDeserializedDAG
+    from airflow.utils.session import create_session
+
+    dagbag = DagBag(dag_folder)
+    dags = list(dagbag.dags.values())
+    dag_ids = [dag.dag_id for dag in dags]
+    serialized = [DagSerialization.to_dict(dag) for dag in dags]
+    click.echo(f"Loaded {len(dags)} DAGs with {sum(len(dag.tasks) for dag in dags)} tasks from {dag_folder}")
+
+    with create_session() as session:
+        session.merge(DagBundleModel(name=BUNDLE_NAME))
+        session.flush()
+        SerializedDAG.bulk_write_to_db(BUNDLE_NAME, None, dags, session=session)
+
+    click.echo(
+        f"\n| {'codec':<14} | {'write_dag (s)':>13} | {'read_all_dags (s)':>17} | {'decode (s)':>10} "
+        f"| {'total (MB)':>10} | {'mean (KB)':>9} |"
+    )
+    click.echo(f"|{'-' * 16}|{'-' * 15}|{'-' * 19}|{'-' * 12}|{'-' * 12}|{'-' * 11}|")
+    try:
+        for codec in map(parse_codec, codecs.split(",")):
+            serialized_dag._get_dag_codec = lambda codec=codec: codec
+            write_times, read_times, decode_times = [], [], []
+            for _ in range(repeat):
+                with create_session() as session:
+                    clear_dags(dag_ids, session)
+                    start = time.perf_counter()
+                    for data in serialized:
+                        SerializedDagModel.write_dag(
+                            LazyDeserializedDAG(data=data), BUNDLE_NAME, session=session
+                        )
+                    session.commit()
+                    write_times.append(time.perf_counter() - start)
+
+                with create_session() as session:
+                    start = time.perf_counter()
+                    SerializedDagModel.read_all_dags(session=session)
+                    read_times.append(time.perf_counter() - start)
+
+                if not codec.uses_json_column:
+                    encoded = [codec.encode(data) for data in serialized]
+                    start = time.perf_counter()
+                    for blob in encoded:
+                        dag_codec.decode(blob)
+                    decode_times.append(time.perf_counter() - start)
+
+            sizes = [row_size(codec, data) for data in serialized]
+            decode_time = f"{statistics.median(decode_times):>10.3f}" if decode_times else f"{'-':>10}"
+            click.echo(
+                f"| {'+'.join(codec):<14} | {statistics.median(write_times):>13.3f} "
+                f"| {statistics.median(read_times):>17.3f} | {decode_time} "
+                f"| {sum(sizes) / 2**20:>10.2f} | {statistics.fmean(sizes) / 2**10:>9.1f} |"
+            )
+    finally:
+        with create_session() as session:
+            clear_dags(dag_ids, session)
+            session.execute(delete(DagModel).where(DagModel.dag_id.in_(dag_ids)))
+
+
+if __name__ == "__main__":
+    main()
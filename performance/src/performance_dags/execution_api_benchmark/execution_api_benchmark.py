@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Load benchmark of the Execution API, with many simulated workers sending requests concurrently.
+
+Each worker is a coroutine standing for a running task instance, which heartbeats and pulls an XCom in a
+loop, against the Execution API app served in-process. The throughput tells how well the routes scale
+with the number of concurrent workers; the report records whether the routes measured are ``async`` or
+run in the threadpool, to compare releases. Airflow is only imported once the database to use is
+configured, so this module must be run as a script.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import os
+import statistics
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+import rich_click as click
+from fastapi import FastAPI, Request  # noqa: TC002 - the annotations of dependencies are evaluated
+from performance_dags.scheduler_benchmark.scheduler_benchmark import metadata_database
+
+if TYPE_CHECKING:
+    import httpx
+
+BUNDLE_NAME = "execution_api_benchmark"
+DAG_ID = "execution_api_benchmark"
+RUN_ID = "benchmark"
+HOSTNAME = "benchmark-worker"
+PID = 4242
+XCOM_KEY = "return_value"
+START_DATE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def seed(workers: int) -> list[UUID]:
+    """Create a run of a Dag with a running task instance per worker, and return their IDs."""
+    from sqlalchemy import select, update
+
+    from airflow.models.dagbundle import DagBundleModel
+    from airflow.models.serialized_dag import SerializedDagModel
+    from airflow.models.taskinstance import TaskInstance as TI
+    from airflow.models.xcom import XComModel
+    from airflow.sdk import DAG, BaseOperator
+    from airflow.serialization.definitions.dag import SerializedDAG
+    from airflow.serialization.serialized_objects import DagSerialization, LazyDeserializedDAG
+    from airflow.utils.session import create_session
+    from airflow.utils.state import DagRunState, TaskInstanceState
+    from airflow.utils.types import DagRunTriggeredByType, DagRunType
+
+    with DAG(DAG_ID, schedule=None) as dag:
+        for index in range(workers):
+            BaseOperator(task_id=f"task_{index}")
+
+    with create_session() as session:
+        session.merge(DagBundleModel(name=BUNDLE_NAME))
+        session.flush()
+        SerializedDAG.bulk_write_to_db(BUNDLE_NAME, None, [dag], session=session)
+        data = DagSerialization.to_dict(dag)
+        SerializedDagModel.write_dag(LazyDeserializedDAG(data=data), BUNDLE_NAME, session=session)
+
+    with create_session() as session:
+        dag_run = DagSerialization.from_dict(data).create_dagrun(
+            run_id=RUN_ID,
+            logical_date=START_DATE,
+            data_interval=(START_DATE, START_DATE),
+            run_after=START_DATE,
+            run_type=DagRunType.MANUAL,
+            triggered_by=DagRunTriggeredByType.TEST,
+            state=DagRunState.RUNNING,
+            session=session,
+        )
+        session.execute(
+            update(TI)
+            .where(TI.dag_id == DAG_ID)
+            .values(state=TaskInstanceState.RUNNING, hostname=HOSTNAME, pid=PID, try_number=1)
+            .execution_options(synchronize_session=False)
+        )
+        XComModel.set(
+            key=XCOM_KEY,
+            value={"rows": 42},
+            dag_id=DAG_ID,
+            task_id="task_0",
+            run_id=dag_run.run_id,
+            session=session,
+        )
+        return list(session.scalars(select(TI.id).where(TI.dag_id == DAG_ID)))
+
+
+async def _trust_path(request: Request):
+    from airflow.api_fastapi.execution_api.datamodels.token import TIClaims, TIToken
+
+    ti_id = UUID(request.path_params.get("task_instance_id", "00000000-0000-0000-0000-000000000000"))
+    return TIToken(id=ti_id, claims=TIClaims(scope="execution"))
+
+
+def create_app() -> FastAPI:
+    """Return the Execution API app, trusting the task instance ID of each request instead of a token."""
+    from airflow.api_fastapi.execution_api.app import create_task_execution_api_app
+    from airflow.api_fastapi.execution_api.security import require_auth
+
+    app = create_task_execution_api_app()
+    app.dependency_overrides[require_auth] = _trust_path
+    return app
+
+
+def routes_implementation() -> dict[str, str]:
+    """Return whether each route benchmarked is ``async``, or ``sync`` and so run in the threadpool."""
+    from airflow.api_fastapi.execution_api.routes.task_instances import ti_heartbeat
+    from airflow.api_fastapi.execution_api.routes.xcoms import get_xcom
+
+    return {
+        route.__name__: "async" if asyncio.iscoroutinefunction(route) else "sync"
+        for route in (ti_heartbeat, get_xcom)
+    }
+
+
+def _requests(ti_id: UUID) -> dict[str, tuple[str, str, dict | None]]:
+    return {
+        "heartbeat": ("PUT", f"/task-instances/{ti_id}/heartbeat", {"hostname": HOSTNAME, "pid": PID}),
+        "get_xcom": ("GET", f"/xcoms/{DAG_ID}/{RUN_ID}/task_0/{XCOM_KEY}", None),
+    }
+
+
+async def _worker(
+    client: httpx.AsyncClient, ti_id: UUID, deadline: float, latencies: dict[str, list[float]], errors: list
+) -> None:
+    while time.perf_counter() < deadline:
+        for name, (method, url, body) in _requests(ti_id).items():
+            start = time.perf_counter()
+            response = await client.request(method, url, json=body)
+            if response.is_success:
+                latencies[name].append(time.perf_counter() - start)
+            else:
+                errors.append((name, response.status_code))
+
+
+async def run_load(app: FastAPI, ti_ids: list[UUID], duration: float) -> dict[str, Any]:
+    """Send requests from a worker per task instance for ``duration`` seconds, and report the throughput."""
+    import httpx
+
+    from airflow import settings
+
+    # The connections of the async engine are bound to the event loop they were created in.
+    settings._configure_async_session()
+    latencies: dict[str, list[float]] = {"heartbeat": [], "get_xcom": []}
+    errors: list[tuple[str, int]] = []
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    async with (
+        app.router.lifespan_context(app),
+        httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://execution-api",
+            limits=limits,
+            timeout=None,
+        ) as client,
+    ):
+        # The first requests build the schemas of the routes, which must not count in the measure.
+        for method, url, body in _requests(ti_ids[0]).values():
+            (await client.request(method, url, json=body)).raise_for_status()
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(_worker(client, ti_id, start + duration, latencies, errors) for ti_id in ti_ids)
+        )
+        elapsed = time.perf_counter() - start
+    if settings.async_engine:
+        await settings.async_engine.dispose()
+
+    report: dict[str, Any] = {
+        "workers": len(ti_ids),
+        "seconds": elapsed,
+        "requests_per_second": sum(len(values) for values in latencies.values()) / elapsed,
+        "errors": dict(Counter(f"{name} {status_code}" for name, status_code in errors)),
+    }
+    for name, values in latencies.items():
+        quantiles = statistics.quantiles(values, n=100) if len(values) > 1 else values * 99
+        report[name] = {
+            "requests": len(values),
+            "requests_per_second": len(values) / elapsed,
+            "p50_seconds": quantiles[49] if quantiles else None,
+            "p99_seconds": quantiles[98] if quantiles else None,
+        }
+    return report
+
+
+@click.command()
+@click.option(
+    "--workers",
+    "workers_counts",
+    default="1000,5000",
+    show_default=True,
+    help="comma-separated numbers of simulated workers, each measured in turn",
+)
+@click.option("--duration", default=10.0, help="seconds of load for each number of workers")
+@click.option("--database", type=click.Choice(["sqlite", "postgres"]), default="sqlite")
+@click.option("--postgres-image", default="postgres:17", help="Docker image used with --database=postgres")
+@click.option(
+    "--sql-alchemy-conn",
+    default=None,
+    help="URL of an existing database to use instead, which is reset: ALL ITS DATA IS DELETED",
+)
+@click.option("--output", type=click.File("w"), default="-", help="file to write the JSON report to")
+def main(workers_counts, duration, database, postgres_image, sql_alchemy_conn, output):
+    """
+    Load the Execution API with simulated workers heartbeating and pulling XComs, and report it as JSON.
+
+    The requests per second and latencies of each route are reported for each number of workers. The
+    database is a new SQLite database by default, or PostgreSQL in a Docker container.
+    """
+    if "airflow.settings" in sys.modules:
+        raise click.ClickException("Airflow must not be imported before the database is configured")
+    try:
+        counts = [int(count) for count in workers_counts.split(",")]
+    except ValueError:
+        raise click.BadParameter(f"Invalid numbers of workers: {workers_counts!r}", param_hint="--workers")
+
+    with metadata_database(database, sql_alchemy_conn, postgres_image) as url:
+        os.environ["AIRFLOW__DATABASE__SQL_ALCHEMY_CONN"] = url
+        os.environ["AIRFLOW__CORE__LOAD_EXAMPLES"] = "False"
+        os.environ.setdefault("AIRFLOW__API_AUTH__JWT_SECRET", "execution-api-benchmark")
+        os.environ.setdefault("AIRFLOW__LOGGING__LOGGING_LEVEL", "WARNING")
+
+        from airflow.utils import db
+
+        click.echo("Creating the database", err=True)
+        db.resetdb()
+        click.echo(f"Seeding {max(counts)} running task instances", err=True)
+        ti_ids = seed(max(counts))
+        report: dict[str, Any] = {
+            "database": database if not sql_alchemy_conn else url.partition(":")[0],
+            "routes": routes_implementation(),
+            "parameters": {"workers": counts, "duration": duration},
+            "runs": [],
+        }
+        app = create_app()
+        for count in counts:
+            click.echo(f"Loading the Execution API with {count} workers for {duration}s", err=True)
+            with contextlib.suppress(KeyboardInterrupt):
+                report["runs"].append(asyncio.run(run_load(app, ti_ids[:count], duration)))
+
+    json.dump(report, output, indent=2)
+    output.write("\n")
+
+
+if __name__ == "__main__":
+    main()
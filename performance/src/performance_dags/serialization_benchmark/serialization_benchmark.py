@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark of the serialization of Dags by the Dag processor, and of their validation against the JSON schema.
+
+The Dags are the example Dags shipped with Airflow, and a synthetic Dag with many tasks. Serializing them
+with and without validation tells how much parsing time ``[dag_processor]
+validate_serialized_dags_on_change`` saves for Dags which do not change.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import statistics
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+import rich_click as click
+
+if TYPE_CHECKING:
+    from airflow.sdk import DAG
+
+SYNTHETIC_DAG_ID = "serialization_benchmark"
+
+
+def load_example_dags() -> list[DAG]:
+    """Return the example Dags shipped with Airflow, except those which cannot be serialized here."""
+    import airflow.example_dags
+    from airflow.dag_processing.dagbag import DagBag
+    from airflow.exceptions import SerializationError
+    from airflow.serialization.serialized_objects import DagSerialization
+
+    dags = []
+    for dag in DagBag(airflow.example_dags.__path__[0]).dags.values():
+        try:
+            DagSerialization.to_dict(dag)
+        except SerializationError:
+            # e.g. Dags using plugins, which are not loaded
+            continue
+        dags.append(dag)
+    return dags
+
+
+def create_synthetic_dag(tasks: int) -> DAG:
+    """Return a Dag of ``tasks`` tasks in a chain, alternately Bash and empty operators."""
+    from airflow.providers.standard.operators.bash import BashOperator
+    from airflow.providers.standard.operators.empty import EmptyOperator
+    from airflow.sdk import DAG, chain
+
+    with DAG(SYNTHETIC_DAG_ID, schedule=None) as dag:
+        chain(
+            *(
+                BashOperator(task_id=f"task_{index}", bash_command="echo {{ ds }}", retries=index % 3)
+                if index % 2
+                else EmptyOperator(task_id=f"task_{index}")
+                for index in range(tasks)
+            )
+        )
+    return dag
+
+
+def _time(func: Callable[[], Any], iterations: int) -> dict[str, float]:
+    durations = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return {"min": min(durations), "median": statistics.median(durations)}
+
+
+def benchmark(dags: list[DAG], iterations: int) -> dict[str, Any]:
+    """Time serializing ``dags`` without validation, and validating the result."""
+    from airflow.serialization.serialized_objects import DagSerialization
+
+    serialized = [DagSerialization.to_dict(dag, validate=False) for dag in dags]
+    serialize = _time(lambda: [DagSerialization.to_dict(dag, validate=False) for dag in dags], iterations)
+    validate = _time(lambda: [DagSerialization.validate_schema(data) for data in serialized], iterations)
+    return {
+        "dags": len(dags),
+        "tasks": sum(len(dag.task_dict) for dag in dags),
+        "serialize_seconds": serialize,
+        "validate_seconds": validate,
+        "validation_share": validate["median"] / (serialize["median"] + validate["median"]),
+    }
+
+
+@click.command()
+@click.option("--tasks", default=5000, help="number of tasks of the synthetic Dag")
+@click.option("--iterations", default=5, help="number of runs of each measurement, to reduce variance")
+@click.option("--output", type=click.File("w"), default="-", help="file to write the JSON report to")
+def main(tasks, iterations, output):
+    """
+    Time the serialization and the schema validation of Dags, and report them as JSON.
+
+    The example Dags and a synthetic Dag of ``--tasks`` tasks are measured separately, as well as the
+    creation of the schema validator, which only happens once per process.
+    """
+    os.environ["AIRFLOW__CORE__LOAD_EXAMPLES"] = "False"
+    os.environ.setdefault("AIRFLOW__LOGGING__LOGGING_LEVEL", "WARNING")
+
+    from airflow.serialization.json_schema import load_dag_schema
+
+    start = time.perf_counter()
+    load_dag_schema()
+    report: dict[str, Any] = {
+        "parameters": {"tasks": tasks, "iterations": iterations},
+        "validator_load_seconds": time.perf_counter() - start,
+    }
+
+    click.echo("Benchmarking the example Dags", err=True)
+    report["example_dags"] = benchmark(load_example_dags(), iterations)
+    click.echo(f"Benchmarking a synthetic Dag of {tasks} tasks", err=True)
+    report["synthetic_dag"] = benchmark([create_synthetic_dag(tasks)], iterations)
+
+    json.dump(report, output, indent=2)
+    output.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+SCRIPT = os.path.join(
+    os.path.dirname(__file__), "../src/performance_dags/execution_api_benchmark/execution_api_benchmark.py"
+)
+
+
+@pytest.mark.parametrize("workers", ["x", "10,"])
+def test_invalid_workers(workers):
+    result = subprocess.run(
+        [sys.executable, SCRIPT, f"--workers={workers}"], capture_output=True, text=True, check=False
+    )
+
+    assert result.returncode == 2
+    assert "Invalid numbers of workers" in result.stderr
+
+
+def test_benchmark_report(tmp_path):
+    output = tmp_path / "report.json"
+    subprocess.run(
+        [sys.executable, SCRIPT, "--workers=2,5", "--duration=0.5", f"--output={output}"],
+        env={**os.environ, "AIRFLOW_HOME": str(tmp_path)},
+        check=True,
+    )
+
+    report = json.loads(output.read_text())
+    assert report["database"] == "sqlite"
+    assert report["routes"] == {"ti_heartbeat": "async", "get_xcom": "async"}
+    assert [run["workers"] for run in report["runs"]] == [2, 5]
+    for run in report["runs"]:
+        assert run["errors"] == {}
+        assert run["heartbeat"]["requests"] > 0
+        assert run["get_xcom"]["requests"] > 0
@@ -0,0 +1,73 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+from performance_dags.scheduler_benchmark.scheduler_benchmark import PHASES, parse_ti_states
+
+SCRIPT = os.path.join(
+    os.path.dirname(__file__), "../src/performance_dags/scheduler_benchmark/scheduler_benchmark.py"
+)
+
+
+@pytest.mark.parametrize(
+    ("spec", "tasks", "expected"),
+    [
+        ("scheduled", 2, ["scheduled", "scheduled"]),
+        ("scheduled=3,success=1", 4, ["scheduled", "scheduled", "scheduled", "success"]),
+        ("none=1,queued=1", 3, [None, None, "queued"]),
+        ("none=1,running=2", 1, ["running"]),
+    ],
+)
+def test_parse_ti_states(spec, tasks, expected):
+    assert parse_ti_states(spec, tasks) == expected
+
+
+@pytest.mark.parametrize("spec", ["scheduled=x", "scheduled=0"])
+def test_parse_ti_states_invalid(spec):
+    with pytest.raises(ValueError, match="task instance state"):
+        parse_ti_states(spec, 10)
+
+
+def test_benchmark_report(tmp_path):
+    output = tmp_path / "report.json"
+    subprocess.run(
+        [
+            sys.executable,
+            SCRIPT,
+            "--dags=2",
+            "--runs=2",
+            "--tasks=4",
+            "--iterations=2",
+            f"--output={output}",
+        ],
+        env={**os.environ, "AIRFLOW_HOME": str(tmp_path)},
+        check=True,
+    )
+
+    report = json.loads(output.read_text())
+    assert report["database"] == "sqlite"
+    assert report["parameters"]["dags"] == 2
+    assert list(report["phases"])[: len(PHASES)] == list(PHASES)
+    assert report["phases"]["schedule_dag_run"]["runs"] == 2 * 2 * 2
+    assert all(report["phases"][phase]["queries"] > 0 for phase in PHASES)
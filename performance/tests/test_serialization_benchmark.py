@@ -0,0 +1,36 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from performance_dags.serialization_benchmark.serialization_benchmark import benchmark, create_synthetic_dag
+
+
+def test_create_synthetic_dag():
+    dag = create_synthetic_dag(5)
+
+    assert len(dag.task_dict) == 5
+    assert dag.get_task("task_0").downstream_task_ids == {"task_1"}
+
+
+def test_benchmark():
+    report = benchmark([create_synthetic_dag(10), create_synthetic_dag(5)], iterations=2)
+
+    assert report["dags"] == 2
+    assert report["tasks"] == 15
+    assert 0 < report["validation_share"] < 1
+    assert report["serialize_seconds"]["min"] <= report["serialize_seconds"]["median"]
@@ -61,7 +61,11 @@ if TYPE_CHECKING:
     from airflow.executors import workloads
     from airflow.models.taskinstance import TaskInstance
     from airflow.models.taskinstancekey import TaskInstanceKey
-    from airflow.providers.celery.executors.celery_executor_utils import TaskTuple, WorkloadInCelery
+    from airflow.providers.celery.executors.celery_executor_utils import (
+        TaskEventReceiver,
+        TaskTuple,
+        WorkloadInCelery,
+    )
 
     if AIRFLOW_V_3_2_PLUS:
         from airflow.executors.workloads.types import (
@@ -155,8 +159,24 @@ class CeleryExecutor(BaseExecutor):
         self.workload_publish_retries: Counter[WorkloadKey] = Counter()
         self.workload_publish_max_retries = self.conf.getint("celery", "task_publish_max_retries", fallback=3)
 
+        # With event driven state sync, the states of the workloads are updated from the events sent by the
+        # workers, and only polled from the result backend every ``_state_reconcile_interval`` seconds.
+        self._event_driven_state_sync = self.conf.getboolean(
+            "celery", "event_driven_state_sync", fallback=False
+        )
+        self._state_reconcile_interval = self.conf.getint(
+            "celery", "state_sync_reconcile_interval", fallback=60
+        )
+        self._last_state_reconcile = 0.0
+        self.task_event_receiver: TaskEventReceiver | None = None
+
     def start(self) -> None:
         self.log.debug("Starting Celery Executor using %s processes for syncing", self._sync_parallelism)
+        if self._event_driven_state_sync:
+            from airflow.providers.celery.executors.celery_executor_utils import TaskEventReceiver
+
+            self.task_event_receiver = TaskEventReceiver(self.celery_app)
+            self.task_event_receiver.start()
 
     def _num_workloads_per_send_process(self, to_send_count: int) -> int:
         """
@@ -258,9 +278,15 @@ class CeleryExecutor(BaseExecutor):
         return key_and_async_results
 
     def sync(self) -> None:
+        if self.task_event_receiver is not None:
+            self.update_workload_states_from_events()
         if not self.workloads:
             self.log.debug("No workload to query celery, skipping sync")
             return
+        if self.task_event_receiver is not None:
+            if time.monotonic() - self._last_state_reconcile < self._state_reconcile_interval:
+                return
+            self._last_state_reconcile = time.monotonic()
         self.update_all_workload_states()
 
     def debug_dump(self) -> None:
@@ -283,6 +309,19 @@ class CeleryExecutor(BaseExecutor):
             if state:
                 self.update_task_state(cast("TaskInstanceKey", key), state, info)
 
+    def update_workload_states_from_events(self) -> None:
+        """Update the states of the workloads which finished, from the events sent by the workers."""
+        if TYPE_CHECKING:
+            assert self.task_event_receiver
+        state_and_info_by_celery_task_id = self.task_event_receiver.get_states()
+        if not state_and_info_by_celery_task_id or not self.workloads:
+            return
+
+        self.log.debug("Received %s celery task event(s)", len(state_and_info_by_celery_task_id))
+        for key, async_result in list(self.workloads.items()):
+            if state_and_info := state_and_info_by_celery_task_id.get(async_result.task_id):
+                self.update_task_state(cast("TaskInstanceKey", key), *state_and_info)
+
     def change_state(self, key: WorkloadKey, state: WorkloadState, info=None, remove_running=True) -> None:
         super().change_state(key, state, info, remove_running=remove_running)
         self.workloads.pop(key, None)
@@ -307,10 +346,15 @@ class CeleryExecutor(BaseExecutor):
                 workload.state not in celery_states.READY_STATES for workload in self.workloads.values()
             ):
                 time.sleep(5)
+        if self.task_event_receiver is not None:
+            self.task_event_receiver.stop()
+            self.task_event_receiver = None
         self.sync()
 
     def terminate(self):
-        pass
+        if self.task_event_receiver is not None:
+            self.task_event_receiver.stop()
+            self.task_event_receiver = None
 
     def try_adopt_task_instances(self, tis: Sequence[TaskInstance]) -> Sequence[TaskInstance]:
         # The scheduler pre-assigns external_executor_id at queuing time (committed to DB
@@ -29,11 +29,13 @@ import math
 import os
 import subprocess
 import sys
+import threading
 import traceback
 from collections.abc import Collection, Mapping, MutableMapping, Sequence
 from concurrent.futures import ProcessPoolExecutor
 from functools import cache
 from importlib import import_module
+from queue import Empty, SimpleQueue
 from typing import TYPE_CHECKING, Any
 
 from celery import Celery, states as celery_states
@@ -70,6 +72,7 @@ else:
 if TYPE_CHECKING:
     from typing import TypeAlias
 
+    from celery.events.receiver import EventReceiver
     from celery.result import AsyncResult
 
     from airflow.configuration import AirflowConfigParser
@@ -572,3 +575,86 @@ class BulkStateFetcher(LoggingMixin):
                 else:
                     states_and_info_by_task_id[task_id] = state_or_exception, info
         return states_and_info_by_task_id
+
+
+class TaskEventReceiver(LoggingMixin):
+    """
+    Receives the events sent by Celery workers when tasks finish, in a daemon thread.
+
+    This lets the executor learn the state of its tasks as they change, instead of polling the result
+    backend for all of them. The workers must send task events, which ``[celery] event_driven_state_sync``
+    enables. Events sent while the receiver is not connected are lost, so the executor still polls the
+    result backend from time to time.
+    """
+
+    #: Celery event types of the finished tasks, and the Celery states they stand for
+    EVENT_STATES: dict[str, str] = {
+        "task-succeeded": celery_states.SUCCESS,
+        "task-failed": celery_states.FAILURE,
+        "task-revoked": celery_states.REVOKED,
+    }
+
+    #: Seconds to wait before connecting again to the broker after losing the connection
+    reconnect_delay: float = 5.0
+
+    #: Seconds to wait for an event before checking again whether the receiver was stopped
+    capture_timeout: float = 1.0
+
+    def __init__(self, celery_app: Celery):
+        super().__init__()
+        self.celery_app = celery_app
+        self._events: SimpleQueue[tuple[str, str, Any]] = SimpleQueue()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="celery-task-events", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout=2 * self.capture_timeout)
+
+    def get_states(self) -> dict[str, EventBufferValueType]:
+        """Return the state and info of the tasks which finished since the last call, by Celery task ID."""
+        states: dict[str, EventBufferValueType] = {}
+        while True:
+            try:
+                task_id, state, info = self._events.get_nowait()
+            except Empty:
+                return states
+            states[task_id] = state, info
+
+    def _on_event(self, event: dict[str, Any]) -> None:
+        self._events.put((event["uuid"], self.EVENT_STATES[event["type"]], event.get("exception")))
+
+    def _run(self) -> None:
+        handlers = dict.fromkeys(self.EVENT_STATES, self._on_event)
+        while not self._stopped.is_set():
+            try:
+                with self.celery_app.connection_for_read() as connection:
+                    # Only task events are routed to the receiver, not the frequent worker heartbeats
+                    receiver = self.celery_app.events.Receiver(
+                        connection, handlers=handlers, routing_key="task.#"
+                    )
+                    self.log.info("Receiving Celery task events")
+                    self._capture(receiver)
+            except Exception:
+                if self._stopped.is_set():
+                    return
+                self.log.exception(
+                    "Lost the connection receiving Celery task events, reconnecting in %ss",
+                    self.reconnect_delay,
+                )
+                self._stopped.wait(self.reconnect_delay)
+
+    def _capture(self, receiver: EventReceiver) -> None:
+        """Capture events until the receiver is stopped, waiting at most ``capture_timeout`` for each."""
+        # The consumer is kept between waits: the event queue is deleted once it is cancelled, and the
+        # events sent in the meantime would be lost.
+        with receiver.consumer_context(wakeup=False) as (connection, _, _):
+            while not self._stopped.is_set():
+                try:
+                    connection.drain_events(timeout=self.capture_timeout)
+                except TimeoutError:
+                    connection.heartbeat_check()
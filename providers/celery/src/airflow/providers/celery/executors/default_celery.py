@@ -124,6 +124,8 @@ def get_default_celery_config(team_conf) -> dict[str, Any]:
         "worker_enable_remote_control": team_conf.getboolean(
             "celery", "worker_enable_remote_control", fallback=True
         ),
+        # The executor keeps the states of the tasks in sync from these events when this is enabled.
+        "worker_send_task_events": team_conf.getboolean("celery", "event_driven_state_sync", fallback=False),
         **(extra_celery_config if isinstance(extra_celery_config, dict) else {}),
     }
 
@@ -155,6 +155,20 @@ def get_provider_info():
                         "example": None,
                         "default": "0",
                     },
+                    "event_driven_state_sync": {
+                        "description": "Keep the states of the tasks in sync from the events sent by the Celery workers when tasks\nfinish, instead of polling the result backend for every running task on each heartbeat of the\nexecutor. The workers are configured to send task events (``worker_send_task_events``), so the\nbroker must support them (Redis and RabbitMQ do, SQS does not). The result backend is still\npolled every ``state_sync_reconcile_interval`` seconds, for the events missed while the\nexecutor was not connected to the broker.\n",
+                        "version_added": "3.21.0",
+                        "type": "boolean",
+                        "example": None,
+                        "default": "False",
+                    },
+                    "state_sync_reconcile_interval": {
+                        "description": "How often (in seconds) to poll the result backend for the states of all the running tasks,\nwhen ``event_driven_state_sync`` is enabled.\n",
+                        "version_added": "3.21.0",
+                        "type": "integer",
+                        "example": None,
+                        "default": "60",
+                    },
                     "celery_config_options": {
                         "description": "Import path for celery configuration options\n",
                         "version_added": None,
@@ -22,6 +22,7 @@ import logging
 import os
 import signal
 import sys
+import time
 from datetime import timedelta
 from unittest import mock
 
@@ -29,7 +30,7 @@ from unittest import mock
 import celery.contrib.testing.tasks  # noqa: F401
 import pytest
 import time_machine
-from celery import Celery
+from celery import Celery, states as celery_states
 from celery.result import AsyncResult
 from kombu.asynchronous import set_event_loop
 
@@ -412,6 +413,71 @@ class TestCeleryExecutor:
         assert not executor.has_task(ti)
         mock_fail.assert_not_called()
 
+    @conf_vars({("celery", "event_driven_state_sync"): "True"})
+    def test_sync_updates_states_from_task_events(self):
+        executor = celery_executor.CeleryExecutor()
+        executor.task_event_receiver = mock.MagicMock(spec=celery_executor_utils.TaskEventReceiver)
+        succeeded = TaskInstanceKey("dag", "succeeded", "run", 1, -1)
+        failed = TaskInstanceKey("dag", "failed", "run", 1, -1)
+        running = TaskInstanceKey("dag", "running", "run", 1, -1)
+        executor.running = {succeeded, failed, running}
+        executor.workloads = {
+            succeeded: mock.Mock(task_id="succeeded-id"),
+            failed: mock.Mock(task_id="failed-id"),
+            running: mock.Mock(task_id="running-id"),
+        }
+        executor.task_event_receiver.get_states.return_value = {
+            "succeeded-id": (celery_states.SUCCESS, None),
+            "failed-id": (celery_states.FAILURE, "ValueError('boom')"),
+            "unknown-id": (celery_states.SUCCESS, None),
+        }
+        executor._last_state_reconcile = time.monotonic()
+
+        with mock.patch.object(executor, "update_all_workload_states") as mock_update_all:
+            executor.sync()
+
+        mock_update_all.assert_not_called()
+        assert executor.event_buffer[succeeded][0] == State.SUCCESS
+        assert executor.event_buffer[failed][0] == State.FAILED
+        assert list(executor.workloads) == [running]
+        assert executor.running == {running}
+
+    @conf_vars(
+        {
+            ("celery", "event_driven_state_sync"): "True",
+            ("celery", "state_sync_reconcile_interval"): "30",
+        }
+    )
+    def test_sync_polls_result_backend_every_reconcile_interval(self):
+        executor = celery_executor.CeleryExecutor()
+        executor.task_event_receiver = mock.MagicMock(spec=celery_executor_utils.TaskEventReceiver)
+        executor.task_event_receiver.get_states.return_value = {}
+        key = TaskInstanceKey("dag", "running", "run", 1, -1)
+        executor.running = {key}
+        executor.workloads = {key: mock.Mock(task_id="running-id")}
+
+        with mock.patch.object(executor, "update_all_workload_states") as mock_update_all:
+            executor.sync()
+            executor.sync()
+            assert mock_update_all.call_count == 1
+
+            executor._last_state_reconcile -= 31
+            executor.sync()
+            assert mock_update_all.call_count == 2
+
+    def test_sync_polls_result_backend_without_event_driven_state_sync(self):
+        executor = celery_executor.CeleryExecutor()
+        executor.start()
+        key = TaskInstanceKey("dag", "running", "run", 1, -1)
+        executor.workloads = {key: mock.Mock(task_id="running-id")}
+
+        with mock.patch.object(executor, "update_all_workload_states") as mock_update_all:
+            executor.sync()
+            executor.sync()
+
+        assert executor.task_event_receiver is None
+        assert mock_update_all.call_count == 2
+
     @conf_vars({("celery", "result_backend_sqlalchemy_engine_options"): '{"pool_recycle": 1800}'})
     def test_result_backend_sqlalchemy_engine_options(self):
         import importlib
@@ -587,6 +653,53 @@ def test_celery_task_acks_late_loaded_from_string():
     assert default_celery.DEFAULT_CELERY_CONFIG["task_acks_late"] is False
 
 
+@conf_vars({("celery", "event_driven_state_sync"): "True"})
+def test_celery_worker_send_task_events_with_event_driven_state_sync():
+    import importlib
+
+    importlib.reload(default_celery)
+    assert default_celery.DEFAULT_CELERY_CONFIG["worker_send_task_events"] is True
+
+
+def test_task_event_receiver_get_states():
+    receiver = celery_executor_utils.TaskEventReceiver(mock.MagicMock(spec=Celery))
+    receiver._on_event({"type": "task-succeeded", "uuid": "succeeded-id", "result": "None"})
+    receiver._on_event({"type": "task-failed", "uuid": "failed-id", "exception": "ValueError('boom')"})
+    receiver._on_event({"type": "task-revoked", "uuid": "revoked-id", "terminated": True})
+
+    assert receiver.get_states() == {
+        "succeeded-id": (celery_states.SUCCESS, None),
+        "failed-id": (celery_states.FAILURE, "ValueError('boom')"),
+        "revoked-id": (celery_states.REVOKED, None),
+    }
+    assert receiver.get_states() == {}
+
+
+def test_task_event_receiver_stop():
+    app = mock.MagicMock(spec=Celery)
+    receiver = celery_executor_utils.TaskEventReceiver(app)
+    receiver.capture_timeout = 0.1
+    consumer_context = app.events.Receiver.return_value.consumer_context
+    connection = mock.MagicMock()
+    consumer_context.return_value.__enter__.return_value = (connection, None, None)
+    connection.drain_events.side_effect = TimeoutError
+
+    receiver.start()
+    while connection.drain_events.call_count < 2:
+        time.sleep(0.01)
+    receiver.stop()
+
+    assert not receiver._thread.is_alive()
+    app.events.Receiver.assert_called_once_with(
+        app.connection_for_read.return_value.__enter__.return_value,
+        handlers={event_type: receiver._on_event for event_type in receiver.EVENT_STATES},
+        routing_key="task.#",
+    )
+    consumer_context.assert_called_once_with(wakeup=False)
+    connection.drain_events.assert_called_with(timeout=0.1)
+    connection.heartbeat_check.assert_called()
+
+
 @conf_vars({("celery", "BROKER_URL"): "redis://localhost:6379/0"})
 def test_visibility_timeout_default_warns_when_not_configured(caplog):
     """Test that a warning is logged when visibility_timeout defaults to 86400 (24h)."""
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Micro-benchmark of the secrets masker engines (``[logging] secret_mask_engine``).
+
+For an increasing number of masked secrets, this script measures for each engine:
+
+1. The time it takes to add all the secrets (as ``mask_secret`` does when connections are fetched)
+2. The time it takes to redact a realistic volume of task log lines, a few of them containing secrets
+
+It also checks that both engines redact every line in exactly the same way.
+
+Usage::
+
+    python scripts/in_container/benchmark_secrets_masker.py [--lines 20000] [--secrets 1,10,100,500]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+# Add airflow to path
+AIRFLOW_SOURCES_DIR = Path(__file__).resolve().parents[2] / "airflow-core" / "src"
+sys.path.insert(0, str(AIRFLOW_SOURCES_DIR))
+
+from airflow._shared.secrets_masker import MASK_ENGINES, SecretsMasker  # noqa: E402
+
+LOG_TEMPLATES = [
+    "[{ts}] {{taskinstance.py:1234}} INFO - Dependencies all met for dep_context=non-requeueable deps ti=<TaskInstance: etl_{n}.load manual__{ts} [queued]>",
+    "[{ts}] {{base.py:84}} INFO - Retrieving connection 'postgres_{n}'",
+    "[{ts}] {{sql.py:470}} INFO - Running statement: SELECT * FROM events WHERE batch_id = {n} AND region = 'eu-west-1', parameters: None",
+    "[{ts}] {{sql.py:479}} INFO - Rows affected: {n}",
+    "[{ts}] {{http.py:171}} INFO - Sending 'POST' to url: https://api.example.com/v2/items/{n}?page=3&per_page=100",
+    "[{ts}] {{logging_mixin.py:190}} INFO - processed {n} records in 0.{n} seconds",
+]
+
+
+def make_log_lines(count: int, secrets: list[str], rand: random.Random) -> list[str]:
+    lines = []
+    for i in range(count):
+        line = rand.choice(LOG_TEMPLATES).format(ts=f"2025-01-01T00:{i // 60 % 60:02d}:{i % 60:02d}", n=i)
+        # About one line in a hundred leaks a secret
+        if secrets and rand.random() < 0.01:
+            line += f" token={rand.choice(secrets)}"
+        lines.append(line)
+    return lines
+
+
+def make_secrets(count: int, rand: random.Random) -> list[str]:
+    alphabet = string.ascii_letters + string.digits
+    return ["".join(rand.choices(alphabet, k=rand.randint(12, 40))) for _ in range(count)]
+
+
+def benchmark(engine: str, secrets: list[str], lines: list[str]) -> tuple[float, float, list]:
+    masker = SecretsMasker()
+    masker.mask_engine = engine
+
+    start = time.perf_counter()
+    for secret in secrets:
+        masker.add_mask(secret)
+    add_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    redacted = [masker.redact(line) for line in lines]
+    redact_time = time.perf_counter() - start
+    return add_time, redact_time, redacted
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("--lines", type=int, default=20_000, help="Number of log lines to redact")
+    parser.add_argument(
+        "--secrets", default="1,10,100,500", help="Comma separated numbers of secrets to benchmark"
+    )
+    args = parser.parse_args()
+
+    rand = random.Random(42)
+    print(f"Redacting {args.lines} log lines\n")
+    print(f"| {'secrets':>7} | {'engine':<12} | {'add (ms)':>10} | {'redact (ms)':>11} | {'us/line':>7} |")
+    print(f"|{'-' * 9}|{'-' * 14}|{'-' * 12}|{'-' * 13}|{'-' * 9}|")
+    for num_secrets in map(int, args.secrets.split(",")):
+        secrets = make_secrets(num_secrets, rand)
+        lines = make_log_lines(args.lines, secrets, rand)
+        outputs = {}
+        for engine in MASK_ENGINES:
+            add_time, redact_time, outputs[engine] = benchmark(engine, secrets, lines)
+            print(
+                f"| {num_secrets:>7} | {engine:<12} | {add_time * 1000:>10.1f} | {redact_time * 1000:>11.1f} "
+                f"| {redact_time / len(lines) * 1e6:>7.1f} |"
+            )
+        reference, *others = outputs.values()
+        if any(other != reference for other in others):
+            print("ERROR: the engines redacted the log lines differently", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
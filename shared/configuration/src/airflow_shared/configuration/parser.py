@@ -37,7 +37,7 @@ from copy import deepcopy
 from enum import Enum
 from json.decoder import JSONDecodeError
 from re import Pattern
-from typing import IO, TYPE_CHECKING, Any, TypeVar, overload
+from typing import IO, TYPE_CHECKING, Any, TypeVar, cast, overload
 
 from .exceptions import AirflowConfigException
 
@@ -92,6 +92,33 @@ class ValueNotFound:
 
 VALUE_NOT_FOUND_SENTINEL = ValueNotFound()
 
+_GetterT = TypeVar("_GetterT", bound=Callable[..., Any])
+
+
+def _snapshotted(getter: _GetterT) -> _GetterT:
+    """
+    Serve the values returned by ``getter`` from the snapshot of the parser, when enabled.
+
+    Values are keyed by the getter and all of its arguments, so that a lookup with a different fallback
+    or team is resolved separately. Lookups raising an exception, or passed unhashable arguments, are
+    not stored in the snapshot.
+    """
+
+    @functools.wraps(getter)
+    def wrapper(self: AirflowConfigParser, *args, **kwargs):
+        if self._snapshot is None:
+            return getter(self, *args, **kwargs)
+        snapshot_key = (getter.__name__, *args, *kwargs.items())
+        try:
+            return self._snapshot[snapshot_key]
+        except KeyError:
+            value = self._snapshot[snapshot_key] = getter(self, *args, **kwargs)
+            return value
+        except TypeError:
+            return getter(self, *args, **kwargs)
+
+    return cast("_GetterT", wrapper)
+
 
 @overload
 def expand_env_var(env_var: None) -> None: ...
@@ -264,6 +291,9 @@ class AirflowConfigParser(ConfigParser):
     # A mapping of new section -> (old section, since_version).
     deprecated_sections: dict[str, tuple[str, str]] = {}
 
+    # Values resolved while the snapshot mode is enabled, see enable_snapshot()
+    _snapshot: dict[tuple, Any] | None = None
+
     @property
     def _lookup_sequence(self) -> list[Callable]:
         """
@@ -524,11 +554,48 @@ class AirflowConfigParser(ConfigParser):
             if isinstance(getattr(type(self), name, None), functools.cached_property)
         ):
             self.__dict__.pop(attr_name, None)
+        self.reload_snapshot()
 
     def _invalidate_provider_flag_caches(self) -> None:
         """Invalidate caches related to provider configuration flags."""
         self.__dict__.pop("configuration_description", None)
         self.__dict__.pop("sensitive_config_values", None)
+        self.reload_snapshot()
+
+    def enable_snapshot(self) -> None:
+        """
+        Resolve each configuration value once, and serve it from a snapshot afterwards.
+
+        ``get`` walks the whole lookup sequence (environment variables, config file, commands,
+        secrets, defaults...) on every call. In snapshot mode, the values returned by ``get``,
+        ``getboolean``, ``getint`` and ``getfloat`` are kept in a flat dict the first time they are
+        resolved, so that later lookups of the same option are a single dict lookup. Changes made
+        through this parser (``set``, ``read``...) drop the snapshot, but changes to the environment,
+        commands or secrets backends are only picked up by ``reload_snapshot``.
+        """
+        if self._snapshot is None:
+            self._snapshot = {}
+
+    def disable_snapshot(self) -> None:
+        """Resolve configuration values on every lookup again."""
+        self._snapshot = None
+
+    def reload_snapshot(self) -> None:
+        """Drop the values resolved so far in snapshot mode, so that they are resolved again."""
+        if self._snapshot is not None:
+            self._snapshot = {}
+
+    @contextmanager
+    def snapshot(self, enabled: bool = True) -> Generator[None, None, None]:
+        """Enable the snapshot mode (see ``enable_snapshot``) for the duration of the context."""
+        if not enabled or self._snapshot is not None:
+            yield
+            return
+        self.enable_snapshot()
+        try:
+            yield
+        finally:
+            self.disable_snapshot()
 
     @functools.cached_property
     def inversed_deprecated_options(self):
@@ -1316,6 +1383,7 @@ class AirflowConfigParser(ConfigParser):
     @overload  # type: ignore[override]
     def get(self, section: str, key: str, **kwargs) -> str | None: ...
 
+    @_snapshotted
     def get(  # type: ignore[misc, override]
         self,
         section: str,
@@ -1363,6 +1431,7 @@ class AirflowConfigParser(ConfigParser):
 
         raise AirflowConfigException(f"section/key [{section}/{key}] not found in config")
 
+    @_snapshotted
     def getboolean(self, section: str, key: str, **kwargs) -> bool:  # type: ignore[override]
         """Get config value as boolean."""
         val = str(self.get(section, key, _extra_stacklevel=1, **kwargs)).lower().strip()
@@ -1377,6 +1446,7 @@ class AirflowConfigParser(ConfigParser):
             f'Current value: "{val}".'
         )
 
+    @_snapshotted
     def getint(self, section: str, key: str, **kwargs) -> int:  # type: ignore[override]
         """Get config value as integer."""
         val = self.get(section, key, _extra_stacklevel=1, **kwargs)
@@ -1398,6 +1468,7 @@ class AirflowConfigParser(ConfigParser):
                     f'Current value: "{val}".'
                 )
 
+    @_snapshotted
     def getfloat(self, section: str, key: str, **kwargs) -> float:  # type: ignore[override]
         """Get config value as float."""
         val = self.get(section, key, _extra_stacklevel=1, **kwargs)
@@ -1582,8 +1653,13 @@ class AirflowConfigParser(ConfigParser):
         filenames: str | bytes | os.PathLike | Iterable[str | bytes | os.PathLike],
         encoding: str | None = None,
     ) -> list[str]:
+        self.reload_snapshot()
         return super().read(filenames=filenames, encoding=encoding)  # type: ignore[arg-type,return-value]
 
+    def read_file(self, f: Iterable[str], source: str | None = None) -> None:
+        self.reload_snapshot()
+        super().read_file(f, source=source)
+
     def read_dict(  # type: ignore[override]
         self, dictionary: dict[str, dict[str, Any]], source: str = "<dict>"
     ) -> None:
@@ -1594,6 +1670,7 @@ class AirflowConfigParser(ConfigParser):
         :param source: source to be used to store the configuration
         :return:
         """
+        self.reload_snapshot()
         super().read_dict(dictionary=dictionary, source=source)
 
     def _has_section_in_any_defaults(self, section: str) -> bool:
@@ -1677,6 +1754,7 @@ class AirflowConfigParser(ConfigParser):
             # automatically create it
             self.add_section(section)
         super().set(section, option, value)
+        self.reload_snapshot()
 
     def remove_option(self, section: str, option: str, remove_default: bool = True):  # type: ignore[override]
         """
@@ -1692,6 +1770,7 @@ class AirflowConfigParser(ConfigParser):
 
         if remove_default and self._default_values.has_option(section, option):
             self._default_values.remove_option(section, option)
+        self.reload_snapshot()
 
     def optionxform(self, optionstr: str) -> str:
         """
@@ -1188,3 +1188,58 @@ existing_list = one,two,three
             test_conf.load_providers_configuration()
         assert test_conf._use_providers_configuration is True
         assert "configuration_description" not in test_conf.__dict__
+
+    def test_snapshot(self):
+        test_conf = AirflowConfigParser()
+        test_conf.enable_snapshot()
+
+        with patch.dict(os.environ, {"AIRFLOW__TEST__KEY2": "1"}):
+            assert test_conf.getint("test", "key2") == 1
+            assert test_conf.get("test", "missing", fallback="fallback") == "fallback"
+        # Resolved values are kept, until the snapshot is reloaded
+        assert test_conf.getint("test", "key2") == 1
+        assert test_conf.get("test", "key2") == "123"
+        assert test_conf.get("test", "missing", fallback=None) is None
+
+        test_conf.reload_snapshot()
+        assert test_conf.getint("test", "key2") == 123
+
+        # Values that could not be resolved are not kept
+        with pytest.raises(AirflowConfigException):
+            test_conf.get("test", "missing")
+        with patch.dict(os.environ, {"AIRFLOW__TEST__MISSING": "value"}):
+            assert test_conf.get("test", "missing") == "value"
+
+        test_conf.disable_snapshot()
+        with patch.dict(os.environ, {"AIRFLOW__TEST__KEY2": "1"}):
+            assert test_conf.getint("test", "key2") == 1
+
+    def test_snapshot_reloaded_on_changes(self):
+        test_conf = AirflowConfigParser()
+        test_conf.enable_snapshot()
+        assert test_conf.get("test", "key1") == "default_value"
+
+        test_conf.set("test", "key1", "set_value")
+        assert test_conf.get("test", "key1") == "set_value"
+
+        test_conf.read_string("[test]\nkey1 = read_value\n")
+        assert test_conf.get("test", "key1") == "read_value"
+
+        test_conf.read_dict({"test": {"key1": "dict_value"}})
+        assert test_conf.get("test", "key1") == "dict_value"
+
+        test_conf.remove_option("test", "key1")
+        assert test_conf.get("test", "key1", fallback=None) is None
+
+    def test_snapshot_context_manager(self):
+        test_conf = AirflowConfigParser()
+
+        with test_conf.snapshot():
+            assert test_conf._snapshot == {}
+            with test_conf.snapshot():
+                test_conf.get("test", "key1")
+            assert test_conf._snapshot
+        assert test_conf._snapshot is None
+
+        with test_conf.snapshot(enabled=False):
+            assert test_conf._snapshot is None
@@ -186,10 +186,140 @@ def _get_v1_env_var_type_cached() -> type:
         return type("V1EnvVar", (), {})
 
 
+class _MultiSecretReplacer:
+    """
+    Aho-Corasick automaton that replaces every occurrence of a set of literal secrets in a string.
+
+    It is a drop-in alternative to the ``re.compile("|".join(patterns))`` replacer of the
+    :class:`SecretsMasker`, producing the same output: leftmost matches win, and of several secrets
+    matching at the same position, the one that comes first in the masker's ``patterns``.
+
+    Unlike the regular expression, which is recompiled from all the patterns whenever a secret is added
+    and tries every alternative at every position of the string, secrets are inserted incrementally and
+    a string is scanned in a single pass, whatever the number of secrets.
+    """
+
+    def __init__(self) -> None:
+        # The trie: transitions of each node (node 0 being the root), the pattern of the secret ending
+        # at a node, if any, and the failure link of the node.
+        self._goto: list[dict[str, int]] = [{}]
+        self._terminal: list[str | None] = [None]
+        self._fail: list[int] = [0]
+        # For each node, the (pattern, length) of all the secrets that end there, including suffixes.
+        self._out: list[list[tuple[str, int]]] = [[]]
+        self._rank: dict[str, int] = {}
+        self._needs_build = False
+        self.min_length = 0
+        self.max_length = 0
+
+    def __bool__(self) -> bool:
+        return self.max_length > 0
+
+    def add(self, pattern: str, secret: str) -> None:
+        """Add a secret, ``pattern`` being its escaped form in the masker's ``patterns``."""
+        node = 0
+        for char in secret:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._terminal.append(None)
+            node = next_node
+        self._terminal[node] = pattern
+        self._rank.setdefault(pattern, len(self._rank))
+        self.min_length = min(self.min_length, len(secret)) if self.min_length else len(secret)
+        self.max_length = max(self.max_length, len(secret))
+        self._needs_build = True
+
+    def prioritize(self, patterns: Iterable[str]) -> None:
+        """Set which secret wins when several match at the same position: the first one in ``patterns``."""
+        self._rank = {pattern: rank for rank, pattern in enumerate(patterns)}
+
+    def _build(self) -> None:
+        goto, terminal = self._goto, self._terminal
+        fail = [0] * len(goto)
+        out: list[list[tuple[str, int]]] = [[] for _ in goto]
+        lengths = [0] * len(goto)
+        queue = collections.deque(goto[0].values())
+        for node in queue:
+            lengths[node] = 1
+        while queue:
+            node = queue.popleft()
+            pattern = terminal[node]
+            out[node] = ([(pattern, lengths[node])] if pattern is not None else []) + out[fail[node]]
+            for char, child in goto[node].items():
+                lengths[child] = lengths[node] + 1
+                state = fail[node]
+                while state and char not in goto[state]:
+                    state = fail[state]
+                fail[child] = goto[state].get(char, 0) if node else 0
+                queue.append(child)
+        self._fail, self._out = fail, out
+        self._needs_build = False
+
+    def sub(self, repl: str, string: str) -> str:
+        """Return ``string`` with all the secrets replaced by ``repl``, like :meth:`re.Pattern.sub`."""
+        if len(string) < self.min_length or not self.max_length:
+            return string
+        if self._needs_build:
+            self._build()
+        if "\\" in repl:
+            # Process escapes in the replacement the way re does
+            repl = re.sub("", repl, "")
+        pieces = []
+        end_of_last_match = 0
+        while match := self._find(string, end_of_last_match):
+            start, end = match
+            pieces.append(string[end_of_last_match:start])
+            pieces.append(repl)
+            end_of_last_match = end
+        if not pieces:
+            return string
+        pieces.append(string[end_of_last_match:])
+        return "".join(pieces)
+
+    def _find(self, string: str, pos: int) -> tuple[int, int] | None:
+        """Return the ``(start, end)`` of the first secret in ``string[pos:]``, if any."""
+        goto, fail, out, rank = self._goto, self._fail, self._out, self._rank
+        root = goto[0]
+        state = 0
+        best_start = best_end = best_rank = -1
+        stop = len(string)
+        for i in range(pos, len(string)):
+            if i >= stop:
+                # No secret starting at or before the best match so far can end after this point
+                break
+            char = string[i]
+            if not state:
+                state = root.get(char, 0)
+            else:
+                while state and char not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(char, 0)
+            if out[state]:
+                for pattern, pattern_length in out[state]:
+                    start = i - pattern_length + 1
+                    if (
+                        best_start < 0
+                        or start < best_start
+                        or (start == best_start and rank[pattern] < best_rank)
+                    ):
+                        best_start, best_end, best_rank = start, i + 1, rank[pattern]
+                stop = best_start + self.max_length
+        if best_start < 0:
+            return None
+        return best_start, best_end
+
+
+MASK_ENGINES = ("regex", "aho-corasick")
+"""Implementations the :class:`SecretsMasker` can use to find secrets in strings."""
+
+
 class SecretsMasker(logging.Filter):
     """Redact secrets from logs."""
 
-    replacer: Pattern | None = None
+    replacer: Pattern | _MultiSecretReplacer | None = None
     patterns: set[str]
 
     ALREADY_FILTERED_FLAG = "__SecretsMasker_filtered"
@@ -199,10 +329,20 @@ class SecretsMasker(logging.Filter):
 
     min_length_to_mask = 5
     secret_mask_adapter = None
+    _min_secret_length = 0
+    mask_engine = "regex"
+    """
+    How secrets are found in strings; one of :data:`MASK_ENGINES`.
+
+    ``regex`` compiles all the secrets in a single regular expression, ``aho-corasick`` uses a
+    :class:`_MultiSecretReplacer`, which scales better to many secrets.
+    """
 
     def __init__(self):
         super().__init__()
         self.patterns = set()
+        # Length of the shortest secret, strings shorter than this can't contain any secret
+        self._min_secret_length = 0
         self.sensitive_variables_fields = []
         self.hide_sensitive_var_conn_fields = True
 
@@ -387,7 +527,7 @@ class SecretsMasker(logging.Filter):
                     )
                 return tmp
             if isinstance(item, str):
-                if self.replacer:
+                if self.replacer and len(item) >= self._min_secret_length:
                     # We can't replace specific values, but the key-based redacting
                     # can still happen, so we can't short-circuit, we need to walk
                     # the structure.
@@ -604,7 +744,7 @@ class SecretsMasker(logging.Filter):
                     SecretsMasker._has_warned_short_secret = True
                 return
 
-            new_mask = False
+            new_masks = {}
             for s in self._adaptations(secret):
                 if s:
                     if len(s) < min_length:
@@ -616,18 +756,47 @@ class SecretsMasker(logging.Filter):
                     pattern = re.escape(s)
                     if pattern not in self.patterns and (not name or self.should_hide_value_for_key(name)):
                         self.patterns.add(pattern)
-                        new_mask = True
-            if new_mask:
-                self.replacer = re.compile("|".join(self.patterns))
+                        new_masks[pattern] = s
+            if new_masks:
+                self._update_replacer(new_masks)
 
         elif isinstance(secret, collections.abc.Iterable):
             for v in secret:
                 self.add_mask(v, name)
 
+    def _update_replacer(self, new_masks: dict[str, str]) -> None:
+        """Make the replacer match ``new_masks``, a mapping of newly added patterns to their secret."""
+        shortest = min(map(len, new_masks.values()))
+        if not self._min_secret_length or shortest < self._min_secret_length:
+            self._min_secret_length = shortest
+
+        if self.mask_engine not in MASK_ENGINES:
+            raise ValueError(
+                f"Unknown secrets mask engine {self.mask_engine!r}, expected one of {MASK_ENGINES}"
+            )
+        if self.mask_engine == "regex":
+            self.replacer = re.compile("|".join(self.patterns))
+            return
+
+        if not isinstance(self.replacer, _MultiSecretReplacer):
+            # Switching engines, or the first secret: (re-)index the secrets added so far
+            self.replacer = _MultiSecretReplacer()
+            new_masks = {pattern: _unescape(pattern) for pattern in self.patterns}
+        for pattern, secret in new_masks.items():
+            self.replacer.add(pattern, secret)
+        # Keep the precedence the regex alternation would give, so both engines redact the same way
+        self.replacer.prioritize(self.patterns)
+
     def reset_masker(self):
         """Reset the patterns and the replacer in the masker instance."""
         self.patterns = set()
         self.replacer = None
+        self._min_secret_length = 0
+
+
+def _unescape(pattern: str) -> str:
+    """Return the string a :func:`re.escape` pattern matches."""
+    return re.sub(r"\\(.)", r"\1", pattern, flags=re.DOTALL)
 
 
 class RedactedIO(TextIO):
@@ -21,6 +21,7 @@ import inspect
 import logging
 import logging.config
 import os
+import random
 import sys
 import textwrap
 from enum import Enum
@@ -33,6 +34,7 @@ from airflow_shared.secrets_masker.secrets_masker import (
     DEFAULT_SENSITIVE_FIELDS,
     RedactedIO,
     SecretsMasker,
+    _MultiSecretReplacer,
     mask_secret,
     merge,
     redact,
@@ -1173,6 +1175,76 @@ class TestEdgeCases:
         assert " and " in redacted
 
 
+class TestAhoCorasickEngine:
+    @staticmethod
+    def _maskers(secrets):
+        regex_masker, ac_masker = SecretsMasker(), SecretsMasker()
+        ac_masker.mask_engine = "aho-corasick"
+        for masker in (regex_masker, ac_masker):
+            configure_secrets_masker_for_test(masker)
+            for secret in secrets:
+                masker.add_mask(secret)
+        return regex_masker, ac_masker
+
+    @pytest.mark.parametrize(
+        ("secrets", "value", "expected"),
+        [
+            pytest.param(["secret"], "a secret and another secret", "a *** and another ***", id="repeated"),
+            pytest.param(["password+with*chars"], "x=password+with*chars;", "x=***;", id="special-chars"),
+            pytest.param(["abcdef", "cdefgh"], "abcdefgh", "***gh", id="overlapping"),
+            pytest.param(["bcdefg", "abcdefgh"], "xabcdefghx", "x***x", id="leftmost-wins"),
+            pytest.param(["secret"], "short", "short", id="shorter-than-secrets"),
+            pytest.param(["sécrèt☃"], "unicode sécrèt☃!", "unicode ***!", id="unicode"),
+        ],
+    )
+    def test_redact(self, secrets, value, expected):
+        regex_masker, ac_masker = self._maskers(secrets)
+
+        assert isinstance(ac_masker.replacer, _MultiSecretReplacer)
+        assert ac_masker.redact(value) == regex_masker.redact(value) == expected
+
+    def test_same_output_as_regex(self):
+        rand = random.Random(42)
+        # A small alphabet gives many secrets sharing prefixes, suffixes and overlapping in the text
+        alphabet = "ab.\\*"
+        for _ in range(200):
+            secrets = [
+                "".join(rand.choices(alphabet, k=rand.randint(5, 8))) for _ in range(rand.randint(1, 10))
+            ]
+            regex_masker, ac_masker = self._maskers(secrets)
+            for _ in range(10):
+                value = "".join(rand.choices(alphabet + "xyz", k=rand.randint(0, 50)))
+                for replacement in ("***", r"\t"):
+                    assert ac_masker.redact(value, replacement=replacement) == regex_masker.redact(
+                        value, replacement=replacement
+                    )
+
+    def test_switching_engine_keeps_existing_secrets(self):
+        masker = SecretsMasker()
+        configure_secrets_masker_for_test(masker)
+        masker.add_mask("first_secret")
+        masker.mask_engine = "aho-corasick"
+        masker.add_mask("second_secret")
+
+        assert isinstance(masker.replacer, _MultiSecretReplacer)
+        assert masker.redact("first_secret second_secret") == "*** ***"
+
+    def test_reset(self):
+        _, masker = self._maskers(["secret"])
+        masker.reset_masker()
+        masker.add_mask("other_secret")
+
+        assert masker.redact("secret other_secret") == "secret ***"
+
+    def test_unknown_engine(self):
+        masker = SecretsMasker()
+        configure_secrets_masker_for_test(masker)
+        masker.mask_engine = "unknown"
+
+        with pytest.raises(ValueError, match="Unknown secrets mask engine"):
+            masker.add_mask("secret")
+
+
 class TestDirectMethodCalls:
     def test_redact_all_directly(self):
         secrets_masker = SecretsMasker()
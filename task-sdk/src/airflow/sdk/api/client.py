@@ -71,6 +71,10 @@ from airflow.sdk.api.datamodels._generated import (
     TaskStateStoreResponse,
     TerminalStateNonSuccess,
     TIAwaitingInputStatePayload,
+    TIBulkHeartbeatBody,
+    TIBulkHeartbeatInfo,
+    TIBulkHeartbeatResponse,
+    TIBulkHeartbeatResult,
     TIDeferredStatePayload,
     TIEnterRunningPayload,
     TIHeartbeatInfo,
@@ -85,6 +89,9 @@ from airflow.sdk.api.datamodels._generated import (
     VariableKeysResponse,
     VariablePostBody,
     VariableResponse,
+    XComBatchBody,
+    XComBatchQuery,
+    XComBatchResponse,
     XComResponse,
     XComSequenceIndexResponse,
     XComSequenceSliceResponse,
@@ -244,6 +251,9 @@ def _log_and_trace_retry(retry_state) -> None:
 class TaskInstanceOperations:
     __slots__ = ("client",)
 
+    # Maximum number of heartbeats sent by a single bulk request
+    BULK_HEARTBEAT_SIZE = 500
+
     def __init__(self, client: Client):
         self.client = client
 
@@ -325,6 +335,20 @@ class TaskInstanceOperations:
         body = TIHeartbeatInfo(pid=pid, hostname=get_hostname())
         self.client.put(f"task-instances/{id}/heartbeat", content=body.model_dump_json())
 
+    def bulk_heartbeat(self, heartbeats: list[TIBulkHeartbeatInfo]) -> list[TIBulkHeartbeatResult]:
+        """
+        Send the heartbeats of several TIs, in as few requests as possible.
+
+        Each heartbeat is authorized by its own token, and gets the outcome of the single heartbeat
+        endpoint instead of an error, see ``TIBulkHeartbeatResult``.
+        """
+        results: list[TIBulkHeartbeatResult] = []
+        for start in range(0, len(heartbeats), self.BULK_HEARTBEAT_SIZE):
+            body = TIBulkHeartbeatBody(heartbeats=heartbeats[start : start + self.BULK_HEARTBEAT_SIZE])
+            resp = self.client.put("task-instances/heartbeats", content=body.model_dump_json())
+            results.extend(TIBulkHeartbeatResponse.model_validate_json(resp.read()).results)
+        return results
+
     def skip_downstream_tasks(self, id: uuid.UUID, msg: SkipDownstreamTasks):
         """Tell the API server to skip the downstream tasks of this TI."""
         body = TISkippedDownstreamTasksStatePayload(tasks=msg.tasks)
@@ -557,6 +581,9 @@ class VariableOperations:
 class XComOperations:
     __slots__ = ("client",)
 
+    # Maximum number of XComs read by a single batch request
+    BATCH_SIZE = 500
+
     def __init__(self, client: Client):
         self.client = client
 
@@ -609,6 +636,19 @@ class XComOperations:
             raise
         return XComResponse.model_validate_json(resp.read())
 
+    def get_batch(self, queries: list[XComBatchQuery]) -> XComBatchResponse:
+        """
+        Get several XCom values from the API server, in as few requests as possible.
+
+        XComs that are not found get an empty list of values instead of an error, see ``XComBatchResponse``.
+        """
+        values: list[list[JsonValue]] = []
+        for start in range(0, len(queries), self.BATCH_SIZE):
+            body = XComBatchBody(queries=queries[start : start + self.BATCH_SIZE])
+            resp = self.client.post("xcoms/batch", content=body.model_dump_json())
+            values.extend(XComBatchResponse.model_validate_json(resp.read()).root)
+        return XComBatchResponse(values)
+
     def set(
         self,
         dag_id: str,
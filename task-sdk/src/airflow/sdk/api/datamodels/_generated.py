@@ -261,6 +261,32 @@ class TIAwaitingInputStatePayload(BaseModel):
     rendered_map_index: Annotated[str | None, Field(title="Rendered Map Index")] = None
 
 
+class TIBulkHeartbeatInfo(BaseModel):
+    """
+    Heartbeat of one TaskInstance in a bulk heartbeat.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+    )
+    hostname: Annotated[str, Field(title="Hostname")]
+    pid: Annotated[int, Field(title="Pid")]
+    id: Annotated[UUID, Field(title="Id")]
+    token: Annotated[str, Field(title="Token")]
+
+
+class TIBulkHeartbeatResult(BaseModel):
+    """
+    Outcome of the heartbeat of one TaskInstance.
+
+    ``status_code`` and ``detail`` are those the single heartbeat endpoint would have responded with.
+    """
+
+    status_code: Annotated[int, Field(title="Status Code")]
+    detail: Annotated[dict[str, Any] | None, Field(title="Detail")] = None
+    refreshed_token: Annotated[str | None, Field(title="Refreshed Token")] = None
+
+
 class TIDeferredStatePayload(BaseModel):
     """
     Schema for updating TaskInstance to a deferred state.
@@ -513,6 +539,39 @@ class VariableResponse(BaseModel):
     value: Annotated[str | None, Field(title="Value")] = None
 
 
+class XComBatchQuery(BaseModel):
+    """
+    A single XCom read in a batch.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+    )
+    dag_id: Annotated[str, Field(title="Dag Id")]
+    run_id: Annotated[str, Field(title="Run Id")]
+    task_id: Annotated[str, Field(title="Task Id")]
+    key: Annotated[str, Field(min_length=1, title="Key")]
+    map_index: Annotated[int | None, Field(title="Map Index")] = -1
+    include_prior_dates: Annotated[bool | None, Field(title="Include Prior Dates")] = False
+
+
+class XComBatchResponse(RootModel[list[list[JsonValue]]]):
+    """
+    XCom values of a batch, in the order of the queries.
+
+    Each query gets a list of values: empty if the XCom was not found, the single value when a map index
+    was given, or the values of all map indexes ordered by map index.
+    """
+
+    root: Annotated[
+        list[list[JsonValue]],
+        Field(
+            description="XCom values of a batch, in the order of the queries.\n\nEach query gets a list of values: empty if the XCom was not found, the single value when a map index\nwas given, or the values of all map indexes ordered by map index.",
+            title="XComBatchResponse",
+        ),
+    ]
+
+
 class XComResponse(BaseModel):
     """
     XCom schema for responses with fields that are needed for Runtime.
@@ -696,6 +755,25 @@ class HTTPValidationError(BaseModel):
     detail: Annotated[list[ValidationError] | None, Field(title="Detail")] = None
 
 
+class TIBulkHeartbeatBody(BaseModel):
+    """
+    Payload for the heartbeats of several TaskInstances in one request.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+    )
+    heartbeats: Annotated[list[TIBulkHeartbeatInfo], Field(title="Heartbeats")]
+
+
+class TIBulkHeartbeatResponse(BaseModel):
+    """
+    Outcome of the heartbeats of several TaskInstances, in the order of the payload.
+    """
+
+    results: Annotated[list[TIBulkHeartbeatResult], Field(title="Results")]
+
+
 class TITerminalStatePayload(BaseModel):
     """
     Schema for updating TaskInstance to a terminal state except SUCCESS state.
@@ -709,6 +787,17 @@ class TITerminalStatePayload(BaseModel):
     rendered_map_index: Annotated[str | None, Field(title="Rendered Map Index")] = None
 
 
+class XComBatchBody(BaseModel):
+    """
+    Payload for reading several XComs in one request.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+    )
+    queries: Annotated[list[XComBatchQuery], Field(title="Queries")]
+
+
 class AssetEventDagRunReference(BaseModel):
     """
     Schema for AssetEvent model used in DagRun.
@@ -18,19 +18,29 @@
 from __future__ import annotations
 
 import collections
-from typing import Any, Protocol
+import itertools
+from typing import TYPE_CHECKING, Any, Protocol
 
 import structlog
 
+from airflow.sdk.api.datamodels._generated import XComBatchQuery
+from airflow.sdk.definitions._internal.types import NOTSET, ArgNotSet, is_arg_set
 from airflow.sdk.execution_time.comms import (
     DeleteXCom,
     GetXCom,
+    GetXComBatch,
     GetXComSequenceSlice,
     SetXCom,
+    XComBatchResult,
     XComResult,
     XComSequenceSliceResult,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from pydantic import JsonValue
+
 # Lightweight wrapper for XCom values
 _XComValueWrapper = collections.namedtuple("_XComValueWrapper", "value")
 
@@ -515,6 +525,162 @@ class BaseXCom:
 
         return [cls.deserialize_value(_XComValueWrapper(value)) for value in msg.root]
 
+    @classmethod
+    def get_batch(
+        cls,
+        *,
+        key: str,
+        dag_id: str,
+        run_id: str,
+        task_ids: Iterable[str],
+        map_indexes: Iterable[int | None] | ArgNotSet = NOTSET,
+        include_prior_dates: bool = False,
+    ) -> list[Any]:
+        """
+        Retrieve the XCom values of several tasks with a single request.
+
+        With ``map_indexes``, this returns what :meth:`get_one` would for each task and map index, in the
+        order of ``itertools.product(task_ids, map_indexes)``. Otherwise, it returns what :meth:`get_all`
+        would for each task. A single XCom, or XCom backends overriding these methods, are read with them.
+
+        :param key: A key for the XComs.
+        :param dag_id: Dag ID to pull XComs from.
+        :param run_id: Dag run ID to pull XComs from.
+        :param task_ids: Task IDs to pull XComs from.
+        :param map_indexes: Map indexes to pull XComs from, or not set to pull all of them.
+        :param include_prior_dates: If *False* (default), only XComs from the specified Dag run are
+            returned. If *True*, the latest matching XComs are returned regardless of the run they belong to.
+        :return: The XCom values, in the order described above.
+        """
+        reads = cls._batch_reads(task_ids, map_indexes)
+        if len(reads) < 2 or not cls._reads_through_supervisor("get_one", "get_all"):
+            return [
+                cls.get_all(
+                    key=key,
+                    dag_id=dag_id,
+                    task_id=task_id,
+                    run_id=run_id,
+                    include_prior_dates=include_prior_dates,
+                )
+                if map_index is NOTSET
+                else cls.get_one(
+                    key=key,
+                    dag_id=dag_id,
+                    task_id=task_id,
+                    run_id=run_id,
+                    map_index=map_index,
+                    include_prior_dates=include_prior_dates,
+                )
+                for task_id, map_index in reads
+            ]
+
+        from airflow.sdk.execution_time.task_runner import SUPERVISOR_COMMS
+
+        msg = SUPERVISOR_COMMS.send(cls._batch_msg(key, dag_id, run_id, reads, include_prior_dates))
+
+        if not isinstance(msg, XComBatchResult):
+            raise TypeError(f"Expected XComBatchResult, received: {type(msg)} {msg}")
+
+        return [
+            cls._deserialize_batch_values(key, values, all_map_indexes=not is_arg_set(map_indexes))
+            for values in msg.root
+        ]
+
+    @classmethod
+    async def aget_batch(
+        cls,
+        *,
+        key: str,
+        dag_id: str,
+        run_id: str,
+        task_ids: Iterable[str],
+        map_indexes: Iterable[int | None] | ArgNotSet = NOTSET,
+        include_prior_dates: bool = False,
+    ) -> list[Any]:
+        """
+        Retrieve the XCom values of several tasks asynchronously with a single request.
+
+        Async version of :meth:`get_batch`; see that method for full documentation.
+        """
+        reads = cls._batch_reads(task_ids, map_indexes)
+        if len(reads) < 2 or not cls._reads_through_supervisor("aget_one", "aget_all"):
+            return [
+                await cls.aget_all(
+                    key=key,
+                    dag_id=dag_id,
+                    task_id=task_id,
+                    run_id=run_id,
+                    include_prior_dates=include_prior_dates,
+                )
+                if map_index is NOTSET
+                else await cls.aget_one(
+                    key=key,
+                    dag_id=dag_id,
+                    task_id=task_id,
+                    run_id=run_id,
+                    map_index=map_index,
+                    include_prior_dates=include_prior_dates,
+                )
+                for task_id, map_index in reads
+            ]
+
+        from airflow.sdk.execution_time.task_runner import SUPERVISOR_COMMS
+
+        msg = await SUPERVISOR_COMMS.asend(cls._batch_msg(key, dag_id, run_id, reads, include_prior_dates))
+
+        if not isinstance(msg, XComBatchResult):
+            raise TypeError(f"Expected XComBatchResult, received: {type(msg)} {msg}")
+
+        return [
+            cls._deserialize_batch_values(key, values, all_map_indexes=not is_arg_set(map_indexes))
+            for values in msg.root
+        ]
+
+    @staticmethod
+    def _batch_reads(
+        task_ids: Iterable[str], map_indexes: Iterable[int | None] | ArgNotSet
+    ) -> list[tuple[str, int | None | ArgNotSet]]:
+        if not is_arg_set(map_indexes):
+            return [(task_id, NOTSET) for task_id in task_ids]
+        return list(itertools.product(task_ids, map_indexes))
+
+    @classmethod
+    def _reads_through_supervisor(cls, *methods: str) -> bool:
+        """Whether the XCom backend leaves the given read methods to BaseXCom."""
+        return all(getattr(getattr(cls, name), "__func__", None) is _BASE_READS[name] for name in methods)
+
+    @staticmethod
+    def _batch_msg(
+        key: str,
+        dag_id: str,
+        run_id: str,
+        reads: list[tuple[str, int | None | ArgNotSet]],
+        include_prior_dates: bool,
+    ) -> GetXComBatch:
+        return GetXComBatch(
+            queries=[
+                XComBatchQuery(
+                    dag_id=dag_id,
+                    run_id=run_id,
+                    task_id=task_id,
+                    key=key,
+                    # A batch query without map index reads all of them, while get_one reads -1
+                    map_index=None if map_index is NOTSET else (-1 if map_index is None else map_index),
+                    include_prior_dates=include_prior_dates,
+                )
+                for task_id, map_index in reads
+            ]
+        )
+
+    @classmethod
+    def _deserialize_batch_values(cls, key: str, values: list[JsonValue], *, all_map_indexes: bool) -> Any:
+        if all_map_indexes:
+            # Same as get_all: the values of all map indexes, or None if there are none
+            return [cls.deserialize_value(_XComValueWrapper(value)) for value in values] if values else None
+        if not values or values[0] is None:
+            return None
+        return cls.deserialize_value(XComResult(key=key, value=values[0]))
+
     @staticmethod
     def serialize_value(
         value: Any,
@@ -572,3 +738,9 @@ class BaseXCom:
                 map_index=map_index,
             ),
         )
+
+
+# The read methods of BaseXCom, to tell whether an XCom backend overrides them
+_BASE_READS = {
+    name: getattr(BaseXCom, name).__func__ for name in ("get_one", "get_all", "aget_one", "aget_all")
+}
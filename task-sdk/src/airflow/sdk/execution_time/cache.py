@@ -18,41 +18,139 @@
 from __future__ import annotations
 
 import datetime
+import hashlib
+import mmap
 import multiprocessing
+import struct
+import time
+from collections.abc import Iterator
+
+
+class _SharedTable:
+    """
+    Fixed-size hash table stored in memory shared with the processes forked after its creation.
+
+    Each key is stored in one of the ``_PROBES`` slots following its hash, along with the time it was
+    saved at. Reads take no lock: each slot carries a sequence number, odd while being written, which
+    readers check before and after copying the slot, treating torn reads as misses. Writes are
+    serialized by a lock, and evict the oldest entry of the probed slots when all are taken. Entries
+    which don't fit in a slot are not stored.
+    """
+
+    _HEADER = struct.Struct("<IQdBHI")  # sequence, key hash, saved at, kind, key length, value length
+    _SEQUENCE = struct.Struct("<I")
+    _PROBES = 8
+
+    EMPTY, VALUE, MISSING = range(3)
+
+    def __init__(self, slots: int, slot_size: int) -> None:
+        self._slots = slots
+        self._slot_size = slot_size
+        # Anonymous mappings are shared (MAP_SHARED) with forked processes
+        self._buffer = mmap.mmap(-1, slots * slot_size)
+        self._lock = multiprocessing.Lock()
+
+    @staticmethod
+    def _hash(key: bytes) -> int:
+        # Unlike hash(), the same in all processes regardless of PYTHONHASHSEED
+        return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+    def _probe(self, key_hash: int) -> Iterator[int]:
+        for i in range(self._PROBES):
+            yield (key_hash + i) % self._slots * self._slot_size
+
+    def _read_key(self, offset: int, key_length: int) -> bytes:
+        start = offset + self._HEADER.size
+        return self._buffer[start : start + key_length]
+
+    def get(self, key: bytes) -> tuple[int, float, bytes] | None:
+        """Return the kind, save time and value of the entry of ``key``, or None if absent."""
+        key_hash = self._hash(key)
+        for offset in self._probe(key_hash):
+            sequence, slot_hash, saved_at, kind, key_length, value_length = self._HEADER.unpack_from(
+                self._buffer, offset
+            )
+            if kind == self.EMPTY or slot_hash != key_hash or sequence % 2:
+                continue
+            start = offset + self._HEADER.size
+            data = self._buffer[start : start + key_length + value_length]
+            if self._SEQUENCE.unpack_from(self._buffer, offset)[0] != sequence:
+                # Overwritten while being read
+                return None
+            if data[:key_length] == key:
+                return kind, saved_at, data[key_length:]
+        return None
+
+    def _write(self, offset: int, *fields, data: bytes = b"") -> None:
+        (sequence,) = self._SEQUENCE.unpack_from(self._buffer, offset)
+        self._SEQUENCE.pack_into(self._buffer, offset, (sequence + 1) & 0xFFFFFFFF)
+        self._buffer[offset + self._HEADER.size : offset + self._HEADER.size + len(data)] = data
+        self._HEADER.pack_into(self._buffer, offset, (sequence + 1) & 0xFFFFFFFF, *fields)
+        self._SEQUENCE.pack_into(self._buffer, offset, (sequence + 2) & 0xFFFFFFFF)
+
+    def _find_slot(self, key: bytes, key_hash: int) -> tuple[int | None, int]:
+        """Return the offset of the slot of ``key`` if present, and the one to store it otherwise."""
+        free = None
+        oldest, oldest_saved_at = next(self._probe(key_hash)), float("inf")
+        for offset in self._probe(key_hash):
+            _, slot_hash, saved_at, kind, key_length, _ = self._HEADER.unpack_from(self._buffer, offset)
+            if kind == self.EMPTY:
+                if free is None:
+                    free = offset
+            elif slot_hash == key_hash and self._read_key(offset, key_length) == key:
+                return offset, offset
+            elif saved_at < oldest_saved_at:
+                oldest, oldest_saved_at = offset, saved_at
+        return None, free if free is not None else oldest
+
+    def put(self, key: bytes, kind: int, value: bytes = b"") -> None:
+        if self._HEADER.size + len(key) + len(value) > self._slot_size:
+            return
+        key_hash = self._hash(key)
+        with self._lock:
+            _, offset = self._find_slot(key, key_hash)
+            self._write(offset, key_hash, time.time(), kind, len(key), len(value), data=key + value)
+
+    def delete(self, key: bytes) -> None:
+        key_hash = self._hash(key)
+        with self._lock:
+            offset, _ = self._find_slot(key, key_hash)
+            if offset is not None:
+                self._write(offset, 0, 0.0, self.EMPTY, 0, 0)
 
 
 class SecretCache:
-    """A static class to manage the global secret cache."""
+    """
+    A static class to manage the global secret cache.
+
+    The cache is stored in shared memory, so that Variables and Connections retrieved by a process are
+    available to all the processes forked from the one which initialized the cache (e.g. by the Dag
+    file processors forked by the Dag processor), without any inter-process call. Lookups that found
+    nothing in the secrets backends are cached too.
+    """
 
-    __manager: multiprocessing.managers.SyncManager | None = None
-    _cache: dict[str, _CacheValue] | None = None
+    _cache: _SharedTable | None = None
     _ttl: datetime.timedelta
 
     class NotPresentException(Exception):
         """Raised when a key is not present in the cache."""
 
-    class _CacheValue:
-        def __init__(self, value: str | None) -> None:
-            from airflow.sdk import timezone
-
-            self.value = value
-            self.date = timezone.utcnow()
-
-        def is_expired(self, ttl: datetime.timedelta) -> bool:
-            from airflow.sdk import timezone
-
-            return timezone.utcnow() - self.date > ttl
+    class MissingException(NotPresentException):
+        """Raised when a key is cached as not present in any secrets backend."""
 
     _VARIABLE_PREFIX = "__v_"
     _CONNECTION_PREFIX = "__c_"
     _TEAM_PATTERN = "_{}_"
 
+    _SLOT_SIZE = 8192
+    """Maximum size of an entry, in bytes. Larger Variables and Connections are not cached."""
+
     @classmethod
     def init(cls):
         """
         Initialize the cache, provided the configuration allows it.
 
-        Safe to call several times.
+        Safe to call several times. Needs to be called before forking the processes sharing the cache.
         """
         if cls._cache is not None:
             return
@@ -61,11 +159,8 @@ class SecretCache:
         use_cache = conf.getboolean(section="secrets", key="use_cache", fallback=False)
         if not use_cache:
             return
-        if cls.__manager is None:
-            # it is not really necessary to save the manager, but doing so allows to reuse it between tests,
-            # making them run a lot faster because this operation takes ~300ms each time
-            cls.__manager = multiprocessing.Manager()
-        cls._cache = cls.__manager.dict()
+        entries = conf.getint(section="secrets", key="cache_entries", fallback=1024)
+        cls._cache = _SharedTable(max(entries, 1), cls._SLOT_SIZE)
         ttl_seconds = conf.getint(section="secrets", key="cache_ttl_seconds", fallback=15 * 60)
         cls._ttl = datetime.timedelta(seconds=ttl_seconds)
 
@@ -74,6 +169,11 @@ class SecretCache:
         """Use for test purposes only."""
         cls._cache = None
 
+    @classmethod
+    def _key(cls, key: str, prefix: str, team_name: str | None) -> bytes:
+        team = cls._TEAM_PATTERN.format(team_name) if team_name else ""
+        return f"{prefix}{team}{key}".encode()
+
     @classmethod
     def get_variable(cls, key: str, team_name: str | None = None) -> str | None:
         """
@@ -85,7 +185,10 @@ class SecretCache:
         :return: The saved value (which can be None) if present in cache and not expired,
             a NotPresent exception otherwise.
         """
-        return cls._get(key, cls._VARIABLE_PREFIX, team_name=team_name)
+        try:
+            return cls._get(key, cls._VARIABLE_PREFIX, team_name=team_name)
+        except cls.MissingException:
+            return None
 
     @classmethod
     def get_connection_uri(cls, conn_id: str, team_name: str | None = None) -> str:
@@ -96,7 +199,8 @@ class SecretCache:
         :param team_name: The team name associated to the connection (if any).
 
         :return: The saved uri if present in cache and not expired,
-            a NotPresent exception otherwise.
+            a NotPresent exception otherwise, or a Missing exception if the connection was saved
+            as missing.
         """
         val = cls._get(conn_id, cls._CONNECTION_PREFIX, team_name=team_name)
         if val:  # there shouldn't be any empty entries in the connections cache, but we enforce it here.
@@ -109,12 +213,15 @@ class SecretCache:
             # using an exception for misses allow to meaningfully cache None values
             raise cls.NotPresentException
 
-        team = cls._TEAM_PATTERN.format(team_name) if team_name else ""
-
-        val = cls._cache.get(f"{prefix}{team}{key}")
-        if val and not val.is_expired(cls._ttl):
-            return val.value
-        raise cls.NotPresentException
+        entry = cls._cache.get(cls._key(key, prefix, team_name))
+        if entry is None:
+            raise cls.NotPresentException
+        kind, saved_at, value = entry
+        if time.time() - saved_at > cls._ttl.total_seconds():
+            raise cls.NotPresentException
+        if kind == _SharedTable.MISSING:
+            raise cls.MissingException
+        return value.decode()
 
     @classmethod
     def save_variable(cls, key: str, value: str | None, team_name: str | None = None):
@@ -129,16 +236,21 @@ class SecretCache:
             return
         cls._save(conn_id, uri, cls._CONNECTION_PREFIX, team_name=team_name)
 
+    @classmethod
+    def save_connection_missing(cls, conn_id: str, team_name: str | None = None):
+        """Save that the connection is not defined in any secrets backend, if initialized."""
+        cls._save(conn_id, None, cls._CONNECTION_PREFIX, team_name=team_name)
+
     @classmethod
     def _save(cls, key: str, value: str | None, prefix: str, team_name: str | None = None):
         if cls._cache is not None:
-            team = cls._TEAM_PATTERN.format(team_name) if team_name else ""
-            cls._cache[f"{prefix}{team}{key}"] = cls._CacheValue(value)
+            if value is None:
+                cls._cache.put(cls._key(key, prefix, team_name), _SharedTable.MISSING)
+            else:
+                cls._cache.put(cls._key(key, prefix, team_name), _SharedTable.VALUE, value.encode())
 
     @classmethod
     def invalidate_variable(cls, key: str, team_name: str | None = None):
         """Invalidate (actually removes) the value stored in the cache for that Variable."""
         if cls._cache is not None:
-            team = cls._TEAM_PATTERN.format(team_name) if team_name else ""
-            # second arg ensures no exception if key is absent
-            cls._cache.pop(f"{cls._VARIABLE_PREFIX}{team}{key}", None)
+            cls._cache.delete(cls._key(key, cls._VARIABLE_PREFIX, team_name))
@@ -94,6 +94,8 @@ from airflow.sdk.api.datamodels._generated import (
     TriggerDAGRunPayload,
     UpdateHITLDetailPayload,
     VariableResponse,
+    XComBatchQuery,
+    XComBatchResponse,
     XComResponse,
     XComSequenceIndexResponse,
     XComSequenceSliceResponse,
@@ -238,6 +240,15 @@ class CommsDecoder(Generic[ReceiveMsgType, SendMsgType]):
 
             return self._get_response()
 
+    def receive(self) -> ReceiveMsgType | None:
+        """
+        Block until the parent sends a message that is not the response to a request.
+
+        :raises EOFError: if the parent closed the socket.
+        """
+        with self._thread_lock:
+            return self._get_response()
+
     async def asend(self, msg: SendMsgType) -> ReceiveMsgType | None:
         """
         Send a request to the parent without blocking.
@@ -513,6 +524,15 @@ class XComCountResponse(BaseModel):
     type: Literal["XComCountResponse"] = "XComCountResponse"
 
 
+class XComBatchResult(BaseModel):
+    root: list[list[JsonValue]]
+    type: Literal["XComBatchResult"] = "XComBatchResult"
+
+    @classmethod
+    def from_response(cls, response: XComBatchResponse) -> XComBatchResult:
+        return cls(root=response.root, type="XComBatchResult")
+
+
 class XComSequenceIndexResult(BaseModel):
     root: JsonValue
     type: Literal["XComSequenceIndexResult"] = "XComSequenceIndexResult"
@@ -791,6 +811,7 @@ ToTask = Annotated[
     | TaskStatesResult
     | VariableResult
     | VariableKeysResult
+    | XComBatchResult
     | XComCountResponse
     | XComResult
     | XComSequenceIndexResult
@@ -869,6 +890,13 @@ class GetXCom(BaseModel):
     type: Literal["GetXCom"] = "GetXCom"
 
 
+class GetXComBatch(BaseModel):
+    """Get the values of several XComs with a single request."""
+
+    queries: list[XComBatchQuery]
+    type: Literal["GetXComBatch"] = "GetXComBatch"
+
+
 class GetXComCount(BaseModel):
     """Get the number of (mapped) XCom values available."""
 
@@ -1229,6 +1257,7 @@ ToSupervisor = Annotated[
     | GetVariable
     | GetVariableKeys
     | GetXCom
+    | GetXComBatch
     | GetXComCount
     | GetXComSequenceItem
     | GetXComSequenceSlice
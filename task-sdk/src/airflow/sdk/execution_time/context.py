@@ -193,12 +193,15 @@ def _get_connection(conn_id: str) -> Connection:
         conn = Connection.from_uri(uri, conn_id=conn_id)
         _mask_connection_secrets(conn)
         return conn
+    except SecretCache.MissingException:
+        raise AirflowNotFoundException(f"The conn_id `{conn_id}` isn't defined") from None
     except SecretCache.NotPresentException:
         pass  # continue to backends
 
     # Iterate over configured backends (which may include SupervisorCommsSecretsBackend
     # in worker contexts or MetastoreBackend in API server contexts)
     backends = ensure_secrets_backend_loaded()
+    backend_failed = False
     for secrets_backend in backends:
         try:
             conn = secrets_backend.get_connection(conn_id=conn_id)  # type: ignore[assignment]
@@ -210,6 +213,7 @@ def _get_connection(conn_id: str) -> Connection:
             # Authoritative deny — must NOT fall through to a less-restrictive backend.
             raise
         except Exception:
+            backend_failed = True
             log.debug(
                 "Unable to retrieve connection from secrets backend (%s). "
                 "Checking subsequent secrets backend.",
@@ -218,7 +222,8 @@ def _get_connection(conn_id: str) -> Connection:
             )
 
     # If no backend found the connection, raise an error
-
+    if not backend_failed:
+        SecretCache.save_connection_missing(conn_id)
     raise AirflowNotFoundException(f"The conn_id `{conn_id}` isn't defined")
 
 
@@ -241,6 +246,8 @@ async def _async_get_connection(conn_id: str) -> Connection:
         conn = Connection.from_uri(uri, conn_id=conn_id)
         _mask_connection_secrets(conn)
         return conn
+    except SecretCache.MissingException:
+        raise AirflowNotFoundException(f"The conn_id `{conn_id}` isn't defined") from None
     except SecretCache.NotPresentException:
         pass  # continue to backends
 
@@ -248,6 +255,7 @@ async def _async_get_connection(conn_id: str) -> Connection:
 
     # Try secrets backends
     backends = ensure_secrets_backend_loaded()
+    backend_failed = False
     for secrets_backend in backends:
         try:
             # Use async method if available, otherwise wrap sync method
@@ -268,6 +276,7 @@ async def _async_get_connection(conn_id: str) -> Connection:
             raise
         except Exception:
             # If one backend fails, try the next one
+            backend_failed = True
             log.debug(
                 "Unable to retrieve connection from secrets backend (%s). "
                 "Checking subsequent secrets backend.",
@@ -276,7 +285,8 @@ async def _async_get_connection(conn_id: str) -> Connection:
             )
 
     # If no backend found the connection, raise an error
-
+    if not backend_failed:
+        SecretCache.save_connection_missing(conn_id)
     raise AirflowNotFoundException(f"The conn_id `{conn_id}` isn't defined")
 
 
@@ -287,18 +297,21 @@ def _get_variable(key: str, deserialize_json: bool) -> Any:
     # Check cache first
     try:
         var_val = SecretCache.get_variable(key)
-        if var_val is not None:
-            if deserialize_json:
-                import json
-
-                var_val = json.loads(var_val)
-            if isinstance(var_val, str):
-                mask_secret(var_val, key)
-            return var_val
+        if var_val is None:
+            # Cached as not found in any backend
+            raise _variable_not_found(key)
+        if deserialize_json:
+            import json
+
+            var_val = json.loads(var_val)
+        if isinstance(var_val, str):
+            mask_secret(var_val, key)
+        return var_val
     except SecretCache.NotPresentException:
         pass  # Continue to check backends
 
     backends = ensure_secrets_backend_loaded()
+    backend_failed = False
 
     # Iterate over backends if not in cache (or expired)
     for secrets_backend in backends:
@@ -318,16 +331,23 @@ def _get_variable(key: str, deserialize_json: bool) -> Any:
             # Authoritative deny — must NOT fall through to a less-restrictive backend.
             raise
         except Exception:
+            backend_failed = True
             log.exception(
                 "Unable to retrieve variable from secrets backend (%s). Checking subsequent secrets backend.",
                 type(secrets_backend).__name__,
             )
 
     # If no backend found the variable, raise a not found error (mirrors _get_connection)
+    if not backend_failed:
+        SecretCache.save_variable(key, None)
+    raise _variable_not_found(key)
+
+
+def _variable_not_found(key: str) -> Exception:
     from airflow.sdk.exceptions import AirflowRuntimeError, ErrorType
     from airflow.sdk.execution_time.comms import ErrorResponse
 
-    raise AirflowRuntimeError(
+    return AirflowRuntimeError(
         ErrorResponse(error=ErrorType.VARIABLE_NOT_FOUND, detail={"message": f"Variable {key} not found"})
     )
 
@@ -0,0 +1,225 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Cache of Dag files parsed by the supervisor, inherited by the task processes it forks.
+
+Every task process parses the Dag file of its task before running it, which for slow to import
+files can take longer than the task itself. When ``[workers] parsed_dag_cache_size`` is set, the
+supervisor parses the Dag file before forking the task process instead, and keeps the result for
+the next tasks of the same Dag started by this worker process. As the task process is forked from
+the supervisor, it inherits the already-imported Dag (and the libraries it imports) rather than
+importing the file again.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+from airflow.sdk.configuration import conf
+from airflow.sdk.definitions.context import _AIRFLOW_PARSING_CONTEXT_DAG_ID, _AIRFLOW_PARSING_CONTEXT_TASK_ID
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+    from structlog.typing import FilteringBoundLogger
+
+    from airflow.sdk.api.datamodels._generated import BundleInfo
+    from airflow.sdk.definitions.dag import DAG
+
+
+class _ParsedDag(NamedTuple):
+    dag: DAG
+    bundle_path: Path
+    fileloc: str
+    mtime: float
+    modules: dict[str, ModuleType]
+    """Modules imported from the bundle while parsing, removed from ``sys.modules`` of the supervisor."""
+
+
+_cache: OrderedDict[tuple[str, str | None, str, str], _ParsedDag] = OrderedDict()
+_lock = threading.Lock()
+
+
+def _cache_key(bundle_info: BundleInfo, dag_rel_path: str | os.PathLike[str], dag_id: str):
+    return bundle_info.name, bundle_info.version, os.fspath(dag_rel_path), dag_id
+
+
+def _is_fresh(entry: _ParsedDag) -> bool:
+    # Versioned bundles never change, but the files of unversioned ones can be updated in place.
+    try:
+        return os.stat(entry.fileloc).st_mtime == entry.mtime
+    except OSError:
+        return False
+
+
+@contextmanager
+def _parsing_context(dag_id: str):
+    """Parse with the context of the whole Dag, so that the result can be used by all its tasks."""
+    saved = {
+        key: os.environ.pop(key, None)
+        for key in (_AIRFLOW_PARSING_CONTEXT_DAG_ID, _AIRFLOW_PARSING_CONTEXT_TASK_ID)
+    }
+    os.environ[_AIRFLOW_PARSING_CONTEXT_DAG_ID] = dag_id
+    try:
+        yield
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def _parse(bundle_info: BundleInfo, dag_rel_path: str | os.PathLike[str], dag_id: str) -> _ParsedDag | None:
+    from airflow.dag_processing.bundles.base import BundleVersionLock
+    from airflow.dag_processing.bundles.manager import DagBundlesManager
+    from airflow.dag_processing.dagbag import DagBag
+
+    bundle = DagBundlesManager().get_bundle(name=bundle_info.name, version=bundle_info.version)
+    bundle.initialize()
+    fileloc = os.fspath(Path(bundle.path, dag_rel_path))
+    bundle_path = str(bundle.path)
+
+    # Like BundleDagBag, but without leaving the bundle in sys.path and its modules in sys.modules of the
+    # long-running supervisor: the next version of the bundle must not import them from there.
+    added_to_path = bundle_path not in sys.path
+    if added_to_path:
+        sys.path.append(bundle_path)
+    loaded_modules = set(sys.modules)
+    try:
+        with (
+            BundleVersionLock(bundle_name=bundle.name, bundle_version=bundle.version),
+            _parsing_context(dag_id),
+        ):
+            mtime = os.stat(fileloc).st_mtime
+            bag = DagBag(
+                dag_folder=fileloc,
+                safe_mode=False,
+                load_op_links=False,
+                bundle_path=bundle.path,
+                bundle_name=bundle_info.name,
+            )
+    finally:
+        if added_to_path:
+            sys.path.remove(bundle_path)
+        modules = {
+            name: module
+            for name in set(sys.modules) - loaded_modules
+            if (module := sys.modules[name]) is not None
+            and (getattr(module, "__file__", None) or "").startswith(bundle_path + os.sep)
+        }
+        for name in modules:
+            del sys.modules[name]
+
+    if (dag := bag.dags.get(dag_id)) is None:
+        # Let the task process parse the file again, and report the error
+        return None
+    return _ParsedDag(dag, Path(bundle.path), fileloc, mtime, modules)
+
+
+def preparse_dag_file(
+    *,
+    bundle_info: BundleInfo,
+    dag_rel_path: str | os.PathLike[str],
+    dag_id: str,
+    log: FilteringBoundLogger,
+) -> None:
+    """
+    Parse the Dag file of a task about to be forked, unless already cached.
+
+    The import is bounded by the per-file ``[core] dagbag_import_timeout``, as in the Dag processor, since
+    the task instance is not started yet and nothing else would notice it hanging. It is left to the task
+    process when it cannot be bounded, and failures are logged and otherwise ignored: the task process then
+    parses the file itself.
+    """
+    size = conf.getint("workers", "parsed_dag_cache_size", fallback=0)
+    if size <= 0:
+        return
+    if threading.current_thread() is not threading.main_thread():
+        # The import timeout relies on SIGALRM, which is only delivered to the main thread
+        log.info(
+            "Not parsing the Dag file before starting the task outside of the main thread",
+            dag_file=os.fspath(dag_rel_path),
+        )
+        return
+    key = _cache_key(bundle_info, dag_rel_path, dag_id)
+    with _lock:
+        entry = _cache.get(key)
+        if entry is not None and _is_fresh(entry):
+            _cache.move_to_end(key)
+            return
+
+        start = time.monotonic()
+        try:
+            entry = _parse(bundle_info, dag_rel_path, dag_id)
+        except (Exception, SystemExit):
+            # Dag files calling sys.exit() must not stop the worker
+            log.warning(
+                "Failed to parse the Dag file before starting the task", dag_file=dag_rel_path, exc_info=True
+            )
+            entry = None
+        if entry is None:
+            _cache.pop(key, None)
+            return
+        log.info(
+            "Parsed the Dag file before starting the task",
+            bundle_name=bundle_info.name,
+            bundle_version=bundle_info.version,
+            dag_file=os.fspath(dag_rel_path),
+            dag_id=dag_id,
+            dag_file_parse_ms=int((time.monotonic() - start) * 1000),
+        )
+        _cache[key] = entry
+        while len(_cache) > size:
+            _cache.popitem(last=False)
+
+
+def get_parsed_dag(
+    *,
+    bundle_info: BundleInfo,
+    dag_rel_path: str | os.PathLike[str],
+    dag_id: str,
+    bundle_path: Path,
+) -> DAG | None:
+    """
+    Return the Dag parsed by the supervisor before forking the task process, if any.
+
+    The modules imported from the bundle while parsing are made importable again, as they would
+    be after parsing the file in the task process.
+    """
+    entry = _cache.get(_cache_key(bundle_info, dag_rel_path, dag_id))
+    if entry is None or entry.bundle_path != bundle_path or not _is_fresh(entry):
+        return None
+    if str(bundle_path) not in sys.path:
+        sys.path.append(str(bundle_path))
+    for name, module in entry.modules.items():
+        sys.modules.setdefault(name, module)
+    return entry.dag
+
+
+def clear() -> None:
+    """Drop all the parsed Dags."""
+    with _lock:
+        _cache.clear()
@@ -0,0 +1,311 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Heartbeats of all the task instances running on a host, sent with one request per interval.
+
+Each supervisor normally heartbeats its task instance itself, so a host running N tasks sends N
+requests per ``[workers] min_heartbeat_interval``, each updating one row. When
+``[workers] aggregate_heartbeats`` is set, the executor instead creates ``HeartbeatSlots`` in shared
+memory before starting its worker processes, and runs a ``HeartbeatAggregator`` thread. Each worker
+process claims a slot, in which its supervisors register the task instance they run. The aggregator
+sends the heartbeats of all the registered task instances in one bulk request, and writes the outcome
+of each back to its slot, where the supervisor reads it instead of calling the API server.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import json
+import multiprocessing
+import os
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any, NamedTuple
+from uuid import UUID
+
+import httpx
+import structlog
+
+from airflow.sdk.api.datamodels._generated import TIBulkHeartbeatInfo
+
+if TYPE_CHECKING:
+    from airflow.sdk.api.client import Client
+
+log = structlog.get_logger(__name__)
+
+# Status code recorded when the bulk request itself failed, e.g. as the API server couldn't be reached
+REQUEST_FAILED = 0
+
+
+class _Slot(ctypes.Structure):
+    _fields_ = [
+        # PID of the worker process using this slot, 0 if free
+        ("owner", ctypes.c_int),
+        # Incremented on each registration, so that the outcomes of heartbeats of previous ones are ignored
+        ("generation", ctypes.c_uint64),
+        ("ti_id", ctypes.c_char * 36),
+        ("pid", ctypes.c_int),
+        ("token", ctypes.c_char * 2048),
+        ("refreshed_token", ctypes.c_char * 2048),
+        # Number of heartbeats sent since the registration
+        ("attempts", ctypes.c_uint64),
+        ("status_code", ctypes.c_int),
+        ("detail", ctypes.c_char * 1024),
+    ]
+
+
+class HeartbeatResult(NamedTuple):
+    """Outcome of the last heartbeat sent for the task instance registered in a slot."""
+
+    attempts: int
+    status_code: int
+    detail: dict[str, Any] | None
+
+
+class HeartbeatSlots:
+    """
+    Fixed number of heartbeat slots, in memory shared with the processes started after their creation.
+
+    Instances can be passed to ``multiprocessing.Process`` with either start method.
+    """
+
+    def __init__(self, size: int) -> None:
+        self._slots = multiprocessing.RawArray(_Slot, size)
+        self._lock = multiprocessing.Lock()
+
+    def claim(self) -> HeartbeatSlot:
+        """Claim a free slot for the current process, and use it for the supervisors it runs."""
+        global _process_slot
+
+        with self._lock:
+            index = next((index for index, slot in enumerate(self._slots) if not slot.owner), None)
+            if index is None:
+                raise RuntimeError(f"All the {len(self._slots)} heartbeat slots are already claimed")
+            self._slots[index].owner = os.getpid()
+            self._slots[index].ti_id = b""
+        _process_slot = HeartbeatSlot(self, index)
+        return _process_slot
+
+    def release(self, owner: int) -> None:
+        """Free the slot claimed by the process ``owner``, e.g. after it exited."""
+        with self._lock:
+            for slot in self._slots:
+                if slot.owner == owner:
+                    slot.owner = 0
+                    slot.ti_id = b""
+
+    def collect(self, hostname: str) -> list[tuple[int, int, TIBulkHeartbeatInfo]]:
+        """Return the index, generation and heartbeat of all the registered task instances."""
+        with self._lock:
+            return [
+                (
+                    index,
+                    slot.generation,
+                    TIBulkHeartbeatInfo(
+                        id=UUID(slot.ti_id.decode()),
+                        hostname=hostname,
+                        pid=slot.pid,
+                        token=slot.token.decode(),
+                    ),
+                )
+                for index, slot in enumerate(self._slots)
+                if slot.owner and slot.ti_id
+            ]
+
+    def record(
+        self,
+        index: int,
+        generation: int,
+        status_code: int,
+        detail: dict[str, Any] | None = None,
+        refreshed_token: str | None = None,
+    ) -> None:
+        """Record the outcome of a heartbeat, unless the slot was registered again since it was sent."""
+        encoded_detail = json.dumps(detail).encode() if detail else b""
+        if len(encoded_detail) >= _DETAIL_SIZE:
+            encoded_detail = json.dumps({"message": str(detail)[: _DETAIL_SIZE // 2]}).encode()
+        with self._lock:
+            slot = self._slots[index]
+            if slot.generation != generation or not slot.ti_id:
+                return
+            slot.attempts += 1
+            slot.status_code = status_code
+            slot.detail = encoded_detail
+            if refreshed_token and len(refreshed_token.encode()) < _TOKEN_SIZE:
+                slot.token = slot.refreshed_token = refreshed_token.encode()
+
+
+class HeartbeatSlot:
+    """The slot claimed by a worker process, used by the supervisor of the task instance it runs."""
+
+    def __init__(self, slots: HeartbeatSlots, index: int) -> None:
+        self._slots = slots
+        self._index = index
+
+    @property
+    def _slot(self) -> _Slot:
+        return self._slots._slots[self._index]
+
+    def register(self, ti_id: UUID, pid: int, token: str | None) -> bool:
+        """
+        Heartbeat the task instance ``ti_id`` running in process ``pid`` from now on.
+
+        :return: False if the task instance can't be heartbeat from the slot, e.g. as its token is too long,
+            in which case its supervisor should heartbeat it itself.
+        """
+        if not isinstance(token, str) or len(token.encode()) >= _TOKEN_SIZE:
+            return False
+        with self._slots._lock:
+            slot = self._slot
+            slot.generation += 1
+            slot.ti_id = str(ti_id).encode()
+            slot.pid = pid
+            slot.token = token.encode()
+            slot.refreshed_token = b""
+            slot.attempts = 0
+            slot.status_code = REQUEST_FAILED
+            slot.detail = b""
+        return True
+
+    def unregister(self) -> None:
+        """Stop heartbeating the task instance registered in the slot."""
+        with self._slots._lock:
+            self._slot.ti_id = b""
+
+    def result(self) -> HeartbeatResult:
+        """Return the outcome of the last heartbeat sent since the task instance was registered."""
+        with self._slots._lock:
+            slot = self._slot
+            return HeartbeatResult(
+                attempts=slot.attempts,
+                status_code=slot.status_code,
+                detail=json.loads(slot.detail) if slot.detail else None,
+            )
+
+    def sync_token(self, token: str) -> str:
+        """
+        Exchange tokens with the aggregator, and return the newest one.
+
+        Return the token refreshed by the API server in response to a heartbeat if there is one, otherwise
+        store ``token`` -- which the supervisor's client may have had refreshed in the meantime -- for the
+        next heartbeats.
+        """
+        with self._slots._lock:
+            slot = self._slot
+            if slot.refreshed_token:
+                token = slot.refreshed_token.decode()
+                slot.refreshed_token = b""
+            elif len(token.encode()) < _TOKEN_SIZE:
+                slot.token = token.encode()
+        return token
+
+
+_TOKEN_SIZE = _Slot.token.size
+_DETAIL_SIZE = _Slot.detail.size
+
+_process_slot: HeartbeatSlot | None = None
+
+
+def get_process_slot() -> HeartbeatSlot | None:
+    """Return the slot claimed by the current process, if any."""
+    if _process_slot is not None and _process_slot._slot.owner != os.getpid():
+        # Claimed by the process this one was forked from
+        return None
+    return _process_slot
+
+
+class HeartbeatAggregator:
+    """
+    Thread sending the heartbeats of all the task instances registered in ``slots``, every ``interval``.
+
+    :param slots: The slots claimed by the worker processes of the executor.
+    :param client: The client used to send the heartbeats. Each request is authenticated with the token
+        of one of the task instances, and each heartbeat by the token of its own task instance. The
+        request is sent again with the token of the next task instance if that token is rejected.
+    :param interval: Seconds between two bulk requests.
+    """
+
+    def __init__(self, slots: HeartbeatSlots, client: Client, interval: float) -> None:
+        self.slots = slots
+        self.client = client
+        self.interval = interval
+        self._stop = threading.Event()
+        self._sending = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="heartbeat-aggregator", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    @contextmanager
+    def paused(self) -> Iterator[None]:
+        """Wait for the heartbeats being sent, and send none until exiting, e.g. to fork meanwhile."""
+        with self._sending:
+            yield
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                with self._sending:
+                    self.send_heartbeats()
+            except Exception:
+                log.exception("Failed to send heartbeats")
+
+    def send_heartbeats(self) -> None:
+        """Send the heartbeats of all the registered task instances, and record their outcome."""
+        from airflow.sdk.api.client import BearerAuth, get_hostname
+
+        registered = self.slots.collect(get_hostname())
+        while registered:
+            # The request is authenticated with the token of any of the task instances, and each heartbeat by
+            # the token of its own one. Should the token of the request be rejected, e.g. as it expired, only
+            # that task instance fails to heartbeat, and the request is sent again with the next token.
+            index, generation, info = registered[0]
+            self.client.auth = BearerAuth(info.token)
+            try:
+                results = self.client.task_instances.bulk_heartbeat([info for _, _, info in registered])
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code not in (HTTPStatus.UNAUTHORIZED, HTTPStatus.FORBIDDEN):
+                    self._record_failure(registered, e)
+                    return
+                log.warning("Token of the heartbeat request rejected", ti_id=str(info.id))
+                self.slots.record(index, generation, e.response.status_code, {"message": str(e)})
+                registered = registered[1:]
+                continue
+            except Exception as e:
+                self._record_failure(registered, e)
+                return
+            for (index, generation, _), result in zip(registered, results):
+                self.slots.record(
+                    index, generation, result.status_code, result.detail, result.refreshed_token
+                )
+            return
+
+    def _record_failure(self, registered: list[tuple[int, int, TIBulkHeartbeatInfo]], error: Exception):
+        log.warning("Failed to send heartbeats", count=len(registered), exc_info=error)
+        for index, generation, _ in registered:
+            self.slots.record(index, generation, REQUEST_FAILED, {"message": str(error)})
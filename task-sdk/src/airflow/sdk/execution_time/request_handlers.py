@@ -35,6 +35,7 @@ from airflow.sdk.api.datamodels._generated import (
     DagRunStateResponse,
     TaskStatesResponse,
     VariableResponse,
+    XComBatchResponse,
     XComResponse,
     XComSequenceIndexResponse,
     XComSequenceSliceResponse,
@@ -54,6 +55,7 @@ from airflow.sdk.execution_time.comms import (
     GetVariable,
     GetVariableKeys,
     GetXCom,
+    GetXComBatch,
     GetXComCount,
     GetXComSequenceItem,
     GetXComSequenceSlice,
@@ -64,6 +66,7 @@ from airflow.sdk.execution_time.comms import (
     TaskStatesResult,
     VariableKeysResult,
     VariableResult,
+    XComBatchResult,
     XComResult,
     XComSequenceIndexResult,
     XComSequenceSliceResult,
@@ -263,6 +266,14 @@ def handle_get_xcom_sequence_slice(
     return xcoms, {}
 
 
+def handle_get_xcom_batch(client: Client, msg: GetXComBatch) -> tuple[BaseModel | None, dict[str, bool]]:
+    """Fetch several XComs with a single request and normalize them for supervisor response handling."""
+    xcoms = client.xcoms.get_batch(msg.queries)
+    if isinstance(xcoms, XComBatchResponse):
+        return XComBatchResult.from_response(xcoms), {}
+    return xcoms, {}
+
+
 def handle_get_xcom(client: Client, msg: GetXCom) -> tuple[BaseModel | None, dict[str, bool]]:
     """Fetch an XCom and normalize it for supervisor response handling."""
     xcom = client.xcoms.get(
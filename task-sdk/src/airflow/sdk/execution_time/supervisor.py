@@ -49,7 +49,7 @@ import structlog
 from pydantic import BaseModel, TypeAdapter
 
 from airflow.sdk._shared.logging.structlog import reconfigure_logger
-from airflow.sdk.api.client import Client, ServerResponseError
+from airflow.sdk.api.client import BearerAuth, Client, ServerResponseError
 from airflow.sdk.api.datamodels._generated import (
     AssetResponse,
     ConnectionResponse,
@@ -58,7 +58,7 @@ from airflow.sdk.api.datamodels._generated import (
 )
 from airflow.sdk.configuration import conf
 from airflow.sdk.exceptions import ErrorType
-from airflow.sdk.execution_time import comms
+from airflow.sdk.execution_time import comms, dag_cache, heartbeat_aggregator
 from airflow.sdk.execution_time.comms import (
     AssetEventsResult,
     AssetResult,
@@ -101,6 +101,7 @@ from airflow.sdk.execution_time.comms import (
     GetVariable,
     GetVariableKeys,
     GetXCom,
+    GetXComBatch,
     GetXComCount,
     GetXComSequenceItem,
     GetXComSequenceSlice,
@@ -146,6 +147,7 @@ from airflow.sdk.execution_time.request_handlers import (
     handle_get_variable,
     handle_get_variable_keys,
     handle_get_xcom,
+    handle_get_xcom_batch,
     handle_get_xcom_count,
     handle_get_xcom_sequence_item,
     handle_get_xcom_sequence_slice,
@@ -1296,6 +1298,10 @@ class ActivitySubprocess(WatchedSubprocess):
 
     _last_successful_heartbeat: float = attrs.field(default=0, init=False)
     _last_heartbeat_attempt: float = attrs.field(default=0, init=False)
+    # When the worker process aggregates the heartbeats of its host, the slot the TI is registered in, and
+    # the number of heartbeats sent from it that we already checked the outcome of.
+    _heartbeat_slot: heartbeat_aggregator.HeartbeatSlot | None = attrs.field(default=None, init=False)
+    _heartbeats_checked: int = attrs.field(default=0, init=False)
 
     _should_retry: bool = attrs.field(default=False, init=False)
     """Whether the task should retry or not as decided by the API server."""
@@ -1330,6 +1336,11 @@ class ActivitySubprocess(WatchedSubprocess):
         # Tests override `target` with a local stub to exercise the base
         # infrastructure; keep bare fork for those.
         use_exec = target is _subprocess_main and sys.platform in _FORK_EXEC_PLATFORMS
+        if not use_exec:
+            # The task process inherits the parsed Dag, unless a fresh interpreter is exec'd
+            dag_cache.preparse_dag_file(
+                bundle_info=bundle_info, dag_rel_path=dag_rel_path, dag_id=what.dag_id, log=logger or log
+            )
         proc: Self = super().start(
             id=what.id, client=client, target=target, logger=logger, use_exec=use_exec, **kwargs
         )
@@ -1364,6 +1375,10 @@ class ActivitySubprocess(WatchedSubprocess):
             self.kill(signal.SIGKILL)
             raise
 
+        slot = heartbeat_aggregator.get_process_slot()
+        if slot is not None and slot.register(self.id, self.pid, getattr(self.client.auth, "token", None)):
+            self._heartbeat_slot = slot
+
         # ti_context.start_date is only populated by the server when resuming from a deferral (to preserve the
         # original start_date rather than using the resume time). We fall back to now() otherwise. This ensures
         # that `context["ti"].start_date` always reflects the *first* start time. See TIRunContext.start_date
@@ -1414,6 +1429,8 @@ class ActivitySubprocess(WatchedSubprocess):
         try:
             self._monitor_subprocess()
         finally:
+            if self._heartbeat_slot is not None:
+                self._heartbeat_slot.unregister()
             self.selector.close()
             signal.signal(signal.SIGTERM, prev_sigterm)
             signal.signal(signal.SIGINT, prev_sigint)
@@ -1604,9 +1621,14 @@ class ActivitySubprocess(WatchedSubprocess):
         if self._terminal_state:
             # If the task has finished, and we are in "overtime" (running OL listeners etc) we shouldn't
             # heartbeat
+            if self._heartbeat_slot is not None:
+                self._heartbeat_slot.unregister()
             return
 
         self._last_heartbeat_attempt = time.monotonic()
+        if self._heartbeat_slot is not None:
+            self._check_aggregated_heartbeat(self._heartbeat_slot)
+            return
         try:
             self.client.task_instances.heartbeat(self.id, pid=self._process.pid)
             # Update the last heartbeat time on success
@@ -1616,25 +1638,54 @@ class ActivitySubprocess(WatchedSubprocess):
             self.failed_heartbeats = 0
         except ServerResponseError as e:
             if e.response.status_code in {HTTPStatus.NOT_FOUND, HTTPStatus.GONE, HTTPStatus.CONFLICT}:
-                log.error(
-                    "Server indicated the task shouldn't be running anymore",
-                    detail=e.detail,
-                    status_code=e.response.status_code,
-                    ti_id=self.id,
-                )
-                self.process_log.error(
-                    "Server indicated the task shouldn't be running anymore. Terminating process",
-                    detail=e.detail,
-                )
-                self.kill(signal.SIGTERM, force=True)
-                self.process_log.error("Task killed!")
-                self._terminal_state = SERVER_TERMINATED
+                self._handle_server_terminated(e.response.status_code, e.detail)
             else:
                 # If we get any other error, we'll just log it and try again next time
                 self._handle_heartbeat_failures(e)
         except Exception as e:
             self._handle_heartbeat_failures(e)
 
+    def _check_aggregated_heartbeat(self, slot: heartbeat_aggregator.HeartbeatSlot):
+        """Check the outcome of the heartbeats sent for this TI by the aggregator of the host."""
+        if isinstance(self.client.auth, BearerAuth):
+            # Pick up the token refreshed by the server in response to a heartbeat, or hand over ours
+            self.client.auth.token = slot.sync_token(self.client.auth.token)
+
+        result = slot.result()
+        if result.attempts == self._heartbeats_checked:
+            # Nothing was sent since the last check. That's expected when the aggregator is out of phase
+            # with us, but not for longer than an interval.
+            if time.monotonic() - self._last_successful_heartbeat > 2 * MIN_HEARTBEAT_INTERVAL:
+                self._handle_heartbeat_failures(RuntimeError("No heartbeat was sent by the aggregator"))
+            return
+        self._heartbeats_checked = result.attempts
+
+        if result.status_code in {HTTPStatus.NOT_FOUND, HTTPStatus.GONE, HTTPStatus.CONFLICT}:
+            self._handle_server_terminated(result.status_code, result.detail)
+        elif result.status_code < 300 and result.status_code != heartbeat_aggregator.REQUEST_FAILED:
+            self._last_successful_heartbeat = time.monotonic()
+            self.failed_heartbeats = 0
+        else:
+            self._handle_heartbeat_failures(
+                RuntimeError(f"Heartbeat failed with status {result.status_code}: {result.detail}")
+            )
+
+    def _handle_server_terminated(self, status_code: int, detail):
+        """Kill the process when the server indicates the task shouldn't be running anymore."""
+        log.error(
+            "Server indicated the task shouldn't be running anymore",
+            detail=detail,
+            status_code=status_code,
+            ti_id=self.id,
+        )
+        self.process_log.error(
+            "Server indicated the task shouldn't be running anymore. Terminating process",
+            detail=detail,
+        )
+        self.kill(signal.SIGTERM, force=True)
+        self.process_log.error("Task killed!")
+        self._terminal_state = SERVER_TERMINATED
+
     def _handle_heartbeat_failures(self, exc: Exception):
         """Increment the failed heartbeats counter and kill the process if too many failures."""
         self.failed_heartbeats += 1
@@ -1708,6 +1759,8 @@ class ActivitySubprocess(WatchedSubprocess):
             resp, dump_opts = handle_get_variable_keys(self.client, msg)
         elif isinstance(msg, GetXCom):
             resp, dump_opts = handle_get_xcom(self.client, msg)
+        elif isinstance(msg, GetXComBatch):
+            resp, dump_opts = handle_get_xcom_batch(self.client, msg)
         elif isinstance(msg, GetXComSequenceItem):
             resp, dump_opts = handle_get_xcom_sequence_item(self.client, msg)
         elif isinstance(msg, GetXComSequenceSlice):
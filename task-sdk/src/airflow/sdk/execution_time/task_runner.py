@@ -28,7 +28,6 @@ import time
 from collections.abc import Callable, Iterable, Iterator, Mapping
 from contextlib import ExitStack, contextmanager, suppress
 from datetime import datetime, timedelta, timezone
-from itertools import product
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated, Any, Literal
 from urllib.parse import quote
@@ -80,6 +79,7 @@ from airflow.sdk.exceptions import (
     TaskAwaitingInput,
     TaskDeferred,
 )
+from airflow.sdk.execution_time import dag_cache
 from airflow.sdk.execution_time.callback_runner import create_executable_runner
 from airflow.sdk.execution_time.comms import (
     AssetEventDagRunReferenceResult,
@@ -433,8 +433,8 @@ class RuntimeTaskInstance(TaskInstance):
         :returns: A tuple of ``(dag_id, run_id, task_ids, single_task_requested,
             single_map_index_requested, map_indexes_iterable)``.  When
             ``map_indexes_iterable`` is ``NOTSET`` the caller should fetch *all*
-            map-indexes (i.e. use ``get_all`` / ``aget_all``); otherwise it is an
-            iterable of explicit map indexes to fetch one-by-one.
+            map-indexes (as ``get_all`` / ``aget_all`` do); otherwise it is an
+            iterable of explicit map indexes to fetch for each task.
         """
         if dag_id is None:
             dag_id = self.dag_id
@@ -528,32 +528,26 @@ class RuntimeTaskInstance(TaskInstance):
 
         xcoms: list[Any] = []
 
+        # All the XComs are pulled with a single request to the API server
+        pulled = XCom.get_batch(
+            key=key,
+            dag_id=dag_id,
+            run_id=run_id,
+            task_ids=task_ids,
+            map_indexes=map_indexes_iterable,
+            include_prior_dates=include_prior_dates,
+        )
+
         if not is_arg_set(map_indexes_iterable):
-            # map_indexes was not specified — fetch all map indexes for each task
-            for t_id in task_ids:
-                values = XCom.get_all(
-                    run_id=run_id,
-                    key=key,
-                    task_id=t_id,
-                    dag_id=dag_id,
-                    include_prior_dates=include_prior_dates,
-                )
+            # map_indexes was not specified — all map indexes were fetched for each task
+            for values in pulled:
                 xcoms.append(None) if values is None else xcoms.extend(values)
             # For a single task pulling from an unmapped task, return a single value
             if single_task_requested and len(xcoms) == 1:
                 return xcoms[0]
             return xcoms
 
-        for t_id, m_idx in product(task_ids, map_indexes_iterable):
-            value = XCom.get_one(
-                run_id=run_id,
-                key=key,
-                task_id=t_id,
-                dag_id=dag_id,
-                map_index=m_idx,
-                include_prior_dates=include_prior_dates,
-            )
-            xcoms.append(default if value is None else value)
+        xcoms = [default if value is None else value for value in pulled]
 
         if single_task_requested and single_map_index_requested:
             return xcoms[0]
@@ -577,32 +571,26 @@ class RuntimeTaskInstance(TaskInstance):
 
         xcoms: list[Any] = []
 
+        # All the XComs are pulled with a single request to the API server
+        pulled = await XCom.aget_batch(
+            key=key,
+            dag_id=dag_id,
+            run_id=run_id,
+            task_ids=task_ids,
+            map_indexes=map_indexes_iterable,
+            include_prior_dates=include_prior_dates,
+        )
+
         if not is_arg_set(map_indexes_iterable):
-            # map_indexes was not specified — fetch all map indexes for each task
-            for t_id in task_ids:
-                values = await XCom.aget_all(
-                    run_id=run_id,
-                    key=key,
-                    task_id=t_id,
-                    dag_id=dag_id,
-                    include_prior_dates=include_prior_dates,
-                )
+            # map_indexes was not specified — all map indexes were fetched for each task
+            for values in pulled:
                 xcoms.append(None) if values is None else xcoms.extend(values)
             # For a single task pulling from an unmapped task, return a single value
             if single_task_requested and len(xcoms) == 1:
                 return xcoms[0]
             return xcoms
 
-        for t_id, m_idx in product(task_ids, map_indexes_iterable):
-            value = await XCom.aget_one(
-                run_id=run_id,
-                key=key,
-                task_id=t_id,
-                dag_id=dag_id,
-                map_index=m_idx,
-                include_prior_dates=include_prior_dates,
-            )
-            xcoms.append(default if value is None else value)
+        xcoms = [default if value is None else value for value in pulled]
 
         if single_task_requested and single_map_index_requested:
             return xcoms[0]
@@ -1004,22 +992,30 @@ def parse(what: StartupDetails, log: Logger) -> RuntimeTaskInstance:
     _verify_bundle_access(bundle_instance, log)
     bundle_prepare_ms = int((time.monotonic() - bundle_prepare_start) * 1000)
 
-    dag_absolute_path = os.fspath(Path(bundle_instance.path, what.dag_rel_path))
+    if TYPE_CHECKING:
+        assert what.ti.dag_id
+
     dag_file_parse_start = time.monotonic()
-    bag = BundleDagBag(
-        dag_folder=dag_absolute_path,
-        safe_mode=False,
-        load_op_links=False,
+    # Reuse the Dag parsed by the supervisor before forking this process, if any
+    dag = dag_cache.get_parsed_dag(
+        bundle_info=bundle_info,
+        dag_rel_path=what.dag_rel_path,
+        dag_id=what.ti.dag_id,
         bundle_path=bundle_instance.path,
-        bundle_name=bundle_info.name,
     )
+    dag_cache_hit = dag is not None
+    if dag is None:
+        bag = BundleDagBag(
+            dag_folder=os.fspath(Path(bundle_instance.path, what.dag_rel_path)),
+            safe_mode=False,
+            load_op_links=False,
+            bundle_path=bundle_instance.path,
+            bundle_name=bundle_info.name,
+        )
+        dag = bag.dags.get(what.ti.dag_id)
     dag_file_parse_ms = int((time.monotonic() - dag_file_parse_start) * 1000)
-    if TYPE_CHECKING:
-        assert what.ti.dag_id
 
-    try:
-        dag = bag.dags[what.ti.dag_id]
-    except KeyError:
+    if dag is None:
         log.error(
             "Dag not found during start up", dag_id=what.ti.dag_id, bundle=bundle_info, path=what.dag_rel_path
         )
@@ -1065,6 +1061,7 @@ def parse(what: StartupDetails, log: Logger) -> RuntimeTaskInstance:
         dag_id=what.ti.dag_id,
         bundle_prepare_ms=bundle_prepare_ms,
         dag_file_parse_ms=dag_file_parse_ms,
+        dag_cache_hit=dag_cache_hit,
     )
     return RuntimeTaskInstance.model_construct(
         **what.ti.model_dump(exclude_unset=True),
@@ -32,7 +32,7 @@ from task_sdk import make_client, make_client_w_dry_run, make_client_w_responses
 from uuid6 import uuid7
 
 from airflow.sdk import timezone
-from airflow.sdk.api.client import Client, RemoteValidationError, ServerResponseError
+from airflow.sdk.api.client import Client, RemoteValidationError, ServerResponseError, XComOperations
 from airflow.sdk.api.datamodels._generated import (
     AssetEventsResponse,
     AssetResponse,
@@ -46,7 +46,10 @@ from airflow.sdk.api.datamodels._generated import (
     HITLUser,
     TaskStateStoreResponse,
     TerminalTIState,
+    TIBulkHeartbeatInfo,
     VariableResponse,
+    XComBatchQuery,
+    XComBatchResponse,
     XComResponse,
 )
 from airflow.sdk.exceptions import ErrorType, TaskAlreadyRunningError
@@ -441,6 +444,36 @@ class TestTaskInstanceOperations:
         client = make_client(transport=httpx.MockTransport(handle_request))
         client.task_instances.heartbeat(ti_id, 100)
 
+    def test_task_instance_bulk_heartbeat(self, monkeypatch):
+        monkeypatch.setattr("airflow.sdk.api.client.TaskInstanceOperations.BULK_HEARTBEAT_SIZE", 2)
+        heartbeats = [
+            TIBulkHeartbeatInfo(id=uuid6.uuid7(), hostname="host", pid=100 + i, token=f"token-{i}")
+            for i in range(3)
+        ]
+        requests = []
+
+        def handle_request(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/task-instances/heartbeats":
+                body = json.loads(request.read())
+                requests.append(body)
+                return httpx.Response(
+                    status_code=200,
+                    json={"results": [{"status_code": 204} for _ in body["heartbeats"]]},
+                )
+            return httpx.Response(status_code=400, json={"detail": "Bad Request"})
+
+        client = make_client(transport=httpx.MockTransport(handle_request))
+        results = client.task_instances.bulk_heartbeat(heartbeats)
+
+        assert [len(body["heartbeats"]) for body in requests] == [2, 1]
+        assert requests[0]["heartbeats"][0] == {
+            "id": str(heartbeats[0].id),
+            "hostname": "host",
+            "pid": 100,
+            "token": "token-0",
+        }
+        assert [result.status_code for result in results] == [204, 204, 204]
+
     @pytest.mark.parametrize("queues_enabled", [False, True])
     def test_task_instance_defer(self, queues_enabled: bool):
         # Simulate a successful response from the server that defers a task
@@ -1110,6 +1143,40 @@ class TestXCOMOperations:
         )
         assert result == OKResponse(ok=True)
 
+    def test_xcom_get_batch(self, monkeypatch):
+        # Simulate the batch endpoint answering with the task id of each query
+        requests = []
+
+        def handle_request(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/xcoms/batch" and request.method == "POST":
+                queries = json.loads(request.read())["queries"]
+                requests.append(queries)
+                return httpx.Response(status_code=200, json=[[query["task_id"]] for query in queries])
+            return httpx.Response(status_code=400, json={"detail": "Bad Request"})
+
+        monkeypatch.setattr(XComOperations, "BATCH_SIZE", 2)
+        client = make_client(transport=httpx.MockTransport(handle_request))
+        queries = [
+            XComBatchQuery(dag_id="dag_id", run_id="run_id", task_id=f"task_{i}", key="key", map_index=None)
+            for i in range(3)
+        ]
+        result = client.xcoms.get_batch(queries)
+
+        assert result == XComBatchResponse([["task_0"], ["task_1"], ["task_2"]])
+        # Large batches are split in several requests
+        assert [[query["task_id"] for query in batch] for batch in requests] == [
+            ["task_0", "task_1"],
+            ["task_2"],
+        ]
+        assert requests[0][0] == {
+            "dag_id": "dag_id",
+            "run_id": "run_id",
+            "task_id": "task_0",
+            "key": "key",
+            "map_index": None,
+            "include_prior_dates": False,
+        }
+
 
 class TestConnectionOperations:
     """
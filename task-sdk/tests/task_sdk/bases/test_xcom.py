@@ -21,11 +21,14 @@ from unittest import mock
 
 import pytest
 
+from airflow.sdk.api.datamodels._generated import XComBatchQuery
 from airflow.sdk.bases.xcom import BaseXCom
 from airflow.sdk.execution_time.comms import (
     DeleteXCom,
     GetXCom,
+    GetXComBatch,
     GetXComSequenceSlice,
+    XComBatchResult,
     XComResult,
     XComSequenceSliceResult,
 )
@@ -272,3 +275,117 @@ class TestBaseXCom:
                 include_prior_dates=False,
             )
         )
+
+    def test_get_batch_sends_a_single_request(self, mock_supervisor_comms):
+        """get_batch reads all the XComs of several tasks and map indexes with one GetXComBatch."""
+        mock_supervisor_comms.send.return_value = XComBatchResult(root=[["a0"], [], ["b0"], [None]])
+
+        result = BaseXCom.get_batch(
+            key="test_key",
+            dag_id="test_dag",
+            run_id="test_run",
+            task_ids=["task_a", "task_b"],
+            map_indexes=[0, None],
+        )
+
+        assert result == ["a0", None, "b0", None]
+        mock_supervisor_comms.send.assert_called_once_with(
+            GetXComBatch(
+                queries=[
+                    XComBatchQuery(
+                        dag_id="test_dag",
+                        run_id="test_run",
+                        task_id=task_id,
+                        key="test_key",
+                        map_index=map_index,
+                    )
+                    for task_id in ("task_a", "task_b")
+                    for map_index in (0, -1)
+                ]
+            )
+        )
+
+    def test_get_batch_all_map_indexes(self, mock_supervisor_comms):
+        """Without map indexes, get_batch returns what get_all would for each task."""
+        mock_supervisor_comms.send.return_value = XComBatchResult(root=[["a0", "a1"], []])
+
+        result = BaseXCom.get_batch(
+            key="test_key",
+            dag_id="test_dag",
+            run_id="test_run",
+            task_ids=["task_a", "task_b"],
+            include_prior_dates=True,
+        )
+
+        assert result == [["a0", "a1"], None]
+        mock_supervisor_comms.send.assert_called_once_with(
+            GetXComBatch(
+                queries=[
+                    XComBatchQuery(
+                        dag_id="test_dag",
+                        run_id="test_run",
+                        task_id=task_id,
+                        key="test_key",
+                        map_index=None,
+                        include_prior_dates=True,
+                    )
+                    for task_id in ("task_a", "task_b")
+                ]
+            )
+        )
+
+    def test_get_batch_single_xcom_uses_get_one(self, mock_supervisor_comms):
+        """A single XCom is read with GetXCom, as get_one does."""
+        mock_supervisor_comms.send.return_value = XComResult(key="test_key", value="value")
+
+        result = BaseXCom.get_batch(
+            key="test_key", dag_id="test_dag", run_id="test_run", task_ids=["task_a"], map_indexes=[None]
+        )
+
+        assert result == ["value"]
+        mock_supervisor_comms.send.assert_called_once_with(
+            GetXCom(key="test_key", dag_id="test_dag", task_id="task_a", run_id="test_run", map_index=None)
+        )
+
+    def test_get_batch_calls_overridden_get_one(self, mock_supervisor_comms):
+        """XCom backends overriding get_one keep having it called for every XCom."""
+
+        class CustomXCom(BaseXCom):
+            @classmethod
+            def get_one(cls, *, task_id, map_index=None, **kwargs):
+                return f"{task_id}-{map_index}"
+
+        result = CustomXCom.get_batch(
+            key="test_key",
+            dag_id="test_dag",
+            run_id="test_run",
+            task_ids=["task_a", "task_b"],
+            map_indexes=[1],
+        )
+
+        assert result == ["task_a-1", "task_b-1"]
+        mock_supervisor_comms.send.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_aget_batch_sends_a_single_request(self, mock_supervisor_comms):
+        """aget_batch awaits asend with a single GetXComBatch."""
+        mock_supervisor_comms.asend = mock.AsyncMock(return_value=XComBatchResult(root=[["a"], ["b"]]))
+
+        result = await BaseXCom.aget_batch(
+            key="test_key",
+            dag_id="test_dag",
+            run_id="test_run",
+            task_ids=["task_a", "task_b"],
+            map_indexes=[-1],
+        )
+
+        assert result == ["a", "b"]
+        mock_supervisor_comms.asend.assert_called_once_with(
+            GetXComBatch(
+                queries=[
+                    XComBatchQuery(dag_id="test_dag", run_id="test_run", task_id=task_id, key="test_key")
+                    for task_id in ("task_a", "task_b")
+                ]
+            )
+        )
+        mock_supervisor_comms.send.assert_not_called()
@@ -174,3 +174,37 @@ class TestSecretCache:
 
         with pytest.raises(SecretCache.NotPresentException):
             SecretCache.get_connection_uri("key")
+
+    def test_connection_missing(self):
+        SecretCache.save_connection_missing("conn", team_name="team")
+
+        with pytest.raises(SecretCache.MissingException):
+            SecretCache.get_connection_uri("conn", team_name="team")
+        with pytest.raises(SecretCache.NotPresentException):
+            SecretCache.get_connection_uri("conn")
+
+        SecretCache.save_connection_uri("conn", "some_value", team_name="team")
+        assert SecretCache.get_connection_uri("conn", team_name="team") == "some_value"
+
+    def test_large_value_not_saved(self):
+        SecretCache.save_variable("key", "x" * SecretCache._SLOT_SIZE)
+
+        with pytest.raises(SecretCache.NotPresentException):
+            SecretCache.get_variable("key")
+
+    @conf_vars({("secrets", "use_cache"): "true", ("secrets", "cache_entries"): "4"})
+    def test_full_cache_evicts_oldest(self):
+        SecretCache.reset()
+        SecretCache.init()
+
+        for i in range(5):
+            SecretCache.save_variable(f"key{i}", f"value{i}")
+
+        with pytest.raises(SecretCache.NotPresentException):
+            SecretCache.get_variable("key0")
+        assert [SecretCache.get_variable(f"key{i}") for i in range(1, 5)] == [
+            "value1",
+            "value2",
+            "value3",
+            "value4",
+        ]
@@ -160,6 +160,20 @@ class TestCommsDecoder:
         assert len(msg.value) == 10 * 1024 * 1024 + 1
         assert msg.value[-1] == "b"
 
+    def test_receive(self):
+        r, w = socketpair()
+        decoder = CommsDecoder(socket=r, log=None)
+
+        data = msgspec.msgpack.encode(
+            _ResponseFrame(0, {"type": "VariableResult", "key": "a", "value": "b"}, None)
+        )
+        w.sendall(len(data).to_bytes(4, byteorder="big") + data)
+        assert decoder.receive() == VariableResult(key="a", value="b")
+
+        w.close()
+        with pytest.raises(EOFError):
+            decoder.receive()
+
     def test_send_thread_safety(self):
         r, w = socketpair()
         decoder = CommsDecoder(socket=r, log=structlog.get_logger())
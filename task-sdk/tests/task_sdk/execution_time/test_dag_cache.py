@@ -0,0 +1,178 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import json
+import os
+import sys
+import textwrap
+import threading
+import time
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from airflow.sdk.api.datamodels._generated import BundleInfo
+from airflow.sdk.execution_time import dag_cache
+
+from tests_common.test_utils.config import conf_vars
+
+BUNDLE_INFO = BundleInfo(name="cached-bundle", version=None)
+
+DAG_FILE = textwrap.dedent(
+    """
+    from airflow.sdk import DAG
+    from airflow.sdk.bases.operator import BaseOperator
+
+    from cached_dag_helpers import TASK_ID
+
+    with DAG("cached_dag", schedule=None):
+        BaseOperator(task_id=TASK_ID)
+    """
+)
+
+
+@pytest.fixture
+def bundle_path(tmp_path: Path):
+    (tmp_path / "cached_dag.py").write_text(DAG_FILE)
+    (tmp_path / "cached_dag_helpers.py").write_text("TASK_ID = 'a'\n")
+    bundle_config = [
+        {
+            "name": BUNDLE_INFO.name,
+            "classpath": "airflow.dag_processing.bundles.local.LocalDagBundle",
+            "kwargs": {"path": str(tmp_path), "refresh_interval": 1},
+        }
+    ]
+    with mock.patch.dict(
+        os.environ, {"AIRFLOW__DAG_PROCESSOR__DAG_BUNDLE_CONFIG_LIST": json.dumps(bundle_config)}
+    ):
+        yield tmp_path
+    dag_cache.clear()
+    sys.modules.pop("cached_dag_helpers", None)
+    if str(tmp_path) in sys.path:
+        sys.path.remove(str(tmp_path))
+
+
+def _preparse():
+    dag_cache.preparse_dag_file(
+        bundle_info=BUNDLE_INFO, dag_rel_path="cached_dag.py", dag_id="cached_dag", log=mock.Mock()
+    )
+
+
+def _get(bundle_path):
+    return dag_cache.get_parsed_dag(
+        bundle_info=BUNDLE_INFO, dag_rel_path="cached_dag.py", dag_id="cached_dag", bundle_path=bundle_path
+    )
+
+
+def test_disabled_by_default(bundle_path):
+    _preparse()
+
+    assert _get(bundle_path) is None
+
+
+@conf_vars({("workers", "parsed_dag_cache_size"): "1"})
+def test_preparse(bundle_path):
+    _preparse()
+
+    # The supervisor does not keep the bundle importable, for the next versions of the bundle
+    assert str(bundle_path) not in sys.path
+    assert "cached_dag_helpers" not in sys.modules
+
+    dag = _get(bundle_path)
+    assert dag.dag_id == "cached_dag"
+    assert list(dag.task_dict) == ["a"]
+    assert str(bundle_path) in sys.path
+    assert "cached_dag_helpers" in sys.modules
+
+    with mock.patch.object(dag_cache, "_parse") as mock_parse:
+        _preparse()
+    mock_parse.assert_not_called()
+
+
+@conf_vars({("workers", "parsed_dag_cache_size"): "1"})
+def test_modified_dag_file_is_parsed_again(bundle_path):
+    _preparse()
+    dag = _get(bundle_path)
+
+    dag_file = bundle_path / "cached_dag.py"
+    os.utime(dag_file, (dag_file.stat().st_atime, dag_file.stat().st_mtime + 10))
+    assert _get(bundle_path) is None
+
+    _preparse()
+    assert _get(bundle_path) is not dag
+
+
+@conf_vars({("workers", "parsed_dag_cache_size"): "1"})
+def test_missing_dag_is_not_cached(bundle_path):
+    (bundle_path / "cached_dag.py").write_text("raise ImportError('broken')\n")
+
+    _preparse()
+
+    assert _get(bundle_path) is None
+
+
+@conf_vars({("workers", "parsed_dag_cache_size"): "1", ("core", "dagbag_import_timeout"): "0.5"})
+def test_slow_dag_file_times_out(bundle_path):
+    (bundle_path / "cached_dag.py").write_text("import time\ntime.sleep(10)\n" + DAG_FILE)
+
+    start = time.monotonic()
+    _preparse()
+
+    assert time.monotonic() - start < 5
+    assert _get(bundle_path) is None
+    assert "cached_dag_helpers" not in sys.modules
+
+
+@conf_vars({("workers", "parsed_dag_cache_size"): "1"})
+def test_dag_file_exiting_does_not_stop_the_worker(bundle_path):
+    (bundle_path / "cached_dag.py").write_text("import sys\nsys.exit(1)\n")
+
+    _preparse()
+
+    assert _get(bundle_path) is None
+
+
+@conf_vars({("workers", "parsed_dag_cache_size"): "1"})
+def test_not_parsed_outside_of_the_main_thread(bundle_path):
+    log = mock.Mock()
+    thread = threading.Thread(
+        target=dag_cache.preparse_dag_file,
+        kwargs={
+            "bundle_info": BUNDLE_INFO,
+            "dag_rel_path": "cached_dag.py",
+            "dag_id": "cached_dag",
+            "log": log,
+        },
+    )
+    thread.start()
+    thread.join()
+
+    assert _get(bundle_path) is None
+    log.info.assert_called_once_with(
+        "Not parsing the Dag file before starting the task outside of the main thread",
+        dag_file="cached_dag.py",
+    )
+
+
+@conf_vars({("workers", "parsed_dag_cache_size"): "1", ("core", "dagbag_import_timeout"): "0"})
+def test_preparse_without_import_timeout(bundle_path):
+    _preparse()
+
+    assert _get(bundle_path).dag_id == "cached_dag"
@@ -0,0 +1,203 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import json
+import multiprocessing
+from unittest import mock
+
+import httpx
+import pytest
+from task_sdk import make_client
+from uuid6 import uuid7
+
+from airflow.sdk.execution_time import heartbeat_aggregator
+from airflow.sdk.execution_time.heartbeat_aggregator import (
+    REQUEST_FAILED,
+    HeartbeatAggregator,
+    HeartbeatResult,
+    HeartbeatSlot,
+    HeartbeatSlots,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_process_slot(monkeypatch):
+    monkeypatch.setattr(heartbeat_aggregator, "_process_slot", None)
+
+
+def _register_in_child(slots: HeartbeatSlots, ti_id: str) -> None:
+    slots.claim().register(ti_id, 4321, "child-token")
+
+
+class TestHeartbeatSlots:
+    def test_register_and_record(self):
+        slots = HeartbeatSlots(2)
+        slot = slots.claim()
+        assert heartbeat_aggregator.get_process_slot() is slot
+        ti_id = uuid7()
+
+        assert slots.collect("host") == []
+        assert slot.register(ti_id, 1234, "token")
+        [(index, generation, info)] = slots.collect("host")
+        assert (info.id, info.hostname, info.pid, info.token) == (ti_id, "host", 1234, "token")
+
+        slots.record(index, generation, 409, {"reason": "not_running"})
+        assert slot.result() == HeartbeatResult(attempts=1, status_code=409, detail={"reason": "not_running"})
+
+        # Outcomes of heartbeats sent for a previous registration are ignored
+        assert slot.register(uuid7(), 1234, "token")
+        slots.record(index, generation, 204)
+        assert slot.result() == HeartbeatResult(attempts=0, status_code=REQUEST_FAILED, detail=None)
+
+        slot.unregister()
+        assert slots.collect("host") == []
+
+    def test_too_long_token_is_not_registered(self):
+        slot = HeartbeatSlots(1).claim()
+        assert not slot.register(uuid7(), 1234, "x" * 4096)
+        assert not slot.register(uuid7(), 1234, None)
+
+    def test_claim_and_release(self):
+        slots = HeartbeatSlots(1)
+        slots.claim()
+        with pytest.raises(RuntimeError, match="already claimed"):
+            slots.claim()
+        slots.release(multiprocessing.current_process().pid)
+        slots.claim()
+
+    def test_sync_token(self):
+        slots = HeartbeatSlots(1)
+        slot = slots.claim()
+        slot.register(uuid7(), 1234, "token")
+
+        # The token of the supervisor is used for the next heartbeats...
+        assert slot.sync_token("newer-token") == "newer-token"
+        [(index, generation, info)] = slots.collect("host")
+        assert info.token == "newer-token"
+
+        # ... unless the server refreshed it in response to a heartbeat
+        slots.record(index, generation, 204, refreshed_token="refreshed-token")
+        assert slot.sync_token("newer-token") == "refreshed-token"
+        assert slots.collect("host")[0][2].token == "refreshed-token"
+
+    def test_shared_with_worker_processes(self):
+        slots = HeartbeatSlots(2)
+        ti_id = uuid7()
+        process = multiprocessing.get_context("fork").Process(
+            target=_register_in_child, args=(slots, str(ti_id))
+        )
+        process.start()
+        process.join()
+
+        [(_, _, info)] = slots.collect("host")
+        assert (info.id, info.pid, info.token) == (ti_id, 4321, "child-token")
+        # The slot of the child isn't the one of this process
+        assert heartbeat_aggregator.get_process_slot() is None
+
+        slots.release(process.pid)
+        assert slots.collect("host") == []
+
+
+class TestHeartbeatAggregator:
+    def test_send_heartbeats(self):
+        slots = HeartbeatSlots(3)
+        alive_id, gone_id = uuid7(), uuid7()
+        requests = []
+
+        def handle_request(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(
+                status_code=200,
+                json={
+                    "results": [
+                        {"status_code": 204, "refreshed_token": "refreshed"},
+                        {"status_code": 410, "detail": {"reason": "not_found"}},
+                    ]
+                },
+            )
+
+        alive = slots.claim()
+        alive.register(alive_id, 1, "alive-token")
+        # Claimed by another worker process
+        slots._slots[1].owner = 1
+        gone = HeartbeatSlot(slots, 1)
+        gone.register(gone_id, 2, "gone-token")
+
+        aggregator = HeartbeatAggregator(
+            slots, make_client(transport=httpx.MockTransport(handle_request)), interval=5
+        )
+        aggregator.send_heartbeats()
+
+        assert len(requests) == 1
+        assert requests[0].headers["Authorization"] == "Bearer alive-token"
+        assert alive.result() == HeartbeatResult(attempts=1, status_code=204, detail=None)
+        assert alive.sync_token("alive-token") == "refreshed"
+        assert gone.result() == HeartbeatResult(attempts=1, status_code=410, detail={"reason": "not_found"})
+
+    def test_send_heartbeats_rejected_token(self):
+        slots = HeartbeatSlots(2)
+        expired, valid = slots.claim(), HeartbeatSlot(slots, 1)
+        slots._slots[1].owner = 1
+        expired.register(uuid7(), 1, "expired-token")
+        valid.register(uuid7(), 2, "valid-token")
+        requests = []
+
+        def handle_request(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.headers["Authorization"] == "Bearer expired-token":
+                return httpx.Response(status_code=403, json={"detail": "Invalid auth token"})
+            return httpx.Response(status_code=200, json={"results": [{"status_code": 204}]})
+
+        aggregator = HeartbeatAggregator(
+            slots, make_client(transport=httpx.MockTransport(handle_request)), interval=5
+        )
+        aggregator.send_heartbeats()
+
+        # Only the task instance whose token was rejected fails to heartbeat
+        assert [request.headers["Authorization"] for request in requests] == [
+            "Bearer expired-token",
+            "Bearer valid-token",
+        ]
+        assert len(json.loads(requests[1].content)["heartbeats"]) == 1
+        assert expired.result().status_code == 403
+        assert valid.result() == HeartbeatResult(attempts=1, status_code=204, detail=None)
+
+    def test_paused(self):
+        aggregator = HeartbeatAggregator(HeartbeatSlots(1), mock.Mock(), interval=5)
+        with aggregator.paused():
+            assert aggregator._sending.locked()
+        assert not aggregator._sending.locked()
+
+    def test_send_heartbeats_request_failure(self):
+        slots = HeartbeatSlots(1)
+        slot = slots.claim()
+        slot.register(uuid7(), 1, "token")
+        client = mock.Mock()
+        client.task_instances.bulk_heartbeat.side_effect = httpx.ConnectError("Connection refused")
+
+        HeartbeatAggregator(slots, client, interval=5).send_heartbeats()
+
+        assert slot.result() == HeartbeatResult(
+            attempts=1, status_code=REQUEST_FAILED, detail={"message": "Connection refused"}
+        )
+
+    def test_nothing_registered(self):
+        client = mock.Mock()
+        HeartbeatAggregator(HeartbeatSlots(1), client, interval=5).send_heartbeats()
+        client.task_instances.bulk_heartbeat.assert_not_called()
@@ -68,6 +68,7 @@ from airflow.sdk.api.datamodels._generated import (
     PreviousTIResponse,
     TaskInstance,
     TaskInstanceState,
+    XComBatchQuery,
 )
 from airflow.sdk.exceptions import AirflowRuntimeError, ErrorType, TaskAlreadyRunningError
 from airflow.sdk.execution_time import supervisor, task_runner
@@ -118,6 +119,7 @@ from airflow.sdk.execution_time.comms import (
     GetVariable,
     GetVariableKeys,
     GetXCom,
+    GetXComBatch,
     GetXComCount,
     GetXComSequenceItem,
     GetXComSequenceSlice,
@@ -153,6 +155,7 @@ from airflow.sdk.execution_time.comms import (
     ValidateInletsAndOutlets,
     VariableKeysResult,
     VariableResult,
+    XComBatchResult,
     XComCountResponse,
     XComResult,
     XComSequenceIndexResult,
@@ -160,7 +163,9 @@ from airflow.sdk.execution_time.comms import (
     _RequestFrame,
     _ResponseFrame,
 )
+from airflow.sdk.execution_time.heartbeat_aggregator import REQUEST_FAILED, HeartbeatSlots
 from airflow.sdk.execution_time.supervisor import (
+    SERVER_TERMINATED,
     ActivitySubprocess,
     InProcessSupervisorComms,
     InProcessTestSupervisor,
@@ -1123,6 +1128,52 @@ class TestWatchedSubprocess:
             "loc": mocker.ANY,
         } in captured_logs
 
+    def test_aggregated_heartbeat(self, monkeypatch, mocker):
+        """The outcome of the heartbeats sent by the aggregator of the host is read from the slot."""
+        monkeypatch.setattr("airflow.sdk.execution_time.supervisor.MIN_HEARTBEAT_INTERVAL", 5)
+        mock_kill = mocker.patch("airflow.sdk.execution_time.supervisor.WatchedSubprocess.kill")
+        slots = HeartbeatSlots(1)
+        slot = slots.claim()
+        client = mocker.Mock(auth=sdk_client.BearerAuth("token"))
+
+        proc = ActivitySubprocess(
+            process_log=mocker.MagicMock(),
+            id=TI_ID,
+            pid=12345,
+            stdin=mocker.MagicMock(),
+            client=client,
+            process=mocker.Mock(pid=12345),
+        )
+        assert slot.register(TI_ID, 12345, "token")
+        proc._heartbeat_slot = slot
+        now = 10.0
+
+        with patch("airflow.sdk.execution_time.supervisor.time.monotonic", side_effect=lambda: now):
+            # Nothing sent by the aggregator yet
+            proc._last_successful_heartbeat = now
+            proc._send_heartbeat_if_needed()
+            assert proc.failed_heartbeats == 0
+
+            (index, generation, _), *_ = slots.collect("host")
+            slots.record(index, generation, 204, refreshed_token="refreshed")
+            now += 5
+            proc._send_heartbeat_if_needed()
+            assert proc._last_successful_heartbeat == now
+            assert client.auth.token == "refreshed"
+
+            slots.record(index, generation, REQUEST_FAILED, {"message": "Connection refused"})
+            now += 5
+            proc._send_heartbeat_if_needed()
+            assert proc.failed_heartbeats == 1
+
+            slots.record(index, generation, 409, {"reason": "not_running"})
+            now += 5
+            proc._send_heartbeat_if_needed()
+
+        client.task_instances.heartbeat.assert_not_called()
+        mock_kill.assert_called_once_with(signal.SIGTERM, force=True)
+        assert proc._terminal_state == SERVER_TERMINATED
+
     @pytest.mark.parametrize(
         ("terminal_state", "task_end_time_monotonic", "overtime_threshold", "expected_kill"),
         [
@@ -2676,6 +2727,30 @@ REQUEST_TEST_CASES = [
         ),
         test_id="get_xcom_seq_slice",
     ),
+    RequestTestCase(
+        message=GetXComBatch(
+            queries=[
+                XComBatchQuery(dag_id="test_dag", run_id="test_run", task_id="task_1", key="test_key"),
+                XComBatchQuery(
+                    dag_id="test_dag", run_id="test_run", task_id="task_2", key="test_key", map_index=None
+                ),
+            ]
+        ),
+        expected_body={"root": [["foo"], ["bar", "baz"]], "type": "XComBatchResult"},
+        client_mock=ClientMock(
+            method_path="xcoms.get_batch",
+            args=(
+                [
+                    XComBatchQuery(dag_id="test_dag", run_id="test_run", task_id="task_1", key="test_key"),
+                    XComBatchQuery(
+                        dag_id="test_dag", run_id="test_run", task_id="task_2", key="test_key", map_index=None
+                    ),
+                ],
+            ),
+            response=XComBatchResult(root=[["foo"], ["bar", "baz"]]),
+        ),
+        test_id="get_xcom_batch",
+    ),
     RequestTestCase(
         message=TaskState(state=TaskInstanceState.SKIPPED, end_date=timezone.parse("2024-10-31T12:00:00Z")),
         test_id="patch_task_instance_to_skipped",
@@ -72,6 +72,7 @@ from airflow.sdk.api.datamodels._generated import (
     TaskInstance,
     TaskInstanceState,
     TIRunContext,
+    XComBatchQuery,
 )
 from airflow.sdk.bases.xcom import BaseXCom
 from airflow.sdk.definitions._internal.types import NOTSET, SET_DURING_EXECUTION, is_arg_set
@@ -123,6 +124,7 @@ from airflow.sdk.execution_time.comms import (
     GetTICount,
     GetVariable,
     GetXCom,
+    GetXComBatch,
     GetXComSequenceSlice,
     InactiveAssetsResult,
     MaskSecret,
@@ -146,6 +148,7 @@ from airflow.sdk.execution_time.comms import (
     TriggerDagRun,
     ValidateInletsAndOutlets,
     VariableResult,
+    XComBatchResult,
     XComResult,
     XComSequenceSliceResult,
 )
@@ -301,6 +304,60 @@ def test_parse_dag_bag(mock_dagbag, test_dags_dir: Path, make_ti_context):
     )
 
 
+@mock.patch("airflow.dag_processing.dagbag.BundleDagBag")
+@mock.patch("airflow.sdk.execution_time.dag_cache.get_parsed_dag")
+def test_parse_from_dag_cache(mock_get_parsed_dag, mock_dagbag, test_dags_dir: Path, make_ti_context):
+    """Test that the Dag parsed by the supervisor before forking is used instead of parsing the file"""
+    mock_task = mock.Mock(spec=BaseOperator)
+    mock_task.deserialization_allowed_class_fields = ()
+    mock_dag = mock.Mock(spec=DAG, task_dict={"a": mock_task}, tasks=[mock_task])
+    mock_get_parsed_dag.return_value = mock_dag
+
+    what = StartupDetails(
+        ti=TaskInstance(
+            id=uuid7(),
+            task_id="a",
+            dag_id="super_basic",
+            run_id="c",
+            try_number=1,
+            dag_version_id=uuid7(),
+            queue="default",
+        ),
+        dag_rel_path="super_basic.py",
+        bundle_info=BundleInfo(name="my-bundle", version=None),
+        ti_context=make_ti_context(),
+        start_date=timezone.utcnow(),
+        sentry_integration="",
+    )
+    log = mock.Mock()
+
+    with patch.dict(
+        os.environ,
+        {
+            "AIRFLOW__DAG_PROCESSOR__DAG_BUNDLE_CONFIG_LIST": json.dumps(
+                [
+                    {
+                        "name": "my-bundle",
+                        "classpath": "airflow.dag_processing.bundles.local.LocalDagBundle",
+                        "kwargs": {"path": str(test_dags_dir), "refresh_interval": 1},
+                    }
+                ]
+            ),
+        },
+    ):
+        ti = parse(what, log)
+
+    assert ti.task is mock_task
+    mock_get_parsed_dag.assert_called_once_with(
+        bundle_info=what.bundle_info,
+        dag_rel_path="super_basic.py",
+        dag_id="super_basic",
+        bundle_path=test_dags_dir,
+    )
+    mock_dagbag.assert_not_called()
+    assert log.info.call_args.kwargs["dag_cache_hit"] is True
+
+
 @pytest.mark.parametrize(
     ("dag_id", "task_id", "expected_error"),
     (
@@ -2252,6 +2309,8 @@ class TestRuntimeTaskInstance:
             print(f"{args=}, {kwargs=}, {msg=}")
             if isinstance(msg, GetXComSequenceSlice):
                 return XComSequenceSliceResult(root=[ser_value])
+            if isinstance(msg, GetXComBatch):
+                return XComBatchResult(root=[[ser_value] for _ in msg.queries])
             return XComResult(key="key", value=ser_value)
 
         mock_supervisor_comms.send.side_effect = mock_send_side_effect
@@ -2265,10 +2324,34 @@ class TestRuntimeTaskInstance:
         if not isinstance(map_indexes, Iterable):
             map_indexes = [map_indexes]
 
-        for task_id_raw in task_ids:
-            # Without task_ids (or None) expected behavior is to pull with calling task_id
-            task_id = task_id_raw if is_arg_set(task_id_raw) and task_id_raw is not None else test_task_id
+        # Without task_ids (or None) expected behavior is to pull with calling task_id
+        task_ids = [
+            task_id if is_arg_set(task_id) and task_id is not None else test_task_id for task_id in task_ids
+        ]
 
+        if len(task_ids) * len(map_indexes) > 1:
+            # Several XComs are pulled with a single request
+            mock_supervisor_comms.send.assert_any_call(
+                msg=GetXComBatch(
+                    queries=[
+                        XComBatchQuery(
+                            key="key",
+                            dag_id="test_dag",
+                            run_id="test_run",
+                            task_id=task_id,
+                            # A batch query without map index reads all of them
+                            map_index=None
+                            if map_index is NOTSET
+                            else (-1 if map_index is None else map_index),
+                        )
+                        for task_id in task_ids
+                        for map_index in map_indexes
+                    ]
+                ),
+            )
+            return
+
+        for task_id in task_ids:
             for map_index in map_indexes:
                 if map_index == NOTSET:
                     mock_supervisor_comms.send.assert_any_call(
@@ -3604,11 +3687,12 @@ class TestXComAfterTaskExecution:
         runtime_ti = create_runtime_ti(task=task)
         run(runtime_ti, context=runtime_ti.get_template_context(), log=mock.MagicMock())
 
-        mock_xcom_backend.get_all.assert_called_once_with(
+        mock_xcom_backend.get_batch.assert_called_once_with(
             key="key",
             dag_id="test_dag",
-            task_id="pull_task",
             run_id="test_run",
+            task_ids=["pull_task"],
+            map_indexes=NOTSET,
             include_prior_dates=False,
         )
 